@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Benchmark de debit de l'extracteur deterministe de citations.
+
+Genere des reponses juridiques synthetiques de taille croissante et mesure
+le temps d'extraction (µs par reponse, Mo/s, citations/s).
+
+Usage : python scripts/bench_citations.py [--repeat 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from frenchlaw_bench.scoring.citation_extractor import citations_to_claims, extract_citations
+
+_PARAGRAPH = """\
+Aux termes de l'article 1240 du Code civil, tout fait quelconque de l'homme qui cause \
+a autrui un dommage oblige celui par la faute duquel il est arrive a le reparer. La \
+Cour de cassation l'a rappele (Cass. com., 12 janv. 2021, n° 19-12.345), et la \
+transformation d'une SARL en SAS obeit aux articles L223-43 et suivants du Code de \
+commerce. En droit de l'Union, la CJUE a precise la portee des articles 101 et 102 TFUE \
+(CJUE, C-311/18 ; voir aussi CE, 5 février 1963, aff. 26/62). Le Conseil d'Etat juge de \
+meme (CE, Ass., 20 octobre 1989, n° 108243 ; ECLI:FR:CEASS:1989:108243.19891020).
+Le juge apprecie souverainement les circonstances de l'espece, sans qu'aucune regle \
+generale ne puisse etre degagee de facon abstraite ; l'analyse doit rester concrete.
+"""
+
+
+def _run(size_kb: int, repeat: int) -> None:
+    text = _PARAGRAPH * max(1, (size_kb * 1024) // len(_PARAGRAPH))
+    n_bytes = len(text.encode("utf-8"))
+
+    extract_citations(text)  # chauffe
+    start = time.perf_counter()
+    for _ in range(repeat):
+        citations = extract_citations(text)
+        citations_to_claims(citations)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    print(
+        f"{size_kb:>6} Ko | {len(citations):>6} citations | "
+        f"{elapsed * 1e6:>10.0f} µs/reponse | "
+        f"{n_bytes / elapsed / 1e6:>6.1f} Mo/s | "
+        f"{len(citations) / elapsed:>10.0f} citations/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    for size_kb in (4, 16, 64, 256, 1024):
+        _run(size_kb, args.repeat if size_kb < 256 else max(1, args.repeat // 10))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Benchmark du parser JSON des reponses du juge.
+
+Rejoue le corpus `tests/data/judge_outputs.jsonl` (sorties de juge typiques :
+blocs markdown, virgules finales, accolades dans la prose, sorties tronquees)
+avec `parse_llm_json` et avec l'ancienne implementation (premier `{`, dernier
+`}`, jusqu'a six `json.loads`), et compare taux de parsing correct et µs/parse.
+
+Usage : python scripts/bench_json.py [--repeat 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from frenchlaw_bench.json_utils import parse_llm_json
+
+CORPUS = Path(__file__).resolve().parent.parent / "tests" / "data" / "judge_outputs.jsonl"
+
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_MARKDOWN_BLOCK_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?\s*```", re.DOTALL)
+
+
+def legacy_parse(text: str) -> dict | list:
+    """Implementation precedente, conservee pour comparaison."""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    cleaned = text.strip()
+    md_match = _MARKDOWN_BLOCK_RE.search(cleaned)
+    if md_match:
+        extracted = md_match.group(1).strip()
+        for attempt in (extracted, _TRAILING_COMMA_RE.sub(r"\1", extracted)):
+            try:
+                return json.loads(attempt)
+            except json.JSONDecodeError:
+                pass
+    obj_start, arr_start = cleaned.find("{"), cleaned.find("[")
+    if obj_start >= 0 and (arr_start < 0 or obj_start <= arr_start):
+        start, end = obj_start, cleaned.rfind("}") + 1
+    else:
+        start, end = arr_start, cleaned.rfind("]") + 1
+    if start >= 0 and end > start:
+        block = cleaned[start:end]
+        for attempt in (block, _TRAILING_COMMA_RE.sub(r"\1", block)):
+            try:
+                return json.loads(attempt)
+            except json.JSONDecodeError:
+                pass
+    return json.loads(_TRAILING_COMMA_RE.sub(r"\1", cleaned))
+
+
+def load_corpus(path: Path = CORPUS) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _outcome(parse: Callable[[str], object], text: str) -> object:
+    try:
+        return parse(text)
+    except ValueError:
+        return None
+
+
+def _run(name: str, parse: Callable[[str], object], corpus: list[dict], repeat: int) -> None:
+    correct = sum(_outcome(parse, row["output"]) == row["expected"] for row in corpus)
+    misses = [row["kind"] for row in corpus if _outcome(parse, row["output"]) != row["expected"]]
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for row in corpus:
+            _outcome(parse, row["output"])
+    elapsed = (time.perf_counter() - start) / (repeat * len(corpus))
+
+    print(
+        f"{name:<8} | {correct:>3}/{len(corpus)} corrects | {elapsed * 1e6:>7.1f} µs/parse"
+        + (f" | echecs : {', '.join(misses)}" if misses else "")
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+    corpus = load_corpus()
+    _run("ancien", legacy_parse, corpus, args.repeat)
+    _run("actuel", parse_llm_json, corpus, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark des sorties du juge sur les criteres : verbatim vs spans.
+
+Rejuge un echantillon de criteres d'un run archive (memes reponses, meme juge)
+dans les deux modes et compare tokens d'entree et de sortie, latence par appel
+et accord des verdicts. Appelle le juge reel (OPENROUTER_API_KEY requise).
+
+Usage : python scripts/bench_judge_output.py RUN_ID [--items 40] [--judge-model ID] [-c 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+
+from frenchlaw_bench import config
+from frenchlaw_bench.core.loader import load_tasks
+from frenchlaw_bench.llm.openrouter import OpenRouterClient
+from frenchlaw_bench.models.enums import Dimension
+from frenchlaw_bench.reports.results_io import find_results, load_run
+from frenchlaw_bench.scoring.judge import (
+    judge_negatif_item,
+    judge_rubric_item,
+    reset_verdict_stats,
+    verdict_stats_dict,
+)
+
+
+async def _judge_all(client, samples, output: str, concurrency: int) -> tuple[list[bool], dict]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def judge(task, response, item):
+        negatif = item.dimension == Dimension.NEGATIF
+        judge_item = judge_negatif_item if negatif else judge_rubric_item
+        async with semaphore:
+            return await judge_item(client, task, response, item, output=output)
+
+    reset_verdict_stats()
+    verdicts = await asyncio.gather(*(judge(*s) for s in samples))
+    return [v.satisfied for v in verdicts], verdict_stats_dict().get(client.model, {})
+
+
+async def _bench(args: argparse.Namespace) -> None:
+    results_path = find_results(config.RESULTS_DIR / args.run_id)
+    if results_path is None:
+        raise SystemExit(f"Run {args.run_id} introuvable dans {config.RESULTS_DIR}")
+    run = load_run(results_path)
+    task_map = {t.number: t for t in load_tasks()}
+    pool = [
+        (task_map[r.task_number], r.response, item)
+        for r in run.task_results
+        if not r.error and r.task_number in task_map
+        for item in task_map[r.task_number].rubric.items
+    ]
+    samples = random.Random(0).sample(pool, min(args.items, len(pool)))
+
+    client = OpenRouterClient(model=args.judge_model or run.metadata.judge_model)
+    try:
+        verbatim, before = await _judge_all(client, samples, "verbatim", args.concurrency)
+        spans, after = await _judge_all(client, samples, "spans", args.concurrency)
+    finally:
+        await client.close()
+
+    print(f"{len(samples)} criteres, juge {client.model}")
+    for label, stats in (("verbatim", before), ("spans", after)):
+        calls = max(stats.get("calls", 0), 1)
+        print(
+            f"{label:9}: {stats.get('input_tokens', 0) / calls:7.0f} tokens d'entree, "
+            f"{stats.get('output_tokens_per_call', 0):6.0f} tokens de sortie, "
+            f"{stats.get('latency_per_call', 0):5.2f} s par appel"
+        )
+    if before.get("output_tokens") and before.get("latency_seconds"):
+        print(
+            f"Reduction : sortie -{1 - after['output_tokens'] / before['output_tokens']:.0%}, "
+            f"latence -{1 - after['latency_seconds'] / before['latency_seconds']:.0%}"
+        )
+    agree = sum(a == b for a, b in zip(verbatim, spans, strict=True))
+    print(f"Accord des verdicts : {agree}/{len(samples)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("run_id")
+    parser.add_argument("--items", type=int, default=40)
+    parser.add_argument("--judge-model", default=None)
+    parser.add_argument("-c", "--concurrency", type=int, default=5)
+    asyncio.run(_bench(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark du rejeu de ponderation : boucles Python vs moteur vectorise.
+
+Genere des verdicts aleatoires pour `--runs` runs x `--models` modeles sur les
+taches de `data/core/tasks.csv`, puis recalcule tous les scores avec une autre
+ponderation : d'abord avec `compute_answer_score_with_penalties` (un
+`result_map` par resultat), puis avec `scoring.vectorized.rescore`.
+
+Usage : python scripts/bench_reweight.py [--runs 200] [--models 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from frenchlaw_bench.core.loader import load_tasks
+from frenchlaw_bench.models.result import HallucinationDetail, RubricItemResult, TaskResult
+from frenchlaw_bench.scoring.answer_scorer import (
+    compute_answer_score_with_penalties,
+    compute_dimension_scores,
+    compute_negatif_penalty,
+)
+from frenchlaw_bench.scoring.vectorized import SEVERITIES, Weighting, pack_results, rescore
+
+
+def _random_result(task, model_id: str, rng: random.Random) -> TaskResult:
+    return TaskResult(
+        task_number=task.number,
+        model_id=model_id,
+        response="",
+        rubric_results=[
+            RubricItemResult(
+                item_id=i.id, satisfied=rng.random() < 0.6, confidence=rng.uniform(0.3, 1.0)
+            )
+            for i in task.rubric.positive_items
+        ],
+        negatif_results=[
+            RubricItemResult(item_id=i.id, satisfied=rng.random() < 0.3)
+            for i in task.rubric.negatif_items
+        ],
+        hallucination_details=[
+            HallucinationDetail(
+                claim="c", hallucinated=rng.random() < 0.4, severity=rng.choice(SEVERITIES)
+            )
+            for _ in range(rng.randint(0, 12))
+        ],
+    )
+
+
+def _python_rescore(pairs, task_map, w: Weighting) -> list[float]:
+    scores = []
+    for _run_id, r in pairs:
+        task = task_map[r.task_number]
+        penalty = min(
+            sum(
+                w.severity_penalties[d.severity] for d in r.hallucination_details if d.hallucinated
+            ),
+            task.rubric.total_positive_points,
+        )
+        scores.append(
+            compute_answer_score_with_penalties(
+                task.rubric,
+                r.rubric_results,
+                hallucination_penalty=penalty,
+                negatif_penalty=compute_negatif_penalty(r.negatif_results, task.rubric),
+                dimension_weights=w.dimension_weights,
+                use_confidence=w.use_confidence,
+            )
+        )
+        compute_dimension_scores(task.rubric, r.rubric_results)
+    return scores
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--models", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    tasks = load_tasks()
+    task_map = {t.number: t for t in tasks}
+    pairs = [
+        (f"run{run}", _random_result(task, f"model{m}", rng))
+        for run in range(args.runs)
+        for m in range(args.models)
+        for task in tasks
+    ]
+    weighting = Weighting(dimension_weights={"Substance": 2.0, "Style": 0.5})
+
+    start = time.perf_counter()
+    expected = _python_rescore(pairs, task_map, weighting)
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    arrays = pack_results(pairs, tasks)
+    pack = time.perf_counter() - start
+    start = time.perf_counter()
+    rescored = rescore(arrays, weighting)
+    vectorized = time.perf_counter() - start
+
+    max_diff = max(abs(a - b) for a, b in zip(expected, rescored.answer_scores, strict=True))
+    print(f"{len(pairs)} resultats, {len(arrays.item_points)} criteres")
+    print(f"Boucles Python       : {loop * 1000:8.1f} ms par ponderation")
+    print(f"Empilement (une fois): {pack * 1000:8.1f} ms")
+    print(
+        f"Rejeu vectorise      : {vectorized * 1000:8.1f} ms par ponderation "
+        f"(x{loop / vectorized:.0f}, ecart max {max_diff:.1e})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,22 +2,33 @@
 
 from __future__ import annotations
 
-import asyncio
-import json
 import logging
 import sys
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
+from frenchlaw_bench import config
 from frenchlaw_bench.config import RESULTS_DIR
-from frenchlaw_bench.core.loader import load_tasks
-from frenchlaw_bench.pipeline.runner import run_benchmark
-from frenchlaw_bench.reports.generator import generate_report
 
-console = Console()
+# Chaque commande importe ce dont elle a besoin (pipeline, PyMuPDF, httpx,
+# jinja2, rich) : `flb --help`, `validate` et `compare` demarrent sans eux.
+
+
+class _LazyConsole:
+    """Console rich instanciee au premier affichage."""
+
+    def __init__(self) -> None:
+        self._console = None
+
+    def __getattr__(self, name: str) -> object:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return getattr(self._console, name)
+
+
+console = _LazyConsole()
 
 
 def _score_color(score: float) -> str:
@@ -40,6 +51,110 @@ def _fmt_usd(val: float) -> str:
     return f"${val:.2f}"
 
 
+def _dimension_values(names: tuple[str, ...]) -> tuple[str, ...]:
+    """Valeurs de `Dimension` a partir du nom ou de la valeur (insensible a la casse)."""
+    from frenchlaw_bench.models.enums import Dimension
+
+    by_key = {key.casefold(): d.value for d in Dimension for key in (d.name, d.value)}
+    try:
+        return tuple(by_key[name.strip().casefold()] for name in names)
+    except KeyError as e:
+        raise click.BadParameter(f"Dimension inconnue : {e.args[0]}") from None
+
+
+def _print_cascade(report) -> None:
+    """Appels, cout et accord par niveau du juge en cascade."""
+    from rich.table import Table
+
+    total = report.total
+    console.print(
+        f"Juge en cascade : {report.calls_fast} appels rapides ({_fmt_usd(report.cost_fast_usd)}), "
+        f"{report.calls_strong} appels principaux ({_fmt_usd(report.cost_strong_usd)}) ; "
+        f"{total.escalated}/{total.items} criteres escalades"
+    )
+    table = Table(title="Accord juge rapide / juge principal")
+    table.add_column("Dimension", style="bold")
+    table.add_column("Criteres", justify="right")
+    table.add_column("Escalades", justify="right")
+    table.add_column("Accord (escalades)", justify="right")
+    table.add_column("Calibration", justify="right")
+    table.add_column("Accord (calibration)", justify="right")
+    for dim, tier in [*report.by_dimension.items(), ("Total", total)]:
+        table.add_row(
+            dim,
+            str(tier.items),
+            str(tier.escalated),
+            _fmt_pct(tier.escalated_agreement),
+            str(tier.calibrated),
+            _fmt_pct(tier.calibration_agreement),
+        )
+    console.print(table)
+
+
+def _task_selection_options(f):
+    """Options communes de selection des taches : fichier(s) et filtres appliques a la lecture."""
+    options = [
+        click.option(
+            "--tasks-csv",
+            type=click.Path(exists=True),
+            default=None,
+            help="Chemin CSV taches",
+        ),
+        click.option(
+            "--tasks",
+            "task_shards",
+            multiple=True,
+            help="Shard de taches .csv/.jsonl, dossier ou glob (repetable, lu en flux)",
+        ),
+        click.option("--category", multiple=True, help="Filtrer par categorie (repetable)"),
+        click.option(
+            "--sub-category", multiple=True, help="Filtrer par sous-categorie (repetable)"
+        ),
+        click.option("--task-type", multiple=True, help="Filtrer par type de tache (repetable)"),
+        click.option("--numbers", default=None, help="Numeros de taches, ex : 1-10,15"),
+    ]
+    for option in reversed(options):
+        f = option(f)
+    return f
+
+
+def _select_tasks(
+    tasks_csv: str | None,
+    task_shards: tuple[str, ...],
+    category: tuple[str, ...],
+    sub_category: tuple[str, ...],
+    task_type: tuple[str, ...],
+    numbers: str | None,
+    *,
+    use_cache: bool = True,
+):
+    """Taches du run : liste (CSV unique, bundle en cache) ou `TaskSource` lue en flux.
+
+    La source en flux n'est utilisee que si des shards ou un filtre sont donnes.
+    """
+    from pathlib import Path
+
+    from frenchlaw_bench.core.loader import load_tasks
+    from frenchlaw_bench.core.sources import TaskFilter, TaskSource
+
+    try:
+        task_filter = TaskFilter.from_options(category, sub_category, task_type, numbers)
+    except ValueError as e:
+        raise click.UsageError(str(e)) from e
+
+    csv_path = Path(tasks_csv) if tasks_csv else None
+    if not task_shards and not task_filter.active:
+        return load_tasks(csv_path, use_cache=use_cache)
+
+    paths = list(task_shards)
+    if csv_path is not None or not paths:
+        paths.insert(0, csv_path or config.DATA_DIR / "core" / "tasks.csv")
+    try:
+        return TaskSource.from_paths(paths, task_filter)
+    except (FileNotFoundError, ValueError) as e:
+        raise click.UsageError(str(e)) from e
+
+
 @click.group()
 @click.option("--verbose", "-v", is_flag=True, help="Activer les logs detailles")
 def main(verbose: bool) -> None:
@@ -54,32 +169,229 @@ def main(verbose: bool) -> None:
 
 @main.command()
 @click.option("--model", "-m", multiple=True, required=True, help="ID du modele OpenRouter")
-@click.option("--tasks-csv", type=click.Path(exists=True), default=None, help="Chemin CSV taches")
+@_task_selection_options
 @click.option("--max-concurrent", "-c", type=int, default=5, help="Concurrence max")
 @click.option("--output-dir", "-o", type=click.Path(), default=None, help="Dossier de sortie")
-@click.option("--judge-model", "-j", type=str, default=None, help="Modele juge (defaut: JUDGE_MODEL env)")
+@click.option(
+    "--judge-model", "-j", type=str, default=None, help="Modele juge (defaut: JUDGE_MODEL env)"
+)
 @click.option("--provider", "-p", type=str, default=None, help="Provider OpenRouter (ex: Cerebras)")
 @click.option("--quantization", "-q", type=str, default=None, help="Quantization (ex: fp16, int8)")
+@click.option(
+    "--claim-extraction",
+    type=click.Choice(["llm", "citations", "hybrid"]),
+    default="llm",
+    help="Extraction des claims : LLM, citations deterministes, ou hybride",
+)
+@click.option(
+    "--retrieval-k",
+    type=int,
+    default=5,
+    help="Passages documentaires par claim a verifier (0 = dossier complet)",
+)
+@click.option(
+    "--retrieval-budget",
+    type=int,
+    default=1500,
+    help="Budget de tokens du contexte documentaire par claim",
+)
+@click.option(
+    "--combined-extraction",
+    is_flag=True,
+    default=False,
+    help="Source Score calcule dans l'appel d'extraction des claims (un appel de moins)",
+)
+@click.option(
+    "--max-cost-usd",
+    type=float,
+    default=None,
+    help="Plafond de cout (USD) : au-dela, plus aucune nouvelle tache n'est lancee",
+)
+@click.option(
+    "--schedule",
+    type=click.Choice(["lpt", "csv"]),
+    default="lpt",
+    help="Ordre de lancement : lpt = plus longues d'abord (historique), csv = ordre du fichier",
+)
+@click.option(
+    "--compress",
+    type=click.Choice(["none", "gzip", "zstd"]),
+    default="none",
+    help="Compression de results.json (zstd requiert l'extra [zstd])",
+)
+@click.option(
+    "--report-mode",
+    type=click.Choice(["auto", "single", "paged"]),
+    default="auto",
+    help="Rapport HTML : complet, pagine (details charges a la demande) ou auto selon la taille",
+)
+@click.option(
+    "--samples",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Reponses generees par tache (parametre n de l'API si supporte)",
+)
+@click.option(
+    "--sample-temperature",
+    type=float,
+    default=None,
+    help="Temperature du sujet quand --samples > 1 (defaut 0.7)",
+)
+@click.option(
+    "--reuse-judgments",
+    type=click.Choice(["off", "exact", "near"]),
+    default="off",
+    help="Reprendre les verdicts d'une reponse deja jugee : identique, ou quasi identique (MinHash)",
+)
+@click.option(
+    "--reuse-threshold",
+    type=click.FloatRange(0.0, 1.0),
+    default=0.9,
+    help="Similarite minimale d'une reprise en mode near",
+)
+@click.option(
+    "--fast-judge-model",
+    type=str,
+    default=None,
+    help="Juge rapide de premier niveau : le juge principal ne rejuge que les verdicts incertains",
+)
+@click.option(
+    "--escalation-threshold",
+    type=click.FloatRange(0.0, 1.0),
+    default=0.8,
+    help="Confiance sous laquelle un verdict du juge rapide est rejuge",
+)
+@click.option(
+    "--escalate-dimension",
+    "escalate_dimensions",
+    multiple=True,
+    help="Dimension toujours rejugee par le juge principal, ex : Substance (repetable)",
+)
+@click.option(
+    "--calibration-rate",
+    type=click.FloatRange(0.0, 1.0),
+    default=0.05,
+    help="Fraction des autres criteres rejugee pour mesurer l'accord entre juges",
+)
+@click.option(
+    "--judge-votes",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Verdicts au plus par critere, vote majoritaire avec arret anticipe (impair conseille)",
+)
+@click.option(
+    "--vote-temperature",
+    type=click.FloatRange(0.0, 2.0),
+    default=0.7,
+    help="Temperature du juge pour les votes",
+)
+@click.option(
+    "--vote-stop-confidence",
+    type=click.FloatRange(0.0, 1.0),
+    default=0.9,
+    help="Confiance de deux premiers votes concordants suffisant a arreter le vote",
+)
+@click.option(
+    "--rules/--no-rules",
+    default=True,
+    help="Trancher localement les criteres dont la regle {{...}} est concluante (defaut: oui)",
+)
+@click.option(
+    "--judge-output",
+    type=click.Choice(["verbatim", "spans"]),
+    default="verbatim",
+    help="Sortie du juge : preuves recopiees et justification, ou numeros de phrases seulement",
+)
 def run(
     model: tuple[str, ...],
     tasks_csv: str | None,
+    task_shards: tuple[str, ...],
+    category: tuple[str, ...],
+    sub_category: tuple[str, ...],
+    task_type: tuple[str, ...],
+    numbers: str | None,
     max_concurrent: int,
     output_dir: str | None,
     judge_model: str | None,
     provider: str | None,
     quantization: str | None,
+    claim_extraction: str,
+    retrieval_k: int,
+    retrieval_budget: int,
+    combined_extraction: bool,
+    max_cost_usd: float | None,
+    schedule: str,
+    compress: str,
+    report_mode: str,
+    samples: int,
+    sample_temperature: float | None,
+    reuse_judgments: str,
+    reuse_threshold: float,
+    fast_judge_model: str | None,
+    escalation_threshold: float,
+    escalate_dimensions: tuple[str, ...],
+    calibration_rate: float,
+    judge_votes: int,
+    vote_temperature: float,
+    vote_stop_confidence: float,
+    rules: bool,
+    judge_output: str,
 ) -> None:
     """Executer le benchmark sur un ou plusieurs modeles."""
+    import asyncio
     from pathlib import Path
 
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from frenchlaw_bench.pipeline.history import HISTORY_FILENAME, load_history
+    from frenchlaw_bench.pipeline.runner import (
+        DEFAULT_SAMPLE_TEMPERATURE,
+        EvaluationOptions,
+        run_benchmark,
+    )
+    from frenchlaw_bench.reports.generator import generate_report
+
+    if sample_temperature is None:
+        sample_temperature = DEFAULT_SAMPLE_TEMPERATURE
+    if escalate_dimensions and not fast_judge_model:
+        raise click.UsageError("--escalate-dimension requiert --fast-judge-model")
+    escalate_dimensions = _dimension_values(escalate_dimensions)
+    if combined_extraction and claim_extraction == "citations":
+        raise click.UsageError("--combined-extraction requiert --claim-extraction llm ou hybrid")
+
     csv_path = Path(tasks_csv) if tasks_csv else None
-    tasks = load_tasks(csv_path)
-    console.print(f"[bold]{len(tasks)}[/bold] taches chargees")
+    tasks = _select_tasks(tasks_csv, task_shards, category, sub_category, task_type, numbers)
+    if isinstance(tasks, list):
+        console.print(f"[bold]{len(tasks)}[/bold] taches chargees")
+    else:
+        console.print(
+            f"Taches lues en flux : [bold]{len(tasks.shards)}[/bold] shard(s)"
+            + (" (filtrees)" if tasks.task_filter.active else "")
+        )
     console.print(f"Modeles : {', '.join(model)}")
     if provider:
         console.print(f"Provider : {provider}" + (f" ({quantization})" if quantization else ""))
     if judge_model:
         console.print(f"Juge : {judge_model}")
+    if fast_judge_model:
+        console.print(
+            f"Juge rapide : {fast_judge_model} (escalade sous {escalation_threshold:.0%} de "
+            f"confiance"
+            + (f", {', '.join(escalate_dimensions)}" if escalate_dimensions else "")
+            + ")"
+        )
+    if max_cost_usd is not None:
+        console.print(f"Budget : {_fmt_usd(max_cost_usd)}")
+    if samples > 1:
+        console.print(f"Echantillons : {samples} par tache (temperature {sample_temperature})")
+    if judge_votes > 1:
+        console.print(
+            f"Vote du juge : {judge_votes} verdicts au plus par critere "
+            f"(temperature {vote_temperature})"
+        )
+
+    history = load_history(RESULTS_DIR)
 
     benchmark_run = asyncio.run(
         run_benchmark(
@@ -90,22 +402,73 @@ def run(
             judge_model=judge_model,
             provider=provider,
             quantization=quantization,
+            options=EvaluationOptions(
+                claim_extraction=claim_extraction,
+                retrieval_k=retrieval_k,
+                retrieval_token_budget=retrieval_budget,
+                combined_extraction=combined_extraction,
+                samples=samples,
+                sample_temperature=sample_temperature,
+                reuse_judgments=reuse_judgments,
+                reuse_threshold=reuse_threshold,
+                fast_judge_model=fast_judge_model,
+                escalation_threshold=escalation_threshold,
+                escalate_dimensions=escalate_dimensions,
+                calibration_rate=calibration_rate if fast_judge_model else 0.0,
+                judge_votes=judge_votes,
+                vote_temperature=vote_temperature,
+                vote_stop_confidence=vote_stop_confidence,
+                rules=rules,
+                judge_output=judge_output,
+            ),
+            max_cost_usd=max_cost_usd,
+            history=history,
+            schedule=schedule,
         )
     )
 
+    history.update(benchmark_run.task_results)
+    history.save(RESULTS_DIR / HISTORY_FILENAME)
+
     out_dir = Path(output_dir) if output_dir else None
-    report_path = generate_report(benchmark_run, out_dir)
-    console.print(f"\n[green]Rapport genere :[/green] {report_path}")
+    report = generate_report(benchmark_run, out_dir, compression=compress, mode=report_mode)
+
+    from frenchlaw_bench.reports.run_store import RunStore
+
+    with RunStore.open(RESULTS_DIR) as run_store:
+        run_store.add_run(benchmark_run)
+    layout = f"pagine, {report.n_shards} shards, " if report.paged else ""
+    console.print(
+        f"\n[green]Rapport genere :[/green] {report.html_path} ({layout}{report.seconds:.2f}s)"
+    )
 
     # === Resume global ===
     meta = benchmark_run.metadata
-    console.print(Panel(
-        f"Run ID: [bold]{benchmark_run.run_id}[/bold]\n"
-        f"Duree totale: [bold]{meta.duration_seconds:.1f}s[/bold]\n"
-        f"Taches: {meta.n_tasks} | Modeles: {', '.join(meta.subject_models)}\n"
-        f"Juge: {meta.judge_model}",
-        title="FrenchLaw Bench v0.2.0",
-    ))
+    console.print(
+        Panel(
+            f"Run ID: [bold]{benchmark_run.run_id}[/bold]\n"
+            f"Duree totale: [bold]{meta.duration_seconds:.1f}s[/bold]\n"
+            f"Makespan ({meta.schedule}): [bold]{meta.makespan_seconds:.1f}s[/bold] "
+            f"(attendu {meta.expected_makespan_seconds:.0f}s, "
+            f"ordre CSV attendu {meta.expected_csv_makespan_seconds:.0f}s)\n"
+            f"Taches: {meta.n_tasks} | Modeles: {', '.join(meta.subject_models)}\n"
+            f"Juge: {meta.judge_model}\n"
+            f"Cout reel (sujet + juge): [bold]{_fmt_usd(meta.cost_spent_usd)}[/bold]",
+            title="FrenchLaw Bench v0.2.0",
+        )
+    )
+    for model_id, ps in meta.parse_stats.items():
+        if ps["parse_failures"]:
+            console.print(
+                f"[yellow]JSON illisible ({model_id}) : {ps['parse_failures']}/{ps['calls']} "
+                f"reponses ({_fmt_pct(ps['failure_rate'])}), {ps['repaired']} reparee(s), "
+                f"{ps['unrecovered']} perdue(s)[/yellow]"
+            )
+    if meta.budget_exhausted:
+        console.print(
+            f"[yellow]Budget de {_fmt_usd(meta.max_cost_usd or 0)} atteint : "
+            f"{meta.n_tasks_skipped} tache(s) non lancee(s)[/yellow]"
+        )
 
     # === Tableau principal par modele ===
     table = Table(title="Resultats par modele")
@@ -140,6 +503,46 @@ def run(
 
     console.print(table)
 
+    for agg in benchmark_run.aggregates:
+        if agg.judgments_reused_exact or agg.judgments_reused_near:
+            console.print(
+                f"{agg.model_id} : verdicts repris pour {agg.judgments_reused_exact} reponse(s) "
+                f"identique(s) et {agg.judgments_reused_near} quasi identique(s)"
+            )
+    ruled = sum(
+        v.judge_tier == "rule"
+        for r in benchmark_run.task_results
+        if r.judgment_reuse is None
+        for v in r.rubric_results + r.negatif_results
+    )
+    if ruled:
+        console.print(f"Regles : {ruled} critere(s) tranche(s) sans appel au juge")
+    for judge_id, vs in meta.verdict_stats.items():
+        console.print(
+            f"Verdicts ({judge_id}, sortie {meta.judge_output}) : {vs['calls']} appels, "
+            f"{vs['output_tokens_per_call']:.0f} tokens de sortie et "
+            f"{vs['latency_per_call']:.1f}s par appel"
+        )
+    if meta.judge_cascade:
+        _print_cascade(meta.judge_cascade)
+    votes = meta.self_consistency
+    if votes and votes.items:
+        console.print(
+            f"Vote du juge : {votes.votes_per_item:.2f} votes par critere en moyenne "
+            f"(au plus {votes.max_votes}) ; {votes.stopped_early}/{votes.items} criteres acquis "
+            f"avant le dernier vote, {votes.split} aux votes partages"
+        )
+    if meta.samples_per_task > 1:
+        for agg in benchmark_run.aggregates:
+            if agg.within_task_variance is None:
+                continue
+            console.print(
+                f"{agg.model_id} : {agg.samples_per_task:.1f} echantillons/tache, "
+                f"variance intra-tache {agg.within_task_variance:.4f}, "
+                f"inter-taches {agg.between_task_variance:.4f} "
+                "(IC par bootstrap hierarchique)"
+            )
+
     # === Scores par dimension ===
     for agg in benchmark_run.aggregates:
         if agg.answer_score_by_dimension:
@@ -181,9 +584,14 @@ def run(
         r_table = Table(title=f"Criteres rubric — {agg.model_id}")
         r_table.add_column("Metrique", style="bold")
         r_table.add_column("Valeur", justify="right")
-        r_table.add_row("Criteres satisfaits", f"{agg.rubric_items_satisfied_total}/{agg.rubric_items_total}")
+        r_table.add_row(
+            "Criteres satisfaits", f"{agg.rubric_items_satisfied_total}/{agg.rubric_items_total}"
+        )
         r_table.add_row("Taux satisfaction", _fmt_pct(agg.rubric_satisfaction_rate))
-        r_table.add_row("Items negatifs declenches", f"{agg.negatif_items_triggered_total}/{agg.negatif_items_total}")
+        r_table.add_row(
+            "Items negatifs declenches",
+            f"{agg.negatif_items_triggered_total}/{agg.negatif_items_total}",
+        )
         console.print(r_table)
 
     # === Detail par tache ===
@@ -201,9 +609,14 @@ def run(
     for r in sorted(benchmark_run.task_results, key=lambda x: (x.model_id, x.task_number)):
         if r.error:
             detail_table.add_row(
-                str(r.task_number), r.task_title[:40], r.model_id,
-                "—", "—", "—",
-                f"{r.latency_seconds:.1f}s", "—",
+                str(r.task_number),
+                r.task_title[:40],
+                r.model_id,
+                "—",
+                "—",
+                "—",
+                f"{r.latency_seconds:.1f}s",
+                "—",
                 f"[red]ECHEC[/red]",
             )
         else:
@@ -223,10 +636,263 @@ def run(
     console.print(detail_table)
 
 
+@main.command()
+@click.option("--model", "-m", multiple=True, required=True, help="ID du modele OpenRouter")
+@_task_selection_options
+@click.option("--max-concurrent", "-c", type=int, default=5, help="Concurrence max")
+@click.option(
+    "--judge-model", "-j", type=str, default=None, help="Modele juge (defaut: JUDGE_MODEL env)"
+)
+@click.option(
+    "--claim-extraction",
+    type=click.Choice(["llm", "citations", "hybrid"]),
+    default="llm",
+)
+@click.option("--retrieval-k", type=int, default=5)
+@click.option("--retrieval-budget", type=int, default=1500)
+@click.option("--combined-extraction", is_flag=True, default=False)
+@click.option(
+    "--samples",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Reponses generees par tache (comme flb run --samples)",
+)
+@click.option(
+    "--n-param/--no-n-param",
+    default=True,
+    help="Le provider accepte le parametre n : un appel sujet pour tous les echantillons",
+)
+def plan(
+    model: tuple[str, ...],
+    tasks_csv: str | None,
+    task_shards: tuple[str, ...],
+    category: tuple[str, ...],
+    sub_category: tuple[str, ...],
+    task_type: tuple[str, ...],
+    numbers: str | None,
+    max_concurrent: int,
+    judge_model: str | None,
+    claim_extraction: str,
+    retrieval_k: int,
+    retrieval_budget: int,
+    combined_extraction: bool,
+    samples: int,
+    n_param: bool,
+) -> None:
+    """Estimer appels, tokens, cout et duree d'un run avant de le lancer."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from frenchlaw_bench.pipeline.planner import plan_run, run_wall_seconds
+    from frenchlaw_bench.pipeline.runner import EvaluationOptions
+
+    tasks = _select_tasks(tasks_csv, task_shards, category, sub_category, task_type, numbers)
+    effective_judge = judge_model or config.JUDGE_MODEL
+    plans = plan_run(
+        tasks,
+        list(model),
+        effective_judge,
+        max_concurrent,
+        EvaluationOptions(
+            claim_extraction=claim_extraction,
+            retrieval_k=retrieval_k,
+            retrieval_token_budget=retrieval_budget,
+            combined_extraction=combined_extraction,
+            samples=samples,
+        ),
+        results_dir=RESULTS_DIR,
+        supports_n=n_param,
+    )
+
+    n_tasks = len(plans[0].task_seconds) if plans else 0
+    console.print(f"[bold]{n_tasks}[/bold] taches | Juge : {effective_judge}")
+    if samples > 1:
+        console.print(f"Echantillons : {samples} par tache")
+    for p in plans:
+        table = Table(title=f"Plan — {p.model_id}" + (" (historique)" if p.from_history else ""))
+        table.add_column("Etape", style="bold")
+        table.add_column("Appels", justify="right")
+        table.add_column("Tokens in", justify="right")
+        table.add_column("Tokens out", justify="right")
+        table.add_column("Cout", justify="right")
+        for st in p.stages:
+            table.add_row(
+                st.stage,
+                str(st.calls),
+                f"{st.input_tokens:,}",
+                f"{st.output_tokens:,}",
+                _fmt_usd(st.cost_usd),
+            )
+        table.add_row(
+            "[bold]Total[/bold]",
+            str(p.calls),
+            f"{p.input_tokens:,}",
+            f"{p.output_tokens:,}",
+            f"[bold]{_fmt_usd(p.cost_usd)}[/bold]",
+        )
+        console.print(table)
+        console.print(f"Duree estimee : [bold]{p.wall_seconds / 60:.1f} min[/bold]")
+
+    total_cost = sum(p.cost_usd for p in plans)
+    total_wall = run_wall_seconds(plans, max_concurrent)
+    console.print(
+        Panel(
+            f"Cout total estime : [bold]{_fmt_usd(total_cost)}[/bold]\n"
+            f"Duree totale estimee : [bold]{total_wall / 60:.1f} min[/bold]",
+            title="Plan du run",
+        )
+    )
+
+
+@main.group()
+def workflow() -> None:
+    """FLB-Workflows : taches composites multi-etapes."""
+
+
+@workflow.command("run")
+@click.argument("name", type=click.Choice(["cession_actions"]))
+@click.option("--model", "-m", multiple=True, required=True, help="ID du modele OpenRouter")
+@click.option(
+    "--judge-model", "-j", type=str, default=None, help="Modele juge (defaut: JUDGE_MODEL env)"
+)
+@click.option(
+    "--ground-truth",
+    type=click.Path(exists=True),
+    default=None,
+    help="CSV de ground truth",
+)
+@click.option(
+    "--documents-dir",
+    type=click.Path(exists=True, file_okay=False),
+    default=None,
+    help="Dossier des documents (PDF ou texte)",
+)
+@click.option("--output-dir", "-o", type=click.Path(), default=None, help="Dossier des checkpoints")
+@click.option("--extraction-concurrency", type=int, default=4, help="Extractions simultanees")
+@click.option("--scoring-concurrency", type=int, default=4, help="Documents scores simultanement")
+@click.option(
+    "--judge-mode",
+    type=click.Choice(["concurrent", "batch"]),
+    default="concurrent",
+    help="Un appel juge par champ (en parallele) ou un seul appel par document",
+)
+@click.option(
+    "--resume/--no-resume",
+    default=True,
+    help="Reprendre depuis le checkpoint (documents deja scores ignores)",
+)
+@click.option(
+    "--chunk-tokens",
+    type=int,
+    default=None,
+    help="Extraction par morceaux au-dela de N tokens (actes longs ; defaut: document entier)",
+)
+def workflow_run(
+    name: str,
+    model: tuple[str, ...],
+    judge_model: str | None,
+    ground_truth: str | None,
+    documents_dir: str | None,
+    output_dir: str | None,
+    extraction_concurrency: int,
+    scoring_concurrency: int,
+    judge_mode: str,
+    resume: bool,
+    chunk_tokens: int | None,
+) -> None:
+    """Extraire et scorer les deal points d'un portefeuille de documents."""
+    import asyncio
+    from pathlib import Path
+
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from frenchlaw_bench.llm.openrouter import OpenRouterClient
+    from frenchlaw_bench.workflows.cession_actions.loader import load_ground_truth
+    from frenchlaw_bench.workflows.cession_actions.runner import DOCUMENTS_DIR, run_workflow
+
+    entries = load_ground_truth(Path(ground_truth) if ground_truth else None)
+    docs_dir = Path(documents_dir) if documents_dir else DOCUMENTS_DIR
+    out = Path(output_dir) if output_dir else RESULTS_DIR / "workflows" / name
+    effective_judge = judge_model or config.JUDGE_MODEL
+    console.print(f"[bold]{len(entries)}[/bold] documents | Juge : {effective_judge}")
+
+    async def _run(model_id: str):
+        subject = OpenRouterClient(model=model_id)
+        judge = OpenRouterClient(model=effective_judge)
+        try:
+            return await run_workflow(
+                entries,
+                subject,
+                judge,
+                checkpoint_path=out / f"{model_id.replace('/', '__')}.jsonl",
+                documents_dir=docs_dir,
+                extraction_concurrency=extraction_concurrency,
+                scoring_concurrency=scoring_concurrency,
+                judge_mode=judge_mode,
+                resume=resume,
+                chunk_tokens=chunk_tokens,
+            )
+        finally:
+            await subject.close()
+            await judge.close()
+
+    for model_id in model:
+        summary = asyncio.run(_run(model_id))
+
+        table = Table(title=f"{name} — {model_id}")
+        table.add_column("Champ", style="bold")
+        table.add_column("N", justify="right")
+        table.add_column("Precision", justify="right")
+        table.add_column("IC 95%", justify="right")
+        for fa in sorted(summary.fields, key=lambda f: f.accuracy):
+            color = _score_color(fa.accuracy)
+            table.add_row(
+                fa.field,
+                str(fa.n),
+                f"[{color}]{_fmt_pct(fa.accuracy)}[/{color}]",
+                f"[{_fmt_pct(fa.ci_lower)} – {_fmt_pct(fa.ci_upper)}]",
+            )
+        console.print(table)
+
+        avoided = ", ".join(f"{k} {_fmt_pct(v)}" for k, v in summary.calls_avoided.items() if v > 0)
+        low, high = summary.accuracy_ci
+        console.print(
+            Panel(
+                f"Precision: [bold]{_fmt_pct(summary.accuracy)}[/bold] "
+                f"[{_fmt_pct(low)} – {_fmt_pct(high)}]\n"
+                f"Documents: {summary.n_scored} scores, {summary.n_errors} en erreur, "
+                f"{summary.n_resumed} repris du checkpoint\n"
+                f"Debit: [bold]{summary.docs_per_minute:.1f} docs/min[/bold] "
+                f"({summary.duration_seconds:.1f}s)\n"
+                f"Appels juge: {summary.judge_calls}"
+                + (
+                    f"\nMorceaux extraits: {summary.chunks} ({summary.tie_breaks} departage(s) LLM)"
+                    if summary.chunks > summary.n_scored
+                    else ""
+                )
+                + (f"\nAppels evites par normalisation: {avoided}" if avoided else "")
+                + "".join(
+                    f"\nJSON illisible ({m}): {_fmt_pct(ps['failure_rate'])}, "
+                    f"{ps['repaired']} reparee(s), {ps['unrecovered']} perdue(s)"
+                    for m, ps in summary.parse_stats.items()
+                    if ps["parse_failures"]
+                )
+                + f"\nCheckpoint: {summary.checkpoint_path}",
+                title=f"Workflow {name}",
+            )
+        )
+
+
 @main.command()
 @click.argument("run_ids", nargs=-1, required=True)
 def compare(run_ids: tuple[str, ...]) -> None:
     """Comparer les resultats de plusieurs runs."""
+    from rich.table import Table
+
+    from frenchlaw_bench.reports.results_io import find_results
+    from frenchlaw_bench.reports.run_store import RunStore
+
     table = Table(title="Comparaison de runs")
     table.add_column("Run ID", style="bold")
     table.add_column("Modele")
@@ -237,41 +903,472 @@ def compare(run_ids: tuple[str, ...]) -> None:
     table.add_column("Cout", justify="right")
     table.add_column("Duree", justify="right")
 
-    for run_id in run_ids:
-        results_path = RESULTS_DIR / run_id / "results.json"
-        if not results_path.exists():
-            console.print(f"[red]Run {run_id} introuvable[/red]")
-            continue
-
-        data = json.loads(results_path.read_text())
-        duration = data.get("metadata", {}).get("duration_seconds", 0)
-        for agg in data.get("aggregates", []):
-            table.add_row(
-                run_id,
-                agg["model_id"],
-                f"{agg['answer_score_mean'] * 100:.1f}%",
-                f"[{agg.get('answer_score_ci_lower', 0) * 100:.1f}% - {agg.get('answer_score_ci_upper', 0) * 100:.1f}%]",
-                f"{agg.get('hallucination_rate_mean', 0) * 100:.1f}%" if agg.get("hallucination_rate_mean") else "—",
-                str(agg["total_tasks"]),
-                _fmt_usd(agg.get("cost_total_usd", 0)),
-                f"{duration:.0f}s",
+    with RunStore.open(RESULTS_DIR) as store:
+        found: list[str] = []
+        for run_id in run_ids:
+            if not store.has_run(run_id):
+                # Run anterieur au store : indexe au passage (en-tete + resultats en flux)
+                results_path = find_results(RESULTS_DIR / run_id)
+                if results_path is None:
+                    console.print(f"[red]Run {run_id} introuvable[/red]")
+                    continue
+                store.import_file(results_path)
+            found.append(run_id)
+        rows = store.compare(found)
+
+    for row in rows:
+        table.add_row(
+            row.run_id,
+            row.model_id,
+            f"{row.answer_score_mean * 100:.1f}%",
+            f"[{row.answer_score_ci_lower * 100:.1f}% - {row.answer_score_ci_upper * 100:.1f}%]",
+            _fmt_pct(row.hallucination_rate_mean) if row.hallucination_rate_mean else "—",
+            str(row.total_tasks),
+            _fmt_usd(row.cost_total_usd or 0),
+            f"{row.duration_seconds or 0:.0f}s",
+        )
+
+    console.print(table)
+
+
+@main.group()
+def store() -> None:
+    """Index SQLite des runs (results/runs.sqlite) : import, classement, tendances."""
+
+
+@store.command("import")
+@click.option(
+    "--results-dir",
+    type=click.Path(exists=True, file_okay=False),
+    default=None,
+    help="Dossier des runs (defaut: results/)",
+)
+@click.option("--force", is_flag=True, default=False, help="Reimporter les runs deja indexes")
+def store_import(results_dir: str | None, force: bool) -> None:
+    """Indexer les repertoires de resultats existants."""
+    from pathlib import Path
+
+    from frenchlaw_bench.reports.run_store import RunStore
+
+    source = Path(results_dir) if results_dir else RESULTS_DIR
+    with RunStore.open(RESULTS_DIR) as run_store:
+        imported = run_store.import_results_dir(source, force=force)
+    console.print(f"[green]{len(imported)} run(s) importe(s)[/green] dans {RESULTS_DIR}")
+
+
+@store.command("leaderboard")
+@click.option("--task", "task_number", type=int, default=None, help="Restreindre a une tache")
+@click.option("--last", "last_runs", type=int, default=None, help="N derniers runs seulement")
+def store_leaderboard(task_number: int | None, last_runs: int | None) -> None:
+    """Classement des modeles (score moyen et meilleur score)."""
+    from rich.table import Table
+
+    from frenchlaw_bench.reports.run_store import RunStore
+
+    with RunStore.open(RESULTS_DIR) as run_store:
+        entries = run_store.leaderboard(task_number=task_number, last_runs=last_runs)
+
+    scope = f"tache {task_number}" if task_number is not None else "toutes taches"
+    window = f", {last_runs} derniers runs" if last_runs else ""
+    table = Table(title=f"Classement ({scope}{window})")
+    table.add_column("#", justify="right")
+    table.add_column("Modele", style="bold")
+    table.add_column("Score moyen", justify="right")
+    table.add_column("Meilleur", justify="right")
+    table.add_column("Resultats", justify="right")
+    table.add_column("Runs", justify="right")
+    table.add_column("Cout", justify="right")
+    for rank, e in enumerate(entries, 1):
+        color = _score_color(e.mean_score)
+        table.add_row(
+            str(rank),
+            e.model_id,
+            f"[{color}]{_fmt_pct(e.mean_score)}[/{color}]",
+            _fmt_pct(e.best_score),
+            str(e.n_results),
+            str(e.n_runs),
+            _fmt_usd(e.cost_usd or 0),
+        )
+    console.print(table)
+
+
+@store.command("trend")
+@click.option("--model", "-m", required=True, help="ID du modele")
+@click.option("--task", "task_number", type=int, default=None, help="Restreindre a une tache")
+@click.option("--last", "last_runs", type=int, default=None, help="N derniers runs seulement")
+def store_trend(model: str, task_number: int | None, last_runs: int | None) -> None:
+    """Evolution du score d'un modele au fil des runs."""
+    from rich.table import Table
+
+    from frenchlaw_bench.reports.run_store import RunStore
+
+    with RunStore.open(RESULTS_DIR) as run_store:
+        points = run_store.trend(model, task_number=task_number, last_runs=last_runs)
+
+    table = Table(title=f"Tendance — {model}")
+    table.add_column("Date")
+    table.add_column("Run ID", style="bold")
+    table.add_column("Score", justify="right")
+    table.add_column("Resultats", justify="right")
+    for p in points:
+        color = _score_color(p.mean_score)
+        table.add_row(
+            p.timestamp[:16].replace("T", " "),
+            p.run_id,
+            f"[{color}]{_fmt_pct(p.mean_score)}[/{color}]",
+            str(p.n_results),
+        )
+    console.print(table)
+
+
+@main.command()
+@click.option(
+    "--weight",
+    "weights",
+    multiple=True,
+    help="Poids d'une dimension, ex : Substance=2 (repetable)",
+)
+@click.option(
+    "--severity",
+    "severities",
+    multiple=True,
+    help="Penalite d'une severite d'hallucination, ex : critical=3 (repetable)",
+)
+@click.option(
+    "--confidence/--no-confidence",
+    default=True,
+    help="Moduler les points gagnes par la confiance du juge",
+)
+@click.option("--run", "run_ids", multiple=True, help="Restreindre a ces runs (repetable)")
+@click.option("--last", "last_runs", type=int, default=None, help="N derniers runs seulement")
+@click.option(
+    "--by",
+    "breakdown",
+    type=click.Choice(["category", "sub-category", "task-type", "dimension"]),
+    default=None,
+    help="Detail par categorie, sous-categorie, type de tache ou dimension",
+)
+@click.option("--tasks-csv", type=click.Path(exists=True), default=None, help="Chemin CSV taches")
+def reweight(
+    weights: tuple[str, ...],
+    severities: tuple[str, ...],
+    confidence: bool,
+    run_ids: tuple[str, ...],
+    last_runs: int | None,
+    breakdown: str | None,
+    tasks_csv: str | None,
+) -> None:
+    """Rejouer le scoring des runs indexes avec une autre ponderation (extra [analysis])."""
+    import time
+    from pathlib import Path
+
+    from rich.table import Table
+
+    from frenchlaw_bench.core.loader import load_tasks
+    from frenchlaw_bench.reports.run_store import RunStore
+
+    try:
+        from frenchlaw_bench.scoring import vectorized
+    except ImportError as e:
+        raise click.ClickException(str(e)) from e
+
+    try:
+        weighting = vectorized.Weighting(use_confidence=confidence)
+        weighting.dimension_weights.update(
+            vectorized.parse_overrides(weights, vectorized.DIMENSIONS)
+        )
+        weighting.severity_penalties.update(
+            vectorized.parse_overrides(severities, vectorized.SEVERITIES)
+        )
+    except ValueError as e:
+        raise click.UsageError(str(e)) from e
+
+    tasks = load_tasks(Path(tasks_csv) if tasks_csv else None)
+    with RunStore.open(RESULTS_DIR) as run_store:
+        rows = run_store.scoring_rows(run_ids=list(run_ids) or None, last_runs=last_runs)
+    arrays = vectorized.pack_store_rows(*rows, tasks)
+    if not arrays.n_results:
+        console.print("[yellow]Aucun resultat indexe (voir flb store import)[/yellow]")
+        return
+
+    start = time.perf_counter()
+    rescored = vectorized.rescore(arrays, weighting)
+    elapsed = time.perf_counter() - start
+
+    table = Table(title="Scores rejoues par run et par modele")
+    table.add_column("Run", style="dim")
+    table.add_column("Modele", style="bold")
+    table.add_column("Resultats", justify="right")
+    table.add_column("Score stocke", justify="right")
+    table.add_column("Score rejoue", justify="right")
+    table.add_column("Ecart", justify="right")
+    for g in rescored.groups:
+        color = _score_color(g.answer_score_mean)
+        table.add_row(
+            g.run_id,
+            g.model_id,
+            str(g.n_results),
+            _fmt_pct(g.stored_score_mean),
+            f"[{color}]{_fmt_pct(g.answer_score_mean)}[/{color}]",
+            f"{g.delta * 100:+.1f} pts",
+        )
+    console.print(table)
+
+    if breakdown:
+        attr = "by_" + breakdown.replace("-", "_")
+        labels = sorted({k for g in rescored.groups for k in getattr(g, attr)})
+        detail = Table(title=f"Scores rejoues par {breakdown}")
+        detail.add_column("Run", style="dim")
+        detail.add_column("Modele", style="bold")
+        for label in labels:
+            detail.add_column(label[:20], justify="right")
+        for g in rescored.groups:
+            values = getattr(g, attr)
+            detail.add_row(g.run_id, g.model_id, *(_fmt_pct(values.get(label)) for label in labels))
+        console.print(detail)
+
+    console.print(
+        f"{arrays.n_results} resultats, {len(arrays.item_points)} criteres rejoues "
+        f"en {elapsed * 1000:.1f} ms"
+    )
+
+
+@main.command()
+@click.argument("run_id")
+@click.option(
+    "--incremental/--full",
+    default=True,
+    help="Rejuger seulement les criteres ajoutes ou modifies (defaut) ou tous les criteres",
+)
+@click.option("--tasks-csv", type=click.Path(exists=True), default=None, help="Chemin CSV taches")
+@click.option(
+    "--judge-model", "-j", type=str, default=None, help="Modele juge (defaut: celui du run)"
+)
+@click.option("--max-concurrent", "-c", type=int, default=5, help="Resultats rejuges simultanement")
+@click.option("--dry-run", is_flag=True, default=False, help="Lister les criteres sans rejuger")
+@click.option(
+    "--compress",
+    type=click.Choice(["none", "gzip", "zstd"]),
+    default="none",
+    help="Compression de results.json (zstd requiert l'extra [zstd])",
+)
+def rescore(
+    run_id: str,
+    incremental: bool,
+    tasks_csv: str | None,
+    judge_model: str | None,
+    max_concurrent: int,
+    dry_run: bool,
+    compress: str,
+) -> None:
+    """Rescorer un run apres modification des rubrics, sans rappeler les modeles sujets."""
+    import asyncio
+    from pathlib import Path
+
+    from rich.table import Table
+
+    from frenchlaw_bench.core.bundle import file_sha256
+    from frenchlaw_bench.core.loader import load_tasks
+    from frenchlaw_bench.llm.openrouter import OpenRouterClient
+    from frenchlaw_bench.pipeline.rescore import diff_run, rescore_run
+    from frenchlaw_bench.reports.generator import generate_report
+    from frenchlaw_bench.reports.results_io import find_results, load_run
+    from frenchlaw_bench.reports.run_store import RunStore
+
+    results_path = find_results(RESULTS_DIR / run_id)
+    if results_path is None:
+        raise click.ClickException(f"Run {run_id} introuvable dans {RESULTS_DIR}")
+    source_run = load_run(results_path)
+    csv_path = Path(tasks_csv) if tasks_csv else config.DATA_DIR / "core" / "tasks.csv"
+    tasks = load_tasks(csv_path)
+
+    if dry_run:
+        info = diff_run(source_run.task_results, tasks, incremental=incremental)
+    else:
+
+        async def _rescore():
+            judge = OpenRouterClient(
+                model=judge_model or source_run.metadata.judge_model or config.JUDGE_MODEL
             )
+            try:
+                return await rescore_run(
+                    source_run,
+                    tasks,
+                    judge,
+                    incremental=incremental,
+                    max_concurrent=max_concurrent,
+                    dataset_path=str(csv_path),
+                    dataset_sha256=file_sha256(csv_path),
+                )
+            finally:
+                await judge.close()
 
+        new_run = asyncio.run(_rescore())
+        info = new_run.metadata.rescore
+
+    table = Table(title=f"Criteres recalcules — run {run_id}")
+    table.add_column("Tache", justify="right", style="bold")
+    table.add_column("Ajoutes")
+    table.add_column("Modifies")
+    table.add_column("Retires")
+    table.add_column("En echec", style="red")
+    for number in sorted(
+        {*info.items_added, *info.items_changed, *info.items_removed, *info.items_failed}
+    ):
+        table.add_row(
+            str(number),
+            ", ".join(info.items_added.get(number, [])),
+            ", ".join(info.items_changed.get(number, [])),
+            ", ".join(info.items_removed.get(number, [])),
+            ", ".join(info.items_failed.get(number, [])),
+        )
     console.print(table)
+    console.print(f"{info.results_rescored} resultat(s) concerne(s)")
+    if info.tasks_missing:
+        console.print(
+            f"[yellow]Taches absentes du jeu courant (resultats retires) : "
+            f"{', '.join(map(str, info.tasks_missing))}[/yellow]"
+        )
+    if dry_run:
+        return
+
+    report = generate_report(new_run, compression=compress)
+    with RunStore.open(RESULTS_DIR) as run_store:
+        run_store.add_run(new_run)
+    console.print(
+        f"Run [bold]{new_run.run_id}[/bold] : {info.judge_calls} appel(s) au juge "
+        f"({_fmt_usd(info.cost_usd)}), rapport : {report.html_path}"
+    )
+    for before, after in zip(source_run.aggregates, new_run.aggregates, strict=False):
+        if before.model_id == after.model_id:
+            console.print(
+                f"  {after.model_id} : {_fmt_pct(before.answer_score_mean)} -> "
+                f"{_fmt_pct(after.answer_score_mean)}"
+            )
+
+
+@main.group()
+def rules() -> None:
+    """Regles deterministes des criteres ({{...}} dans les rubrics)."""
+
+
+@rules.command("validate")
+@click.argument("run_ids", nargs=-1, required=True)
+@click.option("--tasks-csv", type=click.Path(exists=True), default=None, help="Chemin CSV taches")
+@click.option(
+    "--min-agreement",
+    type=click.FloatRange(0.0, 1.0),
+    default=None,
+    help="Code de sortie 1 si l'accord d'une regle est inferieur a ce seuil",
+)
+def rules_validate(
+    run_ids: tuple[str, ...], tasks_csv: str | None, min_agreement: float | None
+) -> None:
+    """Mesurer l'accord entre les regles et les verdicts du juge LLM de runs passes."""
+    from pathlib import Path
+
+    from rich.table import Table
+
+    from frenchlaw_bench.core.loader import load_tasks
+    from frenchlaw_bench.reports.results_io import find_results, load_run
+    from frenchlaw_bench.scoring.rules import RuleAgreement, validate_rules
+
+    results = []
+    for run_id in run_ids:
+        results_path = find_results(RESULTS_DIR / run_id)
+        if results_path is None:
+            raise click.ClickException(f"Run {run_id} introuvable dans {RESULTS_DIR}")
+        results.extend(load_run(results_path).task_results)
+    csv_path = Path(tasks_csv) if tasks_csv else config.DATA_DIR / "core" / "tasks.csv"
+    agreements = validate_rules(results, load_tasks(csv_path))
+    if not agreements:
+        console.print("[yellow]Aucun verdict du juge a comparer aux regles[/yellow]")
+        return
+
+    total = RuleAgreement(0, "Total", "", "")
+    table = Table(title=f"Accord regles / juge — {', '.join(run_ids)}")
+    table.add_column("Tache", justify="right", style="bold")
+    table.add_column("Critere")
+    table.add_column("Regle")
+    table.add_column("Verdicts", justify="right")
+    table.add_column("Concluants", justify="right")
+    table.add_column("Accord", justify="right")
+    table.add_column("Regle oui / juge non", justify="right")
+    table.add_column("Regle non / juge oui", justify="right")
+    for a in [*agreements, total]:
+        if a is not total:
+            for attr in ("verdicts", "conclusive", "agree", "rule_only", "judge_only"):
+                setattr(total, attr, getattr(total, attr) + getattr(a, attr))
+        low = min_agreement is not None and (a.agreement or 1.0) < min_agreement
+        table.add_row(
+            str(a.task_number) if a is not total else "",
+            a.item_id,
+            f"{a.kind} ({a.policy})" if a.kind else "",
+            str(a.verdicts),
+            f"{a.conclusive} ({_fmt_pct(a.coverage)})",
+            f"[red]{_fmt_pct(a.agreement)}[/red]" if low else _fmt_pct(a.agreement),
+            str(a.rule_only),
+            str(a.judge_only),
+        )
+    console.print(table)
+    console.print(
+        f"{total.conclusive} appel(s) au juge evitable(s) sur {total.verdicts} verdict(s)"
+    )
+    if min_agreement is not None and any(
+        a.agreement is not None and a.agreement < min_agreement for a in agreements
+    ):
+        raise SystemExit(1)
 
 
 @main.command()
-@click.option("--tasks-csv", type=click.Path(exists=True), default=None)
-def validate(tasks_csv: str | None) -> None:
+@_task_selection_options
+def validate(
+    tasks_csv: str | None,
+    task_shards: tuple[str, ...],
+    category: tuple[str, ...],
+    sub_category: tuple[str, ...],
+    task_type: tuple[str, ...],
+    numbers: str | None,
+) -> None:
     """Valider le fichier de taches (parsing CSV + rubrics)."""
-    from pathlib import Path
+    from rich.table import Table
 
     try:
-        tasks = load_tasks(Path(tasks_csv) if tasks_csv else None)
+        # Validation complete : le bundle en cache n'est pas utilise
+        tasks = list(
+            _select_tasks(
+                tasks_csv,
+                task_shards,
+                category,
+                sub_category,
+                task_type,
+                numbers,
+                use_cache=False,
+            )
+        )
+    except click.UsageError:
+        raise
     except Exception as e:
         console.print(f"[red]Erreur de validation :[/red] {e}")
         raise SystemExit(1) from e
 
+    from frenchlaw_bench.core.rubric_parser import rule_errors
+    from frenchlaw_bench.scoring.rules import compile_rule
+
+    errors = [f"Tache {t.number}, {e}" for t in tasks for e in rule_errors(t.rubric_raw)]
+    for t in tasks:
+        for item in t.rubric.items:
+            if item.rule is None:
+                continue
+            try:
+                compile_rule(item.rule)
+            except ValueError as e:
+                errors.append(f"Tache {t.number}, {item.id} : {e}")
+    if errors:
+        for error in errors:
+            console.print(f"[red]Erreur de validation :[/red] {error}")
+        raise SystemExit(1)
+
     console.print(f"[green]{len(tasks)} taches validees avec succes[/green]")
 
     table = Table(title="Resume des taches")
@@ -283,6 +1380,7 @@ def validate(tasks_csv: str | None) -> None:
     table.add_column("Pts+", justify="right")
     table.add_column("Pts-", justify="right")
     table.add_column("Items", justify="right")
+    table.add_column("Regles", justify="right")
     table.add_column("Docs", justify="right")
 
     for t in tasks:
@@ -296,6 +1394,7 @@ def validate(tasks_csv: str | None) -> None:
             f"{t.rubric.total_positive_points:.0f}",
             f"-{neg_pts:.1f}" if neg_pts else "0",
             str(len(t.rubric.items)),
+            str(sum(i.rule is not None for i in t.rubric.items)),
             str(len(t.documents)),
         )
 
@@ -1,18 +1,50 @@
-"""Configuration globale et chargement des variables d'environnement."""
+"""Configuration globale et chargement des variables d'environnement.
+
+Les chemins sont des constantes. Les valeurs issues de l'environnement
+(OPENROUTER_API_KEY, JUDGE_MODEL, MAX_CONCURRENT) sont lues au premier acces,
+apres chargement de `.env` : importer ce module ne charge pas python-dotenv.
+"""
 
 from __future__ import annotations
 
 import os
 from pathlib import Path
 
-from dotenv import load_dotenv
-
-load_dotenv()
-
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 RESULTS_DIR = PROJECT_ROOT / "results"
+# Caches reconstructibles (bundle de taches compile...)
+CACHE_DIR = Path(os.environ.get("FLB_CACHE_DIR", PROJECT_ROOT / ".cache"))
+
+_ENV_DEFAULTS: dict[str, str] = {
+    "OPENROUTER_API_KEY": "",
+    "JUDGE_MODEL": "anthropic/claude-sonnet-4-20250514",
+    "MAX_CONCURRENT": "5",
+}
+_ENV_TYPES = {"MAX_CONCURRENT": int}
+
+OPENROUTER_API_KEY: str
+JUDGE_MODEL: str
+MAX_CONCURRENT: int
+
+_env_loaded = False
+
+
+def load_env() -> None:
+    """Charge `.env` (une seule fois par processus)."""
+    global _env_loaded
+    if _env_loaded:
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    _env_loaded = True
+
 
-OPENROUTER_API_KEY: str = os.environ.get("OPENROUTER_API_KEY", "")
-JUDGE_MODEL: str = os.environ.get("JUDGE_MODEL", "anthropic/claude-sonnet-4-20250514")
-MAX_CONCURRENT: int = int(os.environ.get("MAX_CONCURRENT", "5"))
+def __getattr__(name: str) -> object:
+    if name not in _ENV_DEFAULTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    load_env()
+    value = _ENV_TYPES.get(name, str)(os.environ.get(name, _ENV_DEFAULTS[name]))
+    globals()[name] = value
+    return value
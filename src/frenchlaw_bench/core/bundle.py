@@ -0,0 +1,100 @@
+"""Bundle compile des taches : cache disque de `load_tasks`.
+
+Le CSV est parse et valide une fois ; les `Task` obtenues (index des
+criteres par dimension compris) sont picklees dans `.cache/tasks/`. Le nom
+du fichier porte le SHA-256 du CSV, la version du parser de rubrics et celle
+du format du bundle : toute modification de l'un d'eux invalide le cache.
+Le rechargement (pickle) ne repasse pas par la validation pydantic.
+
+Le cache est local et produit par ce module uniquement ; un bundle illisible
+est ignore et reconstruit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from frenchlaw_bench.models.task import Task
+
+logger = logging.getLogger(__name__)
+
+# A incrementer si les modeles Task / Rubric changent de forme
+BUNDLE_VERSION = 2
+
+_SHA_CACHE: dict[tuple[str, int, int], str] = {}
+
+
+@dataclass
+class TaskBundle:
+    """Taches compilees d'un fichier CSV."""
+
+    sha256: str
+    parser_version: int
+    tasks: list[Task] = field(default_factory=list)
+    bundle_version: int = BUNDLE_VERSION
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 d'un fichier ("" s'il n'existe pas), memorise par (chemin, mtime, taille)."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return ""
+    key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    if key not in _SHA_CACHE:
+        with open(path, "rb") as f:
+            _SHA_CACHE[key] = hashlib.file_digest(f, "sha256").hexdigest()
+    return _SHA_CACHE[key]
+
+
+def _path_tag(csv_path: Path) -> str:
+    return hashlib.sha256(str(csv_path.resolve()).encode()).hexdigest()[:12]
+
+
+def bundle_path(cache_dir: Path, csv_path: Path, sha256: str, parser_version: int) -> Path:
+    return cache_dir / (
+        f"tasks-{_path_tag(csv_path)}-{sha256[:16]}-p{parser_version}-b{BUNDLE_VERSION}.pickle"
+    )
+
+
+def read_bundle(path: Path, sha256: str, parser_version: int) -> TaskBundle | None:
+    """Bundle en cache s'il existe et correspond au CSV courant."""
+    if not path.exists():
+        return None
+    try:
+        with open(path, "rb") as f:
+            bundle = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+        logger.warning("Bundle de taches illisible, reconstruit : %s (%s)", path, e)
+        return None
+    if (
+        not isinstance(bundle, TaskBundle)
+        or bundle.sha256 != sha256
+        or bundle.parser_version != parser_version
+        or bundle.bundle_version != BUNDLE_VERSION
+    ):
+        return None
+    return bundle
+
+
+def write_bundle(path: Path, bundle: TaskBundle) -> None:
+    """Ecrit le bundle (atomiquement) et supprime les versions perimees du meme CSV."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning("Impossible d'ecrire le bundle de taches %s : %s", path, e)
+        return
+    prefix = path.name.split("-")[1]
+    for stale in path.parent.glob(f"tasks-{prefix}-*.pickle"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
@@ -3,48 +3,78 @@
 from __future__ import annotations
 
 import csv
+from collections.abc import Mapping
 from pathlib import Path
+from typing import Any
 
+from frenchlaw_bench import config
 from frenchlaw_bench.config import DATA_DIR
-from frenchlaw_bench.core.rubric_parser import parse_rubric
+from frenchlaw_bench.core.bundle import (
+    TaskBundle,
+    bundle_path,
+    file_sha256,
+    read_bundle,
+    write_bundle,
+)
+from frenchlaw_bench.core.rubric_parser import PARSER_VERSION, parse_rubric
 from frenchlaw_bench.models.enums import Category, SubCategory, TaskType
 from frenchlaw_bench.models.task import Task
 
 
-def load_tasks(csv_path: Path | None = None) -> list[Task]:
-    """Charge toutes les tâches depuis le fichier CSV.
+def load_tasks(csv_path: Path | None = None, *, use_cache: bool = True) -> list[Task]:
+    """Charge toutes les tâches depuis le fichier CSV (via le bundle compilé en cache).
 
     Colonnes attendues :
         Number, Category, SubCategory, TaskType, Title, Prompt, Documents, Rubric
     """
+    return load_task_bundle(csv_path, use_cache=use_cache).tasks
+
+
+def load_task_bundle(csv_path: Path | None = None, *, use_cache: bool = True) -> TaskBundle:
+    """Bundle des tâches : rechargé du cache si le CSV n'a pas changé, sinon recompilé.
+
+    `use_cache=False` force le parsing et la validation (sans écrire de cache).
+    """
     if csv_path is None:
         csv_path = DATA_DIR / "core" / "tasks.csv"
+    sha256 = file_sha256(csv_path)
+    path = bundle_path(config.CACHE_DIR / "tasks", csv_path, sha256, PARSER_VERSION)
+    if use_cache and (bundle := read_bundle(path, sha256, PARSER_VERSION)) is not None:
+        return bundle
+
+    tasks = parse_tasks_csv(csv_path)
+    bundle = TaskBundle(sha256=sha256, parser_version=PARSER_VERSION, tasks=tasks)
+    if use_cache:
+        write_bundle(path, bundle)
+    return bundle
+
 
-    tasks: list[Task] = []
+def parse_tasks_csv(csv_path: Path) -> list[Task]:
+    """Parse et valide le CSV des tâches (sans cache)."""
     with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            docs_raw = row.get("Documents", "").strip()
-            documents = (
-                [d.strip() for d in docs_raw.split(";") if d.strip()]
-                if docs_raw and docs_raw.upper() != "N/A"
-                else []
-            )
-
-            rubric_raw = row["Rubric"]
-            rubric = parse_rubric(rubric_raw)
-
-            task = Task(
-                number=int(row["Number"]),
-                category=Category(row["Category"]),
-                sub_category=SubCategory(row["SubCategory"]),
-                task_type=TaskType(row["TaskType"]),
-                title=row["Title"],
-                prompt=row["Prompt"],
-                documents=documents,
-                rubric=rubric,
-                rubric_raw=rubric_raw,
-            )
-            tasks.append(task)
-
-    return tasks
+        return [task_from_row(row) for row in csv.DictReader(f)]
+
+
+def task_from_row(row: Mapping[str, Any]) -> Task:
+    """Construit une tâche à partir d'une ligne (CSV ou objet JSONL, mêmes colonnes).
+
+    `Documents` est une liste, ou une chaîne séparée par des `;` (`N/A` = aucun).
+    """
+    docs_raw = row.get("Documents") or []
+    if isinstance(docs_raw, str):
+        docs_raw = docs_raw.strip()
+        docs_raw = docs_raw.split(";") if docs_raw.upper() != "N/A" else []
+    documents = [d.strip() for d in docs_raw if d.strip()]
+
+    rubric_raw = row["Rubric"]
+    return Task(
+        number=int(row["Number"]),
+        category=Category(row["Category"]),
+        sub_category=SubCategory(row["SubCategory"]),
+        task_type=TaskType(row["TaskType"]),
+        title=row["Title"],
+        prompt=row["Prompt"],
+        documents=documents,
+        rubric=parse_rubric(rubric_raw),
+        rubric_raw=rubric_raw,
+    )
@@ -20,14 +20,37 @@ Format attendu dans le CSV (colonne Rubric) :
     N1 (-1pt) : Hallucination factuelle
     N2 (-0.5pt) : Information hors sujet
     N3 (-2pts) : Citation d'un texte abrogé sans mention
+
+Un critère peut se terminer par une règle déterministe `{{type[/politique]: motifs}}`,
+évaluée avant le juge (voir `frenchlaw_bench.scoring.rules`) :
+
+    SUB1 (2pts) : Mentionne l'article 1240 du Code civil {{citation: art. 1240 C. civ.}}
+    SUB5 (1pt) : Cite l'article L. 223-43 {{citation/toujours: L. 223-43}}
+    ST2 (1pt) : Évoque la force majeure {{mot-cle: force majeure ; cas fortuit}}
+    M2 (1pt) : Vise un arrêt de la chambre commerciale {{regex/si-absent: Cass\\.?\\s*com}}
+
+Types : citation, mot-cle, regex ; politiques : si-present (défaut), si-absent,
+toujours. Les motifs sont séparés par ";" (sauf regex) et conservés tels
+qu'écrits ; leur normalisation relève de l'évaluation. Une annotation invalide
+est ignorée au chargement (le critère reste au juge) et signalée par
+`flb validate` (voir `rule_errors`).
 """
 
 from __future__ import annotations
 
+import logging
 import re
 
 from frenchlaw_bench.models.enums import Dimension
-from frenchlaw_bench.models.task import Rubric, RubricItem
+from frenchlaw_bench.models.task import Rubric, RubricItem, RubricRule
+
+logger = logging.getLogger(__name__)
+
+# A incrementer a chaque changement du resultat du parsing (invalide les bundles)
+PARSER_VERSION = 3
+
+RULE_KINDS = ("citation", "mot-cle", "regex")
+RULE_POLICIES = ("si-present", "si-absent", "toujours")
 
 _SECTION_MAP: dict[str, Dimension] = {
     "structure": Dimension.STRUCTURE,
@@ -42,10 +65,62 @@ _SECTION_MAP: dict[str, Dimension] = {
 _ITEM_RE = re.compile(
     r"^(?P<id>[A-Z]+\d+)\s*\((?P<pts>-?\d+(?:\.\d+)?)\s*pts?\)"
     r"(?:\s*\(max\s*(?P<max>-?\d+(?:\.\d+)?)\s*pts?\))?"
-    r"\s*:\s*(?P<desc>.+)$"
+    r"\s*:\s*(?P<desc>.+?)"
+    r"(?:\s*\{\{(?P<rule>.+)\}\})?$"
 )
 
 
+def parse_rule(spec: str) -> RubricRule:
+    """Règle à partir du contenu d'une annotation (`citation/toujours: art. 1240 C. civ.`).
+
+    Lève ValueError si le type, la politique ou une regex est invalide, ou sans motif.
+    """
+    head, sep, body = spec.partition(":")
+    kind, _, policy = head.strip().lower().partition("/")
+    kind, policy = kind.strip(), policy.strip() or "si-present"
+    if not sep or kind not in RULE_KINDS:
+        raise ValueError(f"Règle invalide : '{spec}' (types : {', '.join(RULE_KINDS)})")
+    if policy not in RULE_POLICIES:
+        raise ValueError(f"Politique de règle inconnue : '{policy}'")
+
+    body = body.strip()
+    if kind == "regex":
+        try:
+            re.compile(body, re.IGNORECASE)
+        except re.error as e:
+            raise ValueError(f"Regex invalide '{body}' : {e}") from None
+        patterns = [body] if body else []
+    else:
+        patterns = [p.strip() for p in body.split(";")]
+    patterns = list(dict.fromkeys(p for p in patterns if p))
+    if not patterns:
+        raise ValueError(f"Règle sans motif : '{spec}'")
+    return RubricRule(kind=kind, patterns=patterns, policy=policy)
+
+
+def rule_errors(text: str) -> list[str]:
+    """Annotations de règle invalides d'un rubric (ignorées au chargement), par critère."""
+    errors = []
+    for line in text.strip().splitlines():
+        item_match = _ITEM_RE.match(line.strip())
+        if item_match and item_match.group("rule"):
+            try:
+                parse_rule(item_match.group("rule"))
+            except ValueError as e:
+                errors.append(f"{item_match.group('id')} : {e}")
+    return errors
+
+
+def _item_rule(item_id: str, spec: str | None) -> RubricRule | None:
+    if not spec:
+        return None
+    try:
+        return parse_rule(spec)
+    except ValueError as e:
+        logger.warning("Règle ignorée pour %s : %s", item_id, e)
+        return None
+
+
 def parse_rubric(text: str) -> Rubric:
     """Parse un texte de rubric en un objet Rubric structuré."""
     items: list[RubricItem] = []
@@ -74,6 +149,7 @@ def parse_rubric(text: str) -> Rubric:
                     description=item_match.group("desc").strip(),
                     points=float(item_match.group("pts")),
                     max_points=float(max_pts) if max_pts else None,
+                    rule=_item_rule(item_match.group("id"), item_match.group("rule")),
                 )
             )
 
@@ -0,0 +1,192 @@
+"""Sources de taches en flux : shards CSV / JSONL lus paresseusement.
+
+Une `TaskSource` decrit un jeu de taches reparti sur un ou plusieurs fichiers
+(`.csv` avec les colonnes de `data/core/tasks.csv`, ou `.jsonl` avec un objet
+par ligne portant les memes cles). Les taches sont produites une a une par un
+generateur : le filtre (categorie, sous-categorie, type, numeros) est applique
+sur les champs bruts de chaque ligne, avant le parsing de la rubric, et seule
+la tache courante est en memoire.
+
+Le SHA-256 du jeu couvre le contenu de tous les shards, independamment de
+leurs noms et de l'ordre donne ; pour un fichier unique, c'est celui du
+fichier, comme pour `load_tasks`.
+"""
+
+from __future__ import annotations
+
+import csv
+import glob
+import hashlib
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from frenchlaw_bench.core.bundle import file_sha256
+from frenchlaw_bench.core.loader import task_from_row
+from frenchlaw_bench.models.enums import Category, SubCategory, TaskType
+from frenchlaw_bench.models.task import Task
+
+logger = logging.getLogger(__name__)
+
+SHARD_SUFFIXES = (".csv", ".jsonl")
+
+
+def parse_number_ranges(spec: str) -> tuple[tuple[int, int], ...]:
+    """Plages de numeros au format "1-10,15,20-22" -> ((1, 10), (15, 15), (20, 22))."""
+    ranges = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        low, sep, high = part.partition("-")
+        try:
+            start = int(low)
+            end = int(high) if sep else start
+        except ValueError:
+            raise ValueError(f"Plage de numeros invalide : {part!r}") from None
+        if end < start:
+            raise ValueError(f"Plage de numeros inversee : {part!r}")
+        ranges.append((start, end))
+    return tuple(ranges)
+
+
+def _enum_values(enum_cls: type[Enum], names: Iterable[str]) -> frozenset[str]:
+    """Valeurs canoniques d'un enum, a partir de la valeur ou du nom du membre."""
+    by_key = {}
+    for member in enum_cls:
+        by_key[member.value.casefold()] = member.value
+        by_key[member.name.casefold()] = member.value
+    values = set()
+    for name in names:
+        try:
+            values.add(by_key[name.strip().casefold()])
+        except KeyError:
+            raise ValueError(f"{enum_cls.__name__} inconnue : {name!r}") from None
+    return frozenset(values)
+
+
+@dataclass(frozen=True)
+class TaskFilter:
+    """Filtre applique pendant la lecture (ensembles vides = pas de restriction)."""
+
+    categories: frozenset[str] = frozenset()
+    sub_categories: frozenset[str] = frozenset()
+    task_types: frozenset[str] = frozenset()
+    numbers: tuple[tuple[int, int], ...] = ()
+
+    @classmethod
+    def from_options(
+        cls,
+        categories: Iterable[str] = (),
+        sub_categories: Iterable[str] = (),
+        task_types: Iterable[str] = (),
+        numbers: str | None = None,
+    ) -> TaskFilter:
+        """Filtre construit depuis les options CLI (valeurs ou noms d'enum, insensible a la casse)."""
+        return cls(
+            categories=_enum_values(Category, categories),
+            sub_categories=_enum_values(SubCategory, sub_categories),
+            task_types=_enum_values(TaskType, task_types),
+            numbers=parse_number_ranges(numbers) if numbers else (),
+        )
+
+    @property
+    def active(self) -> bool:
+        return bool(self.categories or self.sub_categories or self.task_types or self.numbers)
+
+    def accepts_number(self, number: int) -> bool:
+        return not self.numbers or any(lo <= number <= hi for lo, hi in self.numbers)
+
+    def accepts_row(self, row: dict[str, Any]) -> bool:
+        """Test sur les champs bruts d'une ligne, sans parser la rubric."""
+        if self.categories and row.get("Category") not in self.categories:
+            return False
+        if self.sub_categories and row.get("SubCategory") not in self.sub_categories:
+            return False
+        if self.task_types and row.get("TaskType") not in self.task_types:
+            return False
+        return self.accepts_number(int(row["Number"]))
+
+
+def _expand(path: str | Path) -> list[Path]:
+    """Shards designes par un fichier, un dossier (tous ses .csv/.jsonl) ou un glob."""
+    path = Path(path)
+    if path.is_dir():
+        return sorted(p for p in path.iterdir() if p.suffix in SHARD_SUFFIXES)
+    if path.exists():
+        return [path]
+    return sorted(
+        p for p in map(Path, glob.glob(str(path), recursive=True)) if p.suffix in SHARD_SUFFIXES
+    )
+
+
+def _read_rows(shard: Path) -> Iterator[dict[str, Any]]:
+    with open(shard, newline="", encoding="utf-8") as f:
+        if shard.suffix == ".csv":
+            yield from csv.DictReader(f)
+            return
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{shard}:{line_no} : JSON invalide ({e})") from e
+
+
+@dataclass
+class TaskSource:
+    """Jeu de taches reparti sur des shards, lu en flux et filtre a la volee."""
+
+    shards: list[Path]
+    task_filter: TaskFilter = field(default_factory=TaskFilter)
+
+    @classmethod
+    def from_paths(
+        cls, paths: Iterable[str | Path], task_filter: TaskFilter | None = None
+    ) -> TaskSource:
+        """Source a partir de fichiers, dossiers ou globs (doublons retires, ordre conserve)."""
+        shards: list[Path] = []
+        for spec in paths:
+            found = _expand(spec)
+            if not found:
+                raise FileNotFoundError(f"Aucun shard de taches pour {spec!s}")
+            for shard in found:
+                if shard.suffix not in SHARD_SUFFIXES:
+                    raise ValueError(f"Format de shard non supporte : {shard} ({SHARD_SUFFIXES})")
+                if shard not in shards:
+                    shards.append(shard)
+        return cls(shards, task_filter or TaskFilter())
+
+    def __iter__(self) -> Iterator[Task]:
+        """Taches retenues par le filtre, shard par shard, dans l'ordre des fichiers."""
+        for shard in self.shards:
+            n_read = n_kept = 0
+            for row in _read_rows(shard):
+                n_read += 1
+                try:
+                    task = task_from_row(row) if self.task_filter.accepts_row(row) else None
+                except (KeyError, ValueError) as e:
+                    raise ValueError(f"{shard} : tache {row.get('Number')!r} invalide ({e})") from e
+                if task is not None:
+                    n_kept += 1
+                    yield task
+            logger.debug("%s : %d/%d taches retenues", shard, n_kept, n_read)
+
+    @property
+    def dataset_path(self) -> str:
+        """Chemin(s) du jeu, tel qu'enregistre dans les metadonnees du run."""
+        return ";".join(str(s) for s in self.shards)
+
+    def dataset_sha256(self) -> str:
+        """SHA-256 du jeu complet : celui du fichier s'il est unique, sinon celui des shards."""
+        if len(self.shards) == 1:
+            return file_sha256(self.shards[0])
+        digest = hashlib.sha256()
+        for shard_sha256 in sorted(file_sha256(shard) for shard in self.shards):
+            digest.update(f"{shard_sha256}\n".encode())
+        return digest.hexdigest()
@@ -2,21 +2,38 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
-import fitz  # PyMuPDF
-
 from frenchlaw_bench.config import DATA_DIR
 
 
-def extract_pdf_text(pdf_path: Path) -> str:
-    """Extrait le texte d'un PDF."""
+def extract_pdf_pages(pdf_path: Path) -> list[str]:
+    """Extrait le texte d'un PDF, page par page."""
+    import fitz  # PyMuPDF, lent a importer : charge au premier PDF
+
     doc = fitz.open(pdf_path)
-    pages = []
-    for page in doc:
-        pages.append(page.get_text())
+    pages = [page.get_text() for page in doc]
     doc.close()
-    return "\n\n".join(pages)
+    return pages
+
+
+def extract_pdf_text(pdf_path: Path) -> str:
+    """Extrait le texte d'un PDF."""
+    return "\n\n".join(extract_pdf_pages(pdf_path))
+
+
+@lru_cache(maxsize=64)
+def load_document_pages(name: str, subdir: str = "core") -> tuple[str, ...] | None:
+    """Pages d'un document de tache (None si le fichier est manquant).
+
+    Le resultat est mis en cache : un meme dossier est extrait une seule fois
+    par processus, quel que soit le nombre de modeles evalues.
+    """
+    pdf_path = DATA_DIR / subdir / "documents" / name
+    if not pdf_path.exists():
+        return None
+    return tuple(extract_pdf_pages(pdf_path))
 
 
 def load_task_documents(document_names: list[str], subdir: str = "core") -> str:
@@ -24,14 +41,11 @@ def load_task_documents(document_names: list[str], subdir: str = "core") -> str:
     if not document_names:
         return ""
 
-    docs_dir = DATA_DIR / subdir / "documents"
     texts = []
-
     for name in document_names:
-        pdf_path = docs_dir / name
-        if pdf_path.exists():
-            text = extract_pdf_text(pdf_path)
-            texts.append(f"--- Document : {name} ---\n{text}")
+        pages = load_document_pages(name, subdir)
+        if pages is not None:
+            texts.append(f"--- Document : {name} ---\n" + "\n\n".join(pages))
         else:
             texts.append(f"--- Document : {name} --- [FICHIER MANQUANT]")
 
@@ -0,0 +1,241 @@
+"""Recherche BM25 sur les passages des documents d'une tache.
+
+Les documents sont decoupes en passages (paragraphes regroupes par page),
+indexes dans un index inverse, puis interroges claim par claim pour ne
+transmettre au verificateur que les passages pertinents, dans un budget de
+tokens, au lieu du dossier complet.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+
+from frenchlaw_bench.documents.extractor import load_document_pages
+from frenchlaw_bench.llm.base import estimate_tokens
+
+DEFAULT_TOP_K = 5
+DEFAULT_TOKEN_BUDGET = 1500
+PASSAGE_MAX_CHARS = 1200
+
+NO_PASSAGE_CONTEXT = "Aucun passage pertinent trouve dans les documents source."
+
+_TOKEN_RE = re.compile(r"\w+")
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+
+_STOPWORDS = frozenset(
+    {
+        "a",
+        "au",
+        "aux",
+        "avec",
+        "ce",
+        "ces",
+        "dans",
+        "de",
+        "des",
+        "du",
+        "elle",
+        "en",
+        "et",
+        "eux",
+        "il",
+        "ils",
+        "je",
+        "la",
+        "le",
+        "les",
+        "leur",
+        "lui",
+        "ma",
+        "mais",
+        "me",
+        "meme",
+        "mes",
+        "moi",
+        "mon",
+        "ne",
+        "nos",
+        "notre",
+        "nous",
+        "on",
+        "ou",
+        "par",
+        "pas",
+        "pour",
+        "qu",
+        "que",
+        "qui",
+        "sa",
+        "se",
+        "ses",
+        "son",
+        "sur",
+        "ta",
+        "te",
+        "tes",
+        "toi",
+        "ton",
+        "tu",
+        "un",
+        "une",
+        "vos",
+        "votre",
+        "vous",
+        "est",
+        "sont",
+        "ete",
+        "etre",
+        "avoir",
+        "fait",
+        "cette",
+        "cet",
+        "l",
+        "d",
+        "s",
+        "n",
+        "y",
+        "si",
+        "plus",
+        "tout",
+        "tous",
+        "toute",
+        "toutes",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Passage:
+    """Passage indexe d'un document (un ou plusieurs paragraphes d'une page)."""
+
+    document: str
+    page: int
+    text: str
+
+
+def _fold(text: str) -> str:
+    """Minuscules sans accents."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: str) -> list[str]:
+    """Tokenisation pour l'index : minuscules, sans accents ni mots vides."""
+    return [t for t in _TOKEN_RE.findall(_fold(text)) if t not in _STOPWORDS]
+
+
+def split_passages(document: str, pages: list[str] | tuple[str, ...]) -> list[Passage]:
+    """Decoupe les pages d'un document en passages d'au plus PASSAGE_MAX_CHARS."""
+    passages: list[Passage] = []
+    for page_no, page_text in enumerate(pages, start=1):
+        buffer = ""
+        for para in _PARAGRAPH_SPLIT_RE.split(page_text):
+            para = para.strip()
+            if not para:
+                continue
+            while len(para) > PASSAGE_MAX_CHARS:
+                cut = para.rfind(" ", 0, PASSAGE_MAX_CHARS)
+                cut = cut if cut > 0 else PASSAGE_MAX_CHARS
+                if buffer:
+                    passages.append(Passage(document, page_no, buffer))
+                    buffer = ""
+                passages.append(Passage(document, page_no, para[:cut].strip()))
+                para = para[cut:].strip()
+            if buffer and len(buffer) + len(para) + 2 > PASSAGE_MAX_CHARS:
+                passages.append(Passage(document, page_no, buffer))
+                buffer = ""
+            buffer = f"{buffer}\n\n{para}" if buffer else para
+        if buffer:
+            passages.append(Passage(document, page_no, buffer))
+    return passages
+
+
+class DocumentIndex:
+    """Index inverse BM25 sur des passages."""
+
+    def __init__(self, passages: list[Passage], k1: float = 1.5, b: float = 0.75) -> None:
+        self.passages = passages
+        self._k1 = k1
+        self._b = b
+        self._postings: dict[str, list[tuple[int, int]]] = {}
+        self._lengths: list[int] = []
+
+        for pid, passage in enumerate(passages):
+            counts = Counter(tokenize(passage.text))
+            self._lengths.append(sum(counts.values()))
+            for term, tf in counts.items():
+                self._postings.setdefault(term, []).append((pid, tf))
+
+        n = len(passages)
+        self._avg_len = (sum(self._lengths) / n) if n else 0.0
+        self._idf = {
+            term: math.log(1 + (n - len(post) + 0.5) / (len(post) + 0.5))
+            for term, post in self._postings.items()
+        }
+
+    @property
+    def total_tokens(self) -> int:
+        return sum(estimate_tokens(p.text) for p in self.passages)
+
+    def search(self, query: str, k: int = DEFAULT_TOP_K) -> list[tuple[Passage, float]]:
+        """Retourne les k passages les plus pertinents (score BM25 decroissant)."""
+        scores: dict[int, float] = {}
+        k1, b, avg_len = self._k1, self._b, self._avg_len or 1.0
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = self._idf[term]
+            for pid, tf in postings:
+                norm = k1 * (1 - b + b * self._lengths[pid] / avg_len)
+                scores[pid] = scores.get(pid, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)[:k]
+        return [(self.passages[pid], score) for pid, score in ranked]
+
+    def context_for(
+        self,
+        query: str,
+        k: int = DEFAULT_TOP_K,
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+    ) -> str:
+        """Contexte source pour un claim : top-k passages dans le budget de tokens."""
+        blocks: list[str] = []
+        used = 0
+        for passage, _score in self.search(query, k):
+            block = f"[{passage.document}, p. {passage.page}]\n{passage.text}"
+            cost = estimate_tokens(block)
+            if blocks and used + cost > token_budget:
+                break
+            if not blocks and cost > token_budget:
+                block = block[: token_budget * 4]
+                cost = token_budget
+            blocks.append(block)
+            used += cost
+        return "\n\n".join(blocks) if blocks else NO_PASSAGE_CONTEXT
+
+
+@lru_cache(maxsize=32)
+def _cached_index(document_names: tuple[str, ...], subdir: str) -> DocumentIndex:
+    passages: list[Passage] = []
+    for name in document_names:
+        pages = load_document_pages(name, subdir)
+        if pages is not None:
+            passages.extend(split_passages(name, pages))
+    return DocumentIndex(passages)
+
+
+def get_task_index(document_names: list[str], subdir: str = "core") -> DocumentIndex | None:
+    """Index BM25 des documents d'une tache, construit une fois puis mis en cache.
+
+    Retourne None pour les taches knowledge-only ou sans document lisible.
+    """
+    if not document_names:
+        return None
+    index = _cached_index(tuple(document_names), subdir)
+    return index if index.passages else None
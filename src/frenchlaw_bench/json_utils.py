@@ -5,11 +5,73 @@ from __future__ import annotations
 import json
 import re
 
-# Regex pour retirer les trailing commas avant } ou ]
-_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+# Hors d'un candidat, seuls les ouvrants nous interessent
+_OPEN_RE = re.compile(r"[{\[]")
 
-# Regex pour extraire JSON d'un bloc markdown ```json ... ```
-_MARKDOWN_BLOCK_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?\s*```", re.DOTALL)
+# Dans un candidat : chaine complete (echappements compris), guillemet orphelin
+# (chaine non terminee), crochet/accolade, ou virgule finale (suivie d'un fermant)
+_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|"|[{}\[\]]|,(?=\s*[}\]])', re.DOTALL)
+
+_CLOSERS = {"}": "{", "]": "["}
+
+# Debut plausible d'un JSON apres l'ouvrant (cle, valeur ou conteneur)
+_JSON_START_RE = re.compile(r'\s*["{\[\]}\d-]')
+
+# Bloc markdown ```json ... ``` (ou ``` ... ```)
+_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)```", re.DOTALL)
+
+
+def _scan_candidates(text: str) -> list[tuple[int, str]]:
+    """Repere en une passe les blocs JSON equilibres du texte, avec leur position.
+
+    Les chaines et leurs echappements sont sautes ; les virgules finales
+    (`,}` ou `,]`) sont retirees au vol. Un bloc mal ferme (accolade de prose)
+    est abandonne et le balayage reprend juste apres son ouvrant, pour ne pas
+    perdre un JSON imbrique dans de la prose ; un bloc qui a l'allure d'un JSON
+    mais n'est jamais ferme (reponse tronquee) arrete le balayage, pour ne pas
+    rendre un fragment interne a sa place.
+    """
+    candidates: list[tuple[int, str]] = []
+    pos = 0
+    while True:
+        opener = _OPEN_RE.search(text, pos)
+        if opener is None:
+            return candidates
+        start = opener.start()
+        stack = [text[start]]
+        drop: list[int] = []  # positions des virgules finales
+        truncated = True
+        for tok in _TOKEN_RE.finditer(text, start + 1):
+            t = tok.group()
+            if t == ",":
+                drop.append(tok.start())
+            elif t == '"':
+                break  # chaine non terminee
+            elif t in _CLOSERS:
+                if stack[-1] != _CLOSERS[t]:
+                    truncated = False
+                    break
+                stack.pop()
+                if not stack:
+                    end = tok.end()
+                    break
+            elif t in "{[":
+                stack.append(t)
+        if stack:
+            if truncated and _JSON_START_RE.match(text, start + 1):
+                return candidates
+            pos = start + 1
+            continue
+        if drop:
+            parts, prev = [], start
+            for c in drop:
+                parts.append(text[prev:c])
+                prev = c + 1
+            parts.append(text[prev:end])
+            candidates.append((start, "".join(parts)))
+        else:
+            candidates.append((start, text[start:end]))
+        pos = end
 
 
 def parse_llm_json(text: str) -> dict | list:
@@ -19,59 +81,28 @@ def parse_llm_json(text: str) -> dict | list:
     - JSON valide direct
     - JSON enveloppe dans un bloc markdown ```json ... ```
     - Trailing commas (,} ou ,])
-    - Texte avant/apres le JSON (extraction du premier objet/array)
+    - Texte avant/apres le JSON, y compris des accolades dans la prose
+
+    Les blocs equilibres sont essayes du plus probable au moins probable : les
+    objets avant les listes (une liste entre crochets dans la prose n'est pas
+    un verdict), puis ceux d'un bloc markdown, puis dans l'ordre du texte, le
+    plus long d'abord a egalite. Leve json.JSONDecodeError si aucun ne parse.
     """
-    # 1. Essai direct
     try:
         return json.loads(text)
-    except json.JSONDecodeError:
-        pass
+    except json.JSONDecodeError as e:
+        error = e
+
+    fences = [m.span(1) for m in _FENCE_RE.finditer(text)]
 
-    cleaned = text.strip()
+    def likelihood(candidate: tuple[int, str]) -> tuple[bool, bool, int, int]:
+        start, block = candidate
+        fenced = any(a <= start < b for a, b in fences)
+        return (block[0] != "{", not fenced, start, -len(block))
 
-    # 2. Extraction depuis un bloc markdown
-    md_match = _MARKDOWN_BLOCK_RE.search(cleaned)
-    if md_match:
-        extracted = md_match.group(1).strip()
+    for _, candidate in sorted(_scan_candidates(text), key=likelihood):
         try:
-            return json.loads(extracted)
-        except json.JSONDecodeError:
-            # Essayer avec nettoyage trailing commas
-            fixed = _TRAILING_COMMA_RE.sub(r"\1", extracted)
-            try:
-                return json.loads(fixed)
-            except json.JSONDecodeError:
-                pass
-
-    # 3. Extraction du bloc JSON (premier { ... dernier } ou [ ... ])
-    obj_start = cleaned.find("{")
-    arr_start = cleaned.find("[")
-
-    if obj_start >= 0 and (arr_start < 0 or obj_start <= arr_start):
-        end = cleaned.rfind("}") + 1
-        if end > obj_start:
-            block = cleaned[obj_start:end]
-            try:
-                return json.loads(block)
-            except json.JSONDecodeError:
-                fixed = _TRAILING_COMMA_RE.sub(r"\1", block)
-                try:
-                    return json.loads(fixed)
-                except json.JSONDecodeError:
-                    pass
-    elif arr_start >= 0:
-        end = cleaned.rfind("]") + 1
-        if end > arr_start:
-            block = cleaned[arr_start:end]
-            try:
-                return json.loads(block)
-            except json.JSONDecodeError:
-                fixed = _TRAILING_COMMA_RE.sub(r"\1", block)
-                try:
-                    return json.loads(fixed)
-                except json.JSONDecodeError:
-                    pass
-
-    # 4. Dernier recours : trailing commas sur le texte entier
-    fixed = _TRAILING_COMMA_RE.sub(r"\1", cleaned)
-    return json.loads(fixed)
+            return json.loads(candidate)
+        except json.JSONDecodeError as e:
+            error = e
+    raise error
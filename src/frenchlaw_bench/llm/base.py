@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 
+def estimate_tokens(text: str) -> int:
+    """Estimation grossiere du nombre de tokens (~4 caracteres par token)."""
+    return len(text) // 4
+
+
 @dataclass
 class LLMResponse:
     content: str
@@ -16,6 +22,8 @@ class LLMResponse:
 
 
 class BaseLLMClient(ABC):
+    model: str
+
     @abstractmethod
     async def complete(
         self,
@@ -24,9 +32,33 @@ class BaseLLMClient(ABC):
         system: str = "",
         temperature: float = 0.0,
         max_tokens: int = 4096,
-    ) -> LLMResponse:
-        ...
+        response_format: dict | None = None,
+    ) -> LLMResponse: ...
+
+    async def complete_n(
+        self,
+        prompt: str,
+        n: int,
+        *,
+        system: str = "",
+        temperature: float = 0.0,
+        max_tokens: int = 4096,
+    ) -> list[LLMResponse]:
+        """`n` reponses independantes au meme prompt.
+
+        Par defaut, `n` appels paralleles ; les clients dont l'API accepte un
+        parametre `n` le surchargent pour ne traiter le prompt qu'une fois.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.complete(
+                        prompt, system=system, temperature=temperature, max_tokens=max_tokens
+                    )
+                    for _ in range(n)
+                )
+            )
+        )
 
     @abstractmethod
-    async def close(self) -> None:
-        ...
+    async def close(self) -> None: ...
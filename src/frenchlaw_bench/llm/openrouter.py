@@ -17,6 +17,26 @@ OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
 MAX_RETRIES = 3
 RETRY_DELAYS = [5, 15, 30]
 
+# Marqueurs d'un refus des sorties structurees dans le corps d'une erreur 400/422
+_RESPONSE_FORMAT_MARKERS = (
+    "response_format",
+    "json_schema",
+    "structured_output",
+    "structured output",
+)
+
+
+def _rejects_response_format(resp: httpx.Response) -> bool:
+    """L'erreur designe-t-elle `response_format` comme non supporte ?
+
+    Les autres 400/422 (contexte trop long, parametre invalide...) ne doivent
+    pas desactiver les sorties structurees pour le reste du run.
+    """
+    if resp.status_code not in (400, 422):
+        return False
+    body = resp.text.lower()
+    return any(marker in body for marker in _RESPONSE_FORMAT_MARKERS)
+
 
 class OpenRouterClient(BaseLLMClient):
     def __init__(
@@ -31,6 +51,10 @@ class OpenRouterClient(BaseLLMClient):
         self._provider = provider
         self._quantization = quantization
         self._client = httpx.AsyncClient(timeout=300)
+        # Desactive au premier refus explicite de `response_format` par le modele
+        self.structured_outputs = True
+        # Desactive des qu'un provider renvoie moins de choix que le `n` demande
+        self.supports_n = True
 
     async def complete(
         self,
@@ -39,7 +63,51 @@ class OpenRouterClient(BaseLLMClient):
         system: str = "",
         temperature: float = 0.0,
         max_tokens: int = 4096,
+        response_format: dict | None = None,
     ) -> LLMResponse:
+        payload = self._payload(prompt, system, temperature, max_tokens)
+        if response_format is not None and self.structured_outputs:
+            payload["response_format"] = response_format
+        data, elapsed = await self._post(payload)
+        return self._responses(data, elapsed)[0]
+
+    async def complete_n(
+        self,
+        prompt: str,
+        n: int,
+        *,
+        system: str = "",
+        temperature: float = 0.0,
+        max_tokens: int = 4096,
+    ) -> list[LLMResponse]:
+        """`n` reponses en un seul appel (parametre `n`), le prompt n'etant traite qu'une fois.
+
+        Si le provider ignore `n` (moins de choix que demandes), les reponses
+        manquantes sont demandees par appels separes et `n` n'est plus envoye.
+        """
+        if n <= 1 or not self.supports_n:
+            return await super().complete_n(
+                prompt, n, system=system, temperature=temperature, max_tokens=max_tokens
+            )
+        payload = self._payload(prompt, system, temperature, max_tokens)
+        payload["n"] = n
+        data, elapsed = await self._post(payload)
+        responses = self._responses(data, elapsed)
+        if len(responses) < n:
+            logger.info(
+                "%s : %d/%d choix renvoyes, parametre n desactive", self.model, len(responses), n
+            )
+            self.supports_n = False
+            responses += await super().complete_n(
+                prompt,
+                n - len(responses),
+                system=system,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        return responses[:n]
+
+    def _payload(self, prompt: str, system: str, temperature: float, max_tokens: int) -> dict:
         messages = []
         if system:
             messages.append({"role": "system", "content": system})
@@ -60,6 +128,10 @@ class OpenRouterClient(BaseLLMClient):
             if self._quantization:
                 provider_prefs["quantizations"] = [self._quantization]
             payload["provider"] = provider_prefs
+        return payload
+
+    async def _post(self, payload: dict) -> tuple[dict, float]:
+        """Envoie la requete (retries sur 429 / 5xx) ; retourne le JSON et la latence."""
         headers = {
             "Authorization": f"Bearer {self._api_key}",
             "Content-Type": "application/json",
@@ -69,33 +141,54 @@ class OpenRouterClient(BaseLLMClient):
             start = time.monotonic()
             resp = await self._client.post(OPENROUTER_URL, headers=headers, json=payload)
 
+            if "response_format" in payload and _rejects_response_format(resp):
+                logger.warning(
+                    "%s refuse response_format (HTTP %d) : sorties structurees desactivees",
+                    self.model,
+                    resp.status_code,
+                )
+                self.structured_outputs = False
+                del payload["response_format"]
+                # La latence ne compte que l'appel qui aboutit
+                start = time.monotonic()
+                resp = await self._client.post(OPENROUTER_URL, headers=headers, json=payload)
+
             if resp.status_code == 429 or resp.status_code >= 500:
                 delay = RETRY_DELAYS[min(attempt, len(RETRY_DELAYS) - 1)]
                 logger.warning(
                     "HTTP %d sur %s, retry %d/%d dans %ds",
-                    resp.status_code, self.model, attempt + 1, MAX_RETRIES, delay,
+                    resp.status_code,
+                    self.model,
+                    attempt + 1,
+                    MAX_RETRIES,
+                    delay,
                 )
                 await asyncio.sleep(delay)
                 continue
 
             resp.raise_for_status()
-            elapsed = time.monotonic() - start
+            return resp.json(), time.monotonic() - start
 
-            data = resp.json()
-            choice = data["choices"][0]
-            usage = data.get("usage", {})
-            content = choice["message"].get("content") or ""
+        resp.raise_for_status()
+        raise RuntimeError("Unreachable")
 
-            return LLMResponse(
-                content=content,
+    def _responses(self, data: dict, elapsed: float) -> list[LLMResponse]:
+        """Une reponse par choix ; l'usage (prompt compris) est reparti entre les choix."""
+        choices = data["choices"]
+        usage = data.get("usage", {})
+        n = len(choices)
+        input_tokens = usage.get("prompt_tokens", 0)
+        output_tokens = usage.get("completion_tokens", 0)
+        return [
+            LLMResponse(
+                content=choice["message"].get("content") or "",
                 model=data.get("model", self.model),
-                input_tokens=usage.get("prompt_tokens", 0),
-                output_tokens=usage.get("completion_tokens", 0),
+                input_tokens=input_tokens // n + (input_tokens % n if i == 0 else 0),
+                output_tokens=output_tokens // n + (output_tokens % n if i == 0 else 0),
                 latency_seconds=elapsed,
             )
-
-        resp.raise_for_status()
-        raise RuntimeError("Unreachable")
+            for i, choice in enumerate(choices)
+        ]
 
     async def close(self) -> None:
         await self._client.aclose()
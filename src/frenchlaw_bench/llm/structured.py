@@ -0,0 +1,136 @@
+"""Appels LLM a sortie JSON : schema impose, reparation et suivi des echecs.
+
+`complete_json` demande une sortie conforme a un schema (`response_format`,
+ignore par les modeles qui ne le supportent pas), puis parse la reponse. En
+cas d'echec, un seul appel de reparation est fait : il ne renvoie au modele
+que la sortie mal formee et le schema, sans le prompt d'origine. Les taux
+d'echec sont comptes par modele juge.
+
+La reponse renvoyee apres une reparation porte le contenu de la reparation et
+l'usage cumule des deux appels (tokens, latence).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict, dataclass, replace
+
+from frenchlaw_bench.json_utils import parse_llm_json
+from frenchlaw_bench.llm.base import BaseLLMClient, LLMResponse
+
+logger = logging.getLogger(__name__)
+
+REPAIR_SYSTEM = "Tu corriges des sorties JSON mal formees. Tu ne modifies pas leur contenu."
+
+REPAIR_PROMPT = """\
+La sortie suivante devait etre un JSON valide conforme au schema ci-dessous, \
+mais elle ne peut pas etre parsee. Corrige uniquement la syntaxe (guillemets, \
+virgules, accolades, texte parasite) sans changer les valeurs.
+
+## Schema
+{schema}
+
+## Sortie a corriger
+{output}
+
+Reponds UNIQUEMENT avec le JSON corrige.
+"""
+
+# Marge de tokens de sortie pour la reparation, en plus de la taille de l'original
+_REPAIR_EXTRA_TOKENS = 256
+
+
+@dataclass
+class ParseStats:
+    """Compteurs de parsing JSON pour un modele."""
+
+    calls: int = 0
+    parse_failures: int = 0  # premiere reponse illisible
+    repaired: int = 0
+    unrecovered: int = 0
+
+    @property
+    def failure_rate(self) -> float:
+        return self.parse_failures / self.calls if self.calls else 0.0
+
+
+_PARSE_STATS: dict[str, ParseStats] = {}
+
+
+def json_schema_format(name: str, schema: dict) -> dict:
+    """Parametre `response_format` (format OpenAI / OpenRouter) pour un schema."""
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "strict": False, "schema": schema},
+    }
+
+
+def parse_stats() -> dict[str, ParseStats]:
+    """Compteurs par modele depuis le dernier `reset_parse_stats`."""
+    return dict(_PARSE_STATS)
+
+
+def parse_stats_dict() -> dict[str, dict]:
+    return {
+        model: {**asdict(stats), "failure_rate": stats.failure_rate}
+        for model, stats in sorted(_PARSE_STATS.items())
+    }
+
+
+def reset_parse_stats() -> None:
+    _PARSE_STATS.clear()
+
+
+async def complete_json(
+    client: BaseLLMClient,
+    prompt: str,
+    *,
+    schema: dict,
+    schema_name: str,
+    system: str = "",
+    temperature: float = 0.0,
+    max_tokens: int = 4096,
+) -> tuple[dict | list, LLMResponse]:
+    """Appel LLM dont la reponse est parsee en JSON.
+
+    Leve ValueError (ou json.JSONDecodeError) si la reponse reste illisible
+    apres la reparation. Apres une reparation, la reponse renvoyee compte
+    l'usage des deux appels.
+    """
+    stats = _PARSE_STATS.setdefault(client.model, ParseStats())
+    stats.calls += 1
+    resp = await client.complete(
+        prompt,
+        system=system,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        response_format=json_schema_format(schema_name, schema),
+    )
+    try:
+        return parse_llm_json(resp.content), resp
+    except ValueError:
+        stats.parse_failures += 1
+        if not resp.content.strip():
+            stats.unrecovered += 1
+            raise
+
+    logger.info("Sortie JSON illisible (%s, %s), reparation", client.model, schema_name)
+    repair = await client.complete(
+        REPAIR_PROMPT.format(schema=json.dumps(schema, ensure_ascii=False), output=resp.content),
+        system=REPAIR_SYSTEM,
+        temperature=0.0,
+        max_tokens=max(_REPAIR_EXTRA_TOKENS, len(resp.content) // 3 + _REPAIR_EXTRA_TOKENS),
+    )
+    try:
+        data = parse_llm_json(repair.content)
+    except ValueError:
+        stats.unrecovered += 1
+        raise
+    stats.repaired += 1
+    return data, replace(
+        repair,
+        input_tokens=resp.input_tokens + repair.input_tokens,
+        output_tokens=resp.output_tokens + repair.output_tokens,
+        latency_seconds=resp.latency_seconds + repair.latency_seconds,
+    )
@@ -1,9 +1,26 @@
-"""Pydantic models for FrenchLaw Bench."""
+"""Pydantic models for FrenchLaw Bench.
 
-from frenchlaw_bench.models.enums import Category, Dimension, SubCategory, TaskType
-from frenchlaw_bench.models.result import AggregateScores, BenchmarkRun, TaskResult
-from frenchlaw_bench.models.task import Rubric, RubricItem, Task
-from frenchlaw_bench.models.workflow import CessionActions
+Les exports sont resolus a la demande : importer `models.enums` ne construit
+pas les modeles de resultats ni de workflow.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+
+_EXPORTS = {
+    "Category": "enums",
+    "SubCategory": "enums",
+    "TaskType": "enums",
+    "Dimension": "enums",
+    "Task": "task",
+    "Rubric": "task",
+    "RubricItem": "task",
+    "TaskResult": "result",
+    "BenchmarkRun": "result",
+    "AggregateScores": "result",
+    "CessionActions": "workflow",
+}
 
 __all__ = [
     "Category",
@@ -18,3 +35,11 @@ __all__ = [
     "AggregateScores",
     "CessionActions",
 ]
+
+
+def __getattr__(name: str) -> object:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    globals()[name] = value
+    return value
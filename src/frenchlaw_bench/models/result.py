@@ -20,6 +20,17 @@ class RubricItemResult(BaseModel):
     evidence: list[str] = Field(default_factory=list, description="Passages verbatim extraits")
     confidence: float = Field(default=1.0, ge=0.0, le=1.0)
     dimension: str = ""
+    item_hash: str = Field(
+        default="", description="Empreinte du critere juge (RubricItem.content_hash)"
+    )
+    judge_tier: str | None = Field(
+        default=None,
+        description="rule (regle deterministe) ; juge en cascade : fast | strong ; None sinon",
+    )
+    votes: list[bool | None] = Field(
+        default_factory=list,
+        description="Votes successifs du juge en auto-coherence (None = illisible), vide sinon",
+    )
 
 
 class HallucinationDetail(BaseModel):
@@ -41,6 +52,7 @@ class TaskResult(BaseModel):
     sub_category: str = ""
     task_type: str = ""
     model_id: str
+    sample_index: int = Field(default=0, description="Echantillon (0 a N-1) avec --samples N")
     response: str = Field(description="Reponse brute du LLM")
     rubric_results: list[RubricItemResult] = Field(default_factory=list)
     negatif_results: list[RubricItemResult] = Field(
@@ -62,6 +74,9 @@ class TaskResult(BaseModel):
     input_tokens: int = 0
     output_tokens: int = 0
     total_tokens: int = 0
+    verification_context_tokens: int = Field(
+        default=0, description="Tokens de contexte source envoyes a la verification des claims"
+    )
     cost_usd: float = 0.0
     error: str | None = Field(default=None, description="Message d'erreur si la tache a echoue")
     retry_count: int = 0
@@ -69,6 +84,15 @@ class TaskResult(BaseModel):
     rubric_items_total: int = 0
     negatif_items_triggered: int = 0
     negatif_items_total: int = 0
+    judgment_reuse: str | None = Field(
+        default=None, description="Verdicts repris d'une reponse deja jugee : exact | near"
+    )
+    judgment_similarity: float | None = Field(
+        default=None, description="Similarite MinHash avec la reponse dont les verdicts sont repris"
+    )
+    rescored_items: list[str] = Field(
+        default_factory=list, description="Criteres rejuges par `flb rescore` (ajoutes ou modifies)"
+    )
 
 
 class LatencyStats(BaseModel):
@@ -109,6 +133,13 @@ class AggregateScores(BaseModel):
     answer_score_ci_lower: float = 0.0
     answer_score_ci_upper: float = 0.0
 
+    # Echantillonnage multiple (--samples) : variance intra-tache (moyenne des
+    # variances des echantillons d'une tache) et inter-taches (variance des
+    # moyennes par tache). L'IC est alors un bootstrap hierarchique.
+    samples_per_task: float = 1.0
+    within_task_variance: float | None = None
+    between_task_variance: float | None = None
+
     # Ventilations
     answer_score_by_category: dict[str, float] = Field(default_factory=dict)
     answer_score_by_task_type: dict[str, float] = Field(default_factory=dict)
@@ -135,6 +166,10 @@ class AggregateScores(BaseModel):
     negatif_items_triggered_total: int = 0
     negatif_items_total: int = 0
 
+    # Verdicts repris d'une reponse deja jugee (identique ou quasi identique)
+    judgments_reused_exact: int = 0
+    judgments_reused_near: int = 0
+
     # Latence
     latency: LatencyStats = Field(default_factory=LatencyStats)
 
@@ -150,6 +185,71 @@ class AggregateScores(BaseModel):
     total_tokens: int = 0
 
 
+class RescoreInfo(BaseModel):
+    """Re-scoring d'un run existant (`flb rescore`) : criteres recalcules par tache."""
+
+    source_run_id: str
+    incremental: bool = True
+    items_added: dict[int, list[str]] = Field(default_factory=dict)
+    items_changed: dict[int, list[str]] = Field(default_factory=dict)
+    items_removed: dict[int, list[str]] = Field(default_factory=dict)
+    items_failed: dict[int, list[str]] = Field(
+        default_factory=dict,
+        description="Criteres a rejuger dont le jugement a echoue, ancien verdict conserve",
+    )
+    tasks_missing: list[int] = Field(
+        default_factory=list, description="Taches absentes du jeu courant, resultats retires"
+    )
+    results_rescored: int = 0
+    judge_calls: int = 0
+    cost_usd: float = 0.0
+
+
+class CascadeTier(BaseModel):
+    """Bilan de la cascade de juges pour une dimension (ou l'ensemble)."""
+
+    items: int = 0
+    escalated: int = 0
+    escalated_agreement: float | None = Field(
+        default=None, description="Accord rapide/principal sur les criteres escalades"
+    )
+    calibrated: int = 0
+    calibration_agreement: float | None = Field(
+        default=None, description="Accord rapide/principal sur l'echantillon de calibration"
+    )
+
+
+class CascadeReport(BaseModel):
+    """Juge en cascade d'un run : configuration, appels et couts par niveau, accord."""
+
+    fast_model: str
+    strong_model: str
+    confidence_threshold: float
+    escalate_dimensions: list[str] = Field(default_factory=list)
+    calibration_rate: float = 0.0
+    calls_fast: int = 0
+    calls_strong: int = Field(
+        default=0, description="Appels du juge principal (criteres, hallucinations, sources)"
+    )
+    cost_fast_usd: float = 0.0
+    cost_strong_usd: float = 0.0
+    total: CascadeTier = Field(default_factory=CascadeTier)
+    by_dimension: dict[str, CascadeTier] = Field(default_factory=dict)
+
+
+class SelfConsistencyReport(BaseModel):
+    """Vote majoritaire du juge : configuration et votes effectivement tires."""
+
+    max_votes: int
+    temperature: float
+    stop_confidence: float
+    items: int = Field(default=0, description="Criteres juges par vote (hors verdicts repris)")
+    votes: int = Field(default=0, description="Appels du juge pour ces criteres")
+    votes_per_item: float | None = None
+    stopped_early: int = Field(default=0, description="Criteres acquis avant max_votes")
+    split: int = Field(default=0, description="Criteres dont les votes lisibles divergent")
+
+
 class RunMetadata(BaseModel):
     """Metadonnees d'une execution du benchmark."""
 
@@ -161,12 +261,66 @@ class RunMetadata(BaseModel):
     subject_models: list[str] = Field(default_factory=list)
     judge_model: str = ""
     judge_temperature: float = 0.0
+    claim_extraction: str = Field(default="llm", description="llm | citations | hybrid")
+    retrieval_top_k: int = Field(default=0, description="0 = contexte documentaire complet")
+    retrieval_token_budget: int = 0
+    combined_extraction: bool = Field(
+        default=False, description="Source Score issu de l'extraction des claims"
+    )
+    samples_per_task: int = Field(default=1, description="Reponses du sujet par tache")
+    sample_temperature: float = Field(
+        default=0.0, description="Temperature du sujet (> 0 si samples_per_task > 1)"
+    )
+    reuse_judgments: str = Field(
+        default="off", description="Reprise des verdicts deja rendus : off | exact | near"
+    )
+    reuse_threshold: float | None = Field(
+        default=None, description="Similarite MinHash minimale en mode near"
+    )
+    judge_cascade: CascadeReport | None = Field(
+        default=None, description="Renseigne si les criteres sont juges en cascade"
+    )
+    rules: bool = Field(
+        default=True, description="Regles deterministes des criteres appliquees avant le juge"
+    )
+    judge_output: str = Field(
+        default="verbatim", description="Sortie du juge sur les criteres : verbatim | spans"
+    )
+    self_consistency: SelfConsistencyReport | None = Field(
+        default=None, description="Renseigne si le juge vote sur plusieurs verdicts"
+    )
+    rescore: RescoreInfo | None = Field(
+        default=None, description="Renseigne si le run est un re-scoring d'un run existant"
+    )
 
     # Dataset
     dataset_path: str = ""
     dataset_sha256: str = ""
     n_tasks: int = 0
 
+    # Budget
+    max_cost_usd: float | None = Field(default=None, description="Plafond de cout du run")
+    cost_spent_usd: float = Field(default=0.0, description="Cout reel sujet + juge")
+    budget_exhausted: bool = False
+    n_tasks_skipped: int = Field(default=0, description="Taches non lancees (budget atteint)")
+
+    # Ordonnancement
+    schedule: str = Field(default="csv", description="lpt | csv")
+    expected_makespan_seconds: float = Field(
+        default=0.0, description="Makespan attendu avec l'ordre retenu"
+    )
+    expected_csv_makespan_seconds: float = Field(
+        default=0.0, description="Makespan attendu dans l'ordre du CSV"
+    )
+    makespan_seconds: float = Field(default=0.0, description="Makespan mesure")
+
+    # Parsing des sorties JSON, par modele (calls, parse_failures, repaired,
+    # unrecovered, failure_rate)
+    parse_stats: dict[str, dict] = Field(default_factory=dict)
+    # Verdicts du juge sur les criteres, par modele juge (calls, input_tokens,
+    # output_tokens, latency_seconds, output_tokens_per_call, latency_per_call)
+    verdict_stats: dict[str, dict] = Field(default_factory=dict)
+
     # Environnement
     python_version: str = Field(default_factory=lambda: sys.version)
     platform: str = Field(default_factory=lambda: platform.platform())
@@ -188,7 +342,5 @@ class BenchmarkRun(BaseModel):
     models: list[str]
     metadata: RunMetadata = Field(default_factory=RunMetadata)
     task_results: list[TaskResult] = Field(default_factory=list)
-    failed_tasks: list[TaskResult] = Field(
-        default_factory=list, description="Taches ayant echoue"
-    )
+    failed_tasks: list[TaskResult] = Field(default_factory=list, description="Taches ayant echoue")
     aggregates: list[AggregateScores] = Field(default_factory=list)
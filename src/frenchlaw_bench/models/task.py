@@ -2,11 +2,32 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+import hashlib
+import json
+from collections.abc import Mapping
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from frenchlaw_bench.models.enums import Category, Dimension, SubCategory, TaskType
 
 
+class RubricRule(BaseModel):
+    """Règle déterministe d'un critère, évaluée localement avant le juge LLM.
+
+    - kind : citation (comparée aux citations normalisées de la réponse), mot-cle
+      (expressions, sans casse ni accents) ou regex
+    - patterns : motifs tels qu'écrits dans le rubric ; une seule occurrence
+      suffit à déclencher la règle
+    - policy : issue concluante de la règle ; si-present (critère satisfait si
+      la règle se déclenche), si-absent (non satisfait sinon) ou toujours
+    """
+
+    kind: str = Field(description="citation | mot-cle | regex")
+    patterns: list[str] = Field(min_length=1)
+    policy: str = Field(default="si-present", description="si-present | si-absent | toujours")
+
+
 class RubricItem(BaseModel):
     """Un critère individuel dans un rubric."""
 
@@ -18,36 +39,85 @@ class RubricItem(BaseModel):
         default=None,
         description="Pour les pénalités cumulatives, le max de points retirables",
     )
+    rule: RubricRule | None = Field(
+        default=None, description="Règle déterministe évaluée avant le juge (annotation {{...}})"
+    )
+
+    @property
+    def content_hash(self) -> str:
+        """Empreinte du critère tel que jugé (id, description, points, dimension).
+
+        La règle éventuelle n'en fait pas partie : la modifier ne change pas ce
+        que le juge évalue.
+        """
+        content = [self.id, self.description, self.points, self.dimension.value]
+        return hashlib.sha256(json.dumps(content, ensure_ascii=False).encode()).hexdigest()[:16]
 
 
 class Rubric(BaseModel):
-    """Grille de notation complète pour une tâche."""
+    """Grille de notation complète pour une tâche.
 
-    items: list[RubricItem]
+    Immuable : l'index des critères par dimension est calculé à la construction
+    (et conservé dans le bundle de tâches), puis recalculé par `model_copy`
+    lorsque `items` est remplacé.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    items: tuple[RubricItem, ...]
+
+    # Positions des criteres par dimension
+    _by_dimension: dict[Dimension, list[int]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, context: Any, /) -> None:
+        index: dict[Dimension, list[int]] = {}
+        for pos, item in enumerate(self.items):
+            index.setdefault(item.dimension, []).append(pos)
+        self._by_dimension = index
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Rubric:
+        if update is None or "items" not in update:
+            return super().model_copy(update=update, deep=deep)
+        update = {**update, "items": tuple(update["items"])}
+        copy = super().model_copy(update=update, deep=deep)
+        copy.model_post_init(None)
+        return copy
+
+    def index_by_dimension(self) -> dict[Dimension, list[int]]:
+        return self._by_dimension
+
+    def items_for(self, dimension: Dimension) -> list[RubricItem]:
+        return [self.items[i] for i in self._by_dimension.get(dimension, [])]
 
     @property
     def total_positive_points(self) -> float:
         return sum(item.points for item in self.items if item.points > 0)
 
+    @property
+    def positive_items(self) -> list[RubricItem]:
+        """Criteres hors Negatif, dans l'ordre du rubric."""
+        negatif = set(self._by_dimension.get(Dimension.NEGATIF, []))
+        return [item for pos, item in enumerate(self.items) if pos not in negatif]
+
     @property
     def structure_items(self) -> list[RubricItem]:
-        return [i for i in self.items if i.dimension == Dimension.STRUCTURE]
+        return self.items_for(Dimension.STRUCTURE)
 
     @property
     def style_items(self) -> list[RubricItem]:
-        return [i for i in self.items if i.dimension == Dimension.STYLE]
+        return self.items_for(Dimension.STYLE)
 
     @property
     def substance_items(self) -> list[RubricItem]:
-        return [i for i in self.items if i.dimension == Dimension.SUBSTANCE]
+        return self.items_for(Dimension.SUBSTANCE)
 
     @property
     def methodologie_items(self) -> list[RubricItem]:
-        return [i for i in self.items if i.dimension == Dimension.METHODOLOGIE]
+        return self.items_for(Dimension.METHODOLOGIE)
 
     @property
     def negatif_items(self) -> list[RubricItem]:
-        return [i for i in self.items if i.dimension == Dimension.NEGATIF]
+        return self.items_for(Dimension.NEGATIF)
 
 
 class Task(BaseModel):
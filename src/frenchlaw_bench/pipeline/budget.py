@@ -0,0 +1,120 @@
+"""Suivi des couts d'un run et plafond budgetaire."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+
+from frenchlaw_bench.llm.base import BaseLLMClient, LLMResponse
+from frenchlaw_bench.scoring.aggregator import _estimate_cost
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class UsageStats:
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    latency_seconds: float = 0.0
+
+
+class CostTracker:
+    """Cumule les couts de tous les appels LLM d'un run (sujet et juge).
+
+    Les couts sont ventiles par (modele sujet, role) : les appels du juge sont
+    imputes au modele sujet dont ils evaluent la reponse. Si `max_cost_usd`
+    est defini, `exhausted` passe a True des que le plafond est atteint : le
+    pipeline cesse alors de lancer de nouvelles taches, celles en cours
+    terminent normalement.
+    """
+
+    def __init__(self, max_cost_usd: float | None = None) -> None:
+        self.max_cost_usd = max_cost_usd
+        self.usage: dict[tuple[str, str], UsageStats] = {}
+        self.spent_usd = 0.0
+        self._warned = False
+
+    @property
+    def exhausted(self) -> bool:
+        return self.max_cost_usd is not None and self.spent_usd >= self.max_cost_usd
+
+    def record(self, subject_model: str, role: str, resp: LLMResponse, billed_model: str) -> None:
+        cost = _estimate_cost(billed_model, resp.input_tokens, resp.output_tokens)
+        stats = self.usage.setdefault((subject_model, role), UsageStats())
+        stats.calls += 1
+        stats.input_tokens += resp.input_tokens
+        stats.output_tokens += resp.output_tokens
+        stats.cost_usd += cost
+        stats.latency_seconds += resp.latency_seconds
+        self.spent_usd += cost
+
+        if self.exhausted and not self._warned:
+            self._warned = True
+            logger.warning(
+                "Budget de $%.2f atteint ($%.2f depenses) : plus aucune nouvelle tache",
+                self.max_cost_usd,
+                self.spent_usd,
+            )
+
+    def cost_for(self, subject_model: str, role: str) -> float:
+        stats = self.usage.get((subject_model, role))
+        return stats.cost_usd if stats else 0.0
+
+
+class TrackedClient(BaseLLMClient):
+    """Client LLM qui enregistre l'usage de chaque appel dans un CostTracker."""
+
+    def __init__(
+        self,
+        inner: BaseLLMClient,
+        tracker: CostTracker,
+        subject_model: str,
+        role: str,
+    ) -> None:
+        self.inner = inner
+        self.model = inner.model
+        self._tracker = tracker
+        self._subject_model = subject_model
+        self._role = role
+
+    async def complete(
+        self,
+        prompt: str,
+        *,
+        system: str = "",
+        temperature: float = 0.0,
+        max_tokens: int = 4096,
+        response_format: dict | None = None,
+    ) -> LLMResponse:
+        resp = await self.inner.complete(
+            prompt,
+            system=system,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format=response_format,
+        )
+        self._tracker.record(self._subject_model, self._role, resp, self.inner.model)
+        return resp
+
+    async def complete_n(
+        self,
+        prompt: str,
+        n: int,
+        *,
+        system: str = "",
+        temperature: float = 0.0,
+        max_tokens: int = 4096,
+    ) -> list[LLMResponse]:
+        responses = await self.inner.complete_n(
+            prompt, n, system=system, temperature=temperature, max_tokens=max_tokens
+        )
+        for resp in responses:
+            self._tracker.record(self._subject_model, self._role, resp, self.inner.model)
+        return responses
+
+    async def close(self) -> None:
+        # Le client sous-jacent peut etre partage (juge) : sa fermeture
+        # reste a la charge de son proprietaire.
+        return None
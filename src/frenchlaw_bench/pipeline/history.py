@@ -0,0 +1,148 @@
+"""Historique local des durees d'evaluation par (modele, tache).
+
+Fichier JSON compact (`results/history.json`) mis a jour a la fin de chaque run
+par moyenne mobile exponentielle. Il alimente l'ordonnancement des taches
+(plus longues d'abord) et le planificateur de cout/duree.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from frenchlaw_bench.models.result import TaskResult
+
+logger = logging.getLogger(__name__)
+
+HISTORY_VERSION = 1
+HISTORY_FILENAME = "history.json"
+
+# Poids de la derniere observation dans la moyenne mobile
+EMA_ALPHA = 0.5
+
+
+@dataclass
+class TaskStats:
+    """Statistiques lissees d'une tache pour un modele."""
+
+    latency_seconds: float
+    output_tokens: float
+    rubric_size: int
+    claims: float = 0.0
+    n_runs: int = 1
+
+
+class RunHistory:
+    """Historique {modele: {numero de tache: TaskStats}}."""
+
+    def __init__(self, entries: dict[str, dict[int, TaskStats]] | None = None) -> None:
+        self.entries: dict[str, dict[int, TaskStats]] = entries or {}
+
+    @classmethod
+    def load(cls, path: Path) -> RunHistory:
+        if not path.exists():
+            return cls()
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Historique illisible, ignore : %s", path)
+            return cls()
+        if data.get("version") != HISTORY_VERSION:
+            return cls()
+        return cls(
+            {
+                model_id: {int(n): TaskStats(**stats) for n, stats in tasks.items()}
+                for model_id, tasks in data.get("models", {}).items()
+            }
+        )
+
+    @classmethod
+    def from_summaries(cls, results_dir: Path) -> RunHistory:
+        """Reconstruit un historique a partir des `summary.json` des runs passes."""
+        history = cls()
+        if not results_dir.exists():
+            return history
+        summaries = sorted(results_dir.glob("*/summary.json"), key=lambda p: p.stat().st_mtime)
+        for summary_path in summaries:
+            try:
+                data = json.loads(summary_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                continue
+            for ts in data.get("task_scores", []):
+                if ts.get("error"):
+                    continue
+                history.observe(
+                    ts["model_id"],
+                    ts["task_number"],
+                    latency_seconds=ts.get("latency_seconds", 0.0),
+                    output_tokens=ts.get("output_tokens", 0),
+                    rubric_size=ts.get("rubric_size", 0),
+                    claims=ts.get("claims_total", 0),
+                )
+        return history
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": HISTORY_VERSION,
+            "models": {
+                model_id: {str(n): asdict(stats) for n, stats in sorted(tasks.items())}
+                for model_id, tasks in sorted(self.entries.items())
+            },
+        }
+        path.write_text(json.dumps(data, indent=1, ensure_ascii=False), encoding="utf-8")
+
+    def observe(
+        self,
+        model_id: str,
+        task_number: int,
+        *,
+        latency_seconds: float,
+        output_tokens: float,
+        rubric_size: int,
+        claims: float = 0.0,
+    ) -> None:
+        tasks = self.entries.setdefault(model_id, {})
+        prev = tasks.get(task_number)
+        if prev is None:
+            tasks[task_number] = TaskStats(latency_seconds, output_tokens, rubric_size, claims)
+            return
+        a = EMA_ALPHA
+        prev.latency_seconds = a * latency_seconds + (1 - a) * prev.latency_seconds
+        prev.output_tokens = a * output_tokens + (1 - a) * prev.output_tokens
+        prev.claims = a * claims + (1 - a) * prev.claims
+        prev.rubric_size = rubric_size or prev.rubric_size
+        prev.n_runs += 1
+
+    def update(self, results: list[TaskResult]) -> None:
+        """Integre les resultats reussis d'un run (premier echantillon de chaque tache)."""
+        for r in results:
+            if r.error or r.sample_index:
+                continue
+            self.observe(
+                r.model_id,
+                r.task_number,
+                latency_seconds=r.latency_seconds,
+                output_tokens=r.output_tokens,
+                rubric_size=r.rubric_items_total + r.negatif_items_total,
+                claims=len(r.hallucination_details),
+            )
+
+    def get(self, model_id: str, task_number: int) -> TaskStats | None:
+        return self.entries.get(model_id, {}).get(task_number)
+
+    def model_stats(self, model_id: str) -> list[TaskStats]:
+        return list(self.entries.get(model_id, {}).values())
+
+    def task_stats(self, task_number: int) -> list[TaskStats]:
+        return [t[task_number] for t in self.entries.values() if task_number in t]
+
+
+def load_history(results_dir: Path) -> RunHistory:
+    """Historique du dossier de resultats, reconstruit depuis les runs passes si absent."""
+    path = results_dir / HISTORY_FILENAME
+    if path.exists():
+        return RunHistory.load(path)
+    return RunHistory.from_summaries(results_dir)
@@ -0,0 +1,176 @@
+"""Reutilisation des verdicts du juge pour les reponses deja jugees.
+
+Les verdicts (criteres positifs, criteres Negatif, hallucinations, Source
+Score) de chaque reponse jugee sont conserves dans `.cache/judgments.sqlite`,
+indexes par configuration du juge (modele, options, contenu de la tache), par
+tache et par empreinte de la reponse (voir `scoring.fingerprint`). Une reponse
+identique apres normalisation reprend les verdicts existants ; en mode "near",
+une reponse dont la similarite MinHash depasse le seuil les reprend aussi.
+
+Les verdicts repris pour une quasi-copie sont ceux de la reponse la plus
+proche : c'est une approximation, signalee dans le `TaskResult`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Self
+
+from frenchlaw_bench.models.result import HallucinationDetail, RubricItemResult
+from frenchlaw_bench.scoring.fingerprint import ResponseFingerprint
+from frenchlaw_bench.scoring.hallucination_detector import HallucinationResult
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = "judgments.sqlite"
+# Modes de reutilisation : "off", "exact" (hash des tokens normalises), "near" (MinHash)
+REUSE_MODES: tuple[str, ...] = ("off", "exact", "near")
+DEFAULT_REUSE_THRESHOLD = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS judgments (
+    judge_key TEXT NOT NULL,
+    task_number INTEGER NOT NULL,
+    exact_hash TEXT NOT NULL,
+    signature BLOB NOT NULL,
+    verdicts TEXT NOT NULL,
+    PRIMARY KEY (judge_key, task_number, exact_hash)
+);
+"""
+
+
+@dataclass
+class Verdicts:
+    """Verdicts du juge sur une reponse, independants de la ponderation."""
+
+    rubric_results: list[RubricItemResult]
+    negatif_results: list[RubricItemResult]
+    hallucination: HallucinationResult
+    source_score: float | None
+
+    def to_json(self) -> str:
+        halluc = asdict(self.hallucination)
+        halluc["details"] = [d.model_dump() for d in self.hallucination.details]
+        return json.dumps(
+            {
+                "rubric_results": [r.model_dump() for r in self.rubric_results],
+                "negatif_results": [r.model_dump() for r in self.negatif_results],
+                "hallucination": halluc,
+                "source_score": self.source_score,
+            },
+            ensure_ascii=False,
+        )
+
+    @classmethod
+    def from_json(cls, raw: str) -> Verdicts:
+        data = json.loads(raw)
+        halluc = data["hallucination"]
+        halluc["details"] = [HallucinationDetail(**d) for d in halluc["details"]]
+        return cls(
+            rubric_results=[RubricItemResult(**r) for r in data["rubric_results"]],
+            negatif_results=[RubricItemResult(**r) for r in data["negatif_results"]],
+            hallucination=HallucinationResult(**halluc),
+            source_score=data["source_score"],
+        )
+
+
+@dataclass
+class JudgmentMatch:
+    """Verdicts repris : "exact" ou "near", avec la similarite estimee."""
+
+    verdicts: Verdicts
+    kind: str
+    similarity: float
+
+
+class JudgmentCache:
+    """Verdicts deja rendus, par (configuration du juge, tache, empreinte)."""
+
+    def __init__(
+        self, path: Path, *, mode: str = "exact", threshold: float = DEFAULT_REUSE_THRESHOLD
+    ) -> None:
+        if mode not in REUSE_MODES:
+            raise ValueError(f"Mode de reutilisation inconnu : {mode!r} ({REUSE_MODES})")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.mode = mode
+        self.threshold = threshold
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+        # Empreintes par (configuration, tache), chargees a la premiere recherche
+        self._fingerprints: dict[tuple[str, int], list[ResponseFingerprint]] = {}
+
+    @classmethod
+    def open(cls, cache_dir: Path, **kwargs: object) -> JudgmentCache:
+        return cls(cache_dir / CACHE_FILENAME, **kwargs)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _known(self, judge_key: str, task_number: int) -> list[ResponseFingerprint]:
+        key = (judge_key, task_number)
+        if key not in self._fingerprints:
+            rows = self._conn.execute(
+                "SELECT exact_hash, signature FROM judgments WHERE judge_key = ? AND task_number = ?",
+                (judge_key, task_number),
+            )
+            self._fingerprints[key] = [ResponseFingerprint.from_bytes(e, s) for e, s in rows]
+        return self._fingerprints[key]
+
+    def lookup(
+        self, judge_key: str, task_number: int, fingerprint: ResponseFingerprint
+    ) -> JudgmentMatch | None:
+        """Verdicts de la reponse deja jugee la plus proche, si elle est assez proche."""
+        if self.mode == "off":
+            return None
+        best, best_similarity = None, 0.0
+        for known in self._known(judge_key, task_number):
+            if known.exact == fingerprint.exact:
+                best, best_similarity = known, 1.0
+                break
+            if self.mode == "near":
+                similarity = known.similarity(fingerprint)
+                if similarity > best_similarity:
+                    best, best_similarity = known, similarity
+        if best is None or (best_similarity < 1.0 and best_similarity < self.threshold):
+            return None
+        row = self._conn.execute(
+            "SELECT verdicts FROM judgments"
+            " WHERE judge_key = ? AND task_number = ? AND exact_hash = ?",
+            (judge_key, task_number, best.exact),
+        ).fetchone()
+        kind = "exact" if best.exact == fingerprint.exact else "near"
+        logger.debug("Tache %d : verdicts repris (%s, %.2f)", task_number, kind, best_similarity)
+        return JudgmentMatch(Verdicts.from_json(row[0]), kind, best_similarity)
+
+    def store(
+        self,
+        judge_key: str,
+        task_number: int,
+        fingerprint: ResponseFingerprint,
+        verdicts: Verdicts,
+    ) -> None:
+        known = self._known(judge_key, task_number)
+        with self._conn:
+            cur = self._conn.execute(
+                "INSERT OR IGNORE INTO judgments VALUES (?, ?, ?, ?, ?)",
+                (
+                    judge_key,
+                    task_number,
+                    fingerprint.exact,
+                    fingerprint.signature_bytes(),
+                    verdicts.to_json(),
+                ),
+            )
+        if cur.rowcount:
+            known.append(fingerprint)
@@ -0,0 +1,231 @@
+"""Planification pre-vol : estimation des appels, tokens, couts et duree d'un run.
+
+Le nombre d'appels juge depend de la taille des rubrics et du nombre de claims
+extraits ; les volumes de tokens dependent des prompts, des documents et de la
+longueur des reponses. Les estimations s'appuient sur l'historique local des
+runs precedents (voir `pipeline.history`) lorsqu'il existe, sinon sur des
+valeurs par defaut prudentes.
+
+Avec `samples > 1`, chaque echantillon est juge separement (reprise des
+jugements ignoree). Si le provider accepte le parametre `n`, les echantillons
+d'une tache sont generes en un appel dont le prompt n'est facture qu'une fois ;
+sinon chaque echantillon est un appel complet. Les jugements des echantillons
+partagent le debit du juge : leur duree est comptee par echantillon.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from frenchlaw_bench.documents.extractor import load_task_documents
+from frenchlaw_bench.llm.base import estimate_tokens
+from frenchlaw_bench.models.task import Task
+from frenchlaw_bench.pipeline.history import RunHistory, load_history
+from frenchlaw_bench.pipeline.runner import EvaluationOptions
+from frenchlaw_bench.pipeline.scheduler import (
+    CALL_OVERHEAD_SECONDS,
+    DEFAULT_SUBJECT_OUTPUT_TOKENS,
+    TOKENS_PER_SECOND,
+    estimate_task_seconds,
+    simulate_makespan,
+)
+from frenchlaw_bench.scoring.aggregator import _estimate_cost
+from frenchlaw_bench.scoring.prompts import (
+    HALLUCINATION_EXTRACT_PROMPT,
+    HALLUCINATION_VERIFY_PROMPT,
+    NEGATIF_ITEM_PROMPT,
+    RUBRIC_ITEM_PROMPT,
+    RUBRIC_JUDGE_SYSTEM,
+    SOURCE_SCORE_PROMPT,
+)
+
+logger = logging.getLogger(__name__)
+
+# Valeur par defaut en l'absence d'historique
+DEFAULT_CLAIMS_PER_TASK = 12
+
+# Tokens de sortie typiques par appel juge
+_JUDGE_OUTPUT_TOKENS: dict[str, int] = {
+    "rubric": 250,
+    "negatif": 200,
+    "extraction": 45,  # par claim extrait
+    "verification": 120,
+    "source": 400,
+}
+
+STAGES: tuple[str, ...] = (
+    "subject",
+    "rubric",
+    "negatif",
+    "extraction",
+    "verification",
+    "source",
+)
+
+
+@dataclass
+class StageEstimate:
+    stage: str
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+
+
+@dataclass
+class ModelPlan:
+    model_id: str
+    stages: list[StageEstimate]
+    wall_seconds: float
+    from_history: bool = False
+    task_seconds: list[float] = field(default_factory=list)
+
+    @property
+    def calls(self) -> int:
+        return sum(s.calls for s in self.stages)
+
+    @property
+    def input_tokens(self) -> int:
+        return sum(s.input_tokens for s in self.stages)
+
+    @property
+    def output_tokens(self) -> int:
+        return sum(s.output_tokens for s in self.stages)
+
+    @property
+    def cost_usd(self) -> float:
+        return sum(s.cost_usd for s in self.stages)
+
+
+def _call_seconds(output_tokens: float) -> float:
+    return CALL_OVERHEAD_SECONDS + output_tokens / TOKENS_PER_SECOND
+
+
+def plan_model(
+    tasks: Iterable[Task],
+    model_id: str,
+    judge_model: str,
+    max_concurrent: int,
+    options: EvaluationOptions | None = None,
+    history: RunHistory | None = None,
+    supports_n: bool = True,
+) -> ModelPlan:
+    """Estime appels, tokens, cout et duree pour un modele sujet.
+
+    `supports_n` : le provider du sujet accepte le parametre `n` (voir
+    `OpenRouterClient.complete_n`), pris en compte si `options.samples > 1`.
+    """
+    opts = options or EvaluationOptions()
+    n_samples = max(1, opts.samples)
+    model_stats = history.model_stats(model_id) if history is not None else []
+    has_history = bool(model_stats)
+    mean_output = sum(s.output_tokens for s in model_stats) / len(model_stats) if has_history else 0
+    mean_claims = sum(s.claims for s in model_stats) / len(model_stats) if has_history else 0
+    response_tokens = mean_output or DEFAULT_SUBJECT_OUTPUT_TOKENS
+    n_claims = mean_claims or DEFAULT_CLAIMS_PER_TASK
+
+    system_tokens = estimate_tokens(RUBRIC_JUDGE_SYSTEM)
+    rubric_tpl = estimate_tokens(RUBRIC_ITEM_PROMPT) + system_tokens
+    negatif_tpl = estimate_tokens(NEGATIF_ITEM_PROMPT) + system_tokens
+    extract_tpl = estimate_tokens(HALLUCINATION_EXTRACT_PROMPT)
+    verify_tpl = estimate_tokens(HALLUCINATION_VERIFY_PROMPT)
+    source_tpl = estimate_tokens(SOURCE_SCORE_PROMPT)
+
+    totals = {s: StageEstimate(s) for s in STAGES}
+    task_seconds: list[float] = []
+
+    for task in tasks:
+        prompt_tokens = estimate_tokens(task.prompt)
+        doc_tokens = estimate_tokens(load_task_documents(task.documents))
+        n_negatif = len(task.rubric.negatif_items)
+        n_positive = len(task.rubric.items) - n_negatif
+        judged = prompt_tokens + response_tokens
+
+        if opts.retrieval_k > 0 and doc_tokens:
+            verify_context = min(doc_tokens, opts.retrieval_token_budget)
+        else:
+            verify_context = doc_tokens or 15
+
+        stage_calls = {
+            "subject": (1, prompt_tokens + doc_tokens, response_tokens),
+            "rubric": (n_positive, rubric_tpl + judged, _JUDGE_OUTPUT_TOKENS["rubric"]),
+            "negatif": (n_negatif, negatif_tpl + judged, _JUDGE_OUTPUT_TOKENS["negatif"]),
+            "extraction": (
+                0 if opts.claim_extraction == "citations" else 1,
+                extract_tpl + response_tokens,
+                _JUDGE_OUTPUT_TOKENS["extraction"] * n_claims,
+            ),
+            "verification": (
+                round(n_claims),
+                verify_tpl + 40 + verify_context,
+                _JUDGE_OUTPUT_TOKENS["verification"],
+            ),
+            "source": (
+                0 if opts.combined_extraction else 1,
+                source_tpl + response_tokens,
+                _JUDGE_OUTPUT_TOKENS["source"],
+            ),
+        }
+
+        # Par echantillon ci-dessus ; un seul appel sujet pour tous avec `n`
+        for stage, (calls, in_tok, out_tok) in stage_calls.items():
+            if stage == "subject" and supports_n and n_samples > 1:
+                out_tok *= n_samples
+            else:
+                calls *= n_samples
+            est = totals[stage]
+            est.calls += calls
+            est.input_tokens += int(calls * in_tok)
+            est.output_tokens += int(calls * out_tok)
+            billed = model_id if stage == "subject" else judge_model
+            est.cost_usd += _estimate_cost(billed, int(calls * in_tok), int(calls * out_tok))
+
+        # Duree de la tache : les etapes sont sequentielles, les appels d'une
+        # meme etape partent en parallele.
+        seconds, known = estimate_task_seconds(task, model_id, history)
+        if known:
+            # Duree d'un echantillon (generation comprise) : borne prudente
+            seconds *= n_samples
+        else:
+            judging = sum(
+                _call_seconds(out_tok)
+                for stage, (calls, _in_tok, out_tok) in stage_calls.items()
+                if calls and stage != "subject"
+            )
+            seconds = _call_seconds(response_tokens) + n_samples * judging
+        task_seconds.append(seconds)
+
+    task_seconds.sort(reverse=True)
+    return ModelPlan(
+        model_id=model_id,
+        stages=list(totals.values()),
+        wall_seconds=simulate_makespan(task_seconds, max_concurrent),
+        from_history=has_history,
+        task_seconds=task_seconds,
+    )
+
+
+def plan_run(
+    tasks: Iterable[Task],
+    model_ids: list[str],
+    judge_model: str,
+    max_concurrent: int,
+    options: EvaluationOptions | None = None,
+    results_dir: Path | None = None,
+    supports_n: bool = True,
+) -> list[ModelPlan]:
+    """Plan pour chaque modele sujet."""
+    history = load_history(results_dir) if results_dir is not None else None
+    return [
+        plan_model(tasks, m, judge_model, max_concurrent, options, history, supports_n)
+        for m in model_ids
+    ]
+
+
+def run_wall_seconds(plans: list[ModelPlan], max_concurrent: int) -> float:
+    """Duree du run complet : tous les modeles partagent le pool, plus longues d'abord."""
+    durations = sorted((s for p in plans for s in p.task_seconds), reverse=True)
+    return simulate_makespan(durations, max_concurrent)
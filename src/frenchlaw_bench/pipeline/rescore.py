@@ -0,0 +1,311 @@
+"""Re-scoring d'un run existant apres modification des rubrics (`flb rescore`).
+
+Chaque verdict du juge porte l'empreinte du critere juge (`item_hash`, voir
+`RubricItem.content_hash`). En mode incremental, le rubric courant est compare
+a ces empreintes, resultat par resultat : seuls les criteres ajoutes ou
+modifies sont rejuges sur la reponse archivee, les criteres supprimes sont
+retires et tous les autres verdicts sont conserves. Les scores (penalites
+Negatif et hallucinations comprises) sont ensuite recalcules sur l'ensemble
+des verdicts, comme a l'issue d'un run complet.
+
+Un verdict sans empreinte (run anterieur) est considere comme modifie. Les
+criteres munis d'une regle deterministe concluante sont tranches sans juge.
+Un critere dont le nouveau jugement echoue (erreur ou sortie illisible du
+juge) n'est pas compte comme rejuge :
+son ancien verdict (et son ancienne empreinte) est conserve, pour etre
+rejuge au prochain re-scoring.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from frenchlaw_bench.llm.base import BaseLLMClient
+from frenchlaw_bench.models.result import BenchmarkRun, RescoreInfo, RubricItemResult, TaskResult
+from frenchlaw_bench.models.task import RubricItem, Task
+from frenchlaw_bench.pipeline.budget import CostTracker, TrackedClient
+from frenchlaw_bench.scoring.aggregator import aggregate_scores
+from frenchlaw_bench.scoring.answer_scorer import (
+    compute_answer_score_with_penalties,
+    compute_dimension_scores,
+    compute_negatif_penalty,
+)
+from frenchlaw_bench.scoring.hallucination_detector import SEVERITY_PENALTIES
+from frenchlaw_bench.scoring.judge import is_parse_error, judge_negatif_item, judge_rubric_item
+from frenchlaw_bench.scoring.rules import rule_verdict
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ItemChanges:
+    """Ecart entre le rubric courant et les verdicts d'un resultat."""
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    # Criteres ajoutes ou modifies dont le nouveau jugement a echoue
+    failed: list[str] = field(default_factory=list)
+
+    @property
+    def recomputed(self) -> list[str]:
+        return self.added + self.changed
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+def diff_items(
+    items: Sequence[RubricItem], stored: Sequence[RubricItemResult], *, incremental: bool = True
+) -> ItemChanges:
+    """Criteres a rejuger (ajoutes, modifies) et a retirer, dans l'ordre du rubric.
+
+    Hors mode incremental, tous les criteres courants sont consideres comme modifies.
+    """
+    stored_by_id = {r.item_id: r for r in stored}
+    current_ids = {item.id for item in items}
+    changes = ItemChanges(removed=[r.item_id for r in stored if r.item_id not in current_ids])
+    for item in items:
+        previous = stored_by_id.get(item.id)
+        if previous is None:
+            changes.added.append(item.id)
+        elif not incremental or previous.item_hash != item.content_hash:
+            changes.changed.append(item.id)
+    return changes
+
+
+def diff_run(
+    results: Iterable[TaskResult], tasks: Iterable[Task], *, incremental: bool = True
+) -> RescoreInfo:
+    """Criteres a recalculer par tache, sans appel au juge (`flb rescore --dry-run`)."""
+    task_map = {t.number: t for t in tasks}
+    info = RescoreInfo(source_run_id="", incremental=incremental)
+    for r in results:
+        task = task_map.get(r.task_number)
+        if task is None:
+            _note_missing(info, r.task_number)
+            continue
+        if r.error:
+            continue
+        positive, negatif = _diffs(task, r, incremental)
+        _record(info, task, positive, negatif)
+    return info
+
+
+def _diffs(task: Task, r: TaskResult, incremental: bool) -> tuple[ItemChanges, ItemChanges]:
+    return (
+        diff_items(task.rubric.positive_items, r.rubric_results, incremental=incremental),
+        diff_items(task.rubric.negatif_items, r.negatif_results, incremental=incremental),
+    )
+
+
+def _note_missing(info: RescoreInfo, task_number: int) -> None:
+    if task_number not in info.tasks_missing:
+        info.tasks_missing.append(task_number)
+
+
+def _record(info: RescoreInfo, task: Task, *changes: ItemChanges) -> None:
+    """Ajoute les ecarts d'un resultat a ceux de sa tache (ordre du rubric)."""
+    order = {item.id: pos for pos, item in enumerate(task.rubric.items)}
+    for attr in ("added", "changed", "removed", "failed"):
+        ids = {i for c in changes for i in getattr(c, attr)}
+        if not ids:
+            continue
+        by_task = getattr(info, f"items_{attr}")
+        merged = ids | set(by_task.get(task.number, []))
+        by_task[task.number] = sorted(merged, key=lambda i: (order.get(i, len(order)), i))
+    if any(changes):
+        info.results_rescored += 1
+
+
+def _merge(
+    items: Sequence[RubricItem],
+    stored: Sequence[RubricItemResult],
+    fresh: Sequence[RubricItemResult],
+) -> list[RubricItemResult]:
+    """Verdicts dans l'ordre du rubric courant : nouveaux verdicts, sinon verdicts conserves."""
+    by_id = {r.item_id: r for r in stored} | {r.item_id: r for r in fresh}
+    return [by_id[item.id] for item in items if item.id in by_id]
+
+
+async def _rejudge(
+    judge_item,
+    client: BaseLLMClient,
+    task: Task,
+    response: str,
+    item: RubricItem,
+    output: str,
+) -> RubricItemResult:
+    return rule_verdict(item, response) or await judge_item(
+        client, task, response, item, output=output
+    )
+
+
+async def _judge(changes: ItemChanges, coros: list) -> list[RubricItemResult]:
+    """Verdicts des criteres `changes.recomputed` ; les echecs passent dans `changes.failed`."""
+    verdicts = []
+    ids = changes.recomputed
+    for item_id, verdict in zip(
+        ids, await asyncio.gather(*coros, return_exceptions=True), strict=True
+    ):
+        if isinstance(verdict, BaseException):
+            logger.error("Erreur evaluation rubric item %s: %s", item_id, verdict)
+            changes.failed.append(item_id)
+        elif is_parse_error(verdict):
+            changes.failed.append(item_id)
+        else:
+            verdicts.append(verdict)
+    changes.added = [i for i in changes.added if i not in changes.failed]
+    changes.changed = [i for i in changes.changed if i not in changes.failed]
+    return verdicts
+
+
+async def rescore_result(
+    task: Task,
+    r: TaskResult,
+    judge_client: BaseLLMClient,
+    *,
+    incremental: bool = True,
+    judge_output: str = "verbatim",
+) -> tuple[TaskResult, ItemChanges, ItemChanges]:
+    """Rejuge les criteres ajoutes ou modifies d'un resultat et recalcule ses scores."""
+    positive, negatif = _diffs(task, r, incremental)
+    items = {item.id: item for item in task.rubric.items}
+    fresh_positive, fresh_negatif = await asyncio.gather(
+        _judge(
+            positive,
+            [
+                _rejudge(judge_rubric_item, judge_client, task, r.response, items[i], judge_output)
+                for i in positive.recomputed
+            ],
+        ),
+        _judge(
+            negatif,
+            [
+                _rejudge(judge_negatif_item, judge_client, task, r.response, items[i], judge_output)
+                for i in negatif.recomputed
+            ],
+        ),
+    )
+    rubric_results = _merge(task.rubric.positive_items, r.rubric_results, fresh_positive)
+    negatif_results = _merge(task.rubric.negatif_items, r.negatif_results, fresh_negatif)
+
+    # Penalite d'hallucination recalculee : son plafond suit les points positifs du rubric
+    raw_penalty = sum(
+        SEVERITY_PENALTIES.get(d.severity, SEVERITY_PENALTIES["minor"])
+        for d in r.hallucination_details
+        if d.hallucinated
+    )
+    halluc_penalty = min(raw_penalty, task.rubric.total_positive_points)
+    answer_score = compute_answer_score_with_penalties(
+        task.rubric,
+        rubric_results,
+        hallucination_penalty=halluc_penalty,
+        negatif_penalty=compute_negatif_penalty(negatif_results, task.rubric),
+    )
+    rescored = r.model_copy(
+        update={
+            "task_title": task.title,
+            "category": task.category.value,
+            "sub_category": task.sub_category.value,
+            "task_type": task.task_type.value,
+            "rubric_results": rubric_results,
+            "negatif_results": negatif_results,
+            "answer_score": answer_score,
+            "answer_score_by_dimension": compute_dimension_scores(task.rubric, rubric_results),
+            "hallucination_penalty": halluc_penalty,
+            "rubric_items_satisfied": sum(1 for v in rubric_results if v.satisfied),
+            "rubric_items_total": len(rubric_results),
+            "negatif_items_triggered": sum(1 for v in negatif_results if v.satisfied),
+            "negatif_items_total": len(negatif_results),
+            "rescored_items": positive.recomputed + negatif.recomputed,
+        }
+    )
+    return rescored, positive, negatif
+
+
+async def rescore_run(
+    run: BenchmarkRun,
+    tasks: Iterable[Task],
+    judge_client: BaseLLMClient,
+    *,
+    incremental: bool = True,
+    max_concurrent: int = 5,
+    dataset_path: str | None = None,
+    dataset_sha256: str | None = None,
+) -> BenchmarkRun:
+    """Nouveau run : les reponses de `run`, rejugees sur les criteres ajoutes ou modifies.
+
+    Les resultats des taches absentes du jeu courant sont retires ; les
+    resultats en erreur sont conserves tels quels. Les criteres sont rejuges
+    avec la sortie du juge du run d'origine (`judge_output`).
+    """
+    start = datetime.now()
+    task_map = {t.number: t for t in tasks}
+    tracker = CostTracker()
+    semaphore = asyncio.Semaphore(max_concurrent)
+    info = RescoreInfo(source_run_id=run.run_id, incremental=incremental)
+
+    async def rescore(r: TaskResult) -> TaskResult:
+        task = task_map[r.task_number]
+        if r.error:
+            return r
+        async with semaphore:
+            judge = TrackedClient(judge_client, tracker, r.model_id, "judge")
+            rescored, positive, negatif = await rescore_result(
+                task,
+                r,
+                judge,
+                incremental=incremental,
+                judge_output=run.metadata.judge_output,
+            )
+        _record(info, task, positive, negatif)
+        return rescored
+
+    kept = []
+    for r in run.task_results:
+        if r.task_number in task_map:
+            kept.append(r)
+        else:
+            _note_missing(info, r.task_number)
+    if info.tasks_missing:
+        logger.warning("Taches absentes du jeu courant, retirees : %s", info.tasks_missing)
+    results = list(await asyncio.gather(*(rescore(r) for r in kept)))
+
+    info.judge_calls = sum(
+        stats.calls for (_, role), stats in tracker.usage.items() if role == "judge"
+    )
+    info.cost_usd = tracker.spent_usd
+    aggregates = aggregate_scores(None, results)
+    previous_judge_cost = {a.model_id: a.cost_judge_usd for a in run.aggregates}
+    for a in aggregates:
+        a.cost_judge_usd = previous_judge_cost.get(a.model_id, 0.0) + tracker.cost_for(
+            a.model_id, "judge"
+        )
+
+    metadata = run.metadata.model_copy(
+        update={
+            "timestamp_utc": start,
+            "duration_seconds": (datetime.now() - start).total_seconds(),
+            "judge_model": judge_client.model,
+            "dataset_path": dataset_path or run.metadata.dataset_path,
+            "dataset_sha256": dataset_sha256 or run.metadata.dataset_sha256,
+            "n_tasks": len({r.task_number for r in results}),
+            "cost_spent_usd": run.metadata.cost_spent_usd + tracker.spent_usd,
+            "rescore": info,
+        }
+    )
+    return BenchmarkRun(
+        run_id=uuid.uuid4().hex[:12],
+        timestamp=datetime.now(),
+        models=run.models,
+        metadata=metadata,
+        task_results=results,
+        failed_tasks=[r for r in run.failed_tasks if r.task_number in task_map],
+        aggregates=aggregates,
+    )
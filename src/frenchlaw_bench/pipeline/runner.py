@@ -3,43 +3,226 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
 import time
 import uuid
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
 
+from frenchlaw_bench import config
 from frenchlaw_bench.config import DATA_DIR, JUDGE_MODEL, MAX_CONCURRENT
+from frenchlaw_bench.core.bundle import file_sha256
+from frenchlaw_bench.core.sources import TaskSource
 from frenchlaw_bench.documents.extractor import load_task_documents
+from frenchlaw_bench.documents.retriever import (
+    DEFAULT_TOKEN_BUDGET,
+    DEFAULT_TOP_K,
+    DocumentIndex,
+    get_task_index,
+)
+from frenchlaw_bench.llm.base import BaseLLMClient, LLMResponse
 from frenchlaw_bench.llm.openrouter import OpenRouterClient
+from frenchlaw_bench.llm.structured import parse_stats_dict, reset_parse_stats
 from frenchlaw_bench.models.result import (
     BenchmarkRun,
+    CascadeReport,
+    CascadeTier,
     HallucinationDetail,
+    RubricItemResult,
     RunMetadata,
+    SelfConsistencyReport,
     TaskResult,
 )
 from frenchlaw_bench.models.task import Task
+from frenchlaw_bench.pipeline.budget import CostTracker, TrackedClient
+from frenchlaw_bench.pipeline.history import RunHistory
+from frenchlaw_bench.pipeline.judgment_cache import (
+    DEFAULT_REUSE_THRESHOLD,
+    JudgmentCache,
+    Verdicts,
+)
+from frenchlaw_bench.pipeline.scheduler import (
+    MakespanSimulator,
+    ScheduledTask,
+    build_schedule,
+    iter_windows,
+)
 from frenchlaw_bench.scoring.aggregator import _estimate_cost, aggregate_scores
 from frenchlaw_bench.scoring.answer_scorer import (
     compute_answer_score_with_penalties,
     compute_dimension_scores,
     compute_negatif_penalty,
 )
-from frenchlaw_bench.scoring.hallucination_detector import detect_hallucinations
-from frenchlaw_bench.scoring.judge import judge_all_items, judge_negatif_items
+from frenchlaw_bench.scoring.fingerprint import ResponseFingerprint
+from frenchlaw_bench.scoring.hallucination_detector import (
+    HallucinationResult,
+    detect_hallucinations,
+)
+from frenchlaw_bench.scoring.judge import (
+    JudgeCascade,
+    SelfConsistency,
+    TierStats,
+    is_parse_error,
+    judge_all_items,
+    judge_negatif_items,
+    reset_verdict_stats,
+    verdict_stats_dict,
+)
 from frenchlaw_bench.scoring.source_scorer import compute_source_score
 
 logger = logging.getLogger(__name__)
 
+# Taches lues et ordonnancees ensemble quand le run est alimente par un flux
+SCHEDULE_WINDOW = 256
+# Temperature du modele sujet en echantillonnage multiple (--samples > 1)
+DEFAULT_SAMPLE_TEMPERATURE = 0.7
+# A incrementer quand les prompts du juge changent : invalide les verdicts reutilisables
+JUDGMENT_VERSION = 1
+# Juge en cascade : confiance minimale d'un verdict du juge rapide conserve tel quel
+DEFAULT_ESCALATION_THRESHOLD = 0.8
+# Vote majoritaire du juge : temperature des votes et confiance d'arret anticipe
+DEFAULT_VOTE_TEMPERATURE = 0.7
+DEFAULT_VOTE_STOP_CONFIDENCE = 0.9
+
+
+@dataclass
+class EvaluationOptions:
+    """Options d'evaluation d'une tache (extraction, recherche documentaire, etc.).
+
+    - claim_extraction : "llm", "citations" ou "hybrid" (voir EXTRACTION_MODES)
+    - retrieval_k : passages documentaires par claim verifie (0 = dossier complet)
+    - retrieval_token_budget : budget de tokens du contexte par claim
+    - combined_extraction : Source Score issu de l'appel d'extraction des claims
+    - samples : reponses du modele sujet par tache, jugees chacune
+    - sample_temperature : temperature du sujet quand samples > 1 (sinon 0)
+    - reuse_judgments : reprise des verdicts d'une reponse deja jugee ("off",
+      "exact" ou "near", voir REUSE_MODES)
+    - reuse_threshold : similarite MinHash minimale d'une reprise en mode "near"
+    - fast_judge_model : juge rapide de premier niveau (None = pas de cascade)
+    - escalation_threshold : confiance sous laquelle un verdict rapide est rejuge
+    - escalate_dimensions : dimensions toujours jugees par le juge principal
+    - calibration_rate : fraction des autres criteres rejugee pour mesurer l'accord
+    - judge_votes : verdicts au plus par critere, vote majoritaire (1 = pas de vote)
+    - vote_temperature : temperature du juge pour les votes
+    - vote_stop_confidence : confiance de deux premiers votes concordants suffisant
+      a arreter le vote
+    - rules : criteres munis d'une regle deterministe tranches localement si
+      la regle est concluante
+    - judge_output : sortie du juge sur les criteres, "verbatim" ou "spans"
+      (numeros de phrases, voir JUDGE_OUTPUT_MODES)
+    """
+
+    claim_extraction: str = "llm"
+    retrieval_k: int = DEFAULT_TOP_K
+    retrieval_token_budget: int = DEFAULT_TOKEN_BUDGET
+    combined_extraction: bool = False
+    samples: int = 1
+    sample_temperature: float = DEFAULT_SAMPLE_TEMPERATURE
+    reuse_judgments: str = "off"
+    reuse_threshold: float = DEFAULT_REUSE_THRESHOLD
+    fast_judge_model: str | None = None
+    escalation_threshold: float = DEFAULT_ESCALATION_THRESHOLD
+    escalate_dimensions: tuple[str, ...] = ()
+    calibration_rate: float = 0.0
+    judge_votes: int = 1
+    vote_temperature: float = DEFAULT_VOTE_TEMPERATURE
+    vote_stop_confidence: float = DEFAULT_VOTE_STOP_CONFIDENCE
+    rules: bool = True
+    judge_output: str = "verbatim"
+
+    @property
+    def self_consistency(self) -> SelfConsistency | None:
+        if self.judge_votes <= 1:
+            return None
+        return SelfConsistency(
+            max_votes=self.judge_votes,
+            temperature=self.vote_temperature,
+            stop_confidence=self.vote_stop_confidence,
+        )
+
+
+@dataclass
+class _Judgment:
+    """Evaluation d'une reponse par le juge (rubric, negatif, hallucinations, sources)."""
+
+    rubric_results: list[RubricItemResult]
+    negatif_results: list[RubricItemResult]
+    hallucination: HallucinationResult
+    source_score: float | None
+    answer_score: float
+    dimension_scores: dict[str, float]
+    finished_at: float
+    # Verdicts repris d'une reponse deja jugee : "exact" ou "near"
+    reuse: str | None = None
+    similarity: float | None = None
+
+    @property
+    def verdicts(self) -> Verdicts:
+        return Verdicts(
+            self.rubric_results, self.negatif_results, self.hallucination, self.source_score
+        )
+
 
 async def evaluate_task(
     task: Task,
-    subject_client: OpenRouterClient,
-    judge_client: OpenRouterClient,
+    subject_client: BaseLLMClient,
+    judge_client: BaseLLMClient,
     semaphore: asyncio.Semaphore,
-) -> TaskResult:
-    """Evalue une seule tache : appel LLM sujet -> juge -> negatif -> hallucination -> source."""
+    options: EvaluationOptions | None = None,
+    budget: CostTracker | None = None,
+    judgments: JudgmentCache | None = None,
+    cascade: JudgeCascade | None = None,
+) -> TaskResult | None:
+    """Evalue une seule tache : appel LLM sujet -> juge -> negatif -> hallucination -> source.
+
+    Retourne None si le budget du run est epuise avant le demarrage de la tache.
+    Avec `options.samples > 1`, seul le premier echantillon est retourne (voir
+    `evaluate_task_samples`).
+    """
+    results = await evaluate_task_samples(
+        task,
+        subject_client,
+        judge_client,
+        semaphore,
+        options=options,
+        budget=budget,
+        judgments=judgments,
+        cascade=cascade,
+    )
+    return results[0] if results else None
+
+
+async def evaluate_task_samples(
+    task: Task,
+    subject_client: BaseLLMClient,
+    judge_client: BaseLLMClient,
+    semaphore: asyncio.Semaphore,
+    options: EvaluationOptions | None = None,
+    budget: CostTracker | None = None,
+    judgments: JudgmentCache | None = None,
+    cascade: JudgeCascade | None = None,
+) -> list[TaskResult] | None:
+    """Evalue `options.samples` reponses du modele sujet a une tache.
+
+    Les reponses sont demandees en un appel (`complete_n`), puis jugees en
+    parallele ; une reponse identique a une autre n'est jugee qu'une fois.
+    Avec `judgments`, une reponse deja jugee (meme configuration du juge)
+    reprend ses verdicts au lieu d'etre rejugee. Avec `cascade`, les criteres
+    sont d'abord juges par le juge rapide (voir `JudgeCascade`).
+    Un `TaskResult` par echantillon (`sample_index`), None si le budget du run
+    est epuise avant le demarrage de la tache.
+    """
+    opts = options or EvaluationOptions()
+    n_samples = max(1, opts.samples)
     async with semaphore:
+        if budget is not None and budget.exhausted:
+            logger.info("Tache %d ignoree (budget atteint)", task.number)
+            return None
+
         logger.info("Tache %d : %s (modele %s)", task.number, task.title, subject_client.model)
 
         task_start = time.monotonic()
@@ -49,184 +232,514 @@ async def evaluate_task(
         full_prompt = task.prompt
         if doc_context:
             full_prompt = f"{doc_context}\n\n---\n\n{task.prompt}"
+        source_index = get_task_index(task.documents) if opts.retrieval_k > 0 else None
 
+        # 1. Appel au modele sujet
         try:
-            # 1. Appel au modele sujet
-            subject_resp = await subject_client.complete(full_prompt, max_tokens=4096)
-            response_text = subject_resp.content
-
-            # 2. Evaluation des criteres positifs (en parallele)
-            rubric_results = await judge_all_items(judge_client, task, response_text)
-
-            # 3. Evaluation des criteres Negatif (en parallele)
-            negatif_results = await judge_negatif_items(judge_client, task, response_text)
-
-            # 4. Detection d'hallucinations (avec plafond = total points positifs)
-            max_penalty = task.rubric.total_positive_points
-            halluc = await detect_hallucinations(
-                judge_client,
-                response_text,
-                task.title,
-                source_context=doc_context or "Pas de documents source (tache knowledge-only)",
-                max_penalty=max_penalty,
-            )
+            if n_samples > 1:
+                subject_resps = await subject_client.complete_n(
+                    full_prompt, n_samples, temperature=opts.sample_temperature, max_tokens=4096
+                )
+            else:
+                subject_resps = [await subject_client.complete(full_prompt, max_tokens=4096)]
+        except Exception as e:
+            logger.error("Erreur tache %d: %s", task.number, e)
+            return [
+                _error_result(task, subject_client.model, e, time.monotonic() - task_start, i)
+                for i in range(n_samples)
+            ]
 
-            # 5. Source scoring
-            src_score = await compute_source_score(judge_client, response_text)
+        # 2-7. Jugement des echantillons en parallele (reponses distinctes uniquement)
+        distinct = list(dict.fromkeys(r.content for r in subject_resps))
+        by_text = dict(
+            zip(
+                distinct,
+                await asyncio.gather(
+                    *(
+                        _judge_or_reuse(
+                            task,
+                            text,
+                            judge_client,
+                            doc_context,
+                            source_index,
+                            opts,
+                            judgments,
+                            cascade,
+                        )
+                        for text in distinct
+                    ),
+                    return_exceptions=True,
+                ),
+                strict=True,
+            )
+        )
 
-            # 6. Calcul du score final avec toutes les penalites
-            negatif_pen = compute_negatif_penalty(negatif_results, task.rubric)
-            answer_score = compute_answer_score_with_penalties(
-                task.rubric,
-                rubric_results,
-                hallucination_penalty=halluc.penalty_points,
-                negatif_penalty=negatif_pen,
+        results = []
+        seen: set[str] = set()
+        for sample_index, subject_resp in enumerate(subject_resps):
+            judgment = by_text[subject_resp.content]
+            if subject_resp.content in seen and not isinstance(judgment, BaseException):
+                # Echantillon identique a un precedent : meme jugement, repris
+                judgment = replace(judgment, reuse="exact", similarity=1.0)
+            seen.add(subject_resp.content)
+            if isinstance(judgment, BaseException):
+                logger.error("Erreur tache %d: %s", task.number, judgment)
+                results.append(
+                    _error_result(
+                        task,
+                        subject_client.model,
+                        judgment,
+                        time.monotonic() - task_start,
+                        sample_index,
+                    )
+                )
+                continue
+            results.append(
+                _task_result(
+                    task,
+                    subject_client.model,
+                    subject_resp,
+                    judgment,
+                    latency=judgment.finished_at - task_start,
+                    sample_index=sample_index,
+                )
             )
+        return results
 
-            # 7. Scores par dimension
-            dim_scores = compute_dimension_scores(task.rubric, rubric_results)
 
-            # 8. Comptages
-            rubric_satisfied = sum(1 for r in rubric_results if r.satisfied)
-            negatif_triggered = sum(1 for r in negatif_results if r.satisfied)
+def _judge_key(task: Task, judge_model: str, opts: EvaluationOptions) -> str:
+    """Configuration du juge dont dependent les verdicts (modele, options, tache)."""
+    spec = {
+        "version": JUDGMENT_VERSION,
+        "judge_model": judge_model,
+        "claim_extraction": opts.claim_extraction,
+        "retrieval_k": opts.retrieval_k,
+        "retrieval_token_budget": opts.retrieval_token_budget if opts.retrieval_k > 0 else 0,
+        "combined_extraction": opts.combined_extraction,
+        "task": task.model_dump(mode="json"),
+    }
+    if opts.fast_judge_model:
+        spec["cascade"] = [
+            opts.fast_judge_model,
+            opts.escalation_threshold,
+            sorted(opts.escalate_dimensions),
+            opts.calibration_rate,
+        ]
+    if not opts.rules:
+        spec["rules"] = False
+    if opts.judge_output != "verbatim":
+        spec["judge_output"] = opts.judge_output
+    if opts.judge_votes > 1:
+        spec["votes"] = [opts.judge_votes, opts.vote_temperature, opts.vote_stop_confidence]
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()
 
-            # 9. Cout
-            cost = _estimate_cost(
-                subject_client.model,
-                subject_resp.input_tokens,
-                subject_resp.output_tokens,
-            )
 
-            # Convertir les details hallucination
-            halluc_details = [
-                HallucinationDetail(
-                    claim=d.claim,
-                    hallucinated=d.hallucinated,
-                    severity=d.severity,
-                    category=d.category,
-                    reasoning=d.reasoning,
-                )
-                for d in halluc.details
-            ]
+async def _judge_or_reuse(
+    task: Task,
+    response_text: str,
+    judge_client: BaseLLMClient,
+    doc_context: str,
+    source_index: DocumentIndex | None,
+    opts: EvaluationOptions,
+    judgments: JudgmentCache | None,
+    cascade: JudgeCascade | None = None,
+) -> _Judgment:
+    """Verdicts repris d'une reponse deja jugee si possible, sinon jugement complet."""
+    if judgments is None:
+        return await _judge_response(
+            task, response_text, judge_client, doc_context, source_index, opts, cascade
+        )
+    judge_key = _judge_key(task, judge_client.model, opts)
+    fingerprint = ResponseFingerprint.of(response_text)
+    match = judgments.lookup(judge_key, task.number, fingerprint)
+    if match is not None:
+        return replace(
+            _score_verdicts(task, match.verdicts), reuse=match.kind, similarity=match.similarity
+        )
+    judgment = await _judge_response(
+        task, response_text, judge_client, doc_context, source_index, opts, cascade
+    )
+    if _is_complete(task, judgment.verdicts):
+        judgments.store(judge_key, task.number, fingerprint, judgment.verdicts)
+    else:
+        logger.warning("Jugement incomplet pour la tache %d : non conserve", task.number)
+    return judgment
 
-            elapsed = time.monotonic() - task_start
-
-            return TaskResult(
-                task_number=task.number,
-                task_title=task.title,
-                category=task.category.value,
-                sub_category=task.sub_category.value,
-                task_type=task.task_type.value,
-                model_id=subject_client.model,
-                response=response_text,
-                rubric_results=rubric_results,
-                negatif_results=negatif_results,
-                answer_score=answer_score,
-                answer_score_by_dimension=dim_scores,
-                source_score=src_score,
-                hallucination_rate=halluc.rate,
-                hallucination_details=halluc_details,
-                hallucination_penalty=halluc.penalty_points,
-                hallucination_count=halluc.hallucinated_claims,
-                hallucination_severity_counts=halluc.severity_counts,
-                latency_seconds=elapsed,
-                input_tokens=subject_resp.input_tokens,
-                output_tokens=subject_resp.output_tokens,
-                total_tokens=subject_resp.input_tokens + subject_resp.output_tokens,
-                cost_usd=cost,
-                rubric_items_satisfied=rubric_satisfied,
-                rubric_items_total=len(rubric_results),
-                negatif_items_triggered=negatif_triggered,
-                negatif_items_total=len(negatif_results),
-            )
 
-        except Exception as e:
-            elapsed = time.monotonic() - task_start
-            logger.error("Erreur tache %d: %s", task.number, e)
-            return TaskResult(
-                task_number=task.number,
-                task_title=task.title,
-                category=task.category.value,
-                sub_category=task.sub_category.value,
-                task_type=task.task_type.value,
-                model_id=subject_client.model,
-                response="",
-                error=str(e),
-                latency_seconds=elapsed,
-            )
+def _is_complete(task: Task, verdicts: Verdicts) -> bool:
+    """Jugement rejouable : chaque critere juge, sans sortie illisible, extraction reussie."""
+    results = verdicts.rubric_results + verdicts.negatif_results
+    return (
+        len(verdicts.rubric_results) == len(task.rubric.positive_items)
+        and len(verdicts.negatif_results) == len(task.rubric.negatif_items)
+        and not any(is_parse_error(r) for r in results)
+        and verdicts.hallucination.complete
+    )
+
+
+async def _judge_response(
+    task: Task,
+    response_text: str,
+    judge_client: BaseLLMClient,
+    doc_context: str,
+    source_index: DocumentIndex | None,
+    opts: EvaluationOptions,
+    cascade: JudgeCascade | None = None,
+) -> _Judgment:
+    # 2. Evaluation des criteres positifs (en parallele)
+    consistency = opts.self_consistency
+    rubric_results = await judge_all_items(
+        judge_client, task, response_text, cascade, consistency, opts.rules, opts.judge_output
+    )
+
+    # 3. Evaluation des criteres Negatif (en parallele)
+    negatif_results = await judge_negatif_items(
+        judge_client, task, response_text, cascade, consistency, opts.rules, opts.judge_output
+    )
+
+    # 4. Detection d'hallucinations (avec plafond = total points positifs)
+    max_penalty = task.rubric.total_positive_points
+    halluc = await detect_hallucinations(
+        judge_client,
+        response_text,
+        task.title,
+        source_context=doc_context or "Pas de documents source (tache knowledge-only)",
+        max_penalty=max_penalty,
+        extraction_mode=opts.claim_extraction,
+        source_index=source_index,
+        retrieval_k=opts.retrieval_k,
+        retrieval_token_budget=opts.retrieval_token_budget,
+        with_sources=opts.combined_extraction,
+    )
+
+    # 5. Source scoring (deja calcule par l'extraction en mode combine)
+    if opts.combined_extraction:
+        src_score = halluc.source_score
+    else:
+        src_score = await compute_source_score(judge_client, response_text)
+
+    return _score_verdicts(task, Verdicts(rubric_results, negatif_results, halluc, src_score))
+
+
+def _score_verdicts(task: Task, verdicts: Verdicts) -> _Judgment:
+    # 6. Calcul du score final avec toutes les penalites
+    negatif_pen = compute_negatif_penalty(verdicts.negatif_results, task.rubric)
+    answer_score = compute_answer_score_with_penalties(
+        task.rubric,
+        verdicts.rubric_results,
+        hallucination_penalty=verdicts.hallucination.penalty_points,
+        negatif_penalty=negatif_pen,
+    )
+
+    # 7. Scores par dimension
+    dim_scores = compute_dimension_scores(task.rubric, verdicts.rubric_results)
+
+    return _Judgment(
+        rubric_results=verdicts.rubric_results,
+        negatif_results=verdicts.negatif_results,
+        hallucination=verdicts.hallucination,
+        source_score=verdicts.source_score,
+        answer_score=answer_score,
+        dimension_scores=dim_scores,
+        finished_at=time.monotonic(),
+    )
+
+
+def _task_result(
+    task: Task,
+    model_id: str,
+    subject_resp: LLMResponse,
+    judgment: _Judgment,
+    *,
+    latency: float,
+    sample_index: int = 0,
+) -> TaskResult:
+    halluc = judgment.hallucination
+
+    # 8. Comptages
+    rubric_satisfied = sum(1 for r in judgment.rubric_results if r.satisfied)
+    negatif_triggered = sum(1 for r in judgment.negatif_results if r.satisfied)
+
+    # 9. Cout
+    cost = _estimate_cost(model_id, subject_resp.input_tokens, subject_resp.output_tokens)
+
+    # Convertir les details hallucination
+    halluc_details = [
+        HallucinationDetail(
+            claim=d.claim,
+            hallucinated=d.hallucinated,
+            severity=d.severity,
+            category=d.category,
+            reasoning=d.reasoning,
+        )
+        for d in halluc.details
+    ]
+
+    return TaskResult(
+        task_number=task.number,
+        task_title=task.title,
+        category=task.category.value,
+        sub_category=task.sub_category.value,
+        task_type=task.task_type.value,
+        model_id=model_id,
+        sample_index=sample_index,
+        response=subject_resp.content,
+        rubric_results=judgment.rubric_results,
+        negatif_results=judgment.negatif_results,
+        answer_score=judgment.answer_score,
+        answer_score_by_dimension=judgment.dimension_scores,
+        source_score=judgment.source_score,
+        hallucination_rate=halluc.rate,
+        hallucination_details=halluc_details,
+        hallucination_penalty=halluc.penalty_points,
+        hallucination_count=halluc.hallucinated_claims,
+        hallucination_severity_counts=halluc.severity_counts,
+        latency_seconds=latency,
+        input_tokens=subject_resp.input_tokens,
+        output_tokens=subject_resp.output_tokens,
+        total_tokens=subject_resp.input_tokens + subject_resp.output_tokens,
+        verification_context_tokens=halluc.source_context_tokens,
+        cost_usd=cost,
+        rubric_items_satisfied=rubric_satisfied,
+        rubric_items_total=len(judgment.rubric_results),
+        negatif_items_triggered=negatif_triggered,
+        negatif_items_total=len(judgment.negatif_results),
+        judgment_reuse=judgment.reuse,
+        judgment_similarity=judgment.similarity,
+    )
+
+
+def _error_result(
+    task: Task, model_id: str, error: BaseException, latency: float, sample_index: int = 0
+) -> TaskResult:
+    return TaskResult(
+        task_number=task.number,
+        task_title=task.title,
+        category=task.category.value,
+        sub_category=task.sub_category.value,
+        task_type=task.task_type.value,
+        model_id=model_id,
+        sample_index=sample_index,
+        response="",
+        error=str(error),
+        latency_seconds=latency,
+    )
 
 
 async def run_benchmark(
-    tasks: list[Task],
+    tasks: Iterable[Task],
     model_ids: list[str],
     max_concurrent: int = MAX_CONCURRENT,
     tasks_csv_path: Path | None = None,
     judge_model: str | None = None,
     provider: str | None = None,
     quantization: str | None = None,
+    options: EvaluationOptions | None = None,
+    max_cost_usd: float | None = None,
+    history: RunHistory | None = None,
+    schedule: str = "lpt",
+    window: int | None = None,
 ) -> BenchmarkRun:
-    """Execute le benchmark complet sur les modeles donnes."""
+    """Execute le benchmark complet sur les modeles donnes.
+
+    Les couples (modele, tache) partagent le meme pool de `max_concurrent`
+    slots et sont lances dans l'ordre de `schedule` ("lpt" : plus longs
+    d'abord d'apres `history`, "csv" : ordre des modeles puis du fichier).
+
+    `tasks` peut etre une liste ou un flux (`TaskSource`) : les taches sont
+    alors lues et ordonnancees par fenetres de `window` taches (defaut :
+    SCHEDULE_WINDOW), et la file d'attente des workers reste bornee. Une liste
+    est ordonnancee d'un seul tenant.
+
+    Si `max_cost_usd` est defini, le cout cumule (sujet + juge) est suivi en
+    direct : une fois le plafond atteint, plus aucune tache n'est lancee et
+    les taches en cours terminent normalement.
+    """
+    opts = options or EvaluationOptions()
     run_start = time.monotonic()
     semaphore = asyncio.Semaphore(max_concurrent)
     effective_judge = judge_model or JUDGE_MODEL
     judge_client = OpenRouterClient(model=effective_judge)
+    fast_judge_client = (
+        OpenRouterClient(model=opts.fast_judge_model) if opts.fast_judge_model else None
+    )
+    cascade_stats: dict[str, TierStats] = {}
+    tracker = CostTracker(max_cost_usd)
+    judgments = None
+    if opts.reuse_judgments != "off":
+        judgments = JudgmentCache.open(
+            config.CACHE_DIR, mode=opts.reuse_judgments, threshold=opts.reuse_threshold
+        )
+    reset_parse_stats()
+    reset_verdict_stats()
+    if window is None:
+        window = max(len(tasks), 1) if isinstance(tasks, Sequence) else SCHEDULE_WINDOW
 
-    all_results: list[TaskResult] = []
-    failed_results: list[TaskResult] = []
+    expected = MakespanSimulator(max_concurrent)
+    expected_csv = MakespanSimulator(max_concurrent)
+    model_rank = {m: i for i, m in enumerate(model_ids)}
+    # Resultats ranges par modele, ordre de lecture puis echantillon, quel que soit l'ordonnancement
+    ranked: list[tuple[tuple[int, int, int], TaskResult]] = []
+    failed_ranked: list[tuple[tuple[int, int, int], TaskResult]] = []
+    n_tasks = 0
+    n_skipped = 0
 
+    subject_clients: dict[str, OpenRouterClient] = {}
     try:
+        subjects: dict[str, tuple[TrackedClient, TrackedClient]] = {}
+        cascades: dict[str, JudgeCascade] = {}
         for model_id in model_ids:
-            logger.info("=== Evaluation du modele : %s ===", model_id)
-            subject_client = OpenRouterClient(
+            subject_clients[model_id] = OpenRouterClient(
                 model=model_id,
                 provider=provider,
                 quantization=quantization,
             )
+            subjects[model_id] = (
+                TrackedClient(subject_clients[model_id], tracker, model_id, "subject"),
+                TrackedClient(judge_client, tracker, model_id, "judge"),
+            )
+            if fast_judge_client is not None:
+                # Statistiques communes a tous les modeles du run
+                cascades[model_id] = JudgeCascade(
+                    fast=TrackedClient(fast_judge_client, tracker, model_id, "judge_fast"),
+                    threshold=opts.escalation_threshold,
+                    dimensions=frozenset(opts.escalate_dimensions),
+                    calibration_rate=opts.calibration_rate,
+                    stats=cascade_stats,
+                )
 
-            try:
-                coros = [
-                    evaluate_task(task, subject_client, judge_client, semaphore)
-                    for task in tasks
-                ]
-                results = await asyncio.gather(*coros, return_exceptions=True)
-
-                for r in results:
-                    if isinstance(r, Exception):
-                        logger.error("Erreur tache : %s", r)
-                        failed_results.append(
+        queue: asyncio.Queue[tuple[tuple[int, int], ScheduledTask] | None] = asyncio.Queue(
+            maxsize=max_concurrent
+        )
+
+        async def worker() -> None:
+            nonlocal n_skipped
+            while (entry := await queue.get()) is not None:
+                rank, item = entry
+                try:
+                    samples = await evaluate_task_samples(
+                        item.task,
+                        *subjects[item.model_id],
+                        semaphore,
+                        options=opts,
+                        budget=tracker,
+                        judgments=judgments,
+                        cascade=cascades.get(item.model_id),
+                    )
+                except Exception as e:  # noqa: BLE001 - un worker mort bloquerait la file
+                    logger.error("Erreur tache : %s", e)
+                    failed_ranked.append(
+                        (
+                            (*rank, 0),
                             TaskResult(
-                                task_number=0,
-                                model_id=model_id,
+                                task_number=item.task.number,
+                                model_id=item.model_id,
                                 response="",
-                                error=str(r),
-                            )
+                                error=str(e),
+                            ),
                         )
-                    elif r.error:
-                        failed_results.append(r)
-                        all_results.append(r)
-                    else:
-                        all_results.append(r)
-            finally:
-                await subject_client.close()
+                    )
+                    continue
+                if samples is None:
+                    n_skipped += 1
+                    continue
+                for r in samples:
+                    ranked.append(((*rank, r.sample_index), r))
+                    if r.error:
+                        failed_ranked.append(((*rank, r.sample_index), r))
+
+        eval_start = time.monotonic()
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, max_concurrent))]
+        try:
+            for batch in iter_windows(tasks, window):
+                # Par position : deux shards peuvent porter le meme numero de tache
+                read_rank = {id(t): n_tasks + i for i, t in enumerate(batch)}
+                n_tasks += len(batch)
+                for item in build_schedule(batch, model_ids, history, strategy="csv"):
+                    expected_csv.add(item.expected_seconds)
+                for item in build_schedule(batch, model_ids, history, strategy=schedule):
+                    expected.add(item.expected_seconds)
+                    rank = (model_rank[item.model_id], read_rank[id(item.task)])
+                    await queue.put((rank, item))
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for w in workers:
+                w.cancel()
+        makespan = time.monotonic() - eval_start
     finally:
+        for client in subject_clients.values():
+            await client.close()
         await judge_client.close()
+        if fast_judge_client is not None:
+            await fast_judge_client.close()
+        if judgments is not None:
+            judgments.close()
+
+    logger.info(
+        "Ordonnancement %s : makespan attendu %.0fs (ordre CSV : %.0fs), mesure %.0fs",
+        schedule,
+        expected.makespan,
+        expected_csv.makespan,
+        makespan,
+    )
+    all_results = [r for _, r in sorted(ranked, key=lambda x: x[0])]
+    failed_results = [r for _, r in sorted(failed_ranked, key=lambda x: x[0])]
 
     run_duration = time.monotonic() - run_start
 
     # Metadonnees
-    csv_path = tasks_csv_path or (DATA_DIR / "core" / "tasks.csv")
+    if isinstance(tasks, TaskSource):
+        dataset_path, dataset_sha256 = tasks.dataset_path, tasks.dataset_sha256()
+    else:
+        csv_path = tasks_csv_path or (DATA_DIR / "core" / "tasks.csv")
+        # deja calcule par load_tasks
+        dataset_path, dataset_sha256 = str(csv_path), file_sha256(csv_path)
     metadata = RunMetadata(
         timestamp_utc=datetime.now(),
         duration_seconds=run_duration,
         subject_models=model_ids,
         judge_model=effective_judge,
         judge_temperature=0.0,
-        dataset_path=str(csv_path),
-        dataset_sha256=RunMetadata.compute_dataset_hash(csv_path),
-        n_tasks=len(tasks),
+        claim_extraction=opts.claim_extraction,
+        retrieval_top_k=opts.retrieval_k,
+        retrieval_token_budget=opts.retrieval_token_budget if opts.retrieval_k > 0 else 0,
+        combined_extraction=opts.combined_extraction,
+        samples_per_task=max(1, opts.samples),
+        sample_temperature=opts.sample_temperature if opts.samples > 1 else 0.0,
+        reuse_judgments=opts.reuse_judgments,
+        reuse_threshold=opts.reuse_threshold if opts.reuse_judgments == "near" else None,
+        judge_cascade=(
+            _cascade_report(opts, effective_judge, tracker, cascade_stats)
+            if opts.fast_judge_model
+            else None
+        ),
+        rules=opts.rules,
+        judge_output=opts.judge_output,
+        self_consistency=(
+            _self_consistency_report(opts, all_results) if opts.judge_votes > 1 else None
+        ),
+        dataset_path=dataset_path,
+        dataset_sha256=dataset_sha256,
+        n_tasks=n_tasks,
+        max_cost_usd=max_cost_usd,
+        cost_spent_usd=tracker.spent_usd,
+        budget_exhausted=tracker.exhausted,
+        n_tasks_skipped=n_skipped,
+        schedule=schedule,
+        expected_makespan_seconds=expected.makespan,
+        expected_csv_makespan_seconds=expected_csv.makespan,
+        makespan_seconds=makespan,
+        parse_stats=parse_stats_dict(),
+        verdict_stats=verdict_stats_dict(),
     )
 
-    agg = aggregate_scores(tasks, all_results)
+    agg = aggregate_scores(None, all_results)
+    for a in agg:
+        a.cost_judge_usd = tracker.cost_for(a.model_id, "judge") + tracker.cost_for(
+            a.model_id, "judge_fast"
+        )
 
     return BenchmarkRun(
         run_id=uuid.uuid4().hex[:12],
@@ -237,3 +750,74 @@ async def run_benchmark(
         failed_tasks=failed_results,
         aggregates=agg,
     )
+
+
+def _tier(stats: TierStats) -> CascadeTier:
+    return CascadeTier(
+        items=stats.items,
+        escalated=stats.escalated,
+        escalated_agreement=(stats.escalated_agree / stats.escalated if stats.escalated else None),
+        calibrated=stats.calibrated,
+        calibration_agreement=(
+            stats.calibrated_agree / stats.calibrated if stats.calibrated else None
+        ),
+    )
+
+
+def _cascade_report(
+    opts: EvaluationOptions,
+    strong_model: str,
+    tracker: CostTracker,
+    stats: dict[str, TierStats],
+) -> CascadeReport:
+    """Bilan de la cascade : appels et couts par niveau, accord par dimension."""
+    calls = {"judge": 0, "judge_fast": 0}
+    costs = {"judge": 0.0, "judge_fast": 0.0}
+    for (_, role), usage in tracker.usage.items():
+        if role in calls:
+            calls[role] += usage.calls
+            costs[role] += usage.cost_usd
+    total = TierStats()
+    for s in stats.values():
+        total.items += s.items
+        total.escalated += s.escalated
+        total.escalated_agree += s.escalated_agree
+        total.calibrated += s.calibrated
+        total.calibrated_agree += s.calibrated_agree
+    return CascadeReport(
+        fast_model=opts.fast_judge_model or "",
+        strong_model=strong_model,
+        confidence_threshold=opts.escalation_threshold,
+        escalate_dimensions=sorted(opts.escalate_dimensions),
+        calibration_rate=opts.calibration_rate,
+        calls_fast=calls["judge_fast"],
+        calls_strong=calls["judge"],
+        cost_fast_usd=costs["judge_fast"],
+        cost_strong_usd=costs["judge"],
+        total=_tier(total),
+        by_dimension={dim: _tier(s) for dim, s in sorted(stats.items())},
+    )
+
+
+def _self_consistency_report(
+    opts: EvaluationOptions, results: Iterable[TaskResult]
+) -> SelfConsistencyReport:
+    """Bilan du vote majoritaire : votes tires par critere, arrets anticipes, votes partages."""
+    report = SelfConsistencyReport(
+        max_votes=opts.judge_votes,
+        temperature=opts.vote_temperature,
+        stop_confidence=opts.vote_stop_confidence,
+    )
+    for r in results:
+        if r.judgment_reuse is not None:
+            continue
+        for verdict in r.rubric_results + r.negatif_results:
+            if not verdict.votes:
+                continue
+            report.items += 1
+            report.votes += len(verdict.votes)
+            report.stopped_early += len(verdict.votes) < opts.judge_votes
+            report.split += len({v for v in verdict.votes if v is not None}) > 1
+    if report.items:
+        report.votes_per_item = report.votes / report.items
+    return report
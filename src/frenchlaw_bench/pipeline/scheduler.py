@@ -0,0 +1,142 @@
+"""Ordonnancement des taches : les plus longues d'abord (LPT).
+
+La duree attendue de chaque couple (modele, tache) vient de l'historique local
+(`results/history.json`). A defaut, elle est extrapolee de la latence par
+critere du modele, des autres modeles sur la meme tache, ou d'un a priori
+fonde sur la taille de la rubric et le nombre de documents.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from itertools import islice
+
+from frenchlaw_bench.models.task import Task
+from frenchlaw_bench.pipeline.history import RunHistory
+
+SCHEDULES: tuple[str, ...] = ("lpt", "csv")
+
+# A priori sans historique
+DEFAULT_SUBJECT_OUTPUT_TOKENS = 2500
+TOKENS_PER_SECOND = 50.0
+CALL_OVERHEAD_SECONDS = 1.5
+JUDGE_STAGES = 4  # rubric, negatif, hallucinations, source
+JUDGE_STAGE_SECONDS = CALL_OVERHEAD_SECONDS + 250 / TOKENS_PER_SECOND
+SECONDS_PER_RUBRIC_ITEM = 0.5
+SECONDS_PER_DOCUMENT = 5.0
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduledTask:
+    """Couple (modele, tache) et sa duree attendue."""
+
+    model_id: str
+    task: Task
+    expected_seconds: float
+    from_history: bool = False
+
+
+def prior_task_seconds(task: Task) -> float:
+    """Duree a priori d'une tache, sans aucun historique."""
+    return (
+        CALL_OVERHEAD_SECONDS
+        + DEFAULT_SUBJECT_OUTPUT_TOKENS / TOKENS_PER_SECOND
+        + JUDGE_STAGES * JUDGE_STAGE_SECONDS
+        + SECONDS_PER_RUBRIC_ITEM * len(task.rubric.items)
+        + SECONDS_PER_DOCUMENT * len(task.documents)
+    )
+
+
+def estimate_task_seconds(
+    task: Task, model_id: str, history: RunHistory | None
+) -> tuple[float, bool]:
+    """Duree attendue de `task` pour `model_id` et indicateur "issue de l'historique"."""
+    if history is None:
+        return prior_task_seconds(task), False
+
+    stats = history.get(model_id, task.number)
+    if stats is not None:
+        return stats.latency_seconds, True
+
+    rubric_size = len(task.rubric.items)
+    model_stats = [s for s in history.model_stats(model_id) if s.rubric_size]
+    if model_stats:
+        per_item = sum(s.latency_seconds / s.rubric_size for s in model_stats) / len(model_stats)
+        return per_item * rubric_size + SECONDS_PER_DOCUMENT * len(task.documents), True
+
+    task_stats = history.task_stats(task.number)
+    if task_stats:
+        return sum(s.latency_seconds for s in task_stats) / len(task_stats), True
+
+    return prior_task_seconds(task), False
+
+
+def build_schedule(
+    tasks: Sequence[Task],
+    model_ids: Sequence[str],
+    history: RunHistory | None = None,
+    strategy: str = "lpt",
+) -> list[ScheduledTask]:
+    """Liste ordonnee des couples (modele, tache) a lancer.
+
+    - "lpt" : duree attendue decroissante, tous modeles confondus
+    - "csv" : ordre des modeles puis ordre du fichier de taches
+    """
+    if strategy not in SCHEDULES:
+        raise ValueError(f"Ordonnancement inconnu : {strategy!r} (attendu : {SCHEDULES})")
+
+    schedule = []
+    for model_id in model_ids:
+        for task in tasks:
+            seconds, known = estimate_task_seconds(task, model_id, history)
+            schedule.append(ScheduledTask(model_id, task, seconds, known))
+
+    if strategy == "lpt":
+        # Tri stable : a duree egale, l'ordre du CSV est conserve
+        schedule.sort(key=lambda s: s.expected_seconds, reverse=True)
+    return schedule
+
+
+def iter_windows(tasks: Iterable[Task], size: int) -> Iterator[list[Task]]:
+    """Decoupe un flux de taches en fenetres de `size` taches (la derniere peut etre plus courte).
+
+    L'ordonnancement d'un flux se fait fenetre par fenetre : seules les taches
+    de la fenetre courante sont en memoire.
+    """
+    if size < 1:
+        raise ValueError(f"Taille de fenetre invalide : {size}")
+    it = iter(tasks)
+    while window := list(islice(it, size)):
+        yield window
+
+
+class MakespanSimulator:
+    """Simulation incrementale de `simulate_makespan`, une duree a la fois."""
+
+    def __init__(self, workers: int) -> None:
+        self._workers = max(1, workers)
+        self._slots: list[float] = []
+
+    def add(self, duration: float) -> None:
+        if len(self._slots) < self._workers:
+            heapq.heappush(self._slots, duration)
+        else:
+            heapq.heapreplace(self._slots, self._slots[0] + duration)
+
+    @property
+    def makespan(self) -> float:
+        return max(self._slots, default=0.0)
+
+
+def simulate_makespan(durations: Sequence[float], workers: int) -> float:
+    """Makespan d'une liste de durees executees dans l'ordre sur `workers` slots.
+
+    Reproduit le comportement du semaphore : chaque tache demarre des qu'un
+    slot se libere, dans l'ordre de la liste.
+    """
+    sim = MakespanSimulator(workers)
+    for d in durations:
+        sim.add(d)
+    return sim.makespan
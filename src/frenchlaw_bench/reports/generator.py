@@ -3,12 +3,28 @@
 from __future__ import annotations
 
 import json
+import logging
+import re
+import time
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 
-from jinja2 import Template
+from jinja2 import Environment, Template
+from pydantic_core import to_json
 
 from frenchlaw_bench.config import RESULTS_DIR
-from frenchlaw_bench.models.result import BenchmarkRun
+from frenchlaw_bench.models.result import BenchmarkRun, TaskResult
+from frenchlaw_bench.reports.results_io import results_path, write_results
+
+logger = logging.getLogger(__name__)
+
+REPORT_MODES = ("auto", "single", "paged")
+# Au-dela, le mode auto ecrit un rapport pagine
+PAGED_THRESHOLD = 200
+REPORT_DATA_DIR = "report_data"
+
+_SLUG_RE = re.compile(r"[^A-Za-z0-9._-]+")
 
 _HTML_TEMPLATE = """\
 <!DOCTYPE html>
@@ -51,6 +67,14 @@ _HTML_TEMPLATE = """\
   .halluc-detail { background: #fef2f2; border-left: 3px solid var(--red); padding: 0.5rem; margin: 0.3rem 0; font-size: 0.85rem; }
   .evidence { background: #f0fdf4; border-left: 3px solid var(--green); padding: 0.5rem; margin: 0.3rem 0; font-size: 0.85rem; }
   .section-sep { border-top: 2px solid #e5e7eb; margin-top: 3rem; padding-top: 1rem; }
+  #flb-viewport { height: 480px; overflow-y: auto; position: relative; border: 1px solid #d1d5db; background: white; }
+  #flb-rows { position: absolute; left: 0; right: 0; top: 0; }
+  .vrow { display: grid; grid-template-columns: 3rem 2fr 1.5fr repeat(10, 1fr); height: 28px; align-items: center; font-size: 0.8rem; border-bottom: 1px solid #f3f4f6; cursor: pointer; }
+  .vrow span { padding: 0 0.4rem; overflow: hidden; white-space: nowrap; text-overflow: ellipsis; }
+  .vrow:hover { background: #eff6ff; }
+  .vrow.err { color: var(--red); }
+  .vhead { font-weight: 600; background: #f3f4f6; cursor: default; border: 1px solid #d1d5db; border-bottom: none; }
+  #flb-detail pre { white-space: pre-wrap; background: white; border: 1px solid #e5e7eb; padding: 0.75rem; font-size: 0.8rem; }
   @media print { body { max-width: 100%; } .card { break-inside: avoid; } }
 </style>
 </head>
@@ -211,6 +235,19 @@ _HTML_TEMPLATE = """\
 
 {% endfor %}
 
+{% if paged %}
+<!-- ===== DETAIL PAR TACHE (pagine) ===== -->
+<div class="section-sep"></div>
+<h2>Detail par tache</h2>
+<p class="meta">{{ n_results }} resultats — cliquer une ligne pour charger ses criteres, hallucinations et la reponse.</p>
+<input id="flb-filter" type="search" placeholder="Filtrer (modele, titre, numero)..." style="width: 100%; padding: 0.4rem; margin: 0.5rem 0;">
+<div class="vrow vhead">
+  <span>#</span><span>Titre</span><span>Modele</span><span>Score</span><span>Struct.</span><span>Style</span><span>Subst.</span><span>Methodo</span><span>Halluc.</span><span>Negatif</span><span>Source</span><span>Latence</span><span>Cout</span>
+</div>
+<div id="flb-viewport"><div id="flb-spacer"></div><div id="flb-rows"></div></div>
+<div id="flb-detail"></div>
+
+{% else %}
 <!-- ===== DETAIL PAR TACHE ===== -->
 <div class="section-sep"></div>
 <h2>Detail par tache</h2>
@@ -257,7 +294,7 @@ _HTML_TEMPLATE = """\
   <tr><th>ID</th><th>Dimension</th><th>Resultat</th><th>Confiance</th><th>Raisonnement</th></tr>
   {% for item in r.rubric_results %}
   <tr>
-    <td>{{ item.item_id }}</td>
+    <td>{{ item.item_id }}{% if item.item_id in r.rescored_items %} <span class="badge badge-warn">rejuge</span>{% endif %}{% if item.judge_tier == "rule" %} <span class="badge badge-ok">regle</span>{% endif %}</td>
     <td>{{ item.dimension }}</td>
     <td>{% if item.satisfied %}<span class="badge badge-ok">Satisfait</span>{% else %}<span class="badge badge-fail">Non satisfait</span>{% endif %}</td>
     <td>{{ "%.0f"|format(item.confidence * 100) }}%</td>
@@ -266,7 +303,7 @@ _HTML_TEMPLATE = """\
   {% endfor %}
   {% for item in r.negatif_results %}
   <tr style="background: {% if item.satisfied %}#fef2f2{% else %}#f0fdf4{% endif %}">
-    <td>{{ item.item_id }}</td>
+    <td>{{ item.item_id }}{% if item.item_id in r.rescored_items %} <span class="badge badge-warn">rejuge</span>{% endif %}{% if item.judge_tier == "rule" %} <span class="badge badge-ok">regle</span>{% endif %}</td>
     <td>Negatif</td>
     <td>{% if item.satisfied %}<span class="badge badge-fail">Declenche</span>{% else %}<span class="badge badge-ok">Non declenche</span>{% endif %}</td>
     <td>{{ "%.0f"|format(item.confidence * 100) }}%</td>
@@ -291,6 +328,74 @@ _HTML_TEMPLATE = """\
 {% endif %}
 {% endfor %}
 
+{% endif %}
+
+{% set cascade = run.metadata.judge_cascade %}
+{% if cascade %}
+<!-- ===== JUGE EN CASCADE ===== -->
+<div class="section-sep"></div>
+<h2>Juge en cascade</h2>
+<p class="meta">
+  Juge rapide {{ cascade.fast_model }} : {{ cascade.calls_fast }} appels (${{ "%.3f"|format(cascade.cost_fast_usd) }}) |
+  Juge principal {{ cascade.strong_model }} : {{ cascade.calls_strong }} appels (${{ "%.3f"|format(cascade.cost_strong_usd) }}) |
+  Escalade sous {{ "%.0f"|format(cascade.confidence_threshold * 100) }}% de confiance{% if cascade.escalate_dimensions %}, dimensions {{ cascade.escalate_dimensions | join(", ") }}{% endif %} |
+  Calibration {{ "%.0f"|format(cascade.calibration_rate * 100) }}%
+</p>
+<table>
+<tr><th>Dimension</th><th>Criteres</th><th>Escalades</th><th>Accord (escalades)</th><th>Calibration</th><th>Accord (calibration)</th></tr>
+{% for dim, tier in cascade.by_dimension.items() | list + [("Total", cascade.total)] %}
+<tr>
+  <td>{{ dim }}</td>
+  <td>{{ tier.items }}</td>
+  <td>{{ tier.escalated }}</td>
+  <td>{% if tier.escalated_agreement is not none %}{{ "%.0f"|format(tier.escalated_agreement * 100) }}%{% else %}—{% endif %}</td>
+  <td>{{ tier.calibrated }}</td>
+  <td>{% if tier.calibration_agreement is not none %}{{ "%.0f"|format(tier.calibration_agreement * 100) }}%{% else %}—{% endif %}</td>
+</tr>
+{% endfor %}
+</table>
+{% endif %}
+
+{% set votes = run.metadata.self_consistency %}
+{% if votes and votes.items %}
+<!-- ===== VOTE DU JUGE ===== -->
+<div class="section-sep"></div>
+<h2>Vote majoritaire du juge</h2>
+<p class="meta">
+  {{ votes.items }} criteres juges par vote : {{ votes.votes }} appels, {{ "%.2f"|format(votes.votes_per_item) }} votes par critere
+  (au plus {{ votes.max_votes }}, temperature {{ votes.temperature }}) |
+  {{ votes.stopped_early }} acquis avant le dernier vote |
+  {{ votes.split }} aux votes partages
+</p>
+{% endif %}
+
+{% set rescore = run.metadata.rescore %}
+{% if rescore %}
+<!-- ===== RE-SCORING ===== -->
+<div class="section-sep"></div>
+<h2>Re-scoring du run {{ rescore.source_run_id }}</h2>
+<p class="meta">
+  Mode {{ "incremental" if rescore.incremental else "complet" }} :
+  {{ rescore.results_rescored }} resultat(s) rejuge(s), {{ rescore.judge_calls }} appel(s) au juge
+  (${{ "%.3f"|format(rescore.cost_usd) }}). Les autres verdicts sont repris du run d'origine.
+</p>
+<table>
+<tr><th>Tache</th><th>Criteres ajoutes</th><th>Criteres modifies</th><th>Criteres retires</th><th>En echec</th></tr>
+{% for number in (rescore.items_added.keys() | list + rescore.items_changed.keys() | list + rescore.items_removed.keys() | list + rescore.items_failed.keys() | list) | unique | sort %}
+<tr>
+  <td>{{ number }}</td>
+  <td>{{ rescore.items_added.get(number, []) | join(", ") }}</td>
+  <td>{{ rescore.items_changed.get(number, []) | join(", ") }}</td>
+  <td>{{ rescore.items_removed.get(number, []) | join(", ") }}</td>
+  <td>{{ rescore.items_failed.get(number, []) | join(", ") }}</td>
+</tr>
+{% endfor %}
+</table>
+{% if rescore.tasks_missing %}
+<p class="meta">Taches absentes du jeu courant (resultats retires) : {{ rescore.tasks_missing | join(", ") }}</p>
+{% endif %}
+{% endif %}
+
 <!-- ===== METADONNEES ===== -->
 <div class="section-sep"></div>
 <h2>Metadonnees de l'execution</h2>
@@ -313,22 +418,220 @@ _HTML_TEMPLATE = """\
   Genere par FrenchLaw Bench v{{ run.metadata.benchmark_version }}
 </p>
 
+{% if paged %}
+<script>
+const DATA_DIR = {{ data_dir|tojson }};
+{{ viewer_js }}
+</script>
+<script src="{{ data_dir }}/index.js"></script>
+{% endif %}
 </body>
 </html>
 """
 
 
-def generate_report(run: BenchmarkRun, output_dir: Path | None = None) -> Path:
-    """Genere un rapport HTML et sauvegarde les resultats JSON."""
+@dataclass
+class ReportFiles:
+    """Fichiers produits par `generate_report`."""
+
+    html_path: Path
+    results_path: Path
+    summary_path: Path
+    paged: bool = False
+    n_shards: int = 0
+    seconds: float = 0.0
+
+
+@cache
+def _template() -> Template:
+    """Template HTML, compile une seule fois par processus."""
+    return Environment(autoescape=False).from_string(_HTML_TEMPLATE)
+
+
+def _slug(value: str) -> str:
+    return _SLUG_RE.sub("_", value).strip("_") or "_"
+
+
+def _shard_key(result: TaskResult) -> str:
+    return f"{_slug(result.model_id)}/task_{result.task_number}"
+
+
+def _index_row(r: TaskResult) -> list:
+    dims = r.answer_score_by_dimension
+    return [
+        r.task_number,
+        r.task_title[:80],
+        r.model_id,
+        r.answer_score,
+        dims.get("Structure", 0),
+        dims.get("Style", 0),
+        dims.get("Substance", 0),
+        dims.get("Methodologie", 0),
+        r.hallucination_count,
+        f"{r.negatif_items_triggered}/{r.negatif_items_total}",
+        r.source_score,
+        r.latency_seconds,
+        r.cost_usd,
+        r.error,
+        _shard_key(r),
+    ]
+
+
+def _write_shards(run: BenchmarkRun, data_dir: Path) -> int:
+    """Ecrit l'index des lignes et un shard de details par (modele, tache).
+
+    Chaque fichier est un script (`FLB.index(...)` / `FLB.shard(...)`) pour
+    rester chargeable depuis file:// sans serveur.
+    """
+    ordered = sorted(run.task_results, key=lambda r: (r.task_number, r.model_id))
+    shards: dict[str, list[TaskResult]] = {}
+    for r in ordered:
+        shards.setdefault(_shard_key(r), []).append(r)
+
+    data_dir.mkdir(parents=True, exist_ok=True)
+    (data_dir / "index.js").write_bytes(
+        b"FLB.index(" + to_json([_index_row(r) for r in ordered]) + b");\n"
+    )
+    for key, results in shards.items():
+        path = data_dir / f"{key}.js"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"FLB.shard(" + to_json(key) + b", " + to_json(results) + b");\n")
+    return len(shards)
+
+
+# Visionneuse du rapport pagine : table virtualisee (seules les lignes visibles
+# sont dans le DOM) et chargement des details a la demande. Les shards sont des
+# fichiers .js charges par <script> (fetch() est bloque sur file://).
+_VIEWER_JS = """\
+const FLB = { rows: [], view: [], shards: {}, pending: {} };
+const ROW_H = 28;
+const COLS = ["task", "title", "model", "score", "structure", "style", "substance",
+              "methodo", "halluc", "neg", "source", "latency", "cost", "error", "shard"];
+const pct = v => v === null ? "—" : (v * 100).toFixed(0) + "%";
+
+function el(tag, text, cls) {
+  const e = document.createElement(tag);
+  if (text !== undefined) e.textContent = text;
+  if (cls) e.className = cls;
+  return e;
+}
+
+FLB.index = function (rows) {
+  FLB.rows = rows.map(r => Object.fromEntries(COLS.map((c, i) => [c, r[i]])));
+  FLB.view = FLB.rows;
+  render();
+};
+
+FLB.shard = function (key, data) {
+  FLB.shards[key] = data;
+  (FLB.pending[key] || []).forEach(cb => cb(data));
+  delete FLB.pending[key];
+};
+
+function loadShard(key, cb) {
+  if (key in FLB.shards) return cb(FLB.shards[key]);
+  (FLB.pending[key] = FLB.pending[key] || []).push(cb);
+  if (FLB.pending[key].length > 1) return;
+  const s = document.createElement("script");
+  s.src = DATA_DIR + "/" + key + ".js";
+  document.head.appendChild(s);
+}
+
+function render() {
+  const vp = document.getElementById("flb-viewport");
+  const box = document.getElementById("flb-rows");
+  document.getElementById("flb-spacer").style.height = FLB.view.length * ROW_H + "px";
+  const first = Math.max(0, Math.floor(vp.scrollTop / ROW_H) - 10);
+  const last = Math.min(FLB.view.length, first + Math.ceil(vp.clientHeight / ROW_H) + 20);
+  box.style.transform = "translateY(" + first * ROW_H + "px)";
+  box.replaceChildren(...FLB.view.slice(first, last).map(r => {
+    const row = el("div", undefined, "vrow" + (r.error ? " err" : ""));
+    const cells = r.error
+      ? [r.task, r.title, r.model, "ECHEC : " + r.error]
+      : [r.task, r.title, r.model, pct(r.score), pct(r.structure), pct(r.style),
+         pct(r.substance), pct(r.methodo), r.halluc, r.neg, pct(r.source),
+         r.latency.toFixed(1) + "s", "$" + r.cost.toFixed(3)];
+    cells.forEach(c => row.appendChild(el("span", String(c))));
+    row.onclick = () => showDetail(r);
+    return row;
+  }));
+}
+
+function itemTable(title, items, negatif) {
+  const t = el("table");
+  const head = el("tr");
+  ["ID", "Dimension", "Resultat", "Confiance", "Raisonnement", "Preuves"]
+    .forEach(h => head.appendChild(el("th", h)));
+  t.appendChild(head);
+  items.forEach(i => {
+    const tr = el("tr");
+    const verdict = negatif ? (i.satisfied ? "Declenche" : "Non declenche")
+                            : (i.satisfied ? "Satisfait" : "Non satisfait");
+    [i.item_id, negatif ? "Negatif" : i.dimension, verdict, pct(i.confidence),
+     i.reasoning, (i.evidence || []).join(" | ")].forEach(c => tr.appendChild(el("td", c)));
+    t.appendChild(tr);
+  });
+  return [el("h4", title), t];
+}
+
+function showDetail(r) {
+  const box = document.getElementById("flb-detail");
+  box.replaceChildren(el("p", "Chargement...", "meta"));
+  loadShard(r.shard, results => {
+    const parts = [];
+    results.filter(res => res.model_id === r.model).forEach(res => {
+      parts.push(el("h3", "Tache " + res.task_number + " — " + res.task_title +
+                          " (" + res.model_id + ") — " + pct(res.answer_score)));
+      if (res.error) parts.push(el("p", "ECHEC : " + res.error, "bad"));
+      parts.push(...itemTable("Criteres", res.rubric_results, false));
+      parts.push(...itemTable("Negatifs", res.negatif_results, true));
+      res.hallucination_details.filter(h => h.hallucinated).forEach(h => {
+        const d = el("div", undefined, "halluc-detail");
+        d.appendChild(el("strong", "[" + h.severity.toUpperCase() + "] "));
+        d.appendChild(document.createTextNode(h.claim + " — " + h.reasoning));
+        parts.push(d);
+      });
+      const resp = el("details");
+      resp.appendChild(el("summary", "Reponse complete"));
+      resp.appendChild(el("pre", res.response));
+      parts.push(resp);
+    });
+    box.replaceChildren(...parts);
+    box.scrollIntoView({ behavior: "smooth" });
+  });
+}
+
+document.getElementById("flb-viewport").addEventListener("scroll", render);
+document.getElementById("flb-filter").addEventListener("input", e => {
+  const q = e.target.value.toLowerCase();
+  FLB.view = q ? FLB.rows.filter(r =>
+    (r.task + " " + r.title + " " + r.model).toLowerCase().includes(q)) : FLB.rows;
+  document.getElementById("flb-viewport").scrollTop = 0;
+  render();
+});
+"""
+
+
+def generate_report(
+    run: BenchmarkRun,
+    output_dir: Path | None = None,
+    compression: str = "none",
+    mode: str = "auto",
+) -> ReportFiles:
+    """Genere un rapport HTML et sauvegarde les resultats JSON.
+
+    `mode` : "single" (tout dans report.html), "paged" (page de synthese +
+    shards de details charges a la demande), "auto" (pagine au-dela de
+    PAGED_THRESHOLD resultats).
+    """
+    if mode not in REPORT_MODES:
+        raise ValueError(f"Mode de rapport inconnu : {mode}")
+    start = time.perf_counter()
     out = output_dir or RESULTS_DIR / run.run_id
     out.mkdir(parents=True, exist_ok=True)
 
-    # JSON complet
-    json_path = out / "results.json"
-    json_path.write_text(
-        json.dumps(run.model_dump(mode="json"), indent=2, ensure_ascii=False, default=str),
-        encoding="utf-8",
-    )
+    # JSON complet, ecrit en flux (un TaskResult par ligne)
+    json_path = write_results(run, results_path(out, compression))
 
     # JSON resume (stats seulement, sans les reponses completes pour partage)
     summary_data = {
@@ -349,6 +652,10 @@ def generate_report(run: BenchmarkRun, output_dir: Path | None = None) -> Path:
                 "hallucination_severity_counts": r.hallucination_severity_counts,
                 "negatif_items_triggered": r.negatif_items_triggered,
                 "latency_seconds": r.latency_seconds,
+                "input_tokens": r.input_tokens,
+                "output_tokens": r.output_tokens,
+                "claims_total": len(r.hallucination_details),
+                "rubric_size": r.rubric_items_total + r.negatif_items_total,
                 "cost_usd": r.cost_usd,
                 "error": r.error,
             }
@@ -362,8 +669,32 @@ def generate_report(run: BenchmarkRun, output_dir: Path | None = None) -> Path:
     )
 
     # HTML
+    paged = mode == "paged" or (mode == "auto" and len(run.task_results) > PAGED_THRESHOLD)
+    n_shards = _write_shards(run, out / REPORT_DATA_DIR) if paged else 0
     html_path = out / "report.html"
-    template = Template(_HTML_TEMPLATE)
-    html_path.write_text(template.render(run=run), encoding="utf-8")
+    html_path.write_text(
+        _template().render(
+            run=run,
+            paged=paged,
+            n_results=len(run.task_results),
+            data_dir=REPORT_DATA_DIR,
+            viewer_js=_VIEWER_JS,
+        ),
+        encoding="utf-8",
+    )
 
-    return html_path
+    elapsed = time.perf_counter() - start
+    logger.info(
+        "Rapport %s genere en %.2fs (%d shards)",
+        "pagine" if paged else "complet",
+        elapsed,
+        n_shards,
+    )
+    return ReportFiles(
+        html_path=html_path,
+        results_path=json_path,
+        summary_path=summary_path,
+        paged=paged,
+        n_shards=n_shards,
+        seconds=elapsed,
+    )
@@ -0,0 +1,131 @@
+"""Ecriture et lecture en flux de `results.json`.
+
+Le fichier reste un JSON valide (lisible par `BenchmarkRun.model_validate_json`)
+mais il est ecrit ligne par ligne : la premiere ligne porte l'en-tete du run
+(run_id, timestamp, modeles, metadonnees, agregats), puis chaque `TaskResult`
+occupe sa propre ligne, serialise directement par pydantic-core. Le run n'est
+jamais materialise en entier sous forme de dict, et `read_header` lit les
+agregats sans parser une seule reponse.
+
+Compression optionnelle selon le suffixe : `.gz` (gzip) ou `.zst` (zstd,
+dependance `zstandard`, extra `[zstd]`).
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO
+
+from pydantic_core import to_json
+
+from frenchlaw_bench.models.result import BenchmarkRun, TaskResult
+
+logger = logging.getLogger(__name__)
+
+RESULTS_FILENAME = "results.json"
+COMPRESSIONS = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+# Champs ecrits sur la premiere ligne, dans cet ordre
+HEADER_FIELDS = ("run_id", "timestamp", "models", "metadata", "aggregates")
+_RESULT_LISTS = ("task_results", "failed_tasks")
+
+
+def results_path(out_dir: Path, compression: str = "none") -> Path:
+    """Chemin du fichier de resultats pour une compression donnee."""
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Compression inconnue : {compression}")
+    return out_dir / f"{RESULTS_FILENAME}{COMPRESSIONS[compression]}"
+
+
+def find_results(run_dir: Path) -> Path | None:
+    """Fichier de resultats d'un run, quelle que soit sa compression."""
+    for suffix in COMPRESSIONS.values():
+        path = run_dir / f"{RESULTS_FILENAME}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def _open(path: Path, mode: str) -> IO[bytes]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode)  # type: ignore[return-value]
+    if path.suffix == ".zst":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise RuntimeError(
+                "Compression zstd indisponible : installer frenchlaw-bench[zstd]"
+            ) from e
+        stream = zstandard.open(path, mode)
+        # Le lecteur zstd ne fournit pas readline : on le bufferise
+        return io.BufferedReader(stream) if "r" in mode else stream
+    return open(path, mode)
+
+
+def write_results(run: BenchmarkRun, path: Path) -> Path:
+    """Ecrit un run en flux, un `TaskResult` par ligne."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _open(path, "wb") as f:
+        header = b",".join(
+            to_json(name) + b":" + to_json(getattr(run, name)) for name in HEADER_FIELDS
+        )
+        f.write(b"{" + header + b",\n")
+        for i, name in enumerate(_RESULT_LISTS):
+            f.write(to_json(name) + b":[\n")
+            for j, result in enumerate(getattr(run, name)):
+                f.write((b"," if j else b"") + to_json(result) + b"\n")
+            f.write(b"]" + (b",\n" if i < len(_RESULT_LISTS) - 1 else b"}\n"))
+    return path
+
+
+def _is_streamed(first_line: bytes) -> bool:
+    return first_line.startswith(b'{"run_id"') and first_line.rstrip().endswith(b",")
+
+
+def read_header(path: Path) -> dict:
+    """En-tete d'un run (run_id, timestamp, models, metadata, aggregates).
+
+    Sur un fichier ecrit par `write_results`, seule la premiere ligne est lue.
+    Les fichiers d'avant (un seul bloc JSON indente) sont parses en entier.
+    """
+    with _open(path, "rb") as f:
+        first = f.readline()
+        if _is_streamed(first):
+            return json.loads(first.rstrip()[:-1] + b"}")
+        data = json.loads(first + f.read())
+    return {k: data[k] for k in HEADER_FIELDS if k in data}
+
+
+def iter_task_results(path: Path, field: str = "task_results") -> Iterator[TaskResult]:
+    """Itere sur les resultats d'un run sans charger le fichier en memoire."""
+    if field not in _RESULT_LISTS:
+        raise ValueError(f"Liste de resultats inconnue : {field}")
+    with _open(path, "rb") as f:
+        first = f.readline()
+        if not _is_streamed(first):
+            logger.debug("%s : ancien format, lecture complete", path)
+            run = BenchmarkRun.model_validate_json(first + f.read())
+            yield from getattr(run, field)
+            return
+        current = None
+        for line in f:
+            line = line.strip()
+            if line.endswith(b":["):
+                current = json.loads(line[:-2])
+            elif line.startswith(b"]"):
+                if current == field:
+                    return
+                current = None
+            elif current == field:
+                yield TaskResult.model_validate_json(line.removeprefix(b","))
+
+
+def load_run(path: Path) -> BenchmarkRun:
+    """Charge un run complet (ancien ou nouveau format, compresse ou non)."""
+    with _open(path, "rb") as f:
+        return BenchmarkRun.model_validate_json(f.read())
@@ -0,0 +1,413 @@
+"""Index SQLite local de tous les runs (`results/runs.sqlite`).
+
+Chaque run reste archive dans `results/<run_id>/results.json` ; la base n'en
+garde que ce qu'il faut pour les requetes transverses (scores, couts,
+criteres de rubric, hallucinations), sans les reponses completes. Un run est
+ecrit en une transaction a la fin de son execution ; `import_results_dir`
+indexe les repertoires de resultats existants.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Self
+
+from pydantic_core import to_json
+
+from frenchlaw_bench.models.result import AggregateScores, BenchmarkRun, TaskResult
+from frenchlaw_bench.reports.results_io import find_results, iter_task_results, read_header
+
+logger = logging.getLogger(__name__)
+
+STORE_FILENAME = "runs.sqlite"
+STORE_VERSION = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    models TEXT NOT NULL,
+    judge_model TEXT,
+    dataset_sha256 TEXT,
+    n_tasks INTEGER,
+    duration_seconds REAL,
+    metadata TEXT
+);
+CREATE TABLE IF NOT EXISTS aggregates (
+    run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    model_id TEXT NOT NULL,
+    answer_score_mean REAL,
+    answer_score_ci_lower REAL,
+    answer_score_ci_upper REAL,
+    hallucination_rate_mean REAL,
+    total_tasks INTEGER,
+    tasks_failed INTEGER,
+    cost_total_usd REAL,
+    data TEXT,
+    PRIMARY KEY (run_id, model_id)
+);
+CREATE TABLE IF NOT EXISTS task_results (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    model_id TEXT NOT NULL,
+    task_number INTEGER NOT NULL,
+    sample_index INTEGER NOT NULL DEFAULT 0,
+    task_title TEXT,
+    category TEXT,
+    answer_score REAL,
+    source_score REAL,
+    hallucination_count INTEGER,
+    hallucination_rate REAL,
+    latency_seconds REAL,
+    input_tokens INTEGER,
+    output_tokens INTEGER,
+    cost_usd REAL,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS rubric_results (
+    task_result_id INTEGER NOT NULL REFERENCES task_results(id) ON DELETE CASCADE,
+    item_id TEXT NOT NULL,
+    dimension TEXT,
+    negatif INTEGER NOT NULL,
+    satisfied INTEGER NOT NULL,
+    confidence REAL,
+    reasoning TEXT,
+    item_hash TEXT
+);
+CREATE TABLE IF NOT EXISTS hallucinations (
+    task_result_id INTEGER NOT NULL REFERENCES task_results(id) ON DELETE CASCADE,
+    claim TEXT NOT NULL,
+    hallucinated INTEGER NOT NULL,
+    severity TEXT,
+    category TEXT,
+    reasoning TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_timestamp ON runs(timestamp);
+CREATE INDEX IF NOT EXISTS idx_tasks_run ON task_results(run_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_model_task ON task_results(model_id, task_number);
+CREATE INDEX IF NOT EXISTS idx_tasks_task ON task_results(task_number);
+CREATE INDEX IF NOT EXISTS idx_rubric_task ON rubric_results(task_result_id);
+CREATE INDEX IF NOT EXISTS idx_rubric_item ON rubric_results(item_id);
+CREATE INDEX IF NOT EXISTS idx_halluc_task ON hallucinations(task_result_id);
+"""
+
+
+@dataclass
+class RunComparison:
+    """Agregats d'un modele dans un run (une ligne de `flb compare`)."""
+
+    run_id: str
+    timestamp: str
+    model_id: str
+    answer_score_mean: float
+    answer_score_ci_lower: float
+    answer_score_ci_upper: float
+    hallucination_rate_mean: float | None
+    total_tasks: int
+    cost_total_usd: float
+    duration_seconds: float
+
+
+@dataclass
+class LeaderboardEntry:
+    """Scores d'un modele sur une fenetre de runs."""
+
+    model_id: str
+    mean_score: float
+    best_score: float
+    n_results: int
+    n_runs: int
+    cost_usd: float
+
+
+@dataclass
+class TrendPoint:
+    """Score moyen d'un modele dans un run."""
+
+    run_id: str
+    timestamp: str
+    mean_score: float
+    n_results: int
+
+
+class RunStore:
+    """Base SQLite des runs."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+        self._conn.execute(f"PRAGMA user_version = {STORE_VERSION}")
+
+    def _migrate(self) -> None:
+        """Mise a niveau d'une base creee par une version precedente."""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(task_results)")}
+        if "sample_index" not in columns:  # v1 -> v2 : echantillonnage multiple
+            self._conn.execute(
+                "ALTER TABLE task_results ADD COLUMN sample_index INTEGER NOT NULL DEFAULT 0"
+            )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(rubric_results)")}
+        if "item_hash" not in columns:  # v2 -> v3 : empreinte des criteres (rescore incremental)
+            self._conn.execute("ALTER TABLE rubric_results ADD COLUMN item_hash TEXT")
+
+    @classmethod
+    def open(cls, results_dir: Path) -> RunStore:
+        return cls(results_dir / STORE_FILENAME)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # ----- Ecriture -----
+
+    def has_run(self, run_id: str) -> bool:
+        row = self._conn.execute("SELECT 1 FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return row is not None
+
+    def add_run(self, run: BenchmarkRun) -> None:
+        """Indexe un run (remplace une version precedente du meme run_id)."""
+        self._write(
+            run.run_id,
+            run.timestamp.isoformat(),
+            run.models,
+            json.loads(to_json(run.metadata)),
+            run.aggregates,
+            run.task_results,
+        )
+
+    def _write(
+        self,
+        run_id: str,
+        timestamp: str,
+        models: list[str],
+        metadata: dict,
+        aggregates: list[AggregateScores],
+        results: Iterable[TaskResult],
+    ) -> int:
+        with self._conn:
+            self._conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+            self._conn.execute(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    run_id,
+                    timestamp,
+                    json.dumps(models),
+                    metadata.get("judge_model"),
+                    metadata.get("dataset_sha256"),
+                    metadata.get("n_tasks"),
+                    metadata.get("duration_seconds"),
+                    json.dumps(metadata, ensure_ascii=False),
+                ),
+            )
+            self._conn.executemany(
+                "INSERT INTO aggregates VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        a.model_id,
+                        a.answer_score_mean,
+                        a.answer_score_ci_lower,
+                        a.answer_score_ci_upper,
+                        a.hallucination_rate_mean,
+                        a.total_tasks,
+                        a.tasks_failed,
+                        a.cost_total_usd,
+                        a.model_dump_json(),
+                    )
+                    for a in aggregates
+                ],
+            )
+            n = 0
+            for r in results:
+                self._insert_result(run_id, r)
+                n += 1
+        return n
+
+    def _insert_result(self, run_id: str, r: TaskResult) -> None:
+        cur = self._conn.execute(
+            "INSERT INTO task_results (run_id, model_id, task_number, sample_index, task_title,"
+            " category, answer_score, source_score, hallucination_count, hallucination_rate,"
+            " latency_seconds, input_tokens, output_tokens, cost_usd, error)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                run_id,
+                r.model_id,
+                r.task_number,
+                r.sample_index,
+                r.task_title,
+                r.category,
+                r.answer_score,
+                r.source_score,
+                r.hallucination_count,
+                r.hallucination_rate,
+                r.latency_seconds,
+                r.input_tokens,
+                r.output_tokens,
+                r.cost_usd,
+                r.error,
+            ),
+        )
+        result_id = cur.lastrowid
+        self._conn.executemany(
+            "INSERT INTO rubric_results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    result_id,
+                    i.item_id,
+                    i.dimension,
+                    negatif,
+                    i.satisfied,
+                    i.confidence,
+                    i.reasoning,
+                    i.item_hash or None,
+                )
+                for negatif, items in ((0, r.rubric_results), (1, r.negatif_results))
+                for i in items
+            ],
+        )
+        self._conn.executemany(
+            "INSERT INTO hallucinations VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (result_id, h.claim, h.hallucinated, h.severity, h.category, h.reasoning)
+                for h in r.hallucination_details
+            ],
+        )
+
+    def import_file(self, path: Path, *, force: bool = False) -> str | None:
+        """Indexe un fichier de resultats ; None s'il est deja en base.
+
+        Les resultats sont lus en flux (`iter_task_results`) : le run n'est
+        jamais charge en entier.
+        """
+        header = read_header(path)
+        run_id = header["run_id"]
+        if not force and self.has_run(run_id):
+            return None
+        n = self._write(
+            run_id,
+            header["timestamp"],
+            header.get("models", []),
+            header.get("metadata", {}),
+            [AggregateScores.model_validate(a) for a in header.get("aggregates", [])],
+            iter_task_results(path),
+        )
+        logger.info("Run %s importe (%d resultats)", run_id, n)
+        return run_id
+
+    def import_results_dir(self, results_dir: Path, *, force: bool = False) -> list[str]:
+        """Indexe les runs de `results_dir/<run_id>/` absents de la base."""
+        imported: list[str] = []
+        for run_dir in sorted(p for p in results_dir.iterdir() if p.is_dir()):
+            path = find_results(run_dir)
+            if path is None:
+                continue
+            try:
+                run_id = self.import_file(path, force=force)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning("Run illisible, ignore : %s (%s)", path, e)
+                continue
+            if run_id is not None:
+                imported.append(run_id)
+        return imported
+
+    # ----- Requetes -----
+
+    def compare(self, run_ids: list[str]) -> list[RunComparison]:
+        """Agregats par (run, modele), dans l'ordre des run_ids demandes."""
+        order = {run_id: i for i, run_id in enumerate(run_ids)}
+        rows = self._conn.execute(
+            "SELECT a.run_id, r.timestamp, a.model_id, a.answer_score_mean,"
+            " a.answer_score_ci_lower, a.answer_score_ci_upper, a.hallucination_rate_mean,"
+            " a.total_tasks, a.cost_total_usd, r.duration_seconds"
+            " FROM aggregates a JOIN runs r USING (run_id)"
+            f" WHERE a.run_id IN ({','.join('?' * len(run_ids))})",
+            run_ids,
+        ).fetchall()
+        entries = [RunComparison(*row) for row in rows]
+        return sorted(entries, key=lambda e: (order[e.run_id], e.model_id))
+
+    def leaderboard(
+        self, *, task_number: int | None = None, last_runs: int | None = None
+    ) -> list[LeaderboardEntry]:
+        """Score moyen et meilleur score par modele sur les `last_runs` derniers runs."""
+        where, params = self._window(task_number, last_runs)
+        rows = self._conn.execute(
+            "SELECT model_id, AVG(answer_score), MAX(answer_score), COUNT(*),"
+            " COUNT(DISTINCT run_id), SUM(cost_usd)"
+            f" FROM task_results WHERE {where}"
+            " GROUP BY model_id ORDER BY AVG(answer_score) DESC",
+            params,
+        ).fetchall()
+        return [LeaderboardEntry(*row) for row in rows]
+
+    def trend(
+        self, model_id: str, *, task_number: int | None = None, last_runs: int | None = None
+    ) -> list[TrendPoint]:
+        """Evolution du score moyen d'un modele, run par run (ordre chronologique)."""
+        where, params = self._window(task_number, last_runs)
+        rows = self._conn.execute(
+            "SELECT t.run_id, r.timestamp, AVG(t.answer_score), COUNT(*)"
+            " FROM task_results t JOIN runs r USING (run_id)"
+            f" WHERE t.model_id = ? AND {where}"
+            " GROUP BY t.run_id ORDER BY r.timestamp",
+            [model_id, *params],
+        ).fetchall()
+        return [TrendPoint(*row) for row in rows]
+
+    def scoring_rows(
+        self, *, run_ids: list[str] | None = None, last_runs: int | None = None
+    ) -> tuple[list[tuple], list[tuple], list[tuple]]:
+        """Lignes brutes pour rejouer le scoring (`scoring.vectorized.pack_store_rows`).
+
+        Retourne (resultats, criteres, hallucinations) des resultats sans erreur :
+        `(id, run_id, model_id, task_number, answer_score)`,
+        `(task_result_id, item_id, negatif, satisfied, confidence)` et
+        `(task_result_id, severity)` pour les claims hallucines.
+        """
+        where, params = self._window(None, last_runs)
+        if run_ids:
+            where += f" AND run_id IN ({','.join('?' * len(run_ids))})"
+            params += run_ids
+        results = self._conn.execute(
+            "SELECT id, run_id, model_id, task_number, answer_score"
+            f" FROM task_results WHERE {where} ORDER BY id",
+            params,
+        ).fetchall()
+        rubric = self._conn.execute(
+            "SELECT task_result_id, item_id, negatif, satisfied, confidence"
+            " FROM rubric_results"
+            f" WHERE task_result_id IN (SELECT id FROM task_results WHERE {where})",
+            params,
+        ).fetchall()
+        hallucinations = self._conn.execute(
+            "SELECT task_result_id, severity FROM hallucinations"
+            f" WHERE hallucinated = 1 AND task_result_id IN"
+            f" (SELECT id FROM task_results WHERE {where})",
+            params,
+        ).fetchall()
+        return results, rubric, hallucinations
+
+    @staticmethod
+    def _window(task_number: int | None, last_runs: int | None) -> tuple[str, list]:
+        clauses, params = ["error IS NULL"], []
+        if task_number is not None:
+            clauses.append("task_number = ?")
+            params.append(task_number)
+        if last_runs is not None:
+            clauses.append("run_id IN (SELECT run_id FROM runs ORDER BY timestamp DESC LIMIT ?)")
+            params.append(last_runs)
+        return " AND ".join(clauses), params
@@ -5,6 +5,7 @@ from __future__ import annotations
 import math
 import random
 from collections import defaultdict
+from collections.abc import Iterable
 
 from frenchlaw_bench.models.result import AggregateScores, LatencyStats, TaskResult, TokenStats
 from frenchlaw_bench.models.task import Task
@@ -47,11 +48,15 @@ def _median(vals: list[float]) -> float:
     return (s[n // 2 - 1] + s[n // 2]) / 2
 
 
-def _std(vals: list[float]) -> float:
+def _variance(vals: list[float]) -> float:
     if len(vals) < 2:
         return 0.0
     m = _mean(vals)
-    return math.sqrt(sum((v - m) ** 2 for v in vals) / (len(vals) - 1))
+    return sum((v - m) ** 2 for v in vals) / (len(vals) - 1)
+
+
+def _std(vals: list[float]) -> float:
+    return math.sqrt(_variance(vals))
 
 
 def _percentile(vals: list[float], p: float) -> float:
@@ -90,6 +95,43 @@ def _bootstrap_ci(
     return boot_means[lower_idx], boot_means[upper_idx]
 
 
+def _hierarchical_bootstrap_ci(
+    groups: list[list[float]],
+    n_bootstrap: int = 1000,
+    confidence: float = 0.95,
+    seed: int = 42,
+) -> tuple[float, float]:
+    """Intervalle de confiance par bootstrap a deux niveaux (taches, puis echantillons).
+
+    Chaque replique tire les taches avec remise, puis, pour chaque tache tiree,
+    ses echantillons avec remise : l'intervalle reflete a la fois la variance
+    entre taches et la variance d'un run a l'autre sur une meme tache.
+    """
+    groups = [g for g in groups if g]
+    if not groups:
+        return 0.0, 0.0
+    if len(groups) < 2 and len(groups[0]) < 2:
+        m = _mean(groups[0])
+        return m, m
+
+    rng = random.Random(seed)
+    boot_means = []
+    for _ in range(n_bootstrap):
+        total = 0.0
+        count = 0
+        for _ in range(len(groups)):
+            group = rng.choice(groups)
+            total += sum(rng.choice(group) for _ in range(len(group)))
+            count += len(group)
+        boot_means.append(total / count)
+
+    boot_means.sort()
+    alpha = (1 - confidence) / 2
+    lower_idx = max(0, int(alpha * n_bootstrap))
+    upper_idx = min(n_bootstrap - 1, int((1 - alpha) * n_bootstrap))
+    return boot_means[lower_idx], boot_means[upper_idx]
+
+
 def _compute_latency_stats(latencies: list[float]) -> LatencyStats:
     if not latencies:
         return LatencyStats()
@@ -123,11 +165,15 @@ def _compute_token_stats(results: list[TaskResult]) -> TokenStats:
 
 
 def aggregate_scores(
-    tasks: list[Task],
+    tasks: Iterable[Task] | None,
     results: list[TaskResult],
 ) -> list[AggregateScores]:
-    """Agrege les resultats par modele avec statistiques completes."""
-    task_map = {t.number: t for t in tasks}
+    """Agrege les resultats par modele avec statistiques completes.
+
+    Sans `tasks` (run alimente par un flux de taches), categorie, sous-categorie
+    et type sont lus sur chaque `TaskResult`.
+    """
+    task_map = {t.number: t for t in tasks} if tasks is not None else None
 
     by_model: dict[str, list[TaskResult]] = defaultdict(list)
     for r in results:
@@ -140,6 +186,7 @@ def aggregate_scores(
         by_task_type: dict[str, list[float]] = defaultdict(list)
         by_dimension: dict[str, list[float]] = defaultdict(list)
         all_scores: list[float] = []
+        scores_by_task: dict[int, list[float]] = defaultdict(list)
         source_scores: list[float] = []
         hallucination_rates: list[float] = []
         latencies: list[float] = []
@@ -153,10 +200,16 @@ def aggregate_scores(
         rubric_total = 0
         negatif_triggered_total = 0
         negatif_total = 0
+        reused: dict[str | None, int] = defaultdict(int)
 
         for r in model_results:
-            task = task_map.get(r.task_number)
-            if task is None:
+            if task_map is None:
+                category, sub_category, task_type = r.category, r.sub_category, r.task_type
+            elif (task := task_map.get(r.task_number)) is not None:
+                category = task.category.value
+                sub_category = task.sub_category.value
+                task_type = task.task_type.value
+            else:
                 continue
 
             # Succes/echec
@@ -164,11 +217,13 @@ def aggregate_scores(
                 tasks_failed += 1
                 continue
             tasks_succeeded += 1
+            reused[r.judgment_reuse] += 1
 
             all_scores.append(r.answer_score)
-            by_category[task.category.value].append(r.answer_score)
-            by_sub_category[task.sub_category.value].append(r.answer_score)
-            by_task_type[task.task_type.value].append(r.answer_score)
+            scores_by_task[r.task_number].append(r.answer_score)
+            by_category[category].append(r.answer_score)
+            by_sub_category[sub_category].append(r.answer_score)
+            by_task_type[task_type].append(r.answer_score)
             latencies.append(r.latency_seconds)
 
             # Scores par dimension
@@ -197,8 +252,16 @@ def aggregate_scores(
             # Cout
             total_cost += r.cost_usd
 
-        # Intervalles de confiance
-        ci_lower, ci_upper = _bootstrap_ci(all_scores) if all_scores else (0.0, 0.0)
+        # Intervalles de confiance (hierarchiques si plusieurs echantillons par tache)
+        task_groups = list(scores_by_task.values())
+        sampled = any(len(g) > 1 for g in task_groups)
+        if sampled:
+            ci_lower, ci_upper = _hierarchical_bootstrap_ci(task_groups)
+            within_var = _mean([_variance(g) for g in task_groups if len(g) > 1])
+            between_var = _variance([_mean(g) for g in task_groups])
+        else:
+            ci_lower, ci_upper = _bootstrap_ci(all_scores) if all_scores else (0.0, 0.0)
+            within_var = between_var = None
 
         total_tokens_val = sum(
             r.input_tokens + r.output_tokens for r in model_results if not r.error
@@ -215,6 +278,9 @@ def aggregate_scores(
                 answer_score_max=max(all_scores) if all_scores else 0.0,
                 answer_score_ci_lower=ci_lower,
                 answer_score_ci_upper=ci_upper,
+                samples_per_task=len(all_scores) / len(task_groups) if task_groups else 1.0,
+                within_task_variance=within_var,
+                between_task_variance=between_var,
                 # Ventilations
                 answer_score_by_category={k: _mean(v) for k, v in by_category.items()},
                 answer_score_by_task_type={k: _mean(v) for k, v in by_task_type.items()},
@@ -240,13 +306,13 @@ def aggregate_scores(
                     rubric_satisfied_total / rubric_total if rubric_total > 0 else 0.0
                 ),
                 negatif_items_triggered_total=negatif_triggered_total,
+                judgments_reused_exact=reused["exact"],
+                judgments_reused_near=reused["near"],
                 negatif_items_total=negatif_total,
                 # Latence
                 latency=_compute_latency_stats(latencies),
                 # Tokens
-                tokens=_compute_token_stats(
-                    [r for r in model_results if not r.error]
-                ),
+                tokens=_compute_token_stats([r for r in model_results if not r.error]),
                 # Cout
                 cost_total_usd=total_cost,
                 cost_per_task_usd=total_cost / tasks_succeeded if tasks_succeeded > 0 else 0.0,
@@ -0,0 +1,348 @@
+"""Extraction deterministe des citations juridiques (articles, jurisprudence, ECLI).
+
+Une seule expression reguliere compilee parcourt la reponse en une passe et
+reconnait les formes de citation usuelles en droit francais et europeen :
+
+- "article 1240 du Code civil", "art. L. 223-43 C. com.", "articles 101 et 102 TFUE"
+- "L. 223-43", "R. 1234-9" (numerotation codifiee sans mot "article")
+- "Cass. com., 12 janv. 2021, n° 19-12.345", "Cass. 1re civ., 3 mai 2018"
+- "CE, 5 février 1963, n° 45678", "Conseil d'État, sect., 3 mars 2020", "CE, n° 45678"
+- "CEDH, 7 déc. 1976, Handyside c. Royaume-Uni, n° 5493/72"
+- "CJUE, C-311/18", "aff. 26/62"
+- "ECLI:FR:CCASS:2021:CO00045"
+
+Chaque citation est normalisee (code canonique, date ISO, numero de pourvoi)
+pour pouvoir etre dedupliquee et verifiee sans appel LLM d'extraction.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+_MONTHS: dict[str, int] = {
+    "janv": 1,
+    "janvier": 1,
+    "févr": 2,
+    "fevr": 2,
+    "février": 2,
+    "fevrier": 2,
+    "mars": 3,
+    "avr": 4,
+    "avril": 4,
+    "mai": 5,
+    "juin": 6,
+    "juil": 7,
+    "juillet": 7,
+    "août": 8,
+    "aout": 8,
+    "sept": 9,
+    "septembre": 9,
+    "oct": 10,
+    "octobre": 10,
+    "nov": 11,
+    "novembre": 11,
+    "déc": 12,
+    "dec": 12,
+    "décembre": 12,
+    "decembre": 12,
+}
+
+# Codes et textes reconnus -> forme canonique. L'ordre compte : les libelles
+# longs doivent preceder leurs prefixes ("Code de procedure civile" avant "Code civil").
+_CODES: list[tuple[str, str]] = [
+    (r"Code\s+de\s+proc[ée]dure\s+civile|CPC", "Code de procédure civile"),
+    (r"Code\s+de\s+proc[ée]dure\s+p[ée]nale|CPP", "Code de procédure pénale"),
+    (r"Code\s+civil|C\.\s?civ\.?", "Code civil"),
+    (r"Code\s+de\s+commerce|C\.\s?com\.?", "Code de commerce"),
+    (r"Code\s+du\s+travail|C\.\s?trav\.?", "Code du travail"),
+    (r"Code\s+p[ée]nal|C\.\s?p[ée]n\.?", "Code pénal"),
+    (r"Code\s+de\s+la\s+consommation|C\.\s?consom\.?", "Code de la consommation"),
+    (
+        r"Code\s+de\s+la\s+propri[ée]t[ée]\s+intellectuelle|CPI",
+        "Code de la propriété intellectuelle",
+    ),
+    (r"Code\s+mon[ée]taire\s+et\s+financier|CMF", "Code monétaire et financier"),
+    (r"Code\s+g[ée]n[ée]ral\s+des\s+imp[ôo]ts|CGI", "Code général des impôts"),
+    (r"Code\s+de\s+justice\s+administrative|CJA", "Code de justice administrative"),
+    (r"Code\s+de\s+l['’]environnement|C\.\s?env\.?", "Code de l'environnement"),
+    (r"Code\s+des\s+assurances|C\.\s?assur\.?", "Code des assurances"),
+    (r"Code\s+de\s+la\s+sant[ée]\s+publique|CSP", "Code de la santé publique"),
+    (
+        r"Code\s+des\s+relations\s+entre\s+le\s+public\s+et\s+l['’]administration|CRPA",
+        "Code des relations entre le public et l'administration",
+    ),
+    (r"Code\s+de\s+l['’]organisation\s+judiciaire|COJ", "Code de l'organisation judiciaire"),
+    (r"TFUE", "TFUE"),
+    (r"TUE", "TUE"),
+    (r"RGPD", "RGPD"),
+    (
+        r"Charte\s+des\s+droits\s+fondamentaux(?:\s+de\s+l['’]Union\s+europ[ée]enne)?",
+        "Charte des droits fondamentaux",
+    ),
+    (
+        r"(?:Convention\s+europ[ée]enne\s+des\s+droits\s+de\s+l['’]homme|CESDH|CEDH|Conv\.\s?EDH)",
+        "CESDH",
+    ),
+    (r"Constitution", "Constitution"),
+]
+_CODE_RES = [(re.compile(pat, re.IGNORECASE), canon) for pat, canon in _CODES]
+
+_MONTH_RE = (
+    r"(?:janv(?:ier)?|f[ée]vr(?:ier)?|mars|avr(?:il)?|mai|juin|juil(?:let)?|ao[ûu]t"
+    r"|sept(?:embre)?|oct(?:obre)?|nov(?:embre)?|d[ée]c(?:embre)?)\.?"
+)
+_DATE = r"\d{1,2}(?:er)?\s+" + _MONTH_RE + r"\s+\d{4}"
+_DATE_PARTS_RE = re.compile(r"(\d{1,2})(?:er)?\s+([^\W\d_]+)\.?\s+(\d{4})")
+
+# Formation du Conseil d'Etat : "Ass.", "sect.", "10e et 9e ch. reunies", "2e-7e ss-sect."
+_CE_FORMATION = (
+    r"(?:Ass(?:embl[ée]e)?|Sect(?:ion)?|\d{1,2}(?:e|ème)(?:\s*(?:et|-)\s*\d{1,2}(?:e|ème))?"
+    r"\s*(?:ch(?:ambres?)?|ss-sect(?:ions?)?|sous-sections?)(?:\.?\s+r[ée]unies)?)\.?\s*,?\s*"
+)
+
+_ART_NUM = r"(?:(?-i:[LRDA])\.?\s?)?\d+(?:-\d+)*(?:\s(?:bis|ter|quater))?"
+_CODE_ALT = "|".join(f"(?:{pat})" for pat, _ in _CODES)
+
+# Prefiltre : le moteur regex n'essaie les alternatives completes qu'aux debuts
+# de mot qui commencent comme une citation (gain x4 sur du texte courant).
+_PREFILTER = (
+    r"(?<!\w)(?=[ecanptlrd])"
+    r"(?=ecli|cass|ce\b|cedh|conseil|cj|tpi|trib|aff|[ct]-\d|n[°o]|pourvoi|art|[lrd]\.?\s?\d)"
+)
+
+_CITATION_RE = re.compile(
+    _PREFILTER + r"(?:"
+    # ECLI
+    r"(?P<ECLI>\bECLI:[A-Z]{2}:[A-Z0-9]+:\d{4}:[A-Z0-9.]*[A-Z0-9])"
+    # Cour de cassation
+    r"|(?P<CASS>\bCass\.?\s*(?P<cass_ch>civ\.?\s*(?:1(?:re|ère)|2e|3e|[123])?"
+    r"|(?:1(?:re|ère)|2e|3e)\s*(?:ch\.\s*)?civ\.?"
+    r"|com\.?|soc\.?|crim\.?|ass\.\s*pl[ée]n\.?|ch\.\s*mixte|req\.?)?\s*,?\s*"
+    r"(?P<cass_date>" + _DATE + r")"
+    r"(?:\s*,?\s*(?:pourvoi\s+)?n[°o]\s*(?P<cass_no>\d{2}-\d{2}\.\d{3}))?)"
+    # Cour europeenne des droits de l'homme (nom des parties facultatif)
+    r"|(?P<ECHR>\bCEDH\s*,?\s*(?:(?:Gde\s+ch|GC|pl[ée]n)\.?\s*,?\s*)?(?:(?P<echr_date>"
+    + _DATE
+    + r")"
+    r"(?:\s*,\s*(?:[^,;\n]{1,80}?\s*,\s*)?(?:req\.\s*)?n[°o]\s*(?P<echr_no>\d{1,6}/\d{2}))?"
+    r"|(?:req\.\s*)?n[°o]\s*(?P<echr_req>\d{1,6}/\d{2})))"
+    # Conseil d'Etat, date ou numero (un numero "aff." signale en realite une decision CJCE)
+    r"|(?P<CE>(?:\b(?-i:CE)|\bConseil\s+d['’]\s?[ÉEée]tat)\s*,?\s*(?:" + _CE_FORMATION + r")?"
+    r"(?:(?P<ce_date>" + _DATE + r")"
+    r"(?:\s*,\s*(?:n[°o]\s*(?P<ce_no>\d{3,6})|aff\.\s*(?P<ce_aff>(?:(?-i:[CT])-)?\d{1,4}/\d{2}))"
+    r")?"
+    # Sans date : un numero de requete seul (pas "CE n° 1907/2006", un reglement)
+    r"|n[°o]\s*(?P<ce_num>\d{3,6})(?![\d/])))"
+    # Juridictions de l'Union (numero d'affaire)
+    r"|(?P<EU>(?:\b(?P<eu_court>CJUE|CJCE|TPICE|Trib\.\s*UE)\s*,?\s*(?:" + _DATE + r"\s*,?\s*)?)?"
+    r"(?:aff\.\s*(?P<eu_aff>(?:(?-i:[CT])-)?\d{1,4}/\d{2})|\b(?P<eu_no>(?-i:[CT])-\d{1,4}/\d{2})))"
+    # Pourvoi isole
+    r"|(?P<POURVOI>\b(?:pourvoi\s+)?n[°o]\s*(?P<pourvoi_no>\d{2}-\d{2}\.\d{3}))"
+    # Article(s) avec numero, code optionnel
+    r"|(?P<ART>\bart(?:icles?|s?\.)\s*(?P<art_nums>"
+    + _ART_NUM
+    + r"(?:\s*(?:,|et|à|a)\s*"
+    + _ART_NUM
+    + r")*)"
+    r"(?:\s+et\s+s(?:uivants|uiv\.|\.))?"
+    r"(?:\s*,?\s*al(?:in[ée]a|\.)\s*\d+)?"
+    r"(?:\s*,?\s*(?:du|de\s+la|de\s+l['’]|des)?\s*(?P<art_code>" + _CODE_ALT + r"))?)"
+    # Numerotation codifiee sans le mot "article"
+    r"|(?P<CODIFIED>\b(?P<cod_num>(?-i:[LRD])\.?\s?\d{1,4}(?:-\d+)+)"
+    r"(?:\s*,?\s*(?:du|de\s+la|de\s+l['’]|des)?\s*(?P<cod_code>" + _CODE_ALT + r"))?)"
+    r")",
+    re.IGNORECASE,
+)
+
+_ART_NUM_RE = re.compile(_ART_NUM, re.IGNORECASE)
+
+# Frontieres de phrase : fin de ligne ou ponctuation finale suivie d'une majuscule
+_SENTENCE_BOUNDARY_RE = re.compile(r"\n|(?<=[.!?;])\s+(?=[A-ZÉÈÀÂÎÔ«\"(])")
+
+_KIND_CATEGORY: dict[str, str] = {
+    "ECLI": "jurisprudence",
+    "CASS": "jurisprudence",
+    "CE": "jurisprudence",
+    "ECHR": "jurisprudence",
+    "EU": "jurisprudence",
+    "POURVOI": "jurisprudence",
+    "ART": "article_reference",
+    "CODIFIED": "article_reference",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Citation:
+    """Citation juridique reperee dans un texte."""
+
+    kind: str
+    category: str
+    text: str
+    normalized: str
+    start: int
+    end: int
+    sentence: str
+
+
+@lru_cache(maxsize=512)
+def _canonical_code(raw: str | None) -> str:
+    if not raw:
+        return ""
+    for pattern, canon in _CODE_RES:
+        if pattern.fullmatch(raw.strip()):
+            return canon
+    return raw.strip()
+
+
+@lru_cache(maxsize=1024)
+def _iso_date(raw: str | None) -> str:
+    if not raw:
+        return ""
+    m = _DATE_PARTS_RE.search(raw)
+    if not m:
+        return raw
+    month = _MONTHS.get(m.group(2).lower())
+    if month is None:
+        return raw
+    return f"{m.group(3)}-{month:02d}-{int(m.group(1)):02d}"
+
+
+def _normalize_article_number(raw: str) -> str:
+    """'L223-43' / 'L. 223-43' / 'l.223-43' -> 'L. 223-43'."""
+    raw = raw.strip()
+    if raw[0].isalpha():
+        digits = raw[1:].lstrip(". ")
+        return f"{raw[0].upper()}. {digits}"
+    return raw
+
+
+_CHAMBERS: dict[str, str] = {
+    "com": "com.",
+    "soc": "soc.",
+    "crim": "crim.",
+    "req": "req.",
+    "ass": "ass. plén.",
+    "ch": "ch. mixte",
+}
+
+
+def _normalize_chamber(raw: str | None) -> str:
+    """'civ. 1ère' / '1re civ.' / 'civ 1' -> 'Cass. civ. 1re', 'com' -> 'Cass. com.'."""
+    if not raw:
+        return "Cass."
+    ch = raw.strip().lower()
+    if "civ" in ch:
+        digit = re.search(r"[123]", ch)
+        if digit is None:
+            return "Cass. civ."
+        return f"Cass. civ. {digit.group(0)}{'re' if digit.group(0) == '1' else 'e'}"
+    head = re.match(r"[a-z]+", ch)
+    if head is None:
+        return "Cass."
+    return f"Cass. {_CHAMBERS.get(head.group(0), ch)}"
+
+
+class _SentenceIndex:
+    """Index des frontieres de phrase pour retrouver la phrase d'une citation."""
+
+    __slots__ = ("_bounds", "_text")
+
+    def __init__(self, text: str) -> None:
+        self._text = text
+        self._bounds = [m.start() for m in _SENTENCE_BOUNDARY_RE.finditer(text)]
+
+    def around(self, start: int, end: int) -> str:
+        i = bisect.bisect_right(self._bounds, start) - 1
+        left = self._bounds[i] if i >= 0 else 0
+        j = bisect.bisect_left(self._bounds, end)
+        right = self._bounds[j] if j < len(self._bounds) else len(self._text)
+        return self._text[left:right].strip()
+
+
+def _normalized_forms(kind: str, m: re.Match[str]) -> list[str]:
+    """Formes normalisees d'un match (plusieurs pour 'articles 1240 et 1241')."""
+    if kind == "ECLI":
+        return [m.group("ECLI").upper().rstrip(".")]
+    if kind == "CASS":
+        parts = [_normalize_chamber(m.group("cass_ch")), _iso_date(m.group("cass_date"))]
+        if m.group("cass_no"):
+            parts.append(f"n° {m.group('cass_no')}")
+        return [", ".join(parts)]
+    if kind == "ECHR":
+        parts = ["CEDH", _iso_date(m.group("echr_date"))]
+        number = m.group("echr_no") or m.group("echr_req")
+        if number:
+            parts.append(f"n° {number}")
+        return [", ".join(p for p in parts if p)]
+    if kind == "CE":
+        if m.group("ce_aff"):
+            return [f"CJUE, aff. {m.group('ce_aff').upper()}"]
+        parts = ["CE", _iso_date(m.group("ce_date"))]
+        number = m.group("ce_no") or m.group("ce_num")
+        if number:
+            parts.append(f"n° {number}")
+        return [", ".join(p for p in parts if p)]
+    if kind == "EU":
+        number = (m.group("eu_no") or m.group("eu_aff")).upper()
+        court = "Trib. UE" if number.startswith("T-") else "CJUE"
+        return [f"{court}, aff. {number}"]
+    if kind == "POURVOI":
+        return [f"Cass., n° {m.group('pourvoi_no')}"]
+    if kind == "ART":
+        code = _canonical_code(m.group("art_code"))
+        numbers = [_normalize_article_number(n) for n in _ART_NUM_RE.findall(m.group("art_nums"))]
+        return [f"{code}, art. {n}" if code else f"art. {n}" for n in numbers]
+    # CODIFIED
+    code = _canonical_code(m.group("cod_code"))
+    number = _normalize_article_number(m.group("cod_num"))
+    return [f"{code}, art. {number}" if code else f"art. {number}"]
+
+
+def extract_citations(text: str) -> list[Citation]:
+    """Extrait toutes les citations juridiques d'un texte en une seule passe."""
+    if not text:
+        return []
+
+    sentences = _SentenceIndex(text)
+    citations: list[Citation] = []
+    for m in _CITATION_RE.finditer(text):
+        kind = m.lastgroup
+        if kind is None:
+            continue
+        sentence = sentences.around(m.start(), m.end())
+        for normalized in _normalized_forms(kind, m):
+            citations.append(
+                Citation(
+                    kind=kind,
+                    category=_KIND_CATEGORY[kind],
+                    text=m.group(0),
+                    normalized=normalized,
+                    start=m.start(),
+                    end=m.end(),
+                    sentence=sentence,
+                )
+            )
+    return citations
+
+
+def citations_to_claims(citations: list[Citation]) -> list[dict[str, str]]:
+    """Regroupe les citations par phrase pour former des claims a verifier.
+
+    Le format de sortie est celui attendu par l'etape de verification de
+    `detect_hallucinations` : {"claim", "category", "citations"}.
+    """
+    claims: dict[str, dict[str, str]] = {}
+    for c in citations:
+        entry = claims.get(c.sentence)
+        if entry is None:
+            claims[c.sentence] = {
+                "claim": c.sentence,
+                "category": c.category,
+                "citations": c.normalized,
+            }
+        elif c.normalized not in entry["citations"].split(" ; "):
+            entry["citations"] += f" ; {c.normalized}"
+    return list(claims.values())
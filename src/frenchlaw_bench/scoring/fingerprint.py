@@ -0,0 +1,85 @@
+"""Empreintes de reponses : hash exact et signature MinHash sur tokens normalises.
+
+Deux reponses dont les tokens normalises (casse, accents, ponctuation et
+espaces ignores) sont identiques ont le meme hash exact. La signature MinHash
+estime la similarite de Jaccard entre les ensembles de shingles (k tokens
+consecutifs) de deux reponses : elle sert a reconnaitre une quasi-copie
+(reponse "toute faite" d'un modele, echantillon presque identique).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+import unicodedata
+from array import array
+from dataclasses import dataclass
+
+NUM_PERM = 128
+SHINGLE_SIZE = 3
+
+_TOKEN_RE = re.compile(r"\w+")
+_MERSENNE = (1 << 61) - 1
+_MAX_HASH = (1 << 64) - 1
+# Permutations fixes : les signatures restent comparables d'un run a l'autre
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = tuple(
+    (_rng.randrange(1, _MERSENNE), _rng.randrange(0, _MERSENNE)) for _ in range(NUM_PERM)
+)
+
+
+def normalize_tokens(text: str) -> list[str]:
+    """Tokens en minuscules, sans accents ni ponctuation."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _TOKEN_RE.findall(stripped)
+
+
+def _shingle_hashes(tokens: list[str]) -> set[int]:
+    if len(tokens) < SHINGLE_SIZE:
+        shingles = [" ".join(tokens)] if tokens else []
+    else:
+        shingles = [
+            " ".join(tokens[i : i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)
+        ]
+    return {
+        int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "little")
+        for s in shingles
+    }
+
+
+def minhash(tokens: list[str]) -> tuple[int, ...]:
+    """Signature MinHash (NUM_PERM minima) des shingles de `tokens`."""
+    hashes = _shingle_hashes(tokens)
+    if not hashes:
+        return (_MAX_HASH,) * NUM_PERM
+    return tuple(min((a * h + b) % _MERSENNE for h in hashes) for a, b in _PERMUTATIONS)
+
+
+@dataclass(frozen=True)
+class ResponseFingerprint:
+    """Hash exact (tokens normalises) et signature MinHash d'une reponse."""
+
+    exact: str
+    signature: tuple[int, ...]
+
+    @classmethod
+    def of(cls, text: str) -> ResponseFingerprint:
+        tokens = normalize_tokens(text)
+        exact = hashlib.sha256(" ".join(tokens).encode()).hexdigest()
+        return cls(exact, minhash(tokens))
+
+    def similarity(self, other: ResponseFingerprint) -> float:
+        """Similarite de Jaccard estimee (1.0 si les hash exacts coincident)."""
+        if self.exact == other.exact:
+            return 1.0
+        same = sum(a == b for a, b in zip(self.signature, other.signature, strict=True))
+        return same / NUM_PERM
+
+    def signature_bytes(self) -> bytes:
+        return array("Q", self.signature).tobytes()
+
+    @classmethod
+    def from_bytes(cls, exact: str, data: bytes) -> ResponseFingerprint:
+        return cls(exact, tuple(array("Q", data)))
@@ -7,25 +7,47 @@ import json
 import logging
 from dataclasses import dataclass, field
 
-from frenchlaw_bench.json_utils import parse_llm_json
-from frenchlaw_bench.llm.base import BaseLLMClient
+from frenchlaw_bench.documents.retriever import (
+    DEFAULT_TOKEN_BUDGET,
+    DEFAULT_TOP_K,
+    DocumentIndex,
+)
+from frenchlaw_bench.llm.base import BaseLLMClient, estimate_tokens
+from frenchlaw_bench.llm.structured import complete_json
 from frenchlaw_bench.models.result import HallucinationDetail
+from frenchlaw_bench.scoring.citation_extractor import citations_to_claims, extract_citations
 from frenchlaw_bench.scoring.prompts import (
+    HALLUCINATION_EXTRACT_HYBRID_PROMPT,
     HALLUCINATION_EXTRACT_PROMPT,
     HALLUCINATION_EXTRACT_SYSTEM,
+    HALLUCINATION_SOURCE_EXTRACT_HYBRID_PROMPT,
+    HALLUCINATION_SOURCE_EXTRACT_PROMPT,
     HALLUCINATION_VERIFY_PROMPT,
     HALLUCINATION_VERIFY_SYSTEM,
 )
+from frenchlaw_bench.scoring.schemas import (
+    CLAIM_VERDICT_SCHEMA,
+    CLAIMS_SCHEMA,
+    CLAIMS_WITH_SOURCES_HYBRID_SCHEMA,
+    CLAIMS_WITH_SOURCES_SCHEMA,
+)
+from frenchlaw_bench.scoring.source_scorer import source_score_from_claims
 
 logger = logging.getLogger(__name__)
 
 # Penalites par severite (inspirees de HalluDetect, EMNLP 2025)
 SEVERITY_PENALTIES: dict[str, float] = {
     "critical": 2.0,  # Article invente, jurisprudence fictive
-    "major": 1.0,     # Mauvaise juridiction, date incorrecte
-    "minor": 0.3,     # Imprecision legere
+    "major": 1.0,  # Mauvaise juridiction, date incorrecte
+    "minor": 0.3,  # Imprecision legere
 }
 
+# Modes d'extraction des claims :
+# - "llm" : un appel LLM extrait toutes les assertions factuelles
+# - "citations" : extraction deterministe des citations uniquement (aucun appel)
+# - "hybrid" : citations deterministes + LLM pour les assertions hors citations
+EXTRACTION_MODES: tuple[str, ...] = ("llm", "citations", "hybrid")
+
 
 @dataclass
 class HallucinationResult:
@@ -35,6 +57,10 @@ class HallucinationResult:
     penalty_points: float
     severity_counts: dict[str, int] = field(default_factory=dict)
     details: list[HallucinationDetail] = field(default_factory=list)
+    source_context_tokens: int = 0
+    source_score: float | None = None
+    # False si l'extraction ou une verification a echoue : resultat partiel
+    complete: bool = True
 
 
 async def _verify_single_claim(
@@ -51,12 +77,15 @@ async def _verify_single_claim(
         task_title=task_title,
         source_context=source_context,
     )
-    verify_resp = await client.complete(
-        verify_prompt, system=HALLUCINATION_VERIFY_SYSTEM, temperature=0.0
-    )
-
     try:
-        verify_data = parse_llm_json(verify_resp.content)
+        verify_data, _ = await complete_json(
+            client,
+            verify_prompt,
+            schema=CLAIM_VERDICT_SCHEMA,
+            schema_name="claim_verdict",
+            system=HALLUCINATION_VERIFY_SYSTEM,
+            temperature=0.0,
+        )
     except (json.JSONDecodeError, ValueError):
         logger.warning("Impossible de verifier le claim: %s", claim_text[:50])
         return None
@@ -70,12 +99,104 @@ async def _verify_single_claim(
     )
 
 
+async def extract_claims(
+    client: BaseLLMClient,
+    response: str,
+    extraction_mode: str = "llm",
+    with_sources: bool = False,
+) -> list[dict]:
+    """Extrait les claims a verifier selon le mode choisi.
+
+    Les citations (articles, jurisprudence) sont extraites localement en mode
+    "citations" et "hybrid" ; le LLM ne traite alors que les autres assertions.
+
+    Avec `with_sources`, le meme appel (meme perimetre d'extraction) renvoie
+    aussi pour chaque claim les drapeaux `needs_source` et `attribution_valid`
+    du Source Score. En mode "hybrid", le LLM attribue aussi ces drapeaux aux
+    phrases des citations deterministes : citer un article ne prouve pas que
+    l'attribution soit valide. Une phrase sans drapeau n'entre pas dans le
+    Source Score.
+    """
+    claims, _ = await _extract_claims(client, response, extraction_mode, with_sources)
+    return claims
+
+
+async def _extract_claims(
+    client: BaseLLMClient, response: str, extraction_mode: str, with_sources: bool
+) -> tuple[list[dict], bool]:
+    """Claims extraits, et False si la sortie de l'extraction LLM etait illisible."""
+    if extraction_mode not in EXTRACTION_MODES:
+        raise ValueError(f"Mode d'extraction inconnu : '{extraction_mode}'")
+    if with_sources and extraction_mode == "citations":
+        raise ValueError("Le mode combine requiert une extraction LLM (llm ou hybrid)")
+
+    citation_claims: list[dict] = []
+    citation_list = ""
+    if extraction_mode in ("citations", "hybrid"):
+        citations = extract_citations(response)
+        citation_claims = citations_to_claims(citations)
+        if extraction_mode == "citations":
+            return citation_claims, True
+        citation_list = "\n".join(f"- {c['citations']}" for c in citation_claims) or "(aucune)"
+
+    if with_sources and extraction_mode == "hybrid":
+        citation_sentences = (
+            "\n".join(f"[{i}] {c['claim']}" for i, c in enumerate(citation_claims, start=1))
+            or "(aucune)"
+        )
+        extract_prompt = HALLUCINATION_SOURCE_EXTRACT_HYBRID_PROMPT.format(
+            response=response, citations=citation_list, citation_sentences=citation_sentences
+        )
+        schema = CLAIMS_WITH_SOURCES_HYBRID_SCHEMA
+    elif with_sources:
+        extract_prompt = HALLUCINATION_SOURCE_EXTRACT_PROMPT.format(response=response)
+        schema = CLAIMS_WITH_SOURCES_SCHEMA
+    elif extraction_mode == "hybrid":
+        extract_prompt = HALLUCINATION_EXTRACT_HYBRID_PROMPT.format(
+            response=response, citations=citation_list
+        )
+        schema = CLAIMS_SCHEMA
+    else:
+        extract_prompt = HALLUCINATION_EXTRACT_PROMPT.format(response=response)
+        schema = CLAIMS_SCHEMA
+
+    try:
+        extract_data, _ = await complete_json(
+            client,
+            extract_prompt,
+            schema=schema,
+            schema_name="claims",
+            system=HALLUCINATION_EXTRACT_SYSTEM,
+            temperature=0.0,
+        )
+    except (json.JSONDecodeError, ValueError):
+        logger.warning("Impossible de parser les claims extraits")
+        return citation_claims, False
+
+    if not isinstance(extract_data, dict):
+        return citation_claims, False
+    if with_sources:
+        for flags in extract_data.get("citations") or []:
+            index = flags.get("index") if isinstance(flags, dict) else None
+            if isinstance(index, int) and 1 <= index <= len(citation_claims):
+                citation_claims[index - 1]["needs_source"] = bool(flags.get("needs_source"))
+                citation_claims[index - 1]["attribution_valid"] = bool(
+                    flags.get("attribution_valid")
+                )
+    return citation_claims + extract_data.get("claims", []), True
+
+
 async def detect_hallucinations(
     client: BaseLLMClient,
     response: str,
     task_title: str,
     source_context: str = "Pas de documents source (tache knowledge-only)",
     max_penalty: float | None = None,
+    extraction_mode: str = "llm",
+    source_index: DocumentIndex | None = None,
+    retrieval_k: int = DEFAULT_TOP_K,
+    retrieval_token_budget: int = DEFAULT_TOKEN_BUDGET,
+    with_sources: bool = False,
 ) -> HallucinationResult:
     """Pipeline de detection d'hallucinations en 2 etapes.
 
@@ -84,35 +205,41 @@ async def detect_hallucinations(
 
     Args:
         max_penalty: Plafond de penalite (si None, pas de plafond).
+        extraction_mode: "llm", "citations" ou "hybrid" (voir EXTRACTION_MODES).
+        source_index: Index BM25 des documents de la tache. Si fourni, chaque
+            claim n'est verifie qu'avec ses top-k passages (dans le budget de
+            tokens) au lieu de `source_context` complet.
+        with_sources: Mode combine : le Source Score est calcule a partir des
+            drapeaux renvoyes par l'extraction, sans appel separe.
     """
     # Etape 1 : extraction
-    extract_prompt = HALLUCINATION_EXTRACT_PROMPT.format(response=response)
-    extract_resp = await client.complete(
-        extract_prompt, system=HALLUCINATION_EXTRACT_SYSTEM, temperature=0.0
-    )
-
-    try:
-        extract_data = parse_llm_json(extract_resp.content)
-    except (json.JSONDecodeError, ValueError):
-        logger.warning("Impossible de parser les claims extraits")
-        return HallucinationResult(0, 0, 0.0, 0.0)
-
-    claims = extract_data.get("claims", [])
+    claims, complete = await _extract_claims(client, response, extraction_mode, with_sources)
+    src_score = source_score_from_claims(claims) if with_sources else None
     if not claims:
-        return HallucinationResult(0, 0, 0.0, 0.0)
+        return HallucinationResult(0, 0, 0.0, 0.0, source_score=src_score, complete=complete)
 
     # Etape 2 : verification en parallele
-    coros = [
-        _verify_single_claim(
-            client,
-            claim_data.get("claim", ""),
-            claim_data.get("category", "other_fact"),
-            task_title,
-            source_context,
+    coros = []
+    context_tokens = 0
+    for claim_data in claims:
+        claim_text = claim_data.get("claim", "")
+        if not claim_text.strip():
+            continue
+        context = (
+            source_index.context_for(claim_text, retrieval_k, retrieval_token_budget)
+            if source_index is not None
+            else source_context
+        )
+        context_tokens += estimate_tokens(context)
+        coros.append(
+            _verify_single_claim(
+                client,
+                claim_text,
+                claim_data.get("category", "other_fact"),
+                task_title,
+                context,
+            )
         )
-        for claim_data in claims
-        if claim_data.get("claim", "").strip()
-    ]
 
     results = await asyncio.gather(*coros, return_exceptions=True)
 
@@ -120,8 +247,10 @@ async def detect_hallucinations(
     for r in results:
         if isinstance(r, Exception):
             logger.warning("Erreur verification claim: %s", r)
-        elif r is not None:
+        if isinstance(r, HallucinationDetail):
             details.append(r)
+        else:
+            complete = False
 
     # Calcul des metriques
     hallucinated_details = [d for d in details if d.hallucinated]
@@ -148,4 +277,7 @@ async def detect_hallucinations(
         penalty_points=penalty,
         severity_counts=severity_counts,
         details=details,
+        source_context_tokens=context_tokens,
+        source_score=src_score,
+        complete=complete,
     )
@@ -1,101 +1,397 @@
-"""LLM-as-Judge : evaluation de chaque critere de rubric."""
+"""LLM-as-Judge : evaluation de chaque critere de rubric.
+
+Avec une `JudgeCascade`, chaque critere est d'abord juge par un modele rapide
+et peu couteux ; le verdict n'est soumis au juge principal que si sa confiance
+est sous le seuil, s'il n'a pas pu etre lu, ou si le critere releve d'une
+dimension reservee au juge principal (ex : Substance). Une fraction
+deterministe des autres criteres (calibration) est aussi soumise au juge
+principal pour mesurer l'accord entre les deux niveaux.
+
+Avec une `SelfConsistency`, le verdict d'un critere est le vote majoritaire
+de plusieurs verdicts echantillonnes (temperature > 0). Les votes sont tires
+par vagues et s'arretent des que le verdict est acquis : deux premiers votes
+concordants et confiants, ou majorite que les votes restants ne peuvent plus
+renverser. Le juge rapide d'une cascade ne vote pas.
+
+Un critere muni d'une regle deterministe (voir `scoring.rules`) est d'abord
+evalue localement : si la regle est concluante, aucun juge n'est appele.
+
+Sortie du juge (`output`) : "verbatim" demande les preuves recopiees, une
+analyse et une justification ; "spans" presente la reponse en phrases
+numerotees et ne demande que les numeros des preuves, le verdict et la
+confiance, les preuves etant reconstituees localement (voir `scoring.spans`).
+Appels, tokens et latence des verdicts sont comptes par modele juge.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from statistics import fmean
 
-from frenchlaw_bench.json_utils import parse_llm_json
-from frenchlaw_bench.llm.base import BaseLLMClient
+from frenchlaw_bench.llm.base import BaseLLMClient, LLMResponse
+from frenchlaw_bench.llm.structured import complete_json
 from frenchlaw_bench.models.enums import Dimension
 from frenchlaw_bench.models.result import RubricItemResult
 from frenchlaw_bench.models.task import RubricItem, Task
 from frenchlaw_bench.scoring.prompts import (
     NEGATIF_ITEM_PROMPT,
+    NEGATIF_ITEM_SPANS_PROMPT,
     RUBRIC_ITEM_PROMPT,
+    RUBRIC_ITEM_SPANS_PROMPT,
     RUBRIC_JUDGE_SYSTEM,
 )
+from frenchlaw_bench.scoring.rules import rule_verdict
+from frenchlaw_bench.scoring.schemas import (
+    NEGATIF_SPANS_VERDICT_SCHEMA,
+    NEGATIF_VERDICT_SCHEMA,
+    RUBRIC_SPANS_VERDICT_SCHEMA,
+    RUBRIC_VERDICT_SCHEMA,
+)
+from frenchlaw_bench.scoring.spans import evidence_from_spans, numbered, span_ids
 
 logger = logging.getLogger(__name__)
 
+_PARSE_ERROR = "Parse error"
 
-async def judge_rubric_item(
+
+def is_parse_error(verdict: RubricItemResult) -> bool:
+    """Verdict par defaut rendu quand la sortie du juge est illisible (pas un jugement)."""
+    return verdict.reasoning == _PARSE_ERROR
+
+
+JUDGE_OUTPUT_MODES = ("verbatim", "spans")
+# Sortie "spans" : quelques dizaines de tokens attendus, plafond contre les derives
+_SPANS_MAX_TOKENS = 512
+
+
+@dataclass
+class VerdictStats:
+    """Appels du juge sur les criteres (rubric et Negatif) pour un modele."""
+
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    latency_seconds: float = 0.0
+
+    @property
+    def output_tokens_per_call(self) -> float:
+        return self.output_tokens / self.calls if self.calls else 0.0
+
+    @property
+    def latency_per_call(self) -> float:
+        return self.latency_seconds / self.calls if self.calls else 0.0
+
+
+_VERDICT_STATS: dict[str, VerdictStats] = {}
+
+
+def verdict_stats_dict() -> dict[str, dict]:
+    """Compteurs par modele juge depuis le dernier `reset_verdict_stats`."""
+    return {
+        model: {
+            **asdict(stats),
+            "output_tokens_per_call": stats.output_tokens_per_call,
+            "latency_per_call": stats.latency_per_call,
+        }
+        for model, stats in sorted(_VERDICT_STATS.items())
+    }
+
+
+def reset_verdict_stats() -> None:
+    _VERDICT_STATS.clear()
+
+
+def _record_verdict(model: str, resp: LLMResponse) -> None:
+    stats = _VERDICT_STATS.setdefault(model, VerdictStats())
+    stats.calls += 1
+    stats.input_tokens += resp.input_tokens
+    stats.output_tokens += resp.output_tokens
+    stats.latency_seconds += resp.latency_seconds
+
+
+@dataclass
+class TierStats:
+    """Comptages de la cascade pour une dimension."""
+
+    items: int = 0
+    escalated: int = 0
+    escalated_agree: int = 0
+    calibrated: int = 0
+    calibrated_agree: int = 0
+
+
+@dataclass
+class JudgeCascade:
+    """Juge a deux niveaux : `fast` pour tous les criteres, le juge principal en renfort.
+
+    - threshold : confiance minimale d'un verdict rapide conserve tel quel
+    - dimensions : dimensions toujours soumises au juge principal
+    - calibration_rate : fraction des autres criteres aussi soumise au juge
+      principal (accord mesure, verdict principal conserve)
+    """
+
+    fast: BaseLLMClient
+    threshold: float = 0.8
+    dimensions: frozenset[str] = frozenset()
+    calibration_rate: float = 0.0
+    stats: dict[str, TierStats] = field(default_factory=dict)
+
+    def escalates(self, verdict: RubricItemResult) -> bool:
+        return (
+            verdict.confidence < self.threshold
+            or verdict.dimension in self.dimensions
+            or verdict.reasoning == _PARSE_ERROR
+        )
+
+    def calibrates(self, task: Task, response: str, item: RubricItem) -> bool:
+        """Tirage deterministe (tache, critere, reponse) : stable d'un run a l'autre."""
+        if self.calibration_rate <= 0:
+            return False
+        key = f"{task.number}\0{item.id}\0{response}".encode()
+        draw = int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "big") / 2**64
+        return draw < self.calibration_rate
+
+
+JudgeItem = Callable[..., Awaitable[RubricItemResult]]
+
+
+@dataclass(frozen=True)
+class SelfConsistency:
+    """Vote majoritaire du juge sur au plus `max_votes` verdicts par critere.
+
+    - temperature : temperature du juge pour chaque vote
+    - stop_confidence : deux premiers votes concordants, chacun au moins aussi
+      confiant, suffisent a arreter le vote
+    """
+
+    max_votes: int = 5
+    temperature: float = 0.7
+    stop_confidence: float = 0.9
+
+    def settled(self, votes: list[RubricItemResult]) -> bool:
+        """Verdict acquis : arret anticipe, majorite hors d'atteinte ou votes epuises."""
+        remaining = self.max_votes - len(votes)
+        if remaining <= 0:
+            return True
+        ballots = [v for v in votes if v.reasoning != _PARSE_ERROR]
+        if (
+            len(votes) == len(ballots) == 2
+            and ballots[0].satisfied == ballots[1].satisfied
+            and min(b.confidence for b in ballots) >= self.stop_confidence
+        ):
+            return True
+        return _margin(votes) > remaining
+
+    def next_wave(self, votes: list[RubricItemResult]) -> int:
+        """Votes a tirer ensemble : le minimum qui pourrait acquerir le verdict."""
+        remaining = self.max_votes - len(votes)
+        return min(remaining, (remaining - _margin(votes)) // 2 + 1)
+
+    def decide(self, votes: list[RubricItemResult]) -> RubricItemResult:
+        """Verdict majoritaire (egalite : premier vote lisible) avec la distribution des votes.
+
+        La confiance retenue est celle des votes majoritaires, ponderee par leur part.
+        """
+        ballots = [v for v in votes if v.reasoning != _PARSE_ERROR]
+        record = [None if v.reasoning == _PARSE_ERROR else v.satisfied for v in votes]
+        if not ballots:
+            return votes[0].model_copy(update={"votes": record})
+        yes = sum(b.satisfied for b in ballots)
+        majority = ballots[0].satisfied if 2 * yes == len(ballots) else 2 * yes > len(ballots)
+        winners = [b for b in ballots if b.satisfied == majority]
+        return winners[0].model_copy(
+            update={
+                "confidence": len(winners) / len(ballots) * fmean(w.confidence for w in winners),
+                "votes": record,
+            }
+        )
+
+    def voting(self, judge_item: JudgeItem) -> JudgeItem:
+        """`judge_item` dont le verdict est le vote majoritaire de verdicts echantillonnes."""
+
+        async def vote(
+            client: BaseLLMClient, task: Task, response: str, item: RubricItem
+        ) -> RubricItemResult:
+            votes: list[RubricItemResult] = []
+            wave = min(2, self.max_votes)
+            while True:
+                votes += await asyncio.gather(
+                    *(
+                        judge_item(client, task, response, item, temperature=self.temperature)
+                        for _ in range(wave)
+                    )
+                )
+                if self.settled(votes):
+                    return self.decide(votes)
+                wave = self.next_wave(votes)
+
+        return vote
+
+
+def _margin(votes: list[RubricItemResult]) -> int:
+    """Ecart entre les votes lisibles pour et contre."""
+    yes = sum(1 for v in votes if v.reasoning != _PARSE_ERROR and v.satisfied)
+    no = sum(1 for v in votes if v.reasoning != _PARSE_ERROR and not v.satisfied)
+    return abs(yes - no)
+
+
+async def _judge_with_cascade(
+    judge_item: JudgeItem,
     client: BaseLLMClient,
     task: Task,
     response: str,
     item: RubricItem,
+    cascade: JudgeCascade | None,
+    consistency: SelfConsistency | None = None,
+    rules: bool = True,
 ) -> RubricItemResult:
-    """Evalue un critere de rubric via LLM-as-judge avec extraction de preuves."""
-    prompt = RUBRIC_ITEM_PROMPT.format(
-        task_title=task.title,
-        prompt=task.prompt,
-        response=response,
-        item_id=item.id,
-        dimension=item.dimension.value,
-        description=item.description,
-        points=item.points,
-    )
+    if rules and (ruled := rule_verdict(item, response)) is not None:
+        return ruled
+    strong_item = consistency.voting(judge_item) if consistency else judge_item
+    if cascade is None:
+        return await strong_item(client, task, response, item)
+    fast = await judge_item(cascade.fast, task, response, item)
+    stats = cascade.stats.setdefault(fast.dimension, TierStats())
+    stats.items += 1
+    escalated = cascade.escalates(fast)
+    if not escalated and not cascade.calibrates(task, response, item):
+        return fast.model_copy(update={"judge_tier": "fast"})
+
+    strong = await strong_item(client, task, response, item)
+    agree = strong.satisfied == fast.satisfied
+    if escalated:
+        stats.escalated += 1
+        stats.escalated_agree += agree
+    else:
+        stats.calibrated += 1
+        stats.calibrated_agree += agree
+    return strong.model_copy(update={"judge_tier": "strong"})
 
-    llm_resp = await client.complete(prompt, system=RUBRIC_JUDGE_SYSTEM, temperature=0.0)
 
+async def _judge_verdict(
+    client: BaseLLMClient,
+    response: str,
+    item: RubricItem,
+    prompt: str,
+    *,
+    schema: dict,
+    schema_name: str,
+    verdict_key: str,
+    dimension: str,
+    temperature: float,
+    output: str,
+) -> RubricItemResult:
+    spans = output == "spans"
     try:
-        data = parse_llm_json(llm_resp.content)
+        data, resp = await complete_json(
+            client,
+            prompt,
+            schema=schema,
+            schema_name=schema_name,
+            system=RUBRIC_JUDGE_SYSTEM,
+            temperature=temperature,
+            max_tokens=_SPANS_MAX_TOKENS if spans else 4096,
+        )
     except (json.JSONDecodeError, ValueError):
         logger.warning("Impossible de parser la reponse du juge pour %s", item.id)
         return RubricItemResult(
             item_id=item.id,
             satisfied=False,
-            reasoning="Parse error",
-            dimension=item.dimension.value,
+            reasoning=_PARSE_ERROR,
+            dimension=dimension,
+            item_hash=item.content_hash,
         )
+    _record_verdict(client.model, resp)
 
+    if spans:
+        ids = span_ids(data.get("spans") or [], response)
+        evidence = evidence_from_spans(response, ids)
+        reasoning = f"Phrases {', '.join(map(str, ids))}" if ids else "Aucune phrase pertinente"
+    else:
+        evidence = data.get("evidence", [])
+        reasoning = data.get("reasoning", "")
     return RubricItemResult(
         item_id=item.id,
-        satisfied=data.get("satisfied", False),
-        reasoning=data.get("reasoning", ""),
-        evidence=data.get("evidence", []),
+        satisfied=data.get(verdict_key, False),
+        reasoning=reasoning,
+        evidence=evidence,
         confidence=data.get("confidence", 1.0),
-        dimension=item.dimension.value,
+        dimension=dimension,
+        item_hash=item.content_hash,
     )
 
 
-async def judge_negatif_item(
+async def judge_rubric_item(
     client: BaseLLMClient,
     task: Task,
     response: str,
     item: RubricItem,
+    *,
+    temperature: float = 0.0,
+    output: str = "verbatim",
 ) -> RubricItemResult:
-    """Evalue un critere Negatif du rubric (detection d'erreur specifique)."""
-    prompt = NEGATIF_ITEM_PROMPT.format(
+    """Evalue un critere de rubric via LLM-as-judge avec extraction de preuves."""
+    spans = output == "spans"
+    prompt = (RUBRIC_ITEM_SPANS_PROMPT if spans else RUBRIC_ITEM_PROMPT).format(
         task_title=task.title,
         prompt=task.prompt,
-        response=response,
+        response=numbered(response) if spans else response,
         item_id=item.id,
+        dimension=item.dimension.value,
         description=item.description,
         points=item.points,
     )
+    return await _judge_verdict(
+        client,
+        response,
+        item,
+        prompt,
+        schema=RUBRIC_SPANS_VERDICT_SCHEMA if spans else RUBRIC_VERDICT_SCHEMA,
+        schema_name="rubric_spans_verdict" if spans else "rubric_verdict",
+        verdict_key="satisfied",
+        dimension=item.dimension.value,
+        temperature=temperature,
+        output=output,
+    )
 
-    llm_resp = await client.complete(prompt, system=RUBRIC_JUDGE_SYSTEM, temperature=0.0)
-
-    try:
-        data = parse_llm_json(llm_resp.content)
-    except (json.JSONDecodeError, ValueError):
-        logger.warning("Impossible de parser la reponse du juge pour negatif %s", item.id)
-        return RubricItemResult(
-            item_id=item.id,
-            satisfied=False,
-            reasoning="Parse error",
-            dimension=Dimension.NEGATIF.value,
-        )
 
-    return RubricItemResult(
+async def judge_negatif_item(
+    client: BaseLLMClient,
+    task: Task,
+    response: str,
+    item: RubricItem,
+    *,
+    temperature: float = 0.0,
+    output: str = "verbatim",
+) -> RubricItemResult:
+    """Evalue un critere Negatif du rubric (detection d'erreur specifique)."""
+    spans = output == "spans"
+    prompt = (NEGATIF_ITEM_SPANS_PROMPT if spans else NEGATIF_ITEM_PROMPT).format(
+        task_title=task.title,
+        prompt=task.prompt,
+        response=numbered(response) if spans else response,
         item_id=item.id,
-        satisfied=data.get("triggered", False),  # satisfied=True means error IS present
-        reasoning=data.get("reasoning", ""),
-        evidence=data.get("evidence", []),
-        confidence=data.get("confidence", 1.0),
+        description=item.description,
+        points=item.points,
+    )
+    return await _judge_verdict(
+        client,
+        response,
+        item,
+        prompt,
+        schema=NEGATIF_SPANS_VERDICT_SCHEMA if spans else NEGATIF_VERDICT_SCHEMA,
+        schema_name="negatif_spans_verdict" if spans else "negatif_verdict",
+        # satisfied=True : l'erreur est presente
+        verdict_key="triggered",
         dimension=Dimension.NEGATIF.value,
+        temperature=temperature,
+        output=output,
     )
 
 
@@ -103,11 +399,19 @@ async def judge_all_items(
     client: BaseLLMClient,
     task: Task,
     response: str,
+    cascade: JudgeCascade | None = None,
+    consistency: SelfConsistency | None = None,
+    rules: bool = True,
+    output: str = "verbatim",
 ) -> list[RubricItemResult]:
     """Evalue tous les criteres positifs d'un rubric en parallele."""
-    positive_items = [i for i in task.rubric.items if i.dimension != Dimension.NEGATIF]
+    positive_items = task.rubric.positive_items
 
-    coros = [judge_rubric_item(client, task, response, item) for item in positive_items]
+    judge_item = partial(judge_rubric_item, output=output)
+    coros = [
+        _judge_with_cascade(judge_item, client, task, response, item, cascade, consistency, rules)
+        for item in positive_items
+    ]
     results = await asyncio.gather(*coros, return_exceptions=True)
 
     final = []
@@ -123,13 +427,21 @@ async def judge_negatif_items(
     client: BaseLLMClient,
     task: Task,
     response: str,
+    cascade: JudgeCascade | None = None,
+    consistency: SelfConsistency | None = None,
+    rules: bool = True,
+    output: str = "verbatim",
 ) -> list[RubricItemResult]:
     """Evalue tous les criteres Negatif d'un rubric en parallele."""
-    negatif_items = [i for i in task.rubric.items if i.dimension == Dimension.NEGATIF]
+    negatif_items = task.rubric.negatif_items
     if not negatif_items:
         return []
 
-    coros = [judge_negatif_item(client, task, response, item) for item in negatif_items]
+    judge_item = partial(judge_negatif_item, output=output)
+    coros = [
+        _judge_with_cascade(judge_item, client, task, response, item, cascade, consistency, rules)
+        for item in negatif_items
+    ]
     results = await asyncio.gather(*coros, return_exceptions=True)
 
     final = []
@@ -88,6 +88,57 @@ Reponds UNIQUEMENT au format JSON :
 }}
 """
 
+# Sortie `spans` : reponse en phrases numerotees, preuves designees par numero
+
+RUBRIC_ITEM_SPANS_PROMPT = """\
+## Tache
+{task_title}
+
+## Prompt original
+{prompt}
+
+## Reponse du modele (phrases numerotees)
+{response}
+
+## Critere a evaluer
+ID : {item_id}
+Dimension : {dimension}
+Question : {description}
+Points : {points}
+
+## Instructions
+Evalue si la reponse satisfait ce critere. Designe les phrases de la reponse \
+qui fondent ton verdict par leur numero (liste vide si aucune phrase \
+pertinente). Ne recopie aucun passage et n'ajoute aucune explication.
+
+Reponds UNIQUEMENT au format JSON suivant :
+{{"spans": [3, 7], "satisfied": true/false, "confidence": 0.0-1.0}}
+"""
+
+NEGATIF_ITEM_SPANS_PROMPT = """\
+## Tache
+{task_title}
+
+## Prompt original
+{prompt}
+
+## Reponse du modele (phrases numerotees)
+{response}
+
+## Critere negatif a verifier
+ID : {item_id}
+Description : {description}
+Penalite : {points} points
+
+## Instructions
+Verifie si la reponse contient l'erreur decrite par ce critere negatif. \
+Designe les phrases problematiques par leur numero (liste vide si aucune). \
+Ne recopie aucun passage et n'ajoute aucune explication.
+
+Reponds UNIQUEMENT au format JSON :
+{{"spans": [3, 7], "triggered": true/false, "confidence": 0.0-1.0}}
+"""
+
 HALLUCINATION_EXTRACT_SYSTEM = """\
 Tu es un expert en analyse factuelle juridique. Tu extrais les assertions \
 factuelles verifiables d'une reponse juridique. Ignore les opinions, analyses \
@@ -119,6 +170,122 @@ Reponds au format JSON :
 }}
 """
 
+HALLUCINATION_EXTRACT_HYBRID_PROMPT = """\
+## Reponse a analyser
+{response}
+
+## Citations deja extraites (ne pas les repeter)
+{citations}
+
+## Instructions
+Les references aux articles de loi et aux decisions de justice listees \
+ci-dessus ont deja ete extraites automatiquement. Extrais uniquement les \
+AUTRES assertions factuelles verifiables de cette reponse juridique.
+
+Pour chaque assertion, indique sa categorie :
+- "date_fact" : date specifique mentionnee
+- "institution" : reference a une institution ou juridiction
+- "legal_rule" : regle de droit enoncee comme un fait, sans reference a un texte ou une decision
+- "other_fact" : autre assertion factuelle verifiable
+
+Reponds au format JSON :
+{{
+  "claims": [
+    {{"claim": "La transformation d'une SARL en SAS requiert l'unanimite des associes", "category": "legal_rule"}},
+    ...
+  ]
+}}
+"""
+
+# Modes combines : meme perimetre d'extraction que les deux prompts ci-dessus
+# (instructions et categories identiques), plus les drapeaux du Source Score
+HALLUCINATION_SOURCE_EXTRACT_PROMPT = """\
+## Reponse a analyser
+{response}
+
+## Instructions
+Extrais chaque assertion factuelle verifiable de cette reponse juridique.
+
+Pour chaque assertion, indique sa categorie :
+- "article_reference" : reference a un article de loi (ex: "Article 1240 du Code civil")
+- "jurisprudence" : reference a une decision de justice (ex: "Cass. com., 22 oct. 1996")
+- "date_fact" : date specifique mentionnee
+- "institution" : reference a une institution ou juridiction
+- "legal_rule" : regle de droit enoncee comme un fait
+- "other_fact" : autre assertion factuelle verifiable
+
+Indique aussi, pour chaque assertion :
+- "needs_source" : true si l'assertion necessite une source (texte de loi, \
+decision de justice, doctrine) pour etre verifiee ; false si elle releve de l'evidence
+- "attribution_valid" : true si la reponse rattache explicitement cette \
+assertion a une source identifiable prouvant ce point (les sources superflues \
+ne sont ni recompensees ni penalisees)
+
+Reponds au format JSON :
+{{
+  "claims": [
+    {{
+      "claim": "La responsabilite delictuelle suppose une faute, un dommage et un lien de causalite",
+      "category": "legal_rule",
+      "needs_source": true,
+      "attribution_valid": false
+    }},
+    ...
+  ]
+}}
+"""
+
+HALLUCINATION_SOURCE_EXTRACT_HYBRID_PROMPT = """\
+## Reponse a analyser
+{response}
+
+## Citations deja extraites (ne pas les repeter)
+{citations}
+
+## Instructions
+Les references aux articles de loi et aux decisions de justice listees \
+ci-dessus ont deja ete extraites automatiquement. Extrais uniquement les \
+AUTRES assertions factuelles verifiables de cette reponse juridique.
+
+Pour chaque assertion, indique sa categorie :
+- "date_fact" : date specifique mentionnee
+- "institution" : reference a une institution ou juridiction
+- "legal_rule" : regle de droit enoncee comme un fait, sans reference a un texte ou une decision
+- "other_fact" : autre assertion factuelle verifiable
+
+Indique aussi, pour chaque assertion :
+- "needs_source" : true si l'assertion necessite une source (texte de loi, \
+decision de justice, doctrine) pour etre verifiee ; false si elle releve de l'evidence
+- "attribution_valid" : true si la reponse rattache explicitement cette \
+assertion a une source identifiable prouvant ce point (les sources superflues \
+ne sont ni recompensees ni penalisees)
+
+## Phrases contenant les citations
+{citation_sentences}
+
+Pour chacune de ces phrases, indique dans "citations", par son numero, les \
+memes drapeaux. Citer un texte ou une decision ne suffit pas : \
+"attribution_valid" n'est vrai que si la source citee prouve effectivement \
+l'assertion de la phrase.
+
+Reponds au format JSON :
+{{
+  "claims": [
+    {{
+      "claim": "La transformation d'une SARL en SAS requiert l'unanimite des associes",
+      "category": "legal_rule",
+      "needs_source": true,
+      "attribution_valid": false
+    }},
+    ...
+  ],
+  "citations": [
+    {{"index": 1, "needs_source": true, "attribution_valid": true}},
+    ...
+  ]
+}}
+"""
+
 HALLUCINATION_VERIFY_SYSTEM = """\
 Tu es un verificateur juridique expert en droit francais et europeen. \
 Tu determines si une assertion factuelle est correcte en te basant sur tes \
@@ -0,0 +1,199 @@
+"""Regles deterministes des criteres de rubric, evaluees avant le juge LLM.
+
+Les annotations `{{type[/politique]: motifs}}` sont lues par le parser de
+rubric (`core.rubric_parser.parse_rule`) ; ce module les evalue. La regle se
+declenche si l'un des motifs est trouve dans la reponse :
+
+- citation : citations normalisees (voir `extract_citations`) ; un article cite
+  sans code correspond a ce numero dans n'importe quel code
+- mot-cle : expression cherchee sans casse, accents ni ponctuation
+- regex : expression reguliere, insensible a la casse
+
+La politique fixe l'issue concluante : si-present (defaut) tranche le critere
+comme satisfait quand la regle se declenche, si-absent comme non satisfait
+quand elle ne se declenche pas, toujours dans les deux cas. Une issue non
+concluante laisse le critere au juge LLM. Pour un critere Negatif, satisfait
+signifie que l'erreur est presente.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+
+from frenchlaw_bench.models.result import RubricItemResult, TaskResult
+from frenchlaw_bench.models.task import RubricItem, RubricRule, Task
+from frenchlaw_bench.scoring.citation_extractor import extract_citations
+from frenchlaw_bench.scoring.fingerprint import normalize_tokens
+
+logger = logging.getLogger(__name__)
+
+# Valeur de `RubricItemResult.judge_tier` d'un verdict rendu par une regle
+RULE_TIER = "rule"
+
+
+def compile_rule(rule: RubricRule) -> tuple[str, ...]:
+    """Motifs de la regle sous la forme comparee a la reponse.
+
+    Leve ValueError si une citation n'est pas reconnue (`flb validate` le signale).
+    """
+    return _compile(rule.kind, tuple(rule.patterns))
+
+
+@lru_cache(maxsize=256)
+def _compile(kind: str, patterns: tuple[str, ...]) -> tuple[str, ...]:
+    if kind == "regex":
+        return patterns
+    if kind == "mot-cle":
+        forms = [" ".join(normalize_tokens(p)) for p in patterns]
+    else:
+        forms = []
+        for raw in patterns:
+            found = [c.normalized for c in extract_citations(raw)]
+            if not found:
+                raise ValueError(f"Citation non reconnue dans la regle : '{raw}'")
+            forms.extend(found)
+    return tuple(dict.fromkeys(f for f in forms if f))
+
+
+def _patterns(rule: RubricRule) -> tuple[str, ...]:
+    """Motifs compiles, vide si la regle est invalide (le critere revient au juge)."""
+    return _usable(rule.kind, tuple(rule.patterns))
+
+
+@lru_cache(maxsize=256)
+def _usable(kind: str, patterns: tuple[str, ...]) -> tuple[str, ...]:
+    try:
+        return _compile(kind, patterns)
+    except ValueError as e:
+        logger.warning("%s : critere laisse au juge", e)
+        return ()
+
+
+@lru_cache(maxsize=32)
+def _citations(response: str) -> tuple[tuple[str, str], ...]:
+    """(forme normalisee, texte) des citations d'une reponse (partagees par ses criteres)."""
+    return tuple((c.normalized, c.text) for c in extract_citations(response))
+
+
+@lru_cache(maxsize=32)
+def _normalized_text(response: str) -> str:
+    return f" {' '.join(normalize_tokens(response))} "
+
+
+@lru_cache(maxsize=256)
+def _regex(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def match_rule(rule: RubricRule, response: str) -> str | None:
+    """Passage de la reponse qui declenche la regle, None si elle ne se declenche pas."""
+    patterns = _patterns(rule)
+    if rule.kind == "citation":
+        for normalized, text in _citations(response):
+            for pattern in patterns:
+                if normalized == pattern or (
+                    pattern.startswith("art. ") and normalized.endswith(f", {pattern}")
+                ):
+                    return text
+        return None
+    if rule.kind == "mot-cle":
+        text = _normalized_text(response)
+        return next((p for p in patterns if f" {p} " in text), None)
+    for pattern in patterns:
+        if m := _regex(pattern).search(response):
+            return m.group(0)
+    return None
+
+
+def rule_verdict(item: RubricItem, response: str) -> RubricItemResult | None:
+    """Verdict de la regle du critere si elle est concluante, sinon None (juge LLM)."""
+    rule = item.rule
+    if rule is None or not _patterns(rule):
+        return None
+    evidence = match_rule(rule, response)
+    matched = evidence is not None
+    if rule.policy != "toujours" and matched != (rule.policy == "si-present"):
+        return None
+    found = f"'{evidence}' trouve" if matched else "aucune occurrence"
+    return RubricItemResult(
+        item_id=item.id,
+        satisfied=matched,
+        reasoning=f"Regle {rule.kind} ({rule.policy}) : {found}",
+        evidence=[evidence] if matched else [],
+        confidence=1.0,
+        dimension=item.dimension.value,
+        item_hash=item.content_hash,
+        judge_tier=RULE_TIER,
+    )
+
+
+@dataclass
+class RuleAgreement:
+    """Accord entre la regle d'un critere et les verdicts du juge LLM d'un ou plusieurs runs."""
+
+    task_number: int
+    item_id: str
+    kind: str
+    policy: str
+    verdicts: int = 0
+    conclusive: int = 0
+    agree: int = 0
+    # Desaccords : la regle tranche satisfait, le juge non (et inversement)
+    rule_only: int = 0
+    judge_only: int = 0
+
+    @property
+    def coverage(self) -> float | None:
+        """Part des verdicts que la regle aurait tranches sans appel au juge."""
+        return self.conclusive / self.verdicts if self.verdicts else None
+
+    @property
+    def agreement(self) -> float | None:
+        return self.agree / self.conclusive if self.conclusive else None
+
+
+def validate_rules(results: Iterable[TaskResult], tasks: Iterable[Task]) -> list[RuleAgreement]:
+    """Compare les regles des criteres aux verdicts du juge LLM deja rendus.
+
+    Seuls comptent les verdicts du juge (pas ceux deja rendus par une regle)
+    portant sur le critere tel qu'il est aujourd'hui ; les verdicts sans empreinte (runs anterieurs) sont pris tels quels.
+    """
+    task_map = {t.number: t for t in tasks}
+    stats: dict[tuple[int, str], RuleAgreement] = {}
+    for r in results:
+        task = task_map.get(r.task_number)
+        if task is None or r.error:
+            continue
+        items = {item.id: item for item in task.rubric.items if item.rule is not None}
+        for verdict in r.rubric_results + r.negatif_results:
+            item = items.get(verdict.item_id)
+            if item is None or verdict.judge_tier == RULE_TIER:
+                continue
+            if verdict.item_hash and verdict.item_hash != item.content_hash:
+                continue
+            entry = stats.setdefault(
+                (task.number, item.id),
+                RuleAgreement(task.number, item.id, item.rule.kind, item.rule.policy),
+            )
+            entry.verdicts += 1
+            ruled = rule_verdict(item, r.response)
+            if ruled is None:
+                continue
+            entry.conclusive += 1
+            if ruled.satisfied == verdict.satisfied:
+                entry.agree += 1
+            elif ruled.satisfied:
+                entry.rule_only += 1
+            else:
+                entry.judge_only += 1
+
+    order = {
+        (t.number, item.id): pos
+        for t in task_map.values()
+        for pos, item in enumerate(t.rubric.items)
+    }
+    return sorted(stats.values(), key=lambda a: (a.task_number, order[a.task_number, a.item_id]))
@@ -0,0 +1,160 @@
+"""Schemas JSON des reponses attendues du juge (sorties structurees).
+
+Chaque schema reprend la forme demandee par le prompt correspondant (voir
+`prompts.py`) ; celui de l'extraction Cession d'Actions est derive de
+`CessionActions` (`workflows.cession_actions.schema`). Ils sont transmis via
+`response_format` aux modeles qui le supportent et servent de consigne a la
+reparation d'une sortie mal formee.
+"""
+
+from __future__ import annotations
+
+_CATEGORIES = [
+    "article_reference",
+    "jurisprudence",
+    "date_fact",
+    "institution",
+    "legal_rule",
+    "other_fact",
+]
+
+_VERDICT_BASE = {
+    "evidence": {"type": "array", "items": {"type": "string"}},
+    "analysis": {"type": "string"},
+    "reasoning": {"type": "string"},
+    "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+}
+
+
+def _object(properties: dict, required: list[str]) -> dict:
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": required,
+        "additionalProperties": False,
+    }
+
+
+RUBRIC_VERDICT_SCHEMA = _object(
+    {**_VERDICT_BASE, "satisfied": {"type": "boolean"}},
+    ["evidence", "satisfied", "reasoning", "confidence"],
+)
+
+NEGATIF_VERDICT_SCHEMA = _object(
+    {**_VERDICT_BASE, "triggered": {"type": "boolean"}},
+    ["evidence", "triggered", "reasoning", "confidence"],
+)
+
+_SPANS_BASE = {
+    "spans": {"type": "array", "items": {"type": "integer", "minimum": 1}},
+    "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+}
+
+RUBRIC_SPANS_VERDICT_SCHEMA = _object(
+    {**_SPANS_BASE, "satisfied": {"type": "boolean"}},
+    ["spans", "satisfied", "confidence"],
+)
+
+NEGATIF_SPANS_VERDICT_SCHEMA = _object(
+    {**_SPANS_BASE, "triggered": {"type": "boolean"}},
+    ["spans", "triggered", "confidence"],
+)
+
+_CLAIM = {
+    "claim": {"type": "string"},
+    "category": {"type": "string", "enum": _CATEGORIES},
+}
+
+CLAIMS_SCHEMA = _object(
+    {"claims": {"type": "array", "items": _object(_CLAIM, ["claim", "category"])}},
+    ["claims"],
+)
+
+_SOURCE_FLAGS = {
+    "needs_source": {"type": "boolean"},
+    "attribution_valid": {"type": "boolean"},
+}
+
+CLAIMS_WITH_SOURCES_SCHEMA = _object(
+    {
+        "claims": {
+            "type": "array",
+            "items": _object(
+                {**_CLAIM, **_SOURCE_FLAGS},
+                ["claim", "category", "needs_source", "attribution_valid"],
+            ),
+        }
+    },
+    ["claims"],
+)
+
+CLAIMS_WITH_SOURCES_HYBRID_SCHEMA = _object(
+    {
+        **CLAIMS_WITH_SOURCES_SCHEMA["properties"],
+        "citations": {
+            "type": "array",
+            "items": _object(
+                {"index": {"type": "integer", "minimum": 1}, **_SOURCE_FLAGS},
+                ["index", "needs_source", "attribution_valid"],
+            ),
+        },
+    },
+    ["claims", "citations"],
+)
+
+CLAIM_VERDICT_SCHEMA = _object(
+    {
+        "hallucinated": {"type": "boolean"},
+        "severity": {"type": "string", "enum": ["critical", "major", "minor"]},
+        "category": {"type": "string"},
+        "reasoning": {"type": "string"},
+    },
+    ["hallucinated", "severity", "reasoning"],
+)
+
+SOURCE_SCORE_SCHEMA = _object(
+    {
+        "assertions": {
+            "type": "array",
+            "items": _object(
+                {
+                    "text": {"type": "string"},
+                    "needs_source": {"type": "boolean"},
+                    "has_valid_source": {"type": "boolean"},
+                    "source_cited": {"type": ["string", "null"]},
+                },
+                ["text", "needs_source", "has_valid_source"],
+            ),
+        },
+        "total_needing_source": {"type": "integer", "minimum": 0},
+        "total_with_valid_source": {"type": "integer", "minimum": 0},
+    },
+    ["assertions", "total_needing_source", "total_with_valid_source"],
+)
+
+FIELD_MATCH_SCHEMA = _object(
+    {"match": {"type": "boolean"}, "reasoning": {"type": "string"}},
+    ["match"],
+)
+
+BATCH_FIELD_MATCH_SCHEMA = _object(
+    {
+        "verdicts": {
+            "type": "array",
+            "items": _object(
+                {
+                    "field": {"type": "string"},
+                    "match": {"type": "boolean"},
+                    "reasoning": {"type": "string"},
+                },
+                ["field", "match"],
+            ),
+        }
+    },
+    ["verdicts"],
+)
+
+TIE_BREAK_SCHEMA = _object(
+    {"choice": {"type": "integer", "minimum": 1}, "reasoning": {"type": "string"}},
+    ["choice"],
+)
@@ -5,9 +5,10 @@ from __future__ import annotations
 import json
 import logging
 
-from frenchlaw_bench.json_utils import parse_llm_json
 from frenchlaw_bench.llm.base import BaseLLMClient
+from frenchlaw_bench.llm.structured import complete_json
 from frenchlaw_bench.scoring.prompts import SOURCE_SCORE_PROMPT, SOURCE_SCORE_SYSTEM
+from frenchlaw_bench.scoring.schemas import SOURCE_SCORE_SCHEMA
 
 logger = logging.getLogger(__name__)
 
@@ -20,10 +21,15 @@ async def compute_source_score(client: BaseLLMClient, response: str) -> float |
     Retourne None si aucune assertion ne nécessite de source.
     """
     prompt = SOURCE_SCORE_PROMPT.format(response=response)
-    llm_resp = await client.complete(prompt, system=SOURCE_SCORE_SYSTEM, temperature=0.0)
-
     try:
-        data = parse_llm_json(llm_resp.content)
+        data, _ = await complete_json(
+            client,
+            prompt,
+            schema=SOURCE_SCORE_SCHEMA,
+            schema_name="source_score",
+            system=SOURCE_SCORE_SYSTEM,
+            temperature=0.0,
+        )
     except (json.JSONDecodeError, ValueError):
         logger.warning("Impossible de parser la réponse du source scorer")
         return None
@@ -34,3 +40,16 @@ async def compute_source_score(client: BaseLLMClient, response: str) -> float |
 
     valid = data.get("total_with_valid_source", 0)
     return valid / total
+
+
+def source_score_from_claims(claims: list[dict]) -> float | None:
+    """Source Score a partir des claims du mode d'extraction combine.
+
+    Meme definition que `compute_source_score` : attributions valides /
+    assertions necessitant une source, None si aucune n'en necessite.
+    """
+    needing = [c for c in claims if c.get("needs_source")]
+    if not needing:
+        return None
+    valid = sum(1 for c in needing if c.get("attribution_valid"))
+    return valid / len(needing)
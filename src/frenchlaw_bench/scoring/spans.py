@@ -0,0 +1,70 @@
+"""Decoupage d'une reponse en phrases numerotees (sortie `spans` du juge).
+
+En mode `spans`, la reponse est presentee au juge phrase par phrase, chaque
+phrase precedee de son numero (`[3] ...`). Le juge designe ses preuves par
+ces numeros au lieu de les recopier ; le texte des preuves est reconstitue
+localement. Le decoupage est deterministe et partage par tous les criteres
+d'une meme reponse.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+
+# Dans une ligne : ponctuation finale suivie d'une majuscule (meme regle que
+# l'extraction des citations)
+_SENTENCE_RE = re.compile(r"(?<=[.!?;])\s+(?=[A-ZÉÈÀÂÎÔ«\"(])")
+# Fin de fragment qui ne termine pas une phrase : abreviation juridique usuelle
+# ("art.", "Cass.", "cf.") ou numero de liste ("1.", "a)")
+_CONTINUED_RE = re.compile(
+    r"(?:\b(?:art|arts|al|cf|ex|ibid|v|n°|no|p|pp|Cass|civ|com|soc|crim|Cons|const|req|"
+    r"CE|Ass|Sect|[A-Z])\.|^\W*\w{1,3}[.)])$"
+)
+
+
+@lru_cache(maxsize=32)
+def segment(response: str) -> tuple[str, ...]:
+    """Phrases non vides de la reponse, dans l'ordre ; une phrase ne deborde pas sa ligne."""
+    spans: list[str] = []
+    for line in response.splitlines():
+        pending = ""
+        for part in _SENTENCE_RE.split(line.strip()):
+            pending = f"{pending} {part}" if pending else part
+            if not _CONTINUED_RE.search(pending):
+                spans.append(pending)
+                pending = ""
+        if pending:
+            spans.append(pending)
+    return tuple(s for s in spans if s)
+
+
+def numbered(response: str) -> str:
+    """Reponse presentee au juge : une phrase par ligne, numerotee a partir de 1."""
+    return "\n".join(f"[{i}] {span}" for i, span in enumerate(segment(response), start=1))
+
+
+def span_ids(raw: Iterable, response: str) -> list[int]:
+    """Numeros de phrases de la reponse (entiers, ou chaines "[3]" / "3"), sans doublon.
+
+    Les numeros hors de la reponse sont ignores ; l'ordre donne par le juge est conserve.
+    """
+    n_spans = len(segment(response))
+    ids = []
+    for value in raw:
+        if isinstance(value, str):
+            value = value.strip().strip("[]")
+        try:
+            span = int(value)
+        except (TypeError, ValueError):
+            continue
+        if 1 <= span <= n_spans and span not in ids:
+            ids.append(span)
+    return ids
+
+
+def evidence_from_spans(response: str, ids: Iterable[int]) -> list[str]:
+    """Texte des phrases designees (numeros issus de `span_ids`)."""
+    spans = segment(response)
+    return [spans[i - 1] for i in ids if 1 <= i <= len(spans)]
@@ -0,0 +1,395 @@
+"""Moteur de scoring vectorise (NumPy) pour rejouer une ponderation sur de nombreux runs.
+
+Les criteres de tous les resultats sont empiles une fois dans des tableaux
+(`ScoringArrays`) : un element par critere evalue, avec l'indice du resultat
+(modele, tache, echantillon) auquel il appartient, ses points, sa dimension,
+son verdict et la confiance du juge. Les negatifs declenches et les
+hallucinations (par severite) sont empiles de la meme facon.
+
+`rescore` recalcule alors, en une passe de `np.bincount`, les scores finaux
+de `compute_answer_score_with_penalties` pour n'importe quels
+`DIMENSION_WEIGHTS` / `SEVERITY_PENALTIES` / `use_confidence`, puis les
+moyennes par (run, modele) et par categorie, sous-categorie, type de tache
+et dimension.
+
+Dependance optionnelle : `numpy` (extra `[analysis]`).
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import unicodedata
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depend de l'environnement
+    raise ImportError(
+        "Le moteur de scoring vectorise requiert numpy : installer frenchlaw-bench[analysis]"
+    ) from e
+
+from frenchlaw_bench.models.enums import Dimension
+from frenchlaw_bench.models.result import TaskResult
+from frenchlaw_bench.models.task import Task
+from frenchlaw_bench.scoring.answer_scorer import DIMENSION_WEIGHTS
+from frenchlaw_bench.scoring.hallucination_detector import SEVERITY_PENALTIES
+
+logger = logging.getLogger(__name__)
+
+DIMENSIONS: tuple[str, ...] = tuple(d.value for d in Dimension)
+SEVERITIES: tuple[str, ...] = ("critical", "major", "minor")
+# Severite inconnue comptee comme mineure (comme dans detect_hallucinations)
+_DEFAULT_SEVERITY = SEVERITIES.index("minor")
+
+_L = TypeVar("_L", str, tuple[str, str])
+
+
+@dataclass
+class Weighting:
+    """Parametres de scoring a rejouer (defauts : ceux du pipeline)."""
+
+    dimension_weights: dict[str, float] = field(default_factory=lambda: dict(DIMENSION_WEIGHTS))
+    severity_penalties: dict[str, float] = field(default_factory=lambda: dict(SEVERITY_PENALTIES))
+    use_confidence: bool = True
+
+
+def parse_overrides(specs: Iterable[str], choices: Iterable[str]) -> dict[str, float]:
+    """Surcharges "cle=valeur" ; la cle est comparee sans casse ni accents aux `choices`."""
+    by_key = {_fold(c): c for c in choices}
+    overrides = {}
+    for spec in specs:
+        key, sep, value = spec.partition("=")
+        if not sep:
+            raise ValueError(f"Surcharge invalide (attendu cle=valeur) : {spec!r}")
+        name = by_key.get(_fold(key))
+        if name is None:
+            raise ValueError(f"Cle inconnue : {key!r} (attendu : {', '.join(by_key.values())})")
+        try:
+            overrides[name] = float(value)
+        except ValueError:
+            raise ValueError(f"Valeur invalide pour {name} : {value!r}") from None
+    return overrides
+
+
+def _fold(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text.strip().casefold())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+@dataclass
+class ResultKey:
+    """Identite d'un resultat empile : (run, modele, tache) et sa classification."""
+
+    run_id: str
+    model_id: str
+    task_number: int
+    category: str
+    sub_category: str
+    task_type: str
+    stored_score: float
+
+
+@dataclass
+class ScoringArrays:
+    """Criteres, negatifs et hallucinations de tous les resultats, a plat."""
+
+    keys: list[ResultKey]
+    # Criteres positifs
+    item_result: np.ndarray
+    item_points: np.ndarray
+    item_dimension: np.ndarray
+    item_satisfied: np.ndarray
+    item_confidence: np.ndarray
+    # Negatifs declenches (points en valeur absolue)
+    negatif_result: np.ndarray
+    negatif_points: np.ndarray
+    # Claims hallucines
+    hallucination_result: np.ndarray
+    hallucination_severity: np.ndarray
+    # Par resultat : groupe (run, modele), score stocke, codes des classifications
+    result_group: np.ndarray
+    group_keys: list[tuple[str, str]]
+    stored_scores: np.ndarray
+    labels: dict[str, tuple[np.ndarray, list[str]]]
+
+    @property
+    def n_results(self) -> int:
+        return len(self.keys)
+
+
+@dataclass
+class GroupScores:
+    """Scores rejoues d'un modele dans un run."""
+
+    run_id: str
+    model_id: str
+    n_results: int
+    stored_score_mean: float
+    answer_score_mean: float
+    by_category: dict[str, float] = field(default_factory=dict)
+    by_sub_category: dict[str, float] = field(default_factory=dict)
+    by_task_type: dict[str, float] = field(default_factory=dict)
+    by_dimension: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def delta(self) -> float:
+        return self.answer_score_mean - self.stored_score_mean
+
+
+@dataclass
+class RescoredRuns:
+    """Resultat de `rescore` : scores par resultat et agregats par (run, modele)."""
+
+    answer_scores: np.ndarray
+    dimension_scores: np.ndarray  # (n_results, n_dimensions), NaN si dimension absente
+    groups: list[GroupScores]
+
+
+class _Packer:
+    """Accumule les lignes avant conversion en tableaux.
+
+    Chaque resultat recoit tous les criteres positifs de sa rubric (non
+    satisfaits par defaut), comme dans `compute_answer_score_with_penalties`
+    ou un critere sans verdict compte au denominateur.
+    """
+
+    def __init__(self, tasks: Mapping[int, Task]) -> None:
+        self.tasks = tasks
+        self.keys: list[ResultKey] = []
+        self.items: list[list[float]] = []
+        self.negatifs: list[tuple[int, float]] = []
+        self.hallucinations: list[tuple[int, int]] = []
+        self._slots: dict[tuple[int, str], int] = {}
+        self._negatif_points = {
+            number: {i.id: abs(i.points) for i in task.rubric.items if i.points < 0}
+            for number, task in tasks.items()
+        }
+        self.n_unknown_items = 0
+
+    def add_result(
+        self, run_id: str, model_id: str, task_number: int, stored_score: float
+    ) -> int | None:
+        task = self.tasks.get(task_number)
+        if task is None:
+            return None
+        row = len(self.keys)
+        self.keys.append(
+            ResultKey(
+                run_id,
+                model_id,
+                task_number,
+                task.category.value,
+                task.sub_category.value,
+                task.task_type.value,
+                stored_score,
+            )
+        )
+        for item in task.rubric.items:
+            if item.points > 0:
+                self._slots[row, item.id] = len(self.items)
+                self.items.append(
+                    [row, item.points, DIMENSIONS.index(item.dimension.value), 0.0, 1.0]
+                )
+        return row
+
+    def add_item(
+        self, row: int, item_id: str, satisfied: bool, confidence: float, *, negatif: bool
+    ) -> None:
+        if negatif:
+            points = self._negatif_points[self.keys[row].task_number].get(item_id)
+            if points is None:
+                self.n_unknown_items += 1
+            elif satisfied:
+                self.negatifs.append((row, points))
+            return
+        slot = self._slots.get((row, item_id))
+        if slot is None:
+            self.n_unknown_items += 1
+            return
+        self.items[slot][3:] = [float(satisfied), confidence]
+
+    def add_hallucination(self, row: int, severity: str | None) -> None:
+        code = SEVERITIES.index(severity) if severity in SEVERITIES else _DEFAULT_SEVERITY
+        self.hallucinations.append((row, code))
+
+    def arrays(self) -> ScoringArrays:
+        if self.n_unknown_items:
+            logger.warning(
+                "%d critere(s) absent(s) des rubrics actuelles, ignore(s)", self.n_unknown_items
+            )
+        items = np.array(self.items, dtype=float).reshape(-1, 5)
+        negatifs = np.array(self.negatifs, dtype=float).reshape(-1, 2)
+        halluc = np.array(self.hallucinations, dtype=np.int64).reshape(-1, 2)
+        group, group_names = _codes([(k.run_id, k.model_id) for k in self.keys])
+        return ScoringArrays(
+            keys=self.keys,
+            item_result=items[:, 0].astype(np.int64),
+            item_points=items[:, 1],
+            item_dimension=items[:, 2].astype(np.int64),
+            item_satisfied=items[:, 3].astype(bool),
+            item_confidence=items[:, 4],
+            negatif_result=negatifs[:, 0].astype(np.int64),
+            negatif_points=negatifs[:, 1],
+            hallucination_result=halluc[:, 0],
+            hallucination_severity=halluc[:, 1],
+            result_group=group,
+            group_keys=group_names,
+            stored_scores=np.array([k.stored_score for k in self.keys], dtype=float),
+            labels={
+                attr: _codes([getattr(k, attr) for k in self.keys])
+                for attr in ("category", "sub_category", "task_type")
+            },
+        )
+
+
+def pack_results(results: Iterable[tuple[str, TaskResult]], tasks: Iterable[Task]) -> ScoringArrays:
+    """Empile des couples (run_id, TaskResult) ; les resultats en erreur sont ignores."""
+    packer = _Packer({t.number: t for t in tasks})
+    for run_id, r in results:
+        if r.error:
+            continue
+        row = packer.add_result(run_id, r.model_id, r.task_number, r.answer_score)
+        if row is None:
+            continue
+        for item in r.rubric_results:
+            packer.add_item(row, item.item_id, item.satisfied, item.confidence, negatif=False)
+        for item in r.negatif_results:
+            packer.add_item(row, item.item_id, item.satisfied, item.confidence, negatif=True)
+        for h in r.hallucination_details:
+            if h.hallucinated:
+                packer.add_hallucination(row, h.severity)
+    return packer.arrays()
+
+
+def pack_store_rows(
+    results: Iterable[tuple[int, str, str, int, float]],
+    rubric: Iterable[tuple[int, str, bool, bool, float]],
+    hallucinations: Iterable[tuple[int, str | None]],
+    tasks: Iterable[Task],
+) -> ScoringArrays:
+    """Empile les lignes de `RunStore.scoring_rows` (identifiants SQLite des resultats)."""
+    packer = _Packer({t.number: t for t in tasks})
+    rows: dict[int, int] = {}
+    for result_id, run_id, model_id, task_number, score in results:
+        row = packer.add_result(run_id, model_id, task_number, score)
+        if row is not None:
+            rows[result_id] = row
+    for result_id, item_id, negatif, satisfied, confidence in rubric:
+        if (row := rows.get(result_id)) is not None:
+            packer.add_item(row, item_id, bool(satisfied), confidence, negatif=bool(negatif))
+    for result_id, severity in hallucinations:
+        if (row := rows.get(result_id)) is not None:
+            packer.add_hallucination(row, severity)
+    return packer.arrays()
+
+
+def _group_means(groups: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+    """Moyenne de `values` par groupe (NaN ignores, NaN si groupe vide)."""
+    valid = ~np.isnan(values)
+    counts = np.bincount(groups[valid], minlength=n_groups)
+    sums = np.bincount(groups[valid], weights=values[valid], minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+
+
+def _codes(labels: list[_L]) -> tuple[np.ndarray, list[_L]]:
+    """Codes entiers des libelles (ordre trie) et table des libelles."""
+    names = sorted(set(labels))
+    index = {name: i for i, name in enumerate(names)}
+    return np.array([index[label] for label in labels], dtype=np.int64), names
+
+
+def _breakdown(
+    group: np.ndarray, n_groups: int, labels: tuple[np.ndarray, list[str]], scores: np.ndarray
+) -> list[dict[str, float]]:
+    """Moyenne par (groupe, libelle) : une entree par groupe."""
+    codes, names = labels
+    means = _group_means(group * len(names) + codes, scores, n_groups * len(names))
+    return [_labelled(names, row) for row in means.reshape(n_groups, len(names)).tolist()]
+
+
+def _labelled(names: Iterable[str], values: list[float]) -> dict[str, float]:
+    """{libelle: valeur} sans les NaN (groupes vides)."""
+    return {name: v for name, v in zip(names, values, strict=True) if not math.isnan(v)}
+
+
+def rescore(arrays: ScoringArrays, weighting: Weighting | None = None) -> RescoredRuns:
+    """Rejoue le scoring de tous les resultats empiles pour une ponderation donnee.
+
+    Meme formule que `compute_answer_score_with_penalties` (penalite
+    d'hallucination plafonnee au total des points positifs) et que
+    `compute_dimension_scores`.
+    """
+    w = weighting or Weighting()
+    n = arrays.n_results
+    n_dims = len(DIMENSIONS)
+
+    dim_weights = np.array([w.dimension_weights.get(d, 1.0) for d in DIMENSIONS])
+    severity = np.array([w.severity_penalties.get(s, 0.0) for s in SEVERITIES])
+
+    points = arrays.item_points
+    weighted = points * dim_weights[arrays.item_dimension]
+    confidence = arrays.item_confidence if w.use_confidence else 1.0
+    earned = np.where(arrays.item_satisfied, weighted * confidence, 0.0)
+
+    total_weighted = np.bincount(arrays.item_result, weights=weighted, minlength=n)
+    earned_weighted = np.bincount(arrays.item_result, weights=earned, minlength=n)
+    total_positive = np.bincount(arrays.item_result, weights=points, minlength=n)
+    halluc_penalty = np.minimum(
+        np.bincount(
+            arrays.hallucination_result,
+            weights=severity[arrays.hallucination_severity],
+            minlength=n,
+        ),
+        total_positive,
+    )
+    negatif_penalty = np.bincount(arrays.negatif_result, weights=arrays.negatif_points, minlength=n)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        raw = (earned_weighted - halluc_penalty - negatif_penalty) / total_weighted
+    scores = np.where(total_weighted > 0, np.clip(raw, 0.0, 1.0), 0.0)
+
+    # Scores par dimension (points bruts, sans poids ni confiance)
+    cell = arrays.item_result * n_dims + arrays.item_dimension
+    dim_total = np.bincount(cell, weights=points, minlength=n * n_dims).reshape(n, n_dims)
+    dim_earned = np.bincount(
+        cell, weights=np.where(arrays.item_satisfied, points, 0.0), minlength=n * n_dims
+    ).reshape(n, n_dims)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dim_scores = np.where(dim_total > 0, dim_earned / dim_total, np.nan)
+
+    # Agregats par (run, modele)
+    group = arrays.result_group
+    n_groups = len(arrays.group_keys)
+    counts = np.bincount(group, minlength=n_groups)
+    stored_means = _group_means(group, arrays.stored_scores, n_groups)
+    score_means = _group_means(group, scores, n_groups)
+    breakdowns = {
+        attr: _breakdown(group, n_groups, labels, scores) for attr, labels in arrays.labels.items()
+    }
+    dim_means = (
+        np.stack([_group_means(group, dim_scores[:, j], n_groups) for j in range(n_dims)], axis=1)
+        if n
+        else np.empty((0, n_dims))
+    ).tolist()
+    stored_means, score_means, counts = stored_means.tolist(), score_means.tolist(), counts.tolist()
+
+    groups = []
+    for g, (run_id, model_id) in enumerate(arrays.group_keys):
+        groups.append(
+            GroupScores(
+                run_id=run_id,
+                model_id=model_id,
+                n_results=counts[g],
+                stored_score_mean=stored_means[g],
+                answer_score_mean=score_means[g],
+                by_category=breakdowns["category"][g],
+                by_sub_category=breakdowns["sub_category"][g],
+                by_task_type=breakdowns["task_type"][g],
+                by_dimension=_labelled(DIMENSIONS, dim_means[g]),
+            )
+        )
+    return RescoredRuns(answer_scores=scores, dimension_scores=dim_scores, groups=groups)
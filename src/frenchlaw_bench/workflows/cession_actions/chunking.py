@@ -0,0 +1,239 @@
+"""Extraction par morceaux des actes trop longs pour la fenêtre du modèle.
+
+Le document est découpé par section (ARTICLE, TITRE, CHAPITRE...) puis par
+paragraphe, les morceaux sont extraits en parallèle, et les extractions
+partielles sont fusionnées champ par champ : vote majoritaire sur les
+valeurs normalisées, union des listes. Le LLM n'est sollicité qu'en cas
+d'égalité entre valeurs concurrentes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+from dataclasses import dataclass
+from itertools import pairwise
+
+from pydantic import ValidationError
+
+from frenchlaw_bench.llm.base import BaseLLMClient, estimate_tokens
+from frenchlaw_bench.llm.structured import complete_json
+from frenchlaw_bench.models.workflow import CessionActions
+from frenchlaw_bench.scoring.schemas import TIE_BREAK_SCHEMA
+from frenchlaw_bench.workflows.cession_actions.normalizers import canonical, fold
+from frenchlaw_bench.workflows.cession_actions.schema import (
+    CESSION_ACTIONS_SCHEMA,
+    CHUNK_EXTRACTION_PROMPT,
+    TIE_BREAK_PROMPT,
+    get_schema_json,
+)
+from frenchlaw_bench.workflows.cession_actions.scorer import _flatten
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_TOKENS = 12_000
+
+_SECTION_RE = re.compile(
+    r"^[ \t]*(?:(?i:article|titre|chapitre|section|annexe)\s+(?:\d+|[IVXLC]+|premier)\b"
+    r"|\d+(?:\.\d+)*\.?\s+[A-ZÉÈÀ][A-ZÉÈÀ' ]{2,})",
+    re.MULTILINE,
+)
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+
+
+@dataclass
+class ChunkedExtraction:
+    """Extraction d'un document, en un ou plusieurs morceaux."""
+
+    actions: CessionActions
+    input_tokens: int = 0
+    output_tokens: int = 0
+    chunks: int = 1
+    failed_chunks: int = 0
+    tie_breaks: int = 0
+
+
+def split_sections(text: str) -> list[str]:
+    """Découpe un acte sur ses titres de section (préambule inclus)."""
+    starts = [m.start() for m in _SECTION_RE.finditer(text)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    bounds = [*starts, len(text)]
+    sections = [text[a:b].strip() for a, b in pairwise(bounds)]
+    return [s for s in sections if s]
+
+
+def _split_oversized(section: str, max_tokens: int) -> list[str]:
+    max_chars = max_tokens * 4
+    pieces: list[str] = []
+    for para in _PARAGRAPH_SPLIT_RE.split(section):
+        while len(para) > max_chars:
+            cut = para.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            pieces.append(para[:cut])
+            para = para[cut:]
+        if para.strip():
+            pieces.append(para)
+    return pieces
+
+
+def chunk_document(text: str, max_tokens: int = DEFAULT_CHUNK_TOKENS) -> list[str]:
+    """Regroupe les sections en morceaux d'au plus `max_tokens` (estimés)."""
+    chunks: list[str] = []
+    buffer = ""
+    for section in split_sections(text):
+        parts = (
+            [section]
+            if estimate_tokens(section) <= max_tokens
+            else _split_oversized(section, max_tokens)
+        )
+        for part in parts:
+            if buffer and estimate_tokens(buffer) + estimate_tokens(part) > max_tokens:
+                chunks.append(buffer)
+                buffer = ""
+            buffer = f"{buffer}\n\n{part}" if buffer else part
+    if buffer:
+        chunks.append(buffer)
+    return chunks
+
+
+def _is_empty(value: object) -> bool:
+    return value is None or value == "" or value == []
+
+
+def _unflatten(flat: dict[str, object]) -> dict:
+    nested: dict = {}
+    for key, value in flat.items():
+        node = nested
+        *parents, leaf = key.split(".")
+        for p in parents:
+            node = node.setdefault(p, {})
+        node[leaf] = value
+    return nested
+
+
+def merge_partials(
+    partials: list[dict],
+) -> tuple[dict[str, object], dict[str, list[object]]]:
+    """Fusionne des extractions partielles (dicts aplatis, champs renseignés seulement).
+
+    Retourne (valeurs retenues, égalités) : pour chaque champ scalaire, la
+    valeur dont la forme canonique réunit le plus de morceaux l'emporte (à
+    égalité de voix, le champ est renvoyé avec ses candidats, dans l'ordre du
+    document) ; les listes sont unies sans doublon.
+    """
+    merged: dict[str, object] = {}
+    ties: dict[str, list[object]] = {}
+    votes: dict[str, dict[object, list]] = {}
+
+    for partial in partials:
+        for key, value in partial.items():
+            if _is_empty(value):
+                continue
+            if isinstance(value, list):
+                current = merged.setdefault(key, [])
+                seen = {fold(str(v)) for v in current}
+                current.extend(v for v in value if fold(str(v)) not in seen)
+                continue
+            bucket = votes.setdefault(key, {})
+            entry = bucket.setdefault(canonical(key.split(".")[-1], value), [0, value])
+            entry[0] += 1
+
+    for key, bucket in votes.items():
+        ranked = sorted(bucket.values(), key=lambda e: e[0], reverse=True)
+        best = ranked[0][0]
+        leaders = [value for count, value in ranked if count == best]
+        merged[key] = leaders[0]
+        if len(leaders) > 1:
+            ties[key] = leaders
+    return merged, ties
+
+
+async def _break_tie(
+    client: BaseLLMClient, key: str, candidates: list[object]
+) -> tuple[object, int, int]:
+    listing = "\n".join(
+        f"{i}. {json.dumps(c, ensure_ascii=False)}" for i, c in enumerate(candidates, 1)
+    )
+    try:
+        data, resp = await complete_json(
+            client,
+            TIE_BREAK_PROMPT.format(field=key, candidates=listing),
+            schema=TIE_BREAK_SCHEMA,
+            schema_name="tie_break",
+        )
+        choice = int(data.get("choice", 1))
+    except (json.JSONDecodeError, ValueError, TypeError, AttributeError):
+        logger.warning("Départage illisible pour %s, premier candidat retenu", key)
+        return candidates[0], 0, 0
+    if not 1 <= choice <= len(candidates):
+        choice = 1
+    return candidates[choice - 1], resp.input_tokens, resp.output_tokens
+
+
+async def _extract_chunk(
+    client: BaseLLMClient,
+    chunk: str,
+    index: int,
+    total: int,
+    semaphore: asyncio.Semaphore,
+) -> tuple[dict | None, int, int]:
+    prompt = CHUNK_EXTRACTION_PROMPT.format(
+        index=index, total=total, schema=get_schema_json(), document=chunk
+    )
+    try:
+        async with semaphore:
+            data, resp = await complete_json(
+                client,
+                prompt,
+                schema=CESSION_ACTIONS_SCHEMA,
+                schema_name="cession_actions",
+                max_tokens=4096,
+            )
+        partial = CessionActions.model_validate(data)
+    except (ValidationError, json.JSONDecodeError, ValueError) as e:
+        logger.warning("Morceau %d/%d inexploitable : %s", index, total, e)
+        return None, 0, 0
+    # Seuls les champs effectivement renseignés votent (pas les valeurs par défaut)
+    return _flatten(partial.model_dump(exclude_unset=True)), resp.input_tokens, resp.output_tokens
+
+
+async def extract_chunked(
+    client: BaseLLMClient,
+    document_text: str,
+    chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+    semaphore: asyncio.Semaphore | None = None,
+) -> ChunkedExtraction:
+    """Extrait un document morceau par morceau (en parallèle) puis fusionne."""
+    chunks = chunk_document(document_text, chunk_tokens)
+    sem = semaphore or asyncio.Semaphore(len(chunks))
+    outcomes = await asyncio.gather(
+        *(_extract_chunk(client, chunk, i, len(chunks), sem) for i, chunk in enumerate(chunks, 1))
+    )
+
+    partials = [p for p, _, _ in outcomes if p is not None]
+    if not partials:
+        raise ValueError(f"Aucun des {len(chunks)} morceaux n'a produit d'extraction valide")
+    result = ChunkedExtraction(
+        actions=CessionActions(),
+        input_tokens=sum(i for _, i, _ in outcomes),
+        output_tokens=sum(o for _, _, o in outcomes),
+        chunks=len(chunks),
+        failed_chunks=len(chunks) - len(partials),
+    )
+
+    merged, ties = merge_partials(partials)
+    if ties:
+        picks = await asyncio.gather(
+            *(_break_tie(client, key, candidates) for key, candidates in ties.items())
+        )
+        for key, (value, in_tok, out_tok) in zip(ties, picks, strict=True):
+            merged[key] = value
+            result.input_tokens += in_tok
+            result.output_tokens += out_tok
+        result.tie_breaks = len(ties)
+
+    result.actions = CessionActions.model_validate(_unflatten(merged))
+    return result
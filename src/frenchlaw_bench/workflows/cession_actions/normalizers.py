@@ -0,0 +1,280 @@
+"""Normalisation des valeurs de cession d'actions avant le recours au juge LLM.
+
+Chaque normaliseur ramène une valeur à une forme canonique (date ISO, forme
+juridique abrégée, SIREN, durée en mois/jours, juridiction abrégée...) ou
+retourne None s'il ne la reconnaît pas. Deux valeurs dont les formes
+canoniques coïncident sont équivalentes sans appel au juge.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from collections.abc import Callable
+
+_MONTHS = {
+    "janvier": 1,
+    "fevrier": 2,
+    "mars": 3,
+    "avril": 4,
+    "mai": 5,
+    "juin": 6,
+    "juillet": 7,
+    "aout": 8,
+    "septembre": 9,
+    "octobre": 10,
+    "novembre": 11,
+    "decembre": 12,
+}
+
+_NUMBER_WORDS = {
+    "un": 1,
+    "une": 1,
+    "deux": 2,
+    "trois": 3,
+    "quatre": 4,
+    "cinq": 5,
+    "six": 6,
+    "sept": 7,
+    "huit": 8,
+    "neuf": 9,
+    "dix": 10,
+    "onze": 11,
+    "douze": 12,
+    "quinze": 15,
+    "dix-huit": 18,
+    "vingt": 20,
+    "vingt-quatre": 24,
+    "trente": 30,
+    "trente-six": 36,
+    "quarante-huit": 48,
+    "soixante": 60,
+}
+
+_LEGAL_FORMS = {
+    "societe par actions simplifiee unipersonnelle": "SASU",
+    "societe par actions simplifiee": "SAS",
+    "societe anonyme": "SA",
+    "societe a responsabilite limitee": "SARL",
+    "entreprise unipersonnelle a responsabilite limitee": "EURL",
+    "societe en nom collectif": "SNC",
+    "societe civile immobiliere": "SCI",
+    "societe en commandite par actions": "SCA",
+    "societe en commandite simple": "SCS",
+    "societe europeenne": "SE",
+    "groupement d'interet economique": "GIE",
+    "societe d'exercice liberal a responsabilite limitee": "SELARL",
+}
+_LEGAL_ABBREVIATIONS = frozenset(_LEGAL_FORMS.values())
+
+_COURTS = {
+    "tribunal de commerce": "TC",
+    "tribunal des activites economiques": "TAE",
+    "tribunal judiciaire": "TJ",
+    "tribunal de grande instance": "TGI",
+    "cour d'appel": "CA",
+    "cour de cassation": "CCASS",
+}
+_COURT_ABBREVIATIONS = frozenset(_COURTS.values())
+
+_DATE_ISO_RE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})$")
+_DATE_NUM_RE = re.compile(r"^(\d{1,2})[/.-](\d{1,2})[/.-](\d{4})$")
+_DATE_TEXT_RE = re.compile(r"^(\d{1,2})(?:er)? ([a-z]+) (\d{4})$")
+_SIREN_RE = re.compile(r"(?<!\d)(\d{3}) ?(\d{3}) ?(\d{3})(?!\d)")
+_DURATION_RE = re.compile(
+    r"(\d+(?:[.,]\d+)?|[a-z]+(?:-[a-z]+)?) (ans?|annees?|mois|semaines?|jours?)\b"
+)
+# Seuls mots admis autour des durees : tout autre reste ("a compter de la
+# cession", "apres le preavis") qualifie la duree et la laisse au juge
+_DURATION_FILLERS = frozenset({"et", "pour", "pendant", "une", "d", "de", "duree", "periode"})
+_AMOUNT_RE = re.compile(
+    r"^(?:eur )?(\d[\d .]*(?:,\d+)?) ?(m|k|millions?|milliers?)? ?(?:€|eur|euros?)?$"
+)
+_PERCENT_RE = re.compile(r"^(\d+(?:[.,]\d+)?) ?(?:%|pour ?cent)$")
+
+
+def fold(text: str) -> str:
+    """Minuscules sans accents, espaces et ponctuation finale normalisés."""
+    decomposed = unicodedata.normalize("NFKD", text.lower().replace("’", "'"))
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.split()).strip(" .;,")
+
+
+def normalize_date(value: str) -> str | None:
+    """Date ISO AAAA-MM-JJ."""
+    text = fold(value)
+    if m := _DATE_ISO_RE.match(text):
+        year, month, day = int(m[1]), int(m[2]), int(m[3])
+    elif m := _DATE_NUM_RE.match(text):
+        day, month, year = int(m[1]), int(m[2]), int(m[3])
+    elif (m := _DATE_TEXT_RE.match(text)) and m[2] in _MONTHS:
+        day, month, year = int(m[1]), _MONTHS[m[2]], int(m[3])
+    else:
+        return None
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        return None
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def _parse_number(text: str) -> float | None:
+    if text in _NUMBER_WORDS:
+        return float(_NUMBER_WORDS[text])
+    try:
+        return float(text.replace(" ", "").replace(",", "."))
+    except ValueError:
+        return None
+
+
+def normalize_amount(value: str) -> float | None:
+    """Montant en euros : "1 500 000 €", "1,5 M€", "EUR 1.500.000"."""
+    m = _AMOUNT_RE.match(fold(value))
+    if not m:
+        return None
+    digits = m[1].strip()
+    # "1.500.000" : points separateurs de milliers
+    if digits.count(".") > 1 or re.fullmatch(r"\d{1,3}(\.\d{3})+", digits):
+        digits = digits.replace(".", "")
+    amount = _parse_number(digits)
+    if amount is None:
+        return None
+    unit = m[2] or ""
+    if unit.startswith("m"):
+        amount *= 1_000_000 if unit in ("m", "million", "millions") else 1_000
+    elif unit == "k":
+        amount *= 1_000
+    return amount
+
+
+def normalize_percentage(value: str) -> float | None:
+    """Pourcentage : "25 %", "25,5%", "25 pour cent"."""
+    m = _PERCENT_RE.match(fold(value))
+    return _parse_number(m[1]) if m else None
+
+
+def normalize_legal_form(value: str) -> str | None:
+    """Forme juridique abrégée : "société par actions simplifiée" -> "SAS"."""
+    text = fold(value)
+    upper = text.replace(".", "").upper()
+    if upper in _LEGAL_ABBREVIATIONS:
+        return upper
+    for full, abbr in _LEGAL_FORMS.items():
+        if text.startswith(full):
+            return abbr
+    return None
+
+
+def normalize_rcs(value: str) -> str | None:
+    """Immatriculation : "RCS Paris 123 456 789" -> "paris:123456789"."""
+    text = fold(value)
+    m = _SIREN_RE.search(text)
+    if not m:
+        return None
+    rest = (text[: m.start()] + " " + text[m.end() :]).replace("r.c.s", "rcs")
+    city = " ".join(w for w in rest.split() if w not in ("rcs", "de", "b", "siren", "n°", "no"))
+    return f"{city}:{m[1]}{m[2]}{m[3]}"
+
+
+def normalize_duration(value: str) -> tuple[float, float] | None:
+    """Durée en (mois, jours) : "12 mois" et "1 an" -> (12, 0).
+
+    None si la durée est qualifiée ("2 ans à compter de la cession").
+    """
+    text = fold(value)
+    matches = list(_DURATION_RE.finditer(text))
+    # Fourchettes, fractions ("1 an et demi"), point de depart ou terme : laisses au juge
+    residue = re.findall(r"\w+", _DURATION_RE.sub(" ", text))
+    if not matches or any(word not in _DURATION_FILLERS for word in residue):
+        return None
+    months = days = 0.0
+    for m in matches:
+        n = _parse_number(m[1])
+        if n is None:
+            return None
+        unit = m[2]
+        if unit.startswith(("an", "annee")):
+            months += 12 * n
+        elif unit == "mois":
+            months += n
+        elif unit.startswith("semaine"):
+            days += 7 * n
+        else:
+            days += n
+    return months, days
+
+
+def normalize_court(value: str) -> str | None:
+    """Juridiction abrégée : "Tribunal de commerce de Paris" -> "TC paris"."""
+    text = fold(value)
+    for full, abbr in _COURTS.items():
+        if text.startswith(full):
+            city = text[len(full) :].strip()
+            break
+    else:
+        head, _, city = text.partition(" ")
+        abbr = head.replace(".", "").upper()
+        if abbr not in _COURT_ABBREVIATIONS:
+            return None
+    city = re.sub(r"^(de |d'|du )", "", city).strip()
+    return f"{abbr} {city}".strip()
+
+
+_FIELD_NORMALIZERS: dict[str, Callable[[str], object]] = {
+    "date_signature": normalize_date,
+    "forme_juridique": normalize_legal_form,
+    "rcs": normalize_rcs,
+    "duree": normalize_duration,
+    "juridiction_competente": normalize_court,
+}
+
+# Repli pour les champs textuels libres (contrepartie, frais...)
+_GENERIC_NORMALIZERS: tuple[Callable[[str], object], ...] = (
+    normalize_amount,
+    normalize_percentage,
+    normalize_date,
+    normalize_duration,
+)
+
+
+def _same(normalizer: Callable[[str], object], a: str, b: str) -> bool:
+    na = normalizer(a)
+    return na is not None and na == normalizer(b)
+
+
+def normalized_equal(field_name: str, expected: object, extracted: object) -> bool:
+    """Vrai si les deux valeurs sont équivalentes après normalisation."""
+    if isinstance(expected, bool) or isinstance(extracted, bool):
+        return False
+    if isinstance(expected, int | float) and isinstance(extracted, int | float):
+        if abs(expected - extracted) <= 1e-9 * max(1.0, abs(expected)):
+            return True
+        # Pourcentage extrait en fraction (0.25 pour 25 %)
+        return field_name == "pourcentage" and abs(expected - 100 * extracted) < 1e-6
+    if isinstance(expected, list) and isinstance(extracted, list):
+        return sorted(fold(str(v)) for v in expected) == sorted(fold(str(v)) for v in extracted)
+    if not isinstance(expected, str) or not isinstance(extracted, str):
+        return False
+
+    if fold(expected) == fold(extracted):
+        return True
+    normalizer = _FIELD_NORMALIZERS.get(field_name)
+    if normalizer is not None:
+        return _same(normalizer, expected, extracted)
+    return any(_same(n, expected, extracted) for n in _GENERIC_NORMALIZERS)
+
+
+def canonical(field_name: str, value: object) -> object:
+    """Forme canonique d'une valeur, utilisée comme clé de vote."""
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, int | float):
+        return round(float(value), 6)
+    if isinstance(value, list):
+        return tuple(sorted(fold(str(v)) for v in value))
+    text = str(value)
+    normalizer = _FIELD_NORMALIZERS.get(field_name)
+    normalizers = (normalizer,) if normalizer is not None else _GENERIC_NORMALIZERS
+    for n in normalizers:
+        normalized = n(text)
+        if normalized is not None:
+            return normalized
+    return fold(text)
@@ -0,0 +1,334 @@
+"""Exécution du workflow Cession d'Actions sur un portefeuille de documents.
+
+Les documents circulent dans deux pools bornés reliés par des files :
+extraction (modèle sujet) puis scoring (juge). Chaque document terminé est
+ajouté au checkpoint JSONL, ce qui permet de reprendre un run interrompu.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from frenchlaw_bench.config import DATA_DIR
+from frenchlaw_bench.documents.extractor import extract_pdf_text
+from frenchlaw_bench.llm.base import BaseLLMClient, estimate_tokens
+from frenchlaw_bench.llm.structured import complete_json, parse_stats_dict, reset_parse_stats
+from frenchlaw_bench.models.workflow import CessionActions
+from frenchlaw_bench.scoring.aggregator import _bootstrap_ci, _mean
+from frenchlaw_bench.workflows.cession_actions.chunking import ChunkedExtraction, extract_chunked
+from frenchlaw_bench.workflows.cession_actions.schema import (
+    CESSION_ACTIONS_SCHEMA,
+    EXTRACTION_PROMPT,
+    get_schema_json,
+)
+from frenchlaw_bench.workflows.cession_actions.scorer import (
+    TEXT_JUDGE_CONCURRENCY,
+    WorkflowScore,
+    judge_calls_avoided,
+    score_extraction,
+)
+
+logger = logging.getLogger(__name__)
+
+DOCUMENTS_DIR = DATA_DIR / "workflows" / "cession_actions" / "documents"
+EXTRACTION_CONCURRENCY = 4
+SCORING_CONCURRENCY = 4
+CHUNK_CONCURRENCY = 8
+
+# Signal de fin pour les workers
+_DONE = None
+
+
+@dataclass
+class DocumentResult:
+    """Résultat d'un document (une ligne du checkpoint)."""
+
+    document: str
+    model_id: str
+    extracted: dict | None = None
+    accuracy: float = 0.0
+    total_fields: int = 0
+    exact_matches: int = 0
+    normalized_matches: int = 0
+    llm_matches: int = 0
+    judge_calls: int = 0
+    details: list[dict] = field(default_factory=list)
+    extraction_latency_seconds: float = 0.0
+    scoring_latency_seconds: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    chunks: int = 1
+    tie_breaks: int = 0
+    error: str | None = None
+
+
+@dataclass
+class FieldAccuracy:
+    field: str
+    n: int
+    accuracy: float
+    ci_lower: float
+    ci_upper: float
+
+
+@dataclass
+class WorkflowRunSummary:
+    model_id: str
+    n_documents: int
+    n_scored: int
+    n_errors: int
+    n_resumed: int
+    accuracy: float
+    accuracy_ci: tuple[float, float]
+    fields: list[FieldAccuracy]
+    judge_calls: int
+    chunks: int
+    tie_breaks: int
+    calls_avoided: dict[str, float]
+    duration_seconds: float
+    docs_per_minute: float
+    checkpoint_path: Path
+    parse_stats: dict[str, dict] = field(default_factory=dict)
+
+
+def read_checkpoint(path: Path) -> dict[str, DocumentResult]:
+    """Documents déjà traités sans erreur, par nom."""
+    done: dict[str, DocumentResult] = {}
+    if not path.exists():
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                result = DocumentResult(**json.loads(line))
+            except (json.JSONDecodeError, TypeError):
+                logger.warning("Ligne de checkpoint illisible ignorée : %s", path)
+                continue
+            if result.error is None:
+                done[result.document] = result
+    return done
+
+
+def load_document_text(documents_dir: Path, name: str) -> str:
+    path = documents_dir / name
+    if path.suffix.lower() == ".pdf":
+        return extract_pdf_text(path)
+    return path.read_text(encoding="utf-8")
+
+
+async def extract_document(
+    client: BaseLLMClient,
+    document_text: str,
+    chunk_tokens: int | None = None,
+    chunk_semaphore: asyncio.Semaphore | None = None,
+) -> ChunkedExtraction:
+    """Extrait et valide les deal points d'un document.
+
+    Au-dela de `chunk_tokens` (estimes), le document est extrait par morceaux
+    en parallele puis fusionne (voir `chunking`).
+    """
+    if chunk_tokens and estimate_tokens(document_text) > chunk_tokens:
+        return await extract_chunked(client, document_text, chunk_tokens, chunk_semaphore)
+    prompt = EXTRACTION_PROMPT.format(schema=get_schema_json(), document=document_text)
+    data, resp = await complete_json(
+        client,
+        prompt,
+        schema=CESSION_ACTIONS_SCHEMA,
+        schema_name="cession_actions",
+        max_tokens=4096,
+    )
+    return ChunkedExtraction(
+        actions=CessionActions.model_validate(data),
+        input_tokens=resp.input_tokens,
+        output_tokens=resp.output_tokens,
+    )
+
+
+def summarize(
+    model_id: str,
+    results: list[DocumentResult],
+    n_resumed: int,
+    duration_seconds: float,
+    checkpoint_path: Path,
+) -> WorkflowRunSummary:
+    """Précision globale et par champ (IC bootstrap), débit."""
+    scored = [r for r in results if r.error is None]
+    per_field: dict[str, list[float]] = {}
+    for r in scored:
+        for d in r.details:
+            per_field.setdefault(d["field"], []).append(0.0 if d["match"] == "miss" else 1.0)
+
+    fields = []
+    for name, vals in per_field.items():
+        low, high = _bootstrap_ci(vals)
+        fields.append(FieldAccuracy(name, len(vals), _mean(vals), low, high))
+
+    accuracies = [r.accuracy for r in scored]
+    processed = len(results) - n_resumed
+    minutes = duration_seconds / 60
+    return WorkflowRunSummary(
+        model_id=model_id,
+        n_documents=len(results),
+        n_scored=len(scored),
+        n_errors=len(results) - len(scored),
+        n_resumed=n_resumed,
+        accuracy=_mean(accuracies),
+        accuracy_ci=_bootstrap_ci(accuracies),
+        fields=fields,
+        judge_calls=sum(r.judge_calls for r in scored),
+        chunks=sum(r.chunks for r in scored),
+        tie_breaks=sum(r.tie_breaks for r in scored),
+        calls_avoided=judge_calls_avoided(
+            [
+                WorkflowScore(
+                    total_fields=r.total_fields,
+                    exact_matches=r.exact_matches,
+                    llm_matches=r.llm_matches,
+                    accuracy=r.accuracy,
+                    details=r.details,
+                    normalized_matches=r.normalized_matches,
+                )
+                for r in scored
+            ]
+        ),
+        duration_seconds=duration_seconds,
+        docs_per_minute=processed / minutes if minutes > 0 else 0.0,
+        checkpoint_path=checkpoint_path,
+        parse_stats=parse_stats_dict(),
+    )
+
+
+async def run_workflow(
+    entries: list[tuple[str, CessionActions]],
+    subject_client: BaseLLMClient,
+    judge_client: BaseLLMClient,
+    checkpoint_path: Path,
+    documents_dir: Path = DOCUMENTS_DIR,
+    extraction_concurrency: int = EXTRACTION_CONCURRENCY,
+    scoring_concurrency: int = SCORING_CONCURRENCY,
+    judge_mode: str = "concurrent",
+    judge_concurrency: int = TEXT_JUDGE_CONCURRENCY,
+    resume: bool = True,
+    chunk_tokens: int | None = None,
+    chunk_concurrency: int = CHUNK_CONCURRENCY,
+) -> WorkflowRunSummary:
+    """Extrait et score chaque document de `entries` (nom, ground truth).
+
+    Si `chunk_tokens` est defini, les documents plus longs sont extraits par
+    morceaux, au plus `chunk_concurrency` appels de morceaux simultanes.
+
+    Les documents déjà présents sans erreur dans le checkpoint sont repris
+    tels quels si `resume` est vrai ; sinon le checkpoint est réinitialisé.
+    """
+    model_id = subject_client.model
+    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+    if not resume and checkpoint_path.exists():
+        checkpoint_path.unlink()
+    done = read_checkpoint(checkpoint_path)
+    todo = [(name, gt) for name, gt in entries if name not in done]
+    results: list[DocumentResult] = [done[name] for name, _ in entries if name in done]
+    n_resumed = len(results)
+    logger.info(
+        "Workflow cession_actions (%s) : %d documents, %d repris du checkpoint",
+        model_id,
+        len(entries),
+        n_resumed,
+    )
+
+    reset_parse_stats()
+    start = time.monotonic()
+    extraction_queue: asyncio.Queue = asyncio.Queue(maxsize=extraction_concurrency * 2)
+    scoring_queue: asyncio.Queue = asyncio.Queue(maxsize=scoring_concurrency * 2)
+    judge_semaphore = asyncio.Semaphore(judge_concurrency)
+    chunk_semaphore = asyncio.Semaphore(chunk_concurrency)
+
+    def _record(result: DocumentResult) -> None:
+        results.append(result)
+        with open(checkpoint_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(asdict(result), ensure_ascii=False, default=str) + "\n")
+
+    async def _produce() -> None:
+        for item in todo:
+            await extraction_queue.put(item)
+        for _ in range(extraction_concurrency):
+            await extraction_queue.put(_DONE)
+
+    async def _extract_worker() -> None:
+        while (item := await extraction_queue.get()) is not _DONE:
+            name, gt = item
+            t0 = time.monotonic()
+            try:
+                text = await asyncio.to_thread(load_document_text, documents_dir, name)
+                extraction = await extract_document(
+                    subject_client, text, chunk_tokens, chunk_semaphore
+                )
+            except ValidationError as e:
+                logger.error("Extraction %s non conforme au schema : %s", name, e)
+                _record(
+                    DocumentResult(
+                        document=name,
+                        model_id=model_id,
+                        error=f"validation: {e.error_count()} erreur(s)",
+                        extraction_latency_seconds=time.monotonic() - t0,
+                    )
+                )
+                continue
+            except Exception as e:  # noqa: BLE001 - un extracteur mort bloquerait la file
+                logger.error("Extraction %s : %s", name, e)
+                _record(
+                    DocumentResult(
+                        document=name,
+                        model_id=model_id,
+                        error=f"extraction: {e}",
+                        extraction_latency_seconds=time.monotonic() - t0,
+                    )
+                )
+                continue
+            await scoring_queue.put((name, gt, extraction, time.monotonic() - t0))
+
+    async def _score_worker() -> None:
+        while (item := await scoring_queue.get()) is not _DONE:
+            name, gt, extraction, extraction_latency = item
+            result = DocumentResult(
+                document=name,
+                model_id=model_id,
+                extracted=extraction.actions.model_dump(),
+                extraction_latency_seconds=extraction_latency,
+                input_tokens=extraction.input_tokens,
+                output_tokens=extraction.output_tokens,
+                chunks=extraction.chunks,
+                tie_breaks=extraction.tie_breaks,
+            )
+            try:
+                score = await score_extraction(
+                    extraction.actions, gt, judge_client, mode=judge_mode, semaphore=judge_semaphore
+                )
+            except Exception as e:  # noqa: BLE001 - un scoreur mort bloquerait les extracteurs
+                logger.error("Scoring %s : %s", name, e)
+                result.error = f"scoring: {e}"
+            else:
+                result.accuracy = score.accuracy
+                result.total_fields = score.total_fields
+                result.exact_matches = score.exact_matches
+                result.normalized_matches = score.normalized_matches
+                result.llm_matches = score.llm_matches
+                result.judge_calls = score.judge_calls
+                result.details = score.details
+                result.scoring_latency_seconds = score.latency_seconds
+            _record(result)
+
+    scorers = [asyncio.create_task(_score_worker()) for _ in range(scoring_concurrency)]
+    await asyncio.gather(_produce(), *(_extract_worker() for _ in range(extraction_concurrency)))
+    for _ in range(scoring_concurrency):
+        await scoring_queue.put(_DONE)
+    await asyncio.gather(*scorers)
+
+    return summarize(model_id, results, n_resumed, time.monotonic() - start, checkpoint_path)
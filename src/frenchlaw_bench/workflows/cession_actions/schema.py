@@ -32,3 +32,34 @@ schema JSON fourni.
 - Pour les dates, utilise le format YYYY-MM-DD.
 - Réponds UNIQUEMENT avec le JSON structuré, sans commentaire.
 """
+
+CHUNK_EXTRACTION_PROMPT = """\
+Tu es un avocat spécialisé en droit des sociétés français. Voici un extrait \
+(partie {index}/{total}) d'un acte de cession d'actions. Extrais les \
+informations structurées selon le schema JSON fourni.
+
+## Schema JSON attendu
+{schema}
+
+## Extrait du document
+{document}
+
+## Instructions
+- Ne renseigne QUE les champs dont l'information figure dans cet extrait ; \
+omets tous les autres (pas de valeur par défaut, pas de déduction).
+- Pour les montants, utilise des nombres (pas de formatage texte).
+- Pour les dates, utilise le format YYYY-MM-DD.
+- Réponds UNIQUEMENT avec le JSON structuré, sans commentaire.
+"""
+
+TIE_BREAK_PROMPT = """\
+Plusieurs extraits d'un même acte de cession d'actions donnent des valeurs \
+différentes pour le champ « {field} » :
+
+{candidates}
+
+Quelle valeur correspond aux stipulations définitives de l'acte (une clause \
+qui modifie ou précise une autre l'emporte) ?
+
+Réponds UNIQUEMENT : {{"choice": <numéro>, "reasoning": "..."}}
+"""
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import time
 from dataclasses import dataclass
 
 from frenchlaw_bench.llm.base import BaseLLMClient
+from frenchlaw_bench.llm.structured import complete_json
 from frenchlaw_bench.models.workflow import CessionActions
+from frenchlaw_bench.scoring.schemas import BATCH_FIELD_MATCH_SCHEMA, FIELD_MATCH_SCHEMA
+from frenchlaw_bench.workflows.cession_actions.normalizers import normalized_equal
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +48,30 @@ même sens, éventuellement formulées différemment) ?
 Réponds UNIQUEMENT : {{"match": true/false, "reasoning": "..."}}
 """
 
+_BATCH_JUDGE_PROMPT = """\
+Compare, pour chaque champ de cession d'actions ci-dessous, la valeur attendue \
+et la valeur extraite.
+
+{fields}
+
+Pour chaque champ, les valeurs sont-elles sémantiquement équivalentes (même \
+information, même sens, éventuellement formulées différemment) ? Juge chaque \
+champ indépendamment des autres.
+
+Réponds UNIQUEMENT avec un objet JSON, une entrée par champ :
+{{"verdicts": [{{"field": "<champ>", "match": true/false, "reasoning": "..."}}]}}
+"""
+
+_BATCH_FIELD_BLOCK = """\
+### {field}
+Valeur attendue : {expected}
+Valeur extraite : {extracted}"""
+
+# "concurrent" : un appel juge par champ, en parallèle borné
+# "batch" : un seul appel juge par document, verdicts par champ
+JUDGE_MODES = ("concurrent", "batch")
+TEXT_JUDGE_CONCURRENCY = 8
+
 
 @dataclass
 class WorkflowScore:
@@ -51,6 +80,9 @@ class WorkflowScore:
     llm_matches: int
     accuracy: float
     details: list[dict]
+    latency_seconds: float = 0.0
+    judge_calls: int = 0
+    normalized_matches: int = 0
 
 
 def _flatten(obj: dict, prefix: str = "") -> dict[str, object]:
@@ -67,18 +99,82 @@ def _flatten(obj: dict, prefix: str = "") -> dict[str, object]:
     return flat
 
 
+async def _judge_field(
+    judge_client: BaseLLMClient,
+    semaphore: asyncio.Semaphore,
+    key: str,
+    expected: object,
+    extracted: object,
+) -> bool:
+    prompt = _TEXT_JUDGE_PROMPT.format(field=key, expected=expected, extracted=extracted)
+    async with semaphore:
+        try:
+            data, _ = await complete_json(
+                judge_client, prompt, schema=FIELD_MATCH_SCHEMA, schema_name="field_match"
+            )
+        except (json.JSONDecodeError, ValueError):
+            logger.warning("Réponse du juge illisible pour %s", key)
+            return False
+    return isinstance(data, dict) and bool(data.get("match"))
+
+
+async def _judge_batch(
+    judge_client: BaseLLMClient,
+    pending: list[tuple[str, object, object]],
+) -> dict[str, bool]:
+    """Un seul appel pour tous les champs ; les champs absents de la réponse sont omis."""
+    fields = "\n\n".join(
+        _BATCH_FIELD_BLOCK.format(field=key, expected=expected, extracted=extracted)
+        for key, expected, extracted in pending
+    )
+    try:
+        data, _ = await complete_json(
+            judge_client,
+            _BATCH_JUDGE_PROMPT.format(fields=fields),
+            schema=BATCH_FIELD_MATCH_SCHEMA,
+            schema_name="field_matches",
+        )
+    except (json.JSONDecodeError, ValueError):
+        logger.warning("Réponse batch du juge illisible, repli champ par champ")
+        return {}
+    verdicts = data.get("verdicts", []) if isinstance(data, dict) else data
+    keys = {key for key, _, _ in pending}
+    return {
+        v["field"]: bool(v.get("match"))
+        for v in verdicts
+        if isinstance(v, dict) and v.get("field") in keys
+    }
+
+
 async def score_extraction(
     extracted: CessionActions,
     ground_truth: CessionActions,
     judge_client: BaseLLMClient,
+    mode: str = "concurrent",
+    max_concurrent: int = TEXT_JUDGE_CONCURRENCY,
+    semaphore: asyncio.Semaphore | None = None,
 ) -> WorkflowScore:
-    """Score une extraction par rapport au ground truth."""
+    """Score une extraction par rapport au ground truth.
+
+    Les valeurs divergentes sont d'abord comparées après normalisation
+    (dates, montants, formes juridiques, RCS, durées, juridictions : match
+    "normalized"). Les champs textuels restants sont jugés par LLM, soit en parallèle
+    (au plus `max_concurrent` appels, ou `semaphore` s'il est partagé entre
+    documents), soit en un seul appel par document (`mode="batch"`) ; les
+    champs sans verdict dans la réponse batch sont rejugés individuellement.
+    """
+    if mode not in JUDGE_MODES:
+        raise ValueError(f"Mode de jugement inconnu : {mode!r} (attendu : {JUDGE_MODES})")
+
+    start = time.monotonic()
+    sem = semaphore or asyncio.Semaphore(max_concurrent)
     gt_flat = _flatten(ground_truth.model_dump())
     ex_flat = _flatten(extracted.model_dump())
 
-    details = []
+    details: list[dict] = []
+    pending: list[tuple[str, object, object]] = []
     exact_matches = 0
-    llm_matches = 0
+    normalized_matches = 0
     total = 0
 
     for key, gt_val in gt_flat.items():
@@ -94,33 +190,45 @@ async def score_extraction(
             details.append({"field": key, "match": "exact", "expected": gt_val, "got": ex_val})
             continue
 
-        # Pour les champs textuels, utiliser LLM-as-judge
-        if field_name in _TEXT_FIELDS and ex_val:
-            prompt = _TEXT_JUDGE_PROMPT.format(
-                field=key, expected=gt_val, extracted=ex_val
-            )
-            resp = await judge_client.complete(prompt, temperature=0.0)
-            try:
-                data = json.loads(resp.content)
-                if isinstance(data, str):
-                    data = json.loads(data)
-            except json.JSONDecodeError:
-                text = resp.content
-                start = text.find("{")
-                end = text.rfind("}") + 1
-                if start >= 0 and end > start:
-                    data = json.loads(text[start:end])
-                else:
-                    data = {"match": False}
-
-            if data.get("match"):
-                llm_matches += 1
-                details.append({"field": key, "match": "llm", "expected": gt_val, "got": ex_val})
+        if normalized_equal(field_name, gt_val, ex_val):
+            normalized_matches += 1
+            details.append({"field": key, "match": "normalized", "expected": gt_val, "got": ex_val})
+            continue
+
+        # Champs textuels : jugés par LLM après la boucle
+        judged = field_name in _TEXT_FIELDS and bool(ex_val)
+        if judged:
+            pending.append((key, gt_val, ex_val))
+        details.append(
+            {"field": key, "match": "miss", "expected": gt_val, "got": ex_val, "judged": judged}
+        )
+
+    verdicts: dict[str, bool] = {}
+    judge_calls = 0
+    if pending and mode == "batch":
+        verdicts = await _judge_batch(judge_client, pending)
+        judge_calls += 1
+
+    remaining = [p for p in pending if p[0] not in verdicts]
+    if remaining:
+        results = await asyncio.gather(
+            *(_judge_field(judge_client, sem, *p) for p in remaining),
+            return_exceptions=True,
+        )
+        judge_calls += len(remaining)
+        for (key, _, _), r in zip(remaining, results, strict=True):
+            if isinstance(r, Exception):
+                logger.error("Erreur jugement champ %s : %s", key, r)
                 continue
+            verdicts[key] = r
 
-        details.append({"field": key, "match": "miss", "expected": gt_val, "got": ex_val})
+    llm_matches = 0
+    for d in details:
+        if verdicts.get(d["field"]):
+            d["match"] = "llm"
+            llm_matches += 1
 
-    matched = exact_matches + llm_matches
+    matched = exact_matches + normalized_matches + llm_matches
     accuracy = matched / total if total > 0 else 0.0
 
     return WorkflowScore(
@@ -129,4 +237,29 @@ async def score_extraction(
         llm_matches=llm_matches,
         accuracy=accuracy,
         details=details,
+        latency_seconds=time.monotonic() - start,
+        judge_calls=judge_calls,
+        normalized_matches=normalized_matches,
     )
+
+
+def judge_calls_avoided(scores: list[WorkflowScore]) -> dict[str, float]:
+    """Part, par champ textuel, des comparaisons réglées par normalisation plutôt que par le juge.
+
+    Ne compte que les champs qui seraient sinon partis au juge LLM.
+    """
+    normalized: dict[str, int] = {}
+    judged: dict[str, int] = {}
+    for score in scores:
+        for d in score.details:
+            name = d["field"].split(".")[-1]
+            if name not in _TEXT_FIELDS:
+                continue
+            if d["match"] == "normalized":
+                normalized[name] = normalized.get(name, 0) + 1
+            elif d.get("judged") or d["match"] == "llm":
+                judged[name] = judged.get(name, 0) + 1
+    return {
+        name: normalized.get(name, 0) / (normalized.get(name, 0) + judged.get(name, 0))
+        for name in sorted(normalized.keys() | judged.keys())
+    }
@@ -4,10 +4,17 @@ from __future__ import annotations
 
 import pytest
 
+from frenchlaw_bench import config
 from frenchlaw_bench.models.enums import Category, Dimension, SubCategory, TaskType
 from frenchlaw_bench.models.task import Rubric, RubricItem, Task
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path_factory, monkeypatch) -> None:
+    """Les caches (bundle de taches...) sont ecrits hors du depot."""
+    monkeypatch.setattr(config, "CACHE_DIR", tmp_path_factory.mktemp("cache"))
+
+
 @pytest.fixture
 def sample_rubric_text() -> str:
     return """\
@@ -44,8 +51,12 @@ def sample_rubric() -> Rubric:
             RubricItem(id="SUB2", dimension=Dimension.SUBSTANCE, description="Faute", points=1),
             RubricItem(id="SUB3", dimension=Dimension.SUBSTANCE, description="Causalite", points=3),
             RubricItem(id="SUB4", dimension=Dimension.SUBSTANCE, description="Prejudice", points=1),
-            RubricItem(id="M1", dimension=Dimension.METHODOLOGIE, description="Syllogisme", points=1),
-            RubricItem(id="N1", dimension=Dimension.NEGATIF, description="Hallucination", points=-1),
+            RubricItem(
+                id="M1", dimension=Dimension.METHODOLOGIE, description="Syllogisme", points=1
+            ),
+            RubricItem(
+                id="N1", dimension=Dimension.NEGATIF, description="Hallucination", points=-1
+            ),
             RubricItem(id="N2", dimension=Dimension.NEGATIF, description="Hors sujet", points=-0.5),
         ]
     )
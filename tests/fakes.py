@@ -0,0 +1,52 @@
+"""Clients LLM factices pour tester le pipeline sans appels reseau."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+
+from frenchlaw_bench.llm.base import BaseLLMClient, LLMResponse
+
+# Sortie de juge acceptee par toutes les etapes (criteres, claims, sources)
+JUDGE_OUTPUT = json.dumps(
+    {
+        "satisfied": True,
+        "reasoning": "ok",
+        "evidence": [],
+        "confidence": 1.0,
+        "claims": [],
+        "score": 1.0,
+    }
+)
+
+
+class ScriptedClient(BaseLLMClient):
+    """Client LLM dont les reponses sont produites par une fonction `prompt -> texte`."""
+
+    def __init__(self, responder: Callable[[str], str], model: str = "fake/model") -> None:
+        self.model = model
+        self._responder = responder
+        self.prompts: list[str] = []
+        self.response_formats: list[dict | None] = []
+
+    async def complete(
+        self,
+        prompt: str,
+        *,
+        system: str = "",
+        temperature: float = 0.0,
+        max_tokens: int = 4096,
+        response_format: dict | None = None,
+    ) -> LLMResponse:
+        self.prompts.append(prompt)
+        self.response_formats.append(response_format)
+        content = self._responder(prompt)
+        return LLMResponse(
+            content=content,
+            model=self.model,
+            input_tokens=len(prompt) // 4,
+            output_tokens=len(content) // 4,
+        )
+
+    async def close(self) -> None:
+        return None
@@ -0,0 +1,119 @@
+"""Tests du juge en cascade (juge rapide, escalade vers le juge principal)."""
+
+import json
+
+import pytest
+
+from frenchlaw_bench.models.task import Task
+from frenchlaw_bench.pipeline import runner
+from frenchlaw_bench.pipeline.runner import EvaluationOptions, run_benchmark
+from frenchlaw_bench.reports.generator import generate_report
+from frenchlaw_bench.scoring.judge import JudgeCascade, judge_all_items, judge_negatif_items
+from tests.fakes import JUDGE_OUTPUT, ScriptedClient
+
+
+def _verdict(satisfied: bool = True, confidence: float = 0.95) -> str:
+    return json.dumps(
+        {
+            "satisfied": satisfied,
+            "triggered": False,
+            "reasoning": "rapide",
+            "evidence": [],
+            "confidence": confidence,
+        }
+    )
+
+
+def _fast(prompt: str) -> str:
+    """Juge rapide : incertain sur le ton (Style), en desaccord sur la faute (Substance)."""
+    if "Ton pro" in prompt:
+        return _verdict(confidence=0.4)
+    if "Faute" in prompt:
+        return _verdict(satisfied=False)
+    if "Syllogisme" in prompt or "Sortie a corriger" in prompt:
+        # Sortie illisible, reparation comprise
+        return '{"satisfied": true, "reasoning": "tronque'
+    return _verdict()
+
+
+async def test_confident_fast_verdicts_are_kept(sample_task: Task) -> None:
+    fast = ScriptedClient(_fast, model="fast")
+    strong = ScriptedClient(lambda p: JUDGE_OUTPUT, model="strong")
+    cascade = JudgeCascade(fast=fast, threshold=0.8)
+
+    results = await judge_all_items(strong, sample_task, "Reponse", cascade)
+
+    tiers = {r.item_id: r.judge_tier for r in results}
+    # ST1 peu sur, M1 illisible : escalades
+    assert {i for i, t in tiers.items() if t == "strong"} == {"ST1", "M1"}
+    assert len(fast.prompts) >= len(sample_task.rubric.positive_items)
+    assert len(strong.prompts) == 2
+    style = cascade.stats["Style"]
+    assert (style.items, style.escalated, style.escalated_agree) == (1, 1, 1)
+
+
+async def test_dimensions_always_escalated(sample_task: Task) -> None:
+    fast = ScriptedClient(_fast, model="fast")
+    strong = ScriptedClient(lambda p: JUDGE_OUTPUT, model="strong")
+    cascade = JudgeCascade(fast=fast, threshold=0.0, dimensions=frozenset({"Substance"}))
+
+    results = await judge_all_items(strong, sample_task, "Reponse", cascade)
+
+    by_id = {r.item_id: r for r in results}
+    assert {i for i, r in by_id.items() if r.judge_tier == "strong"} >= {
+        "SUB1",
+        "SUB2",
+        "SUB3",
+        "SUB4",
+    }
+    # Verdict du juge principal retenu en cas de desaccord
+    assert by_id["SUB2"].satisfied
+    substance = cascade.stats["Substance"]
+    assert (substance.escalated, substance.escalated_agree) == (4, 3)
+
+
+async def test_calibration_sample_is_deterministic(sample_task: Task) -> None:
+    strong = ScriptedClient(lambda p: JUDGE_OUTPUT, model="strong")
+    full = JudgeCascade(fast=ScriptedClient(_fast), threshold=0.0, calibration_rate=1.0)
+    await judge_negatif_items(strong, sample_task, "Reponse", full)
+    assert sum(s.calibrated for s in full.stats.values()) == len(sample_task.rubric.negatif_items)
+
+    half = JudgeCascade(fast=ScriptedClient(_fast), calibration_rate=0.5)
+    draws = [half.calibrates(sample_task, "Reponse", i) for i in sample_task.rubric.items]
+    assert draws == [half.calibrates(sample_task, "Reponse", i) for i in sample_task.rubric.items]
+    assert not JudgeCascade(fast=ScriptedClient(_fast)).calibrates(
+        sample_task, "Reponse", sample_task.rubric.items[0]
+    )
+
+
+async def test_run_reports_cascade_tiers(tmp_path, sample_task: Task, monkeypatch) -> None:
+    responders = {"subject": lambda p: "Reponse", "strong": lambda p: JUDGE_OUTPUT, "fast": _fast}
+    monkeypatch.setattr(
+        runner,
+        "OpenRouterClient",
+        lambda model, **_: ScriptedClient(responders[model], model=model),
+    )
+
+    run = await run_benchmark(
+        [sample_task],
+        ["subject"],
+        judge_model="strong",
+        options=EvaluationOptions(
+            retrieval_k=0,
+            fast_judge_model="fast",
+            escalate_dimensions=("Substance",),
+        ),
+    )
+
+    report = run.metadata.judge_cascade
+    n_items = len(sample_task.rubric.items)
+    assert (report.fast_model, report.strong_model) == ("fast", "strong")
+    assert report.total.items == n_items
+    assert report.total.escalated == 6  # ST1, M1 et les quatre criteres Substance
+    assert report.calls_fast >= n_items
+    assert report.by_dimension["Substance"].escalated_agreement == pytest.approx(0.75)
+    (agg,) = run.aggregates
+    assert agg.cost_judge_usd == pytest.approx(report.cost_fast_usd + report.cost_strong_usd)
+
+    html = generate_report(run, tmp_path, mode="single").html_path.read_text(encoding="utf-8")
+    assert "Juge en cascade" in html
@@ -0,0 +1,133 @@
+"""Tests pour l'extracteur deterministe de citations."""
+
+import json
+
+from frenchlaw_bench.scoring.citation_extractor import citations_to_claims, extract_citations
+from frenchlaw_bench.scoring.hallucination_detector import detect_hallucinations
+from tests.fakes import ScriptedClient
+
+
+def _normalized(text: str) -> list[str]:
+    return [c.normalized for c in extract_citations(text)]
+
+
+def test_article_with_code() -> None:
+    assert _normalized("L'article 1240 du Code civil") == ["Code civil, art. 1240"]
+    assert _normalized("art. L. 223-43 C. com.") == ["Code de commerce, art. L. 223-43"]
+
+
+def test_article_list_is_split() -> None:
+    assert _normalized("articles 101 et 102 TFUE") == ["TFUE, art. 101", "TFUE, art. 102"]
+
+
+def test_article_et_suivants_keeps_code() -> None:
+    text = "articles L223-43 et suivants du Code de commerce"
+    assert _normalized(text) == ["Code de commerce, art. L. 223-43"]
+
+
+def test_codified_number_without_article() -> None:
+    assert _normalized("conformement a L. 223-43") == ["art. L. 223-43"]
+    # Un simple numero sans tiret n'est pas une citation
+    assert _normalized("la page L. 5") == []
+
+
+def test_cassation_full_reference() -> None:
+    cits = extract_citations("Cass. com., 12 janv. 2021, n° 19-12.345")
+    assert len(cits) == 1
+    assert cits[0].category == "jurisprudence"
+    assert cits[0].normalized == "Cass. com., 2021-01-12, n° 19-12.345"
+
+
+def test_cassation_chamber_normalization() -> None:
+    assert _normalized("Cass. civ. 1ère, 3 mai 2018") == ["Cass. civ. 1re, 2018-05-03"]
+    assert _normalized("Cass. civ. 3e, 27 sept. 2000") == ["Cass. civ. 3e, 2000-09-27"]
+    # Ordre "1re civ." : meme forme normalisee
+    assert _normalized("Cass. 1re civ., 3 mai 2018") == ["Cass. civ. 1re, 2018-05-03"]
+    assert _normalized("Cass. 2e ch. civ., 3 mai 2018, n° 17-12.345") == [
+        "Cass. civ. 2e, 2018-05-03, n° 17-12.345"
+    ]
+
+
+def test_eu_case_numbers() -> None:
+    assert _normalized("CJUE, C-311/18") == ["CJUE, aff. C-311/18"]
+    assert _normalized("CE, 5 février 1963, aff. 26/62") == ["CJUE, aff. 26/62"]
+
+
+def test_conseil_etat() -> None:
+    assert _normalized("CE, Ass., 20 octobre 1989, n° 108243") == ["CE, 1989-10-20, n° 108243"]
+    assert _normalized("CE, 3 mars 2020") == ["CE, 2020-03-03"]
+    assert _normalized("CE, sect., 3 mars 2020") == ["CE, 2020-03-03"]
+    assert _normalized("Conseil d'État, 3 mars 2020") == ["CE, 2020-03-03"]
+    assert _normalized("le conseil d'Etat, 3 mars 2020, n° 412345") == ["CE, 2020-03-03, n° 412345"]
+    assert _normalized("CE, 10e et 9e ch. réunies, 3 mars 2020, n° 412345") == [
+        "CE, 2020-03-03, n° 412345"
+    ]
+    # Sans date : numero de requete seul
+    assert _normalized("CE, n° 412345") == ["CE, n° 412345"]
+    # Ni un reglement "CE n° ...", ni la simple mention de l'institution
+    assert _normalized("le reglement CE n° 1907/2006") == []
+    assert _normalized("Le Conseil d'État a juge que") == []
+
+
+def test_cedh() -> None:
+    text = "CEDH, 7 déc. 1976, Handyside c. Royaume-Uni, n° 5493/72"
+    (citation,) = extract_citations(text)
+    assert (citation.category, citation.normalized) == (
+        "jurisprudence",
+        "CEDH, 1976-12-07, n° 5493/72",
+    )
+    assert _normalized("CEDH, GC, 7 déc. 1976, Handyside c. Royaume-Uni") == ["CEDH, 1976-12-07"]
+    assert _normalized("CEDH, req. n° 5493/72") == ["CEDH, n° 5493/72"]
+    # Apres un numero d'article, CEDH designe la Convention
+    assert _normalized("article 8 de la CEDH") == ["CESDH, art. 8"]
+
+
+def test_ecli() -> None:
+    assert _normalized("Voir ECLI:FR:CCASS:2021:CO00045.") == ["ECLI:FR:CCASS:2021:CO00045"]
+
+
+def test_claims_grouped_by_sentence() -> None:
+    text = (
+        "L'article 1240 du Code civil fonde la responsabilite. "
+        "Voir Cass. com., 12 janv. 2021, n° 19-12.345 et CJUE, C-311/18."
+    )
+    claims = citations_to_claims(extract_citations(text))
+    assert len(claims) == 2
+    assert claims[0]["category"] == "article_reference"
+    assert claims[1]["claim"].startswith("Voir Cass. com.")
+    assert "CJUE, aff. C-311/18" in claims[1]["citations"]
+
+
+async def test_detect_hallucinations_citation_mode_skips_extraction_call() -> None:
+    client = ScriptedClient(
+        lambda prompt: json.dumps({"hallucinated": False, "severity": "minor", "reasoning": "ok"})
+    )
+    result = await detect_hallucinations(
+        client,
+        "L'article 1240 du Code civil fonde la responsabilite.",
+        "Test",
+        extraction_mode="citations",
+    )
+    assert result.total_claims == 1
+    assert len(client.prompts) == 1  # verification uniquement
+
+
+async def test_detect_hallucinations_hybrid_mode() -> None:
+    def responder(prompt: str) -> str:
+        if "Citations deja extraites" in prompt:
+            assert "Code civil, art. 1240" in prompt
+            return json.dumps(
+                {"claims": [{"claim": "Le delai est de 5 ans", "category": "legal_rule"}]}
+            )
+        return json.dumps({"hallucinated": "5 ans" in prompt, "severity": "major"})
+
+    client = ScriptedClient(responder)
+    result = await detect_hallucinations(
+        client,
+        "L'article 1240 du Code civil fonde la responsabilite. Le delai est de 5 ans.",
+        "Test",
+        extraction_mode="hybrid",
+    )
+    assert result.total_claims == 2
+    assert result.hallucinated_claims == 1
+    assert result.severity_counts["major"] == 1
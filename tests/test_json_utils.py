@@ -1,5 +1,8 @@
 """Tests pour le parser JSON robuste."""
 
+import json
+from pathlib import Path
+
 import pytest
 
 from frenchlaw_bench.json_utils import parse_llm_json
@@ -78,3 +81,42 @@ def test_multiple_trailing_commas():
     text = '{"a": [1, 2,], "b": {"c": 3,},}'
     result = parse_llm_json(text)
     assert result == {"a": [1, 2], "b": {"c": 3}}
+
+
+def test_braces_in_surrounding_prose():
+    text = 'Le critere {C3} est rempli.\n{"a": 1}\nVoir {annexe}.'
+    assert parse_llm_json(text) == {"a": 1}
+
+
+def test_braces_inside_strings():
+    text = 'Verdict : {"reasoning": "la clause {d\'agrement} \\"art. 12\\"", "ok": true,}'
+    assert parse_llm_json(text) == {"reasoning": 'la clause {d\'agrement} "art. 12"', "ok": True}
+
+
+def test_json_inside_unbalanced_prose():
+    text = 'Je note (voir [point 3 et {"a": [1, 2]}'
+    assert parse_llm_json(text) == {"a": [1, 2]}
+
+
+def test_mismatched_brackets_skipped():
+    assert parse_llm_json('Note {a] puis {"b": 2}') == {"b": 2}
+
+
+def test_truncated_does_not_return_inner_fragment():
+    with pytest.raises(json.JSONDecodeError):
+        parse_llm_json('{"evidence": ["citation"], "satisfied": true, "reasoning": "coup')
+
+
+def _corpus() -> list[dict]:
+    path = Path(__file__).parent / "data" / "judge_outputs.jsonl"
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+@pytest.mark.parametrize("row", _corpus(), ids=lambda r: r["kind"])
+def test_judge_outputs_corpus(row: dict):
+    if row["expected"] is None:
+        with pytest.raises(ValueError):
+            parse_llm_json(row["output"])
+    else:
+        assert parse_llm_json(row["output"]) == row["expected"]
@@ -0,0 +1,110 @@
+"""Tests de la sortie `spans` du juge (phrases numerotees, preuves reconstituees)."""
+
+import json
+
+from frenchlaw_bench.models.task import Task
+from frenchlaw_bench.pipeline import runner
+from frenchlaw_bench.pipeline.runner import EvaluationOptions, run_benchmark
+from frenchlaw_bench.scoring.judge import (
+    judge_all_items,
+    judge_negatif_item,
+    judge_rubric_item,
+    reset_verdict_stats,
+    verdict_stats_dict,
+)
+from frenchlaw_bench.scoring.spans import evidence_from_spans, numbered, segment, span_ids
+from tests.fakes import JUDGE_OUTPUT, ScriptedClient
+
+ANSWER = (
+    "## Analyse\n"
+    "La faute est etablie. Selon l'art. 1240 C. civ., tout fait oblige a reparer.\n"
+    "1. Le prejudice est certain. Voir Cass. com., 12 janv. 2021.\n"
+)
+
+VERBATIM_OUTPUT = json.dumps(
+    {
+        "evidence": ["Selon l'art. 1240 C. civ., tout fait oblige a reparer."],
+        "analysis": "Le passage cite l'article attendu et en tire la consequence. " * 4,
+        "satisfied": True,
+        "reasoning": "L'article 1240 du Code civil est explicitement mentionne.",
+        "confidence": 0.9,
+    }
+)
+SPANS_OUTPUT = json.dumps({"spans": [3, "[3]", 9], "satisfied": True, "confidence": 0.9})
+
+
+def test_segmentation() -> None:
+    assert segment(ANSWER) == (
+        "## Analyse",
+        "La faute est etablie.",
+        "Selon l'art. 1240 C. civ., tout fait oblige a reparer.",
+        "1. Le prejudice est certain.",
+        "Voir Cass. com., 12 janv. 2021.",
+    )
+    assert numbered(ANSWER).splitlines()[2] == (
+        "[3] Selon l'art. 1240 C. civ., tout fait oblige a reparer."
+    )
+    assert span_ids([4, "[2]", "2", 0, 6, None, "x"], ANSWER) == [4, 2]
+    assert evidence_from_spans(ANSWER, [4, 2]) == [
+        "1. Le prejudice est certain.",
+        "La faute est etablie.",
+    ]
+
+
+async def test_spans_output_rebuilds_evidence(sample_task: Task) -> None:
+    judge = ScriptedClient(lambda p: SPANS_OUTPUT, model="judge")
+    item = sample_task.rubric.items[3]
+
+    verdict = await judge_rubric_item(judge, sample_task, ANSWER, item, output="spans")
+
+    assert "[3] Selon l'art. 1240" in judge.prompts[0]
+    assert judge.response_formats[0]["json_schema"]["name"] == "rubric_spans_verdict"
+    assert verdict.satisfied and verdict.confidence == 0.9
+    assert verdict.evidence == ["Selon l'art. 1240 C. civ., tout fait oblige a reparer."]
+    assert verdict.reasoning == "Phrases 3"
+    assert verdict.item_hash == item.content_hash
+
+    negatif = sample_task.rubric.negatif_items[0]
+    judge = ScriptedClient(
+        lambda p: json.dumps({"spans": [], "triggered": False, "confidence": 1.0})
+    )
+    verdict = await judge_negatif_item(judge, sample_task, ANSWER, negatif, output="spans")
+    assert (verdict.satisfied, verdict.evidence, verdict.judge_tier) == (False, [], None)
+
+
+async def test_verdict_stats_measure_output_tokens(sample_task: Task) -> None:
+    stats = {}
+    for output, judge_output in (("verbatim", VERBATIM_OUTPUT), ("spans", SPANS_OUTPUT)):
+        reset_verdict_stats()
+        judge = ScriptedClient(lambda p, out=judge_output: out, model="judge")
+        await judge_all_items(judge, sample_task, ANSWER, output=output)
+        stats[output] = verdict_stats_dict()["judge"]
+
+    n_items = len(sample_task.rubric.positive_items)
+    assert stats["verbatim"]["calls"] == stats["spans"]["calls"] == n_items
+    lean, verbose = (stats[o]["output_tokens_per_call"] for o in ("spans", "verbatim"))
+    assert lean < verbose / 4
+
+
+async def test_run_records_judge_output(sample_task: Task, monkeypatch) -> None:
+    def judge(prompt: str) -> str:
+        return SPANS_OUTPUT if "phrases numerotees" in prompt else JUDGE_OUTPUT
+
+    responders = {"subject": lambda p: ANSWER, "judge": judge}
+    monkeypatch.setattr(
+        runner,
+        "OpenRouterClient",
+        lambda model, **_: ScriptedClient(responders[model], model=model),
+    )
+
+    run = await run_benchmark(
+        [sample_task],
+        ["subject"],
+        judge_model="judge",
+        options=EvaluationOptions(retrieval_k=0, judge_output="spans"),
+    )
+
+    assert run.metadata.judge_output == "spans"
+    assert run.metadata.verdict_stats["judge"]["calls"] == len(sample_task.rubric.items)
+    (result,) = run.task_results
+    assert all(v.reasoning == "Phrases 3" for v in result.rubric_results)
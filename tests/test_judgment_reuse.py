@@ -0,0 +1,166 @@
+"""Tests de la reprise des verdicts du juge (empreintes exactes et MinHash)."""
+
+import asyncio
+import itertools
+
+import pytest
+
+from frenchlaw_bench.models.result import RubricItemResult
+from frenchlaw_bench.models.task import Task
+from frenchlaw_bench.pipeline.judgment_cache import JudgmentCache, Verdicts
+from frenchlaw_bench.pipeline.runner import EvaluationOptions, evaluate_task_samples
+from frenchlaw_bench.scoring.aggregator import aggregate_scores
+from frenchlaw_bench.scoring.fingerprint import ResponseFingerprint, normalize_tokens
+from frenchlaw_bench.scoring.hallucination_detector import HallucinationResult
+from tests.fakes import JUDGE_OUTPUT, ScriptedClient
+
+LONG_ANSWER = " ".join(
+    f"Selon l'article {1240 + i} du Code civil, la faute engage la responsabilite de son auteur."
+    for i in range(20)
+)
+
+
+def _verdicts(satisfied: bool = True) -> Verdicts:
+    return Verdicts(
+        rubric_results=[RubricItemResult(item_id="S1", satisfied=satisfied, dimension="Structure")],
+        negatif_results=[],
+        hallucination=HallucinationResult(
+            total_claims=1, hallucinated_claims=0, rate=0.0, penalty_points=0.0
+        ),
+        source_score=0.5,
+    )
+
+
+def test_normalization_ignores_case_accents_and_punctuation() -> None:
+    assert normalize_tokens("Réponse : l'Article 1240 !") == ["reponse", "l", "article", "1240"]
+    a = ResponseFingerprint.of("La  Responsabilité délictuelle.")
+    b = ResponseFingerprint.of("la responsabilite delictuelle")
+    assert a.exact == b.exact
+    assert a.similarity(b) == 1.0
+
+
+def test_minhash_separates_near_copies_from_other_answers() -> None:
+    base = ResponseFingerprint.of(LONG_ANSWER)
+    near = ResponseFingerprint.of(LONG_ANSWER.replace("1245", "1345"))
+    other = ResponseFingerprint.of("Le contrat est nul faute de consentement libre et eclaire.")
+    assert base.exact != near.exact
+    assert base.similarity(near) > 0.9
+    assert base.similarity(other) < 0.1
+    restored = ResponseFingerprint.from_bytes(near.exact, near.signature_bytes())
+    assert restored == near
+
+
+@pytest.mark.parametrize(("mode", "reused"), [("exact", None), ("near", "near")])
+def test_cache_lookup_by_mode(tmp_path, mode: str, reused: str | None) -> None:
+    with JudgmentCache.open(tmp_path, mode=mode, threshold=0.9) as cache:
+        cache.store("k", 1, ResponseFingerprint.of(LONG_ANSWER), _verdicts())
+        exact = cache.lookup("k", 1, ResponseFingerprint.of(LONG_ANSWER.upper()))
+        near = cache.lookup("k", 1, ResponseFingerprint.of(LONG_ANSWER.replace("1245", "1345")))
+        assert cache.lookup("k", 2, ResponseFingerprint.of(LONG_ANSWER)) is None
+        assert cache.lookup("autre", 1, ResponseFingerprint.of(LONG_ANSWER)) is None
+
+    assert exact is not None
+    assert (exact.kind, exact.similarity) == ("exact", 1.0)
+    assert exact.verdicts == _verdicts()
+    assert (near.kind if near else None) == reused
+
+
+def test_cache_persists_between_runs(tmp_path) -> None:
+    with JudgmentCache.open(tmp_path) as cache:
+        cache.store("k", 1, ResponseFingerprint.of("reponse"), _verdicts(satisfied=False))
+        # Deja connue : la premiere entree est conservee
+        cache.store("k", 1, ResponseFingerprint.of("Reponse."), _verdicts(satisfied=True))
+    with JudgmentCache.open(tmp_path) as cache:
+        match = cache.lookup("k", 1, ResponseFingerprint.of("REPONSE"))
+    assert match is not None
+    assert match.verdicts.rubric_results[0].satisfied is False
+
+
+async def test_evaluation_reuses_judgments(tmp_path, sample_task: Task) -> None:
+    answers = itertools.cycle([LONG_ANSWER, LONG_ANSWER, LONG_ANSWER.replace("1245", "1345")])
+    subject = ScriptedClient(lambda p: next(answers), model="subject")
+    judge = ScriptedClient(lambda p: JUDGE_OUTPUT, model="judge")
+    opts = EvaluationOptions(samples=3, retrieval_k=0, reuse_judgments="near")
+
+    with JudgmentCache.open(tmp_path, mode="near") as cache:
+        first = await evaluate_task_samples(
+            sample_task, subject, judge, asyncio.Semaphore(1), opts, judgments=cache
+        )
+        n_calls = len(judge.prompts)
+        # Nouveau run : les trois reponses sont deja connues, aucun appel au juge
+        second = await evaluate_task_samples(
+            sample_task, subject, judge, asyncio.Semaphore(1), opts, judgments=cache
+        )
+
+    assert [r.judgment_reuse for r in first] == [None, "exact", None]
+    assert [r.judgment_reuse for r in second] == ["exact", "exact", "exact"]
+    assert len(judge.prompts) == n_calls
+    assert [r.answer_score for r in second] == [r.answer_score for r in first]
+
+    (agg,) = aggregate_scores(None, first + second)
+    assert (agg.judgments_reused_exact, agg.judgments_reused_near) == (4, 0)
+
+
+async def test_near_copy_reuses_closest_judgment(tmp_path, sample_task: Task) -> None:
+    judge = ScriptedClient(lambda p: JUDGE_OUTPUT, model="judge")
+    opts = EvaluationOptions(retrieval_k=0, reuse_judgments="near")
+    with JudgmentCache.open(tmp_path, mode="near") as cache:
+        await evaluate_task_samples(
+            sample_task,
+            ScriptedClient(lambda p: LONG_ANSWER),
+            judge,
+            asyncio.Semaphore(1),
+            opts,
+            judgments=cache,
+        )
+        n_calls = len(judge.prompts)
+        (result,) = await evaluate_task_samples(
+            sample_task,
+            ScriptedClient(lambda p: LONG_ANSWER.replace("1245", "1345")),
+            judge,
+            asyncio.Semaphore(1),
+            opts,
+            judgments=cache,
+        )
+
+    assert len(judge.prompts) == n_calls
+    assert result.judgment_reuse == "near"
+    assert 0.9 <= result.judgment_similarity < 1.0
+
+
+@pytest.mark.parametrize(
+    ("failure", "marker"),
+    [
+        ("error", "Causalite"),
+        ("unparseable", "Causalite"),
+        ("unparseable", "Extrais chaque assertion"),
+    ],
+)
+async def test_failed_judgment_is_not_reused(
+    tmp_path, sample_task: Task, failure: str, marker: str
+) -> None:
+    def flaky(prompt: str) -> str:
+        # La demande de reparation reprend la sortie illisible : elle echoue aussi
+        if marker in prompt or "ILLISIBLE" in prompt:
+            if failure == "error":
+                raise RuntimeError("HTTP 429")
+            return "ILLISIBLE, pas de JSON"
+        return JUDGE_OUTPUT
+
+    def evaluate(judge: ScriptedClient):
+        subject = ScriptedClient(lambda p: LONG_ANSWER)
+        opts = EvaluationOptions(retrieval_k=0, reuse_judgments="exact")
+        return evaluate_task_samples(
+            sample_task, subject, judge, asyncio.Semaphore(1), opts, judgments=cache
+        )
+
+    judge = ScriptedClient(lambda p: JUDGE_OUTPUT, model="judge")
+    with JudgmentCache.open(tmp_path) as cache:
+        await evaluate(ScriptedClient(flaky, model="judge"))
+        (retried,) = await evaluate(judge)
+        n_calls = len(judge.prompts)
+        (reused,) = await evaluate(judge)
+
+    assert retried.judgment_reuse is None and n_calls > 0
+    assert reused.judgment_reuse == "exact"
+    assert len(judge.prompts) == n_calls
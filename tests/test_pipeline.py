@@ -1,5 +1,7 @@
 """Tests pour le pipeline (chargement et agregation, sans appels LLM)."""
 
+import pytest
+
 from frenchlaw_bench.models.enums import Category, Dimension, SubCategory, TaskType
 from frenchlaw_bench.models.result import AggregateScores, RubricItemResult, TaskResult
 from frenchlaw_bench.models.task import Rubric, RubricItem, Task
@@ -123,7 +125,9 @@ def test_aggregate_by_category() -> None:
 
 def test_aggregate_confidence_intervals() -> None:
     tasks = [_make_task(i, Category.DROIT_PRIVE, TaskType.REDACTION) for i in range(1, 6)]
-    results = [_make_result(i, "m", score) for i, score in zip(range(1, 6), [0.5, 0.6, 0.7, 0.8, 0.9])]
+    results = [
+        _make_result(i, "m", score) for i, score in zip(range(1, 6), [0.5, 0.6, 0.7, 0.8, 0.9])
+    ]
     aggs = aggregate_scores(tasks, results)
     agg = aggs[0]
     assert abs(agg.answer_score_mean - 0.7) < 0.001
@@ -301,9 +305,7 @@ def test_score_with_penalties_clamped(sample_rubric: "Rubric") -> None:
         RubricItemResult(item_id="S1", satisfied=True, reasoning="", confidence=1.0),
     ]
     # Huge penalty
-    score = compute_answer_score_with_penalties(
-        sample_rubric, results, hallucination_penalty=100.0
-    )
+    score = compute_answer_score_with_penalties(sample_rubric, results, hallucination_penalty=100.0)
     assert score == 0.0
 
     # No penalty, all satisfied
@@ -390,3 +392,182 @@ def test_hallucination_severity_penalties() -> None:
     assert SEVERITY_PENALTIES["critical"] == 2.0
     assert SEVERITY_PENALTIES["major"] == 1.0
     assert SEVERITY_PENALTIES["minor"] == 0.3
+
+
+# ===== Budget et planification =====
+
+
+async def test_cost_tracker_records_and_exhausts() -> None:
+    from frenchlaw_bench.pipeline.budget import CostTracker, TrackedClient
+    from tests.fakes import ScriptedClient
+
+    tracker = CostTracker(max_cost_usd=0.001)
+    client = TrackedClient(ScriptedClient(lambda p: "x" * 4000), tracker, "m", "judge")
+    assert not tracker.exhausted
+    await client.complete("prompt")
+    # 1000 tokens de sortie au tarif par defaut (8$/M) = 0.008$
+    assert tracker.exhausted
+    assert tracker.usage[("m", "judge")].calls == 1
+    assert abs(tracker.cost_for("m", "judge") - tracker.spent_usd) < 1e-12
+
+
+async def test_evaluate_task_skipped_when_budget_exhausted(sample_task: Task) -> None:
+    import asyncio
+
+    from frenchlaw_bench.pipeline.budget import CostTracker
+    from frenchlaw_bench.pipeline.runner import evaluate_task
+    from tests.fakes import ScriptedClient
+
+    tracker = CostTracker(max_cost_usd=0.0)
+    client = ScriptedClient(lambda p: "{}")
+    result = await evaluate_task(sample_task, client, client, asyncio.Semaphore(1), budget=tracker)
+    assert result is None
+    assert client.prompts == []
+
+
+def test_plan_counts_judge_calls_from_rubric(sample_task: Task) -> None:
+    from frenchlaw_bench.pipeline.planner import plan_model
+    from frenchlaw_bench.pipeline.runner import EvaluationOptions
+
+    plan = plan_model([sample_task], "openai/gpt-4o", "openai/gpt-4o", max_concurrent=1)
+    stages = {s.stage: s for s in plan.stages}
+    assert stages["subject"].calls == 1
+    assert stages["rubric"].calls == 8
+    assert stages["negatif"].calls == 2
+    assert stages["source"].calls == 1
+    assert plan.cost_usd > 0
+    assert plan.wall_seconds > 0
+
+    lean = plan_model(
+        [sample_task],
+        "openai/gpt-4o",
+        "openai/gpt-4o",
+        max_concurrent=1,
+        options=EvaluationOptions(claim_extraction="citations", combined_extraction=False),
+    )
+    assert {s.stage: s.calls for s in lean.stages}["extraction"] == 0
+    assert lean.cost_usd < plan.cost_usd
+
+
+@pytest.mark.parametrize("supports_n", [True, False])
+def test_plan_scales_with_samples(sample_task: Task, supports_n: bool) -> None:
+    from frenchlaw_bench.pipeline.planner import plan_model
+    from frenchlaw_bench.pipeline.runner import EvaluationOptions
+
+    def plan(samples: int):
+        return plan_model(
+            [sample_task],
+            "openai/gpt-4o",
+            "openai/gpt-4o",
+            max_concurrent=1,
+            options=EvaluationOptions(samples=samples),
+            supports_n=supports_n,
+        )
+
+    one, five = plan(1), plan(5)
+    single, multi = ({s.stage: s for s in p.stages} for p in (one, five))
+    for stage in ("rubric", "negatif", "extraction", "verification", "source"):
+        assert multi[stage].calls == 5 * single[stage].calls
+        assert multi[stage].cost_usd == pytest.approx(5 * single[stage].cost_usd)
+    assert multi["subject"].output_tokens == 5 * single["subject"].output_tokens
+    # Parametre n : prompt facture une fois pour les cinq echantillons
+    subject_calls, subject_input = (1, 1) if supports_n else (5, 5)
+    assert multi["subject"].calls == subject_calls * single["subject"].calls
+    assert multi["subject"].input_tokens == subject_input * single["subject"].input_tokens
+    # Generation en parallele, jugements comptes par echantillon
+    assert 2 * one.wall_seconds < five.wall_seconds < 5 * one.wall_seconds
+
+
+def test_plan_uses_history(sample_task: Task, tmp_path) -> None:
+    import json
+
+    from frenchlaw_bench.pipeline.history import load_history
+    from frenchlaw_bench.pipeline.planner import plan_model
+
+    run_dir = tmp_path / "abc123"
+    run_dir.mkdir()
+    (run_dir / "summary.json").write_text(
+        json.dumps(
+            {
+                "task_scores": [
+                    {
+                        "task_number": 99,
+                        "model_id": "m",
+                        "latency_seconds": 42.0,
+                        "output_tokens": 800,
+                        "claims_total": 3,
+                        "error": None,
+                    }
+                ]
+            }
+        )
+    )
+    history = load_history(tmp_path)
+    assert history.get("m", 99).output_tokens == 800
+    plan = plan_model([sample_task], "m", "judge", max_concurrent=1, history=history)
+    assert plan.from_history
+    assert plan.wall_seconds == 42.0
+    assert {s.stage: s.calls for s in plan.stages}["verification"] == 3
+
+
+def _timed_task(number: int, n_items: int) -> Task:
+    return Task(
+        number=number,
+        title=f"Tache {number}",
+        category=Category.DROIT_PRIVE,
+        sub_category=SubCategory.CONTRATS,
+        task_type=TaskType.REDACTION,
+        prompt="Question",
+        rubric=Rubric(
+            items=[
+                RubricItem(id=f"S{i}", dimension=Dimension.SUBSTANCE, description=f"c{i}", points=1)
+                for i in range(n_items)
+            ]
+        ),
+    )
+
+
+def test_history_ema_and_roundtrip(tmp_path) -> None:
+    from frenchlaw_bench.pipeline.history import RunHistory
+
+    history = RunHistory()
+    history.observe("m", 1, latency_seconds=10.0, output_tokens=100, rubric_size=4)
+    history.observe("m", 1, latency_seconds=30.0, output_tokens=300, rubric_size=4)
+    stats = history.get("m", 1)
+    assert stats.latency_seconds == 20.0
+    assert stats.n_runs == 2
+
+    history.save(tmp_path / "history.json")
+    reloaded = RunHistory.load(tmp_path / "history.json")
+    assert reloaded.get("m", 1) == stats
+
+
+def test_simulate_makespan() -> None:
+    from frenchlaw_bench.pipeline.scheduler import simulate_makespan
+
+    assert simulate_makespan([], 4) == 0.0
+    # Ordre CSV : la longue tache part en dernier et fixe le makespan
+    assert simulate_makespan([1, 1, 1, 1, 10], 2) == 12
+    assert simulate_makespan([10, 1, 1, 1, 1], 2) == 10
+
+
+def test_build_schedule_longest_first() -> None:
+    from frenchlaw_bench.pipeline.history import RunHistory
+    from frenchlaw_bench.pipeline.scheduler import build_schedule
+
+    tasks = [_timed_task(1, 2), _timed_task(2, 2), _timed_task(3, 8)]
+    history = RunHistory()
+    history.observe("a", 1, latency_seconds=5.0, output_tokens=100, rubric_size=2)
+    history.observe("a", 2, latency_seconds=60.0, output_tokens=900, rubric_size=2)
+
+    schedule = build_schedule(tasks, ["a", "b"], history)
+    order = [(s.model_id, s.task.number) for s in schedule]
+    # Tache 3 inconnue pour "a" : extrapolee par critere (8 x 16.25s)
+    assert order[0] == ("a", 3)
+    assert order.index(("a", 2)) < order.index(("a", 1))
+    # "b" sans historique : moyenne des autres modeles sur la meme tache
+    b2 = next(s for s in schedule if s.model_id == "b" and s.task.number == 2)
+    assert b2.expected_seconds == 60.0 and b2.from_history
+
+    csv = build_schedule(tasks, ["a", "b"], history, strategy="csv")
+    assert [(s.model_id, s.task.number) for s in csv][:3] == [("a", 1), ("a", 2), ("a", 3)]
@@ -0,0 +1,72 @@
+"""Tests de la generation de rapports (complet et pagine)."""
+
+import json
+
+import pytest
+
+from frenchlaw_bench.models.result import (
+    AggregateScores,
+    BenchmarkRun,
+    RubricItemResult,
+    TaskResult,
+)
+from frenchlaw_bench.reports.generator import generate_report
+
+
+def _run(n_tasks: int) -> BenchmarkRun:
+    results = [
+        TaskResult(
+            task_number=n,
+            task_title=f"Tache {n}",
+            model_id=model,
+            response=f"REPONSE-{model}-{n} <b>brute</b>",
+            answer_score=0.5,
+            rubric_results=[RubricItemResult(item_id="S1", satisfied=True, reasoning="ok")],
+        )
+        for n in range(1, n_tasks + 1)
+        for model in ("vendor/a", "vendor/b:nitro")
+    ]
+    return BenchmarkRun(
+        run_id="r",
+        models=["vendor/a", "vendor/b:nitro"],
+        task_results=results,
+        aggregates=[
+            AggregateScores(model_id="vendor/a"),
+            AggregateScores(model_id="vendor/b:nitro"),
+        ],
+    )
+
+
+def test_single_report_inlines_details(tmp_path) -> None:
+    report = generate_report(_run(3), tmp_path, mode="single")
+
+    html = report.html_path.read_text(encoding="utf-8")
+    assert not report.paged
+    assert "Detail des criteres par tache" in html
+    assert 'id="flb-viewport"' not in html
+    assert not (tmp_path / "report_data").exists()
+    assert report.seconds >= 0
+
+
+def test_paged_report_writes_shards(tmp_path) -> None:
+    report = generate_report(_run(3), tmp_path, mode="paged")
+
+    html = report.html_path.read_text(encoding="utf-8")
+    assert report.paged and report.n_shards == 6
+    assert 'id="flb-viewport"' in html
+    assert "REPONSE-" not in html  # les reponses restent dans les shards
+    assert '<script src="report_data/index.js">' in html
+
+    index = (tmp_path / "report_data" / "index.js").read_text(encoding="utf-8")
+    rows = json.loads(index.removeprefix("FLB.index(").rstrip().removesuffix(");"))
+    assert len(rows) == 6
+    assert rows[0][-1] == "vendor_a/task_1"
+
+    shard = (tmp_path / "report_data" / "vendor_b_nitro" / "task_2.js").read_text(encoding="utf-8")
+    assert shard.startswith('FLB.shard("vendor_b_nitro/task_2", ')
+    assert "REPONSE-vendor/b:nitro-2" in shard
+
+
+@pytest.mark.parametrize(("n_tasks", "paged"), [(2, False), (150, True)])
+def test_auto_mode_threshold(tmp_path, n_tasks: int, paged: bool) -> None:
+    assert generate_report(_run(n_tasks), tmp_path, mode="auto").paged is paged
@@ -0,0 +1,226 @@
+"""Tests du re-scoring incremental apres modification des rubrics."""
+
+import asyncio
+import json
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from frenchlaw_bench.models.enums import Dimension
+from frenchlaw_bench.models.result import BenchmarkRun, TaskResult
+from frenchlaw_bench.models.task import RubricItem, Task
+from frenchlaw_bench.pipeline.rescore import diff_items, diff_run, rescore_result, rescore_run
+from frenchlaw_bench.pipeline.runner import EvaluationOptions, evaluate_task
+from frenchlaw_bench.reports.generator import generate_report
+from frenchlaw_bench.reports.run_store import STORE_VERSION, RunStore
+from frenchlaw_bench.scoring.answer_scorer import compute_answer_score_with_penalties
+from tests.fakes import JUDGE_OUTPUT, ScriptedClient
+
+REJECT_OUTPUT = json.dumps(
+    {
+        "satisfied": False,
+        "triggered": False,
+        "reasoning": "non",
+        "evidence": [],
+        "confidence": 1.0,
+    }
+)
+
+
+async def _evaluated(task: Task) -> TaskResult:
+    judge = ScriptedClient(lambda p: JUDGE_OUTPUT, model="judge")
+    subject = ScriptedClient(lambda p: "Reponse archivee", model="subject")
+    return await evaluate_task(
+        task, subject, judge, asyncio.Semaphore(1), EvaluationOptions(retrieval_k=0)
+    )
+
+
+def _edited(task: Task) -> Task:
+    """SUB3 reformule, SUB4 supprime, SUB5 ajoute, N2 change de points."""
+    items = []
+    for item in task.rubric.items:
+        if item.id == "SUB3":
+            item = item.model_copy(update={"description": "Analyse le lien causal direct"})
+        elif item.id == "SUB4":
+            continue
+        elif item.id == "N2":
+            item = item.model_copy(update={"points": -1.0})
+        items.append(item)
+    items.insert(
+        6,
+        RubricItem(
+            id="SUB5",
+            dimension=Dimension.SUBSTANCE,
+            description="Cite la Cour de cassation",
+            points=1,
+        ),
+    )
+    return task.model_copy(update={"rubric": task.rubric.model_copy(update={"items": items})})
+
+
+def test_content_hash_tracks_item_content() -> None:
+    item = RubricItem(id="S1", dimension=Dimension.STRUCTURE, description="Note", points=1)
+    assert item.content_hash == item.model_copy().content_hash
+    assert item.content_hash != item.model_copy(update={"points": 2}).content_hash
+    assert item.content_hash != item.model_copy(update={"description": "Note."}).content_hash
+    assert item.content_hash != item.model_copy(update={"dimension": Dimension.STYLE}).content_hash
+
+
+async def test_verdicts_carry_item_hashes(sample_task: Task) -> None:
+    result = await _evaluated(sample_task)
+    hashes = {r.item_id: r.item_hash for r in result.rubric_results + result.negatif_results}
+    assert hashes == {item.id: item.content_hash for item in sample_task.rubric.items}
+
+
+async def test_diff_items(sample_task: Task) -> None:
+    result = await _evaluated(sample_task)
+    edited = _edited(sample_task)
+    changes = diff_items(edited.rubric.positive_items, result.rubric_results)
+    assert (changes.added, changes.changed, changes.removed) == (["SUB5"], ["SUB3"], ["SUB4"])
+    assert changes.recomputed == ["SUB5", "SUB3"]
+
+    assert not diff_items(sample_task.rubric.positive_items, result.rubric_results)
+    full = diff_items(sample_task.rubric.positive_items, result.rubric_results, incremental=False)
+    assert full.changed == [i.id for i in sample_task.rubric.positive_items]
+    # Verdict sans empreinte (run anterieur) : rejuge
+    legacy = [r.model_copy(update={"item_hash": ""}) for r in result.rubric_results]
+    assert diff_items(sample_task.rubric.positive_items, legacy).changed[0] == "S1"
+
+
+async def test_unchanged_rubric_keeps_scores_without_judge_calls(sample_task: Task) -> None:
+    result = await _evaluated(sample_task)
+    judge = ScriptedClient(lambda p: REJECT_OUTPUT, model="judge")
+    rescored, positive, negatif = await rescore_result(sample_task, result, judge)
+
+    assert judge.prompts == []
+    assert not positive and not negatif
+    assert rescored.answer_score == pytest.approx(result.answer_score)
+    assert rescored.answer_score_by_dimension == pytest.approx(result.answer_score_by_dimension)
+    assert rescored.rescored_items == []
+
+
+async def test_only_changed_items_are_rejudged(sample_task: Task) -> None:
+    result = await _evaluated(sample_task)
+    edited = _edited(sample_task)
+    judge = ScriptedClient(lambda p: REJECT_OUTPUT, model="judge")
+    rescored, _, _ = await rescore_result(edited, result, judge)
+
+    assert len(judge.prompts) == 3
+    assert sorted(rescored.rescored_items) == ["N2", "SUB3", "SUB5"]
+    assert [r.item_id for r in rescored.rubric_results] == [
+        i.id for i in edited.rubric.positive_items
+    ]
+    verdicts = {r.item_id: r for r in rescored.rubric_results}
+    assert not verdicts["SUB3"].satisfied and not verdicts["SUB5"].satisfied
+    assert verdicts["SUB1"].satisfied
+    assert verdicts["SUB3"].item_hash == edited.rubric.items[5].content_hash
+    # Score coherent avec un calcul complet sur les verdicts fusionnes
+    assert rescored.answer_score == pytest.approx(
+        compute_answer_score_with_penalties(
+            edited.rubric,
+            rescored.rubric_results,
+            hallucination_penalty=rescored.hallucination_penalty,
+        )
+    )
+    assert rescored.rubric_items_total == len(edited.rubric.positive_items)
+
+
+async def test_rescore_run_records_changes(tmp_path, sample_task: Task) -> None:
+    result = await _evaluated(sample_task)
+    orphan = result.model_copy(update={"task_number": 404})
+    run = BenchmarkRun(
+        run_id="r1",
+        timestamp=datetime(2026, 1, 1),
+        models=["subject"],
+        task_results=[result, orphan],
+    )
+    edited = _edited(sample_task)
+    assert diff_run(run.task_results, [edited]).items_changed == {99: ["SUB3", "N2"]}
+
+    judge = ScriptedClient(lambda p: REJECT_OUTPUT, model="judge")
+    new_run = await rescore_run(run, [edited], judge)
+    info = new_run.metadata.rescore
+
+    assert new_run.run_id != "r1"
+    assert info.source_run_id == "r1"
+    assert info.items_added == {99: ["SUB5"]}
+    assert info.items_changed == {99: ["SUB3", "N2"]}
+    assert info.items_removed == {99: ["SUB4"]}
+    assert info.tasks_missing == [404]
+    assert (info.results_rescored, info.judge_calls) == (1, 3)
+    assert [r.task_number for r in new_run.task_results] == [99]
+    (agg,) = new_run.aggregates
+    assert agg.answer_score_mean == pytest.approx(new_run.task_results[0].answer_score)
+
+    report = generate_report(new_run, tmp_path, mode="single")
+    html = report.html_path.read_text(encoding="utf-8")
+    assert "Re-scoring du run r1" in html
+    assert "rejuge" in html
+
+
+@pytest.mark.parametrize("failure", ["error", "unparseable"])
+async def test_failed_rejudge_is_not_reported_as_rescored(sample_task: Task, failure: str) -> None:
+    result = await _evaluated(sample_task)
+    edited = _edited(sample_task)
+
+    def judge(prompt: str) -> str:
+        # La demande de reparation reprend la sortie illisible : elle echoue aussi
+        if "lien causal direct" in prompt or "ILLISIBLE" in prompt:
+            if failure == "error":
+                raise RuntimeError("HTTP 500")
+            return "ILLISIBLE, pas de JSON"
+        return REJECT_OUTPUT
+
+    run = BenchmarkRun(
+        run_id="r1",
+        timestamp=datetime(2026, 1, 1),
+        models=["subject"],
+        task_results=[result],
+    )
+    new_run = await rescore_run(run, [edited], ScriptedClient(judge, model="judge"))
+    info = new_run.metadata.rescore
+    (rescored,) = new_run.task_results
+
+    assert info.items_changed == {99: ["N2"]}
+    assert info.items_failed == {99: ["SUB3"]}
+    assert sorted(rescored.rescored_items) == ["N2", "SUB5"]
+    # Ancien verdict conserve avec son ancienne empreinte : rejuge au prochain re-scoring
+    stale = next(r for r in rescored.rubric_results if r.item_id == "SUB3")
+    assert stale.item_hash == sample_task.rubric.items[5].content_hash
+    assert diff_run(new_run.task_results, [edited]).items_changed == {99: ["SUB3"]}
+
+
+def test_store_keeps_item_hashes(tmp_path) -> None:
+    db = tmp_path / "runs.sqlite"
+    with sqlite3.connect(db) as conn:
+        conn.execute(
+            "CREATE TABLE rubric_results (task_result_id INTEGER NOT NULL, item_id TEXT NOT NULL,"
+            " dimension TEXT, negatif INTEGER NOT NULL, satisfied INTEGER NOT NULL,"
+            " confidence REAL, reasoning TEXT)"
+        )
+    conn.close()
+
+    result = TaskResult(
+        task_number=1,
+        model_id="m",
+        response="r",
+        rubric_results=[
+            {"item_id": "S1", "satisfied": True, "item_hash": "abc"},
+        ],
+    )
+    with RunStore(db) as store:
+        store.add_run(
+            BenchmarkRun(
+                run_id="r1",
+                timestamp=datetime(2026, 1, 1),
+                models=["m"],
+                task_results=[result],
+            )
+        )
+    with sqlite3.connect(db) as conn:
+        rows = conn.execute("SELECT item_id, item_hash FROM rubric_results").fetchall()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+    conn.close()
+    assert rows == [("S1", "abc")]
+    assert version == STORE_VERSION
@@ -0,0 +1,84 @@
+"""Tests de l'ecriture / lecture en flux de results.json."""
+
+import json
+
+import pytest
+
+from frenchlaw_bench.models.result import (
+    AggregateScores,
+    BenchmarkRun,
+    HallucinationDetail,
+    RubricItemResult,
+    TaskResult,
+)
+from frenchlaw_bench.reports.results_io import (
+    find_results,
+    iter_task_results,
+    load_run,
+    read_header,
+    results_path,
+    write_results,
+)
+
+
+def _run() -> BenchmarkRun:
+    results = [
+        TaskResult(
+            task_number=n,
+            model_id="m",
+            response='Reponse {avec accolades}\n« guillemets » et "citations"',
+            answer_score=0.5 + n / 10,
+            rubric_results=[RubricItemResult(item_id="S1", satisfied=True, evidence=["x"])],
+            hallucination_details=[HallucinationDetail(claim="c", hallucinated=False)],
+        )
+        for n in (1, 2, 3)
+    ]
+    failed = [TaskResult(task_number=4, model_id="m", response="", error="API error")]
+    return BenchmarkRun(
+        run_id="run_test",
+        models=["m"],
+        task_results=results + failed,
+        failed_tasks=failed,
+        aggregates=[AggregateScores(model_id="m", answer_score_mean=0.7, total_tasks=4)],
+    )
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip"])
+def test_roundtrip(tmp_path, compression: str) -> None:
+    run = _run()
+    path = write_results(run, results_path(tmp_path, compression))
+
+    assert find_results(tmp_path) == path
+    assert load_run(path) == run
+    assert list(iter_task_results(path)) == run.task_results
+    assert list(iter_task_results(path, "failed_tasks")) == run.failed_tasks
+
+
+def test_streamed_file_is_plain_json(tmp_path) -> None:
+    run = _run()
+    path = write_results(run, results_path(tmp_path))
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["run_id"] == "run_test"
+    assert len(data["task_results"]) == 4
+
+
+def test_read_header_skips_task_results(tmp_path) -> None:
+    path = write_results(_run(), results_path(tmp_path))
+    # Tout ce qui suit l'en-tete est corrompu : il ne doit pas etre lu
+    first = path.read_bytes().split(b"\n", 1)[0]
+    path.write_bytes(first + b"\n<<< corps illisible >>>")
+
+    header = read_header(path)
+    assert header["run_id"] == "run_test"
+    assert header["aggregates"][0]["answer_score_mean"] == 0.7
+    assert "task_results" not in header
+
+
+def test_legacy_indented_results(tmp_path) -> None:
+    run = _run()
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps(run.model_dump(mode="json"), indent=2), encoding="utf-8")
+
+    assert read_header(path)["aggregates"][0]["model_id"] == "m"
+    assert [r.task_number for r in iter_task_results(path)] == [1, 2, 3, 4]
+    assert load_run(path) == run
@@ -0,0 +1,74 @@
+"""Tests pour l'index BM25 des documents de tache."""
+
+import json
+
+from frenchlaw_bench.documents.retriever import (
+    NO_PASSAGE_CONTEXT,
+    DocumentIndex,
+    split_passages,
+    tokenize,
+)
+from frenchlaw_bench.scoring.hallucination_detector import detect_hallucinations
+from tests.fakes import ScriptedClient
+
+_PAGES = [
+    "Article 1 — Objet\n\nLe present contrat a pour objet la cession de 1 000 actions.",
+    "Article 2 — Prix\n\nLe prix de cession est fixe a 2 500 000 euros payables comptant.",
+    "Article 3 — Garantie\n\nLe cedant consent une garantie d'actif et de passif de 24 mois.",
+    "Article 4 — Non-concurrence\n\nLe cedant s'interdit toute activite concurrente en France.",
+]
+
+
+def _index() -> DocumentIndex:
+    return DocumentIndex(split_passages("spa.pdf", _PAGES))
+
+
+def test_tokenize_folds_accents_and_stopwords() -> None:
+    assert tokenize("La Société et le Cédant") == ["societe", "cedant"]
+
+
+def test_split_passages_keeps_page_numbers() -> None:
+    passages = split_passages("spa.pdf", _PAGES)
+    assert {p.page for p in passages} == {1, 2, 3, 4}
+    assert all(p.document == "spa.pdf" for p in passages)
+
+
+def test_split_passages_bounds_long_paragraphs() -> None:
+    passages = split_passages("long.pdf", ["mot " * 2000])
+    assert len(passages) > 1
+    assert all(len(p.text) <= 1200 for p in passages)
+
+
+def test_search_ranks_relevant_page_first() -> None:
+    hits = _index().search("Quel est le prix de cession en euros ?", k=2)
+    assert hits[0][0].page == 2
+
+
+def test_context_for_respects_budget() -> None:
+    context = _index().context_for("garantie actif passif", k=4, token_budget=30)
+    assert context.startswith("[spa.pdf, p. 3]")
+    assert len(context) <= 30 * 4 + 40
+
+
+def test_context_for_without_match() -> None:
+    assert _index().context_for("xyzzy") == NO_PASSAGE_CONTEXT
+
+
+async def test_verification_receives_only_retrieved_passages() -> None:
+    def responder(prompt: str) -> str:
+        if "Extrais chaque assertion" in prompt:
+            return json.dumps({"claims": [{"claim": "Le prix est de 2 500 000 euros"}]})
+        assert "Le prix de cession est fixe" in prompt
+        assert "non-concurrence" not in prompt.lower()
+        return json.dumps({"hallucinated": False})
+
+    result = await detect_hallucinations(
+        ScriptedClient(responder),
+        "Le prix est de 2 500 000 euros.",
+        "Test",
+        source_context="\n\n".join(_PAGES),
+        source_index=_index(),
+        retrieval_k=1,
+    )
+    assert result.total_claims == 1
+    assert 0 < result.source_context_tokens < len("\n\n".join(_PAGES)) // 4
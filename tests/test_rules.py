@@ -0,0 +1,190 @@
+"""Tests des regles deterministes des criteres (annotation, evaluation, validation)."""
+
+import pytest
+
+from frenchlaw_bench.core.rubric_parser import parse_rubric, parse_rule, rule_errors
+from frenchlaw_bench.models.result import RubricItemResult, TaskResult
+from frenchlaw_bench.models.task import Task
+from frenchlaw_bench.pipeline.rescore import rescore_result
+from frenchlaw_bench.scoring.judge import judge_all_items, judge_negatif_items
+from frenchlaw_bench.scoring.rules import (
+    RULE_TIER,
+    compile_rule,
+    match_rule,
+    rule_verdict,
+    validate_rules,
+)
+from tests.fakes import JUDGE_OUTPUT, ScriptedClient
+
+RUBRIC = """\
+[Structure]
+S1 (1pt) : Note professionnelle
+
+[Substance]
+SUB1 (2pts) : Mentionne l'article 1240 du Code civil {{citation: art. 1240 C. civ.}}
+SUB2 (1pt) : Cite l'article L. 223-43 {{citation/toujours: L. 223-43}}
+SUB3 (1pt) : Evoque la force majeure {{mot-cle: force majeure ; cas fortuit}}
+SUB4 (1pt) : Analyse un arret de la chambre commerciale {{regex/si-absent: Cass\\.?\\s*com}}
+
+[Negatif]
+N1 (-1pt) : Cite l'article 1382 (ancienne numerotation) {{citation/toujours: article 1382 C. civ.}}
+"""
+
+ANSWER = (
+    "Sur le fondement de l'article 1240 du Code civil, la faute engage la responsabilite. "
+    "L'evenement relevait de la Force Majeure."
+)
+
+
+@pytest.fixture
+def ruled_task(sample_task: Task) -> Task:
+    return sample_task.model_copy(update={"rubric": parse_rubric(RUBRIC), "rubric_raw": RUBRIC})
+
+
+def test_annotation_is_parsed_out_of_description(ruled_task: Task) -> None:
+    items = {i.id: i for i in ruled_task.rubric.items}
+    assert items["SUB1"].description == "Mentionne l'article 1240 du Code civil"
+    assert items["SUB1"].rule.patterns == ["art. 1240 C. civ."]
+    assert (items["SUB2"].rule.policy, items["SUB2"].rule.patterns) == ("toujours", ["L. 223-43"])
+    assert items["SUB3"].rule.patterns == ["force majeure", "cas fortuit"]
+    # Motifs compares a la reponse : citations normalisees, mots-cles sans casse ni accents
+    assert compile_rule(items["SUB1"].rule) == ("Code civil, art. 1240",)
+    assert compile_rule(items["SUB2"].rule) == ("art. L. 223-43",)
+    assert compile_rule(parse_rule("mot-cle: Évènement ; evenement")) == ("evenement",)
+    assert items["S1"].rule is None
+    # La regle ne fait pas partie de l'empreinte du critere juge
+    bare = items["SUB1"].model_copy(update={"rule": None})
+    assert bare.content_hash == items["SUB1"].content_hash
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        "regex: (ouverte",
+        "inconnu: x",
+        "mot-cle/parfois: x",
+        "mot-cle: ;",
+        "citation art. 1240",
+    ],
+)
+def test_invalid_rules_are_rejected(spec: str) -> None:
+    with pytest.raises(ValueError):
+        parse_rule(spec)
+
+
+def test_invalid_annotation_is_dropped_and_reported() -> None:
+    text = RUBRIC.replace("{{mot-cle: force majeure ; cas fortuit}}", "{{mot-cle/parfois: x}}")
+    items = {i.id: i for i in parse_rubric(text).items}
+    assert items["SUB3"].rule is None
+    assert items["SUB3"].description == "Evoque la force majeure"
+    assert items["SUB1"].rule is not None
+    assert rule_errors(text) == ["SUB3 : Politique de règle inconnue : 'parfois'"]
+    assert rule_errors(RUBRIC) == []
+
+
+def test_unrecognized_citation_is_left_to_the_judge(ruled_task: Task) -> None:
+    rule = parse_rule("citation/toujours: pas une citation")
+    with pytest.raises(ValueError):
+        compile_rule(rule)
+    item = ruled_task.rubric.items[1].model_copy(update={"rule": rule})
+    assert rule_verdict(item, ANSWER) is None
+
+
+def test_matching() -> None:
+    codified = parse_rule("citation: L. 223-43")
+    assert match_rule(codified, "Voir l'article L223-43 du Code de commerce.") is not None
+    assert match_rule(codified, "Voir l'article L. 223-44.") is None
+    civil = parse_rule("citation: article 1240 du Code civil")
+    assert match_rule(civil, "art. 1240 C. civ.") == "art. 1240 C. civ."
+    assert match_rule(civil, "article 1240 du Code de commerce") is None
+    keyword = parse_rule("mot-cle: Force majeure")
+    assert match_rule(keyword, "un cas de FORCE MAJEURE.") == "force majeure"
+    assert match_rule(keyword, "forces majeures") is None
+    assert match_rule(parse_rule(r"regex: Cass\.?\s*com"), "Cass com., 2021") == "Cass com"
+
+
+def test_policies(ruled_task: Task) -> None:
+    items = {i.id: i for i in ruled_task.rubric.items}
+    found = rule_verdict(items["SUB1"], ANSWER)
+    assert found.satisfied and found.judge_tier == RULE_TIER
+    assert found.evidence == ["article 1240 du Code civil"]
+    assert found.item_hash == items["SUB1"].content_hash
+    # si-present : absence non concluante ; si-absent : presence non concluante
+    assert rule_verdict(items["SUB1"], "Rien") is None
+    assert rule_verdict(items["SUB4"], "Cass. com., 12 janv. 2021") is None
+    assert not rule_verdict(items["SUB4"], ANSWER).satisfied
+    # toujours : concluante dans les deux cas
+    assert not rule_verdict(items["SUB2"], ANSWER).satisfied
+    assert rule_verdict(items["S1"], ANSWER) is None
+
+
+async def test_conclusive_rules_skip_the_judge(ruled_task: Task) -> None:
+    judge = ScriptedClient(lambda p: JUDGE_OUTPUT, model="judge")
+    positive = await judge_all_items(judge, ruled_task, ANSWER)
+    negatif = await judge_negatif_items(judge, ruled_task, ANSWER)
+
+    tiers = {r.item_id: r.judge_tier for r in positive + negatif}
+    assert tiers == {
+        "S1": None,
+        "SUB1": RULE_TIER,
+        "SUB2": RULE_TIER,
+        "SUB3": RULE_TIER,
+        "SUB4": RULE_TIER,
+        "N1": RULE_TIER,
+    }
+    assert len(judge.prompts) == 1
+
+    await judge_all_items(judge, ruled_task, ANSWER, rules=False)
+    assert len(judge.prompts) == 1 + len(ruled_task.rubric.positive_items)
+
+
+async def test_rescore_applies_rules(ruled_task: Task) -> None:
+    result = TaskResult(task_number=ruled_task.number, model_id="m", response=ANSWER)
+    judge = ScriptedClient(lambda p: JUDGE_OUTPUT, model="judge")
+    rescored, _, _ = await rescore_result(ruled_task, result, judge)
+    assert len(judge.prompts) == 1
+    assert sorted(rescored.rescored_items) == ["N1", "S1", "SUB1", "SUB2", "SUB3", "SUB4"]
+
+
+def test_validate_rules_against_judge_verdicts(ruled_task: Task) -> None:
+    items = {i.id: i for i in ruled_task.rubric.items}
+
+    def verdict(item_id: str, satisfied: bool, **kw) -> RubricItemResult:
+        return RubricItemResult(
+            item_id=item_id, satisfied=satisfied, item_hash=items[item_id].content_hash, **kw
+        )
+
+    results = [
+        TaskResult(
+            task_number=99,
+            model_id="a",
+            response=ANSWER,
+            rubric_results=[
+                verdict("SUB1", True),
+                verdict("SUB2", True),
+                verdict("SUB3", True),
+                verdict("S1", True),
+            ],
+        ),
+        TaskResult(
+            task_number=99,
+            model_id="b",
+            response="Rien",
+            rubric_results=[
+                verdict("SUB1", False),
+                # Critere modifie depuis, verdict rendu par une regle : ignores
+                verdict("SUB3", True).model_copy(update={"item_hash": "ancien"}),
+                verdict("SUB2", False, judge_tier=RULE_TIER),
+            ],
+        ),
+    ]
+
+    by_item = {a.item_id: a for a in validate_rules(results, [ruled_task])}
+    assert list(by_item) == ["SUB1", "SUB2", "SUB3"]
+    sub1 = by_item["SUB1"]
+    assert (sub1.verdicts, sub1.conclusive, sub1.agree) == (2, 1, 1)
+    assert sub1.coverage == pytest.approx(0.5)
+    # La regle (toujours) tranche non satisfait, le juge avait dit oui
+    sub2 = by_item["SUB2"]
+    assert (sub2.conclusive, sub2.agreement, sub2.judge_only) == (1, 0.0, 1)
+    assert by_item["SUB3"].verdicts == 1
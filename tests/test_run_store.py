@@ -0,0 +1,97 @@
+"""Tests de l'index SQLite des runs."""
+
+from datetime import datetime, timedelta
+
+from frenchlaw_bench.models.result import (
+    AggregateScores,
+    BenchmarkRun,
+    HallucinationDetail,
+    RubricItemResult,
+    TaskResult,
+)
+from frenchlaw_bench.reports.results_io import results_path, write_results
+from frenchlaw_bench.reports.run_store import RunStore
+
+
+def _run(run_id: str, day: int, scores: dict[str, float]) -> BenchmarkRun:
+    results = [
+        TaskResult(
+            task_number=task,
+            model_id=model,
+            response="r",
+            answer_score=score if task == 7 else score / 2,
+            cost_usd=0.01,
+            rubric_results=[RubricItemResult(item_id="S1", satisfied=True)],
+            negatif_results=[RubricItemResult(item_id="N1", satisfied=False)],
+            hallucination_details=[HallucinationDetail(claim="c", hallucinated=True)],
+        )
+        for model, score in scores.items()
+        for task in (1, 7)
+    ]
+    results.append(TaskResult(task_number=7, model_id="a", response="", error="timeout"))
+    return BenchmarkRun(
+        run_id=run_id,
+        timestamp=datetime(2026, 1, 1) + timedelta(days=day),
+        models=list(scores),
+        task_results=results,
+        aggregates=[
+            AggregateScores(model_id=m, answer_score_mean=s, total_tasks=2)
+            for m, s in scores.items()
+        ],
+    )
+
+
+def test_add_run_and_queries(tmp_path) -> None:
+    with RunStore.open(tmp_path) as store:
+        store.add_run(_run("r1", 0, {"a": 0.4, "b": 0.8}))
+        store.add_run(_run("r2", 1, {"a": 0.9, "b": 0.6}))
+        store.add_run(_run("r3", 2, {"a": 0.6}))
+
+        board = store.leaderboard(task_number=7)
+        assert [(e.model_id, e.best_score, e.n_runs) for e in board] == [
+            ("b", 0.8, 2),
+            ("a", 0.9, 3),
+        ]
+        # Les resultats en erreur ne comptent pas
+        assert sum(e.n_results for e in board) == 5
+
+        recent = store.leaderboard(task_number=7, last_runs=1)
+        assert [(e.model_id, e.best_score) for e in recent] == [("a", 0.6)]
+
+        trend = store.trend("a", task_number=7)
+        assert [(p.run_id, p.mean_score) for p in trend] == [
+            ("r1", 0.4),
+            ("r2", 0.9),
+            ("r3", 0.6),
+        ]
+
+        rows = store.compare(["r2", "r1"])
+        assert [(r.run_id, r.model_id) for r in rows] == [
+            ("r2", "a"),
+            ("r2", "b"),
+            ("r1", "a"),
+            ("r1", "b"),
+        ]
+
+
+def test_add_run_replaces_previous_version(tmp_path) -> None:
+    with RunStore.open(tmp_path) as store:
+        store.add_run(_run("r1", 0, {"a": 0.4}))
+        store.add_run(_run("r1", 0, {"a": 0.5}))
+        assert [e.best_score for e in store.leaderboard(task_number=7)] == [0.5]
+        n_items = store._conn.execute("SELECT COUNT(*) FROM rubric_results").fetchone()[0]
+        assert n_items == 4  # 2 resultats x (1 critere + 1 negatif), sans doublon
+
+
+def test_import_results_dir(tmp_path) -> None:
+    results_dir = tmp_path / "results"
+    write_results(_run("r1", 0, {"a": 0.4}), results_path(results_dir / "r1"))
+    write_results(_run("r2", 1, {"a": 0.9}), results_path(results_dir / "r2", "gzip"))
+    (results_dir / "vide").mkdir()
+
+    with RunStore.open(tmp_path) as store:
+        assert store.import_results_dir(results_dir) == ["r1", "r2"]
+        assert store.import_results_dir(results_dir) == []
+        assert [p.mean_score for p in store.trend("a", task_number=7)] == [0.4, 0.9]
+        n_halluc = store._conn.execute("SELECT COUNT(*) FROM hallucinations").fetchone()[0]
+        assert n_halluc == 4
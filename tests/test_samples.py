@@ -0,0 +1,165 @@
+"""Tests de l'echantillonnage multiple (--samples) : appel n, jugement, agregation."""
+
+import asyncio
+import itertools
+import json
+import sqlite3
+
+import httpx
+import pytest
+
+from frenchlaw_bench.llm.openrouter import OpenRouterClient
+from frenchlaw_bench.models.result import TaskResult
+from frenchlaw_bench.models.task import Task
+from frenchlaw_bench.pipeline.runner import EvaluationOptions, evaluate_task_samples
+from frenchlaw_bench.reports.run_store import STORE_VERSION, RunStore
+from frenchlaw_bench.scoring.aggregator import aggregate_scores
+from tests.fakes import JUDGE_OUTPUT, ScriptedClient
+
+
+def _openrouter(handler) -> OpenRouterClient:
+    client = OpenRouterClient(model="vendor/model", api_key="test")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+async def test_complete_n_uses_n_parameter() -> None:
+    payloads: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payloads.append(json.loads(request.content))
+        return httpx.Response(
+            200,
+            json={
+                "choices": [{"message": {"content": f"r{i}"}} for i in range(3)],
+                "usage": {"prompt_tokens": 100, "completion_tokens": 31},
+            },
+        )
+
+    client = _openrouter(handler)
+    try:
+        responses = await client.complete_n("Q", 3, temperature=0.7)
+    finally:
+        await client.close()
+
+    assert [p["n"] for p in payloads] == [3]
+    assert [r.content for r in responses] == ["r0", "r1", "r2"]
+    # L'usage du prompt n'est compte qu'une fois sur l'ensemble des choix
+    assert sum(r.input_tokens for r in responses) == 100
+    assert sum(r.output_tokens for r in responses) == 31
+
+
+async def test_complete_n_falls_back_when_n_ignored() -> None:
+    payloads: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payloads.append(json.loads(request.content))
+        return httpx.Response(
+            200,
+            json={
+                "choices": [{"message": {"content": f"r{len(payloads)}"}}],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 3},
+            },
+        )
+
+    client = _openrouter(handler)
+    try:
+        responses = await client.complete_n("Q", 3)
+        assert not client.supports_n
+        await client.complete_n("Q", 2)
+    finally:
+        await client.close()
+
+    assert len(responses) == 3
+    assert ["n" in p for p in payloads] == [True, False, False, False, False]
+
+
+async def test_distinct_samples_are_judged_once(sample_task: Task) -> None:
+    answers = itertools.cycle(["reponse A", "reponse B"])
+    subject = ScriptedClient(lambda p: next(answers), model="subject")
+    judge = ScriptedClient(lambda p: JUDGE_OUTPUT, model="judge")
+
+    results = await evaluate_task_samples(
+        sample_task,
+        subject,
+        judge,
+        asyncio.Semaphore(1),
+        EvaluationOptions(samples=4, retrieval_k=0),
+    )
+
+    assert [r.sample_index for r in results] == [0, 1, 2, 3]
+    assert [r.response for r in results] == ["reponse A", "reponse B"] * 2
+    assert all(r.error is None for r in results)
+    assert len(subject.prompts) == 4
+    judged = {text for text in ("reponse A", "reponse B") if any(text in p for p in judge.prompts)}
+    assert judged == {"reponse A", "reponse B"}
+    # Deux reponses distinctes : deux fois les appels d'un jugement simple
+    single = ScriptedClient(lambda p: JUDGE_OUTPUT, model="judge")
+    await evaluate_task_samples(
+        sample_task,
+        ScriptedClient(lambda p: "reponse A"),
+        single,
+        asyncio.Semaphore(1),
+        EvaluationOptions(retrieval_k=0),
+    )
+    assert len(judge.prompts) == 2 * len(single.prompts)
+
+
+async def test_subject_failure_yields_one_error_per_sample(sample_task: Task) -> None:
+    def fail(prompt: str) -> str:
+        raise RuntimeError("provider down")
+
+    results = await evaluate_task_samples(
+        sample_task,
+        ScriptedClient(fail),
+        ScriptedClient(lambda p: JUDGE_OUTPUT),
+        asyncio.Semaphore(1),
+        EvaluationOptions(samples=3),
+    )
+    assert [(r.sample_index, r.error) for r in results] == [(i, "provider down") for i in range(3)]
+
+
+def _result(task_number: int, sample_index: int, score: float) -> TaskResult:
+    return TaskResult(
+        task_number=task_number,
+        model_id="m",
+        response="r",
+        category="Droit Privé",
+        sample_index=sample_index,
+        answer_score=score,
+    )
+
+
+def test_aggregate_reports_sample_variances() -> None:
+    scores = {1: [0.2, 0.4], 2: [0.6, 0.8], 3: [0.5, 0.5]}
+    results = [_result(t, i, s) for t, ss in scores.items() for i, s in enumerate(ss)]
+    (agg,) = aggregate_scores(None, results)
+
+    assert agg.samples_per_task == 2.0
+    assert agg.within_task_variance == pytest.approx((0.02 + 0.02 + 0.0) / 3)
+    assert agg.between_task_variance == pytest.approx(0.04)
+    assert agg.answer_score_ci_lower <= agg.answer_score_mean <= agg.answer_score_ci_upper
+    assert agg.answer_score_ci_lower < agg.answer_score_ci_upper
+
+    (single,) = aggregate_scores(None, [_result(t, 0, ss[0]) for t, ss in scores.items()])
+    assert single.samples_per_task == 1.0
+    assert single.within_task_variance is None
+
+
+def test_store_migrates_sample_index(tmp_path) -> None:
+    db = tmp_path / "runs.sqlite"
+    with sqlite3.connect(db) as conn:
+        conn.execute(
+            "CREATE TABLE task_results (id INTEGER PRIMARY KEY, run_id TEXT, model_id TEXT,"
+            " task_number INTEGER NOT NULL)"
+        )
+        conn.execute("PRAGMA user_version = 1")
+    conn.close()
+
+    RunStore(db).close()
+    with sqlite3.connect(db) as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(task_results)")}
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+    conn.close()
+    assert "sample_index" in columns
+    assert version == STORE_VERSION
@@ -1,5 +1,7 @@
 """Tests pour le scoring engine."""
 
+import pytest
+
 from frenchlaw_bench.models.result import RubricItemResult
 from frenchlaw_bench.models.task import Rubric
 from frenchlaw_bench.scoring.answer_scorer import (
@@ -60,9 +62,7 @@ def test_answer_score_with_penalties_clamped(sample_rubric: Rubric) -> None:
     results = [
         RubricItemResult(item_id="S1", satisfied=True),
     ]
-    score = compute_answer_score_with_penalties(
-        sample_rubric, results, hallucination_penalty=100.0
-    )
+    score = compute_answer_score_with_penalties(sample_rubric, results, hallucination_penalty=100.0)
     assert score == 0.0
 
 
@@ -84,3 +84,101 @@ def test_answer_score_with_penalties(sample_rubric: Rubric) -> None:
     )
     assert score_with_penalty < score_no_penalty
     assert score_with_penalty >= 0.0
+
+
+# ===== Mode d'extraction combine (claims + sources) =====
+
+
+COMBINED_RESPONSE = (
+    "Voici mon analyse. Selon l'art. 1240 C. civ., le delai de recours est de 2 ans. "
+    "La faute doit etre prouvee. Le delai de prescription est de 5 ans."
+)
+CITED = "Selon l'art. 1240 C. civ., le delai de recours est de 2 ans."
+# Assertions factuelles de la reponse : (needs_source, attribution_valid) de reference.
+# L'article cite ne prouve pas l'assertion de sa phrase : attribution invalide.
+FACTUAL = {
+    CITED: (True, False),
+    "La faute doit etre prouvee": (True, False),
+    "Le delai de prescription est de 5 ans": (True, True),
+}
+# Hors du perimetre de l'extraction separee (ni verifiee, ni comptee)
+OFF_SCOPE = {"Voici mon analyse": (False, False)}
+
+
+def _instructions(template: str) -> str:
+    """Consigne de perimetre d'un prompt d'extraction (premier paragraphe)."""
+    return template.split("## Instructions\n")[1].split("\n\n")[0]
+
+
+def _combined_responder(prompt: str) -> str:
+    """Juge factice dont l'extraction depend du perimetre reellement demande."""
+    import json
+
+    from frenchlaw_bench.scoring.prompts import (
+        HALLUCINATION_EXTRACT_HYBRID_PROMPT,
+        HALLUCINATION_EXTRACT_PROMPT,
+    )
+
+    if "total_needing_source" in prompt:
+        needing = [flags for flags in FACTUAL.values() if flags[0]]
+        return json.dumps(
+            {
+                "total_needing_source": len(needing),
+                "total_with_valid_source": sum(valid for _, valid in needing),
+            }
+        )
+    if "## Reponse a analyser" not in prompt:
+        return json.dumps({"hallucinated": "5 ans" in prompt, "severity": "major"})
+
+    if _instructions(HALLUCINATION_EXTRACT_HYBRID_PROMPT) in prompt:
+        claims = {c: f for c, f in FACTUAL.items() if c != CITED}
+    elif _instructions(HALLUCINATION_EXTRACT_PROMPT) in prompt:
+        claims = dict(FACTUAL)
+    else:
+        # Toute autre consigne ramene aussi les assertions hors perimetre
+        claims = {**FACTUAL, **OFF_SCOPE}
+    with_flags = "attribution_valid" in prompt
+    data = {
+        "claims": [
+            {"claim": c, "category": "legal_rule"}
+            | ({"needs_source": ns, "attribution_valid": av} if with_flags else {})
+            for c, (ns, av) in claims.items()
+        ]
+    }
+    if "[1] " + CITED in prompt:
+        ns, av = FACTUAL[CITED]
+        data["citations"] = [{"index": 1, "needs_source": ns, "attribution_valid": av}]
+    return json.dumps(data)
+
+
+@pytest.mark.parametrize("mode", ["llm", "hybrid"])
+async def test_combined_extraction_parity_with_separate_mode(mode: str) -> None:
+    from frenchlaw_bench.scoring.hallucination_detector import detect_hallucinations
+    from frenchlaw_bench.scoring.source_scorer import compute_source_score
+    from tests.fakes import ScriptedClient
+
+    separate_client = ScriptedClient(_combined_responder)
+    separate = await detect_hallucinations(
+        separate_client, COMBINED_RESPONSE, "Test", extraction_mode=mode
+    )
+    separate_source = await compute_source_score(separate_client, COMBINED_RESPONSE)
+
+    combined_client = ScriptedClient(_combined_responder)
+    combined = await detect_hallucinations(
+        combined_client, COMBINED_RESPONSE, "Test", extraction_mode=mode, with_sources=True
+    )
+
+    assert separate.total_claims == len(FACTUAL)
+    assert combined.source_score == pytest.approx(separate_source)
+    assert separate_source == pytest.approx(1 / 3)
+    assert combined.total_claims == separate.total_claims
+    assert combined.rate == separate.rate
+    assert combined.penalty_points == separate.penalty_points == 1.0
+    assert len(combined_client.prompts) == len(separate_client.prompts) - 1
+
+
+def test_source_score_from_claims_none_without_sourced_claims() -> None:
+    from frenchlaw_bench.scoring.source_scorer import source_score_from_claims
+
+    assert source_score_from_claims([{"claim": "x", "needs_source": False}]) is None
+    assert source_score_from_claims([]) is None
@@ -0,0 +1,140 @@
+"""Tests du vote majoritaire du juge avec arret anticipe (auto-coherence)."""
+
+import json
+import re
+from collections import defaultdict
+
+import pytest
+
+from frenchlaw_bench.models.result import RubricItemResult
+from frenchlaw_bench.models.task import Task
+from frenchlaw_bench.pipeline import runner
+from frenchlaw_bench.pipeline.runner import EvaluationOptions, run_benchmark
+from frenchlaw_bench.reports.generator import generate_report
+from frenchlaw_bench.scoring.judge import (
+    JudgeCascade,
+    SelfConsistency,
+    judge_all_items,
+    judge_negatif_items,
+)
+from tests.fakes import JUDGE_OUTPUT, ScriptedClient
+
+# Votes successifs par critere : (satisfait, confiance) ; par defaut, oui a 0.95
+SCRIPTS = {
+    "ST1": [(True, 0.6), (True, 0.6), (True, 0.9)],
+    "SUB2": [(True, 0.95), (False, 0.9), (False, 0.8), (True, 0.7), (False, 0.9)],
+    "N1": [(False, 0.95), (False, 0.95)],
+}
+
+
+def _voter():
+    drawn: dict[str, int] = defaultdict(int)
+
+    def respond(prompt: str) -> str:
+        match = re.search(r"ID : (\w+)", prompt)
+        if match is None:  # claims, sources
+            return JUDGE_OUTPUT
+        item_id = match.group(1)
+        script = SCRIPTS.get(item_id, [(True, 0.95)] * 5)
+        satisfied, confidence = script[drawn[item_id]]
+        drawn[item_id] += 1
+        return json.dumps(
+            {
+                "satisfied": satisfied,
+                "triggered": satisfied,
+                "reasoning": f"vote {item_id}",
+                "evidence": [],
+                "confidence": confidence,
+            }
+        )
+
+    return respond, drawn
+
+
+def _vote(satisfied: bool | None, confidence: float = 0.95) -> RubricItemResult:
+    if satisfied is None:
+        return RubricItemResult(item_id="S1", satisfied=False, reasoning="Parse error")
+    return RubricItemResult(item_id="S1", satisfied=satisfied, confidence=confidence)
+
+
+def test_stopping_rule() -> None:
+    sc = SelfConsistency(max_votes=5, stop_confidence=0.9)
+    # Deux votes concordants et confiants
+    assert sc.settled([_vote(True), _vote(True)])
+    assert not sc.settled([_vote(True), _vote(True, 0.5)])
+    # Majorite que les deux votes restants ne peuvent plus renverser
+    assert sc.settled([_vote(True, 0.5)] * 3)
+    assert not sc.settled([_vote(True), _vote(False), _vote(True)])
+    assert sc.settled([_vote(True), _vote(False)] * 2 + [_vote(None)])
+    assert sc.next_wave([_vote(True), _vote(False)]) == 2
+    assert sc.next_wave([_vote(True), _vote(True, 0.5)]) == 1
+
+
+def test_majority_records_vote_distribution() -> None:
+    sc = SelfConsistency(max_votes=5)
+    verdict = sc.decide([_vote(False, 0.8), _vote(True, 0.9), _vote(None), _vote(True, 0.7)])
+    assert verdict.satisfied
+    assert verdict.votes == [False, True, None, True]
+    assert verdict.confidence == pytest.approx(2 / 3 * 0.8)
+    # Egalite : premier vote lisible
+    assert not sc.decide([_vote(None), _vote(False), _vote(True)]).satisfied
+    assert sc.decide([_vote(None)]).votes == [None]
+
+
+async def test_votes_stop_once_settled(sample_task: Task) -> None:
+    respond, drawn = _voter()
+    judge = ScriptedClient(respond, model="judge")
+    sc = SelfConsistency(max_votes=5)
+
+    results = {r.item_id: r for r in await judge_all_items(judge, sample_task, "R", None, sc)}
+    negatif = {r.item_id: r for r in await judge_negatif_items(judge, sample_task, "R", None, sc)}
+
+    assert results["S1"].votes == [True, True]
+    assert results["ST1"].votes == [True, True, True]
+    assert results["SUB2"].votes == [True, False, False, True, False]
+    assert not results["SUB2"].satisfied
+    assert negatif["N1"].votes == [False, False] and not negatif["N1"].satisfied
+    n_items = len(sample_task.rubric.items)
+    assert len(judge.prompts) == sum(drawn.values()) == 2 * n_items + 1 + 3
+    assert sum(drawn.values()) < 5 * n_items
+
+
+async def test_fast_tier_does_not_vote(sample_task: Task) -> None:
+    respond, _ = _voter()
+    fast = ScriptedClient(lambda p: JUDGE_OUTPUT, model="fast")
+    judge = ScriptedClient(respond, model="judge")
+    cascade = JudgeCascade(fast=fast, dimensions=frozenset({"Substance"}))
+
+    results = await judge_all_items(judge, sample_task, "R", cascade, SelfConsistency())
+
+    by_tier = {r.item_id: (r.judge_tier, r.votes) for r in results}
+    assert by_tier["S1"] == ("fast", [])
+    assert by_tier["SUB1"] == ("strong", [True, True])
+    assert len(fast.prompts) == len(sample_task.rubric.positive_items)
+
+
+async def test_run_reports_votes_per_item(tmp_path, sample_task: Task, monkeypatch) -> None:
+    respond, drawn = _voter()
+    responders = {"subject": lambda p: "Reponse", "judge": respond}
+    monkeypatch.setattr(
+        runner,
+        "OpenRouterClient",
+        lambda model, **_: ScriptedClient(responders[model], model=model),
+    )
+
+    run = await run_benchmark(
+        [sample_task],
+        ["subject"],
+        judge_model="judge",
+        options=EvaluationOptions(retrieval_k=0, judge_votes=5),
+    )
+
+    report = run.metadata.self_consistency
+    n_items = len(sample_task.rubric.items)
+    assert (report.items, report.votes) == (n_items, sum(drawn.values()))
+    assert report.votes_per_item == pytest.approx((2 * n_items + 4) / n_items)
+    assert report.stopped_early == n_items - 1
+    assert report.split == 1
+
+    html = generate_report(run, tmp_path, mode="single").html_path.read_text(encoding="utf-8")
+    assert "Vote majoritaire du juge" in html
@@ -0,0 +1,48 @@
+"""Garde-fou du temps de demarrage de la CLI (`python -X importtime`)."""
+
+import subprocess
+import sys
+
+import pytest
+
+# Dependances lentes a importer, reservees aux commandes qui s'en servent
+_HEAVY = {"fitz", "pymupdf", "httpx", "jinja2", "dotenv", "asyncio", "frenchlaw_bench.pipeline"}
+
+
+def _imported_modules(*args: str) -> set[str]:
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import sys; from frenchlaw_bench.cli import main; main(sys.argv[1:])",
+            *args,
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+def _heavy(modules: set[str]) -> set[str]:
+    return {m for m in modules if m.split(".")[0] in _HEAVY or m.startswith(tuple(_HEAVY))}
+
+
+@pytest.mark.parametrize(
+    "args", [("--help",), ("validate",), ("compare", "--help"), ("store", "--help")]
+)
+def test_light_commands_skip_heavy_imports(args: tuple[str, ...]) -> None:
+    modules = _imported_modules(*args)
+    assert "frenchlaw_bench.cli" in modules
+    assert _heavy(modules) == set()
+
+
+def test_help_does_not_load_rich_or_pydantic() -> None:
+    modules = _imported_modules("--help")
+    assert not {m for m in modules if m.split(".")[0] in {"rich", "pydantic"}}
@@ -0,0 +1,137 @@
+"""Tests des sorties JSON structurees (schema, reparation, compteurs)."""
+
+import json
+
+import httpx
+import pytest
+
+from frenchlaw_bench.llm.openrouter import OpenRouterClient
+from frenchlaw_bench.llm.structured import complete_json, parse_stats, reset_parse_stats
+from frenchlaw_bench.models.task import Task
+from frenchlaw_bench.scoring.judge import (
+    judge_rubric_item,
+    reset_verdict_stats,
+    verdict_stats_dict,
+)
+from frenchlaw_bench.scoring.schemas import FIELD_MATCH_SCHEMA
+from tests.fakes import ScriptedClient
+
+
+@pytest.fixture(autouse=True)
+def _clean_stats():
+    reset_parse_stats()
+    yield
+    reset_parse_stats()
+
+
+async def test_complete_json_sends_schema() -> None:
+    client = ScriptedClient(lambda p: '{"match": true}')
+    data, _ = await complete_json(client, "Q", schema=FIELD_MATCH_SCHEMA, schema_name="fm")
+
+    assert data == {"match": True}
+    fmt = client.response_formats[0]
+    assert fmt["type"] == "json_schema"
+    assert fmt["json_schema"]["name"] == "fm"
+    assert fmt["json_schema"]["schema"] is FIELD_MATCH_SCHEMA
+    assert parse_stats()["fake/model"].parse_failures == 0
+
+
+async def test_complete_json_repairs_only_the_malformed_output() -> None:
+    def responder(prompt: str) -> str:
+        if "Sortie a corriger" in prompt:
+            return '{"match": true, "reasoning": "ok"}'
+        return "Voici : {match: true, reasoning: 'ok'"
+
+    client = ScriptedClient(responder)
+    data, _ = await complete_json(
+        client, "PROMPT ORIGINAL TRES LONG", schema=FIELD_MATCH_SCHEMA, schema_name="fm"
+    )
+
+    assert data["match"] is True
+    assert len(client.prompts) == 2
+    assert "PROMPT ORIGINAL" not in client.prompts[1]
+    assert "{match: true, reasoning: 'ok'" in client.prompts[1]
+    # La reparation n'impose pas de schema
+    assert client.response_formats[1] is None
+    stats = parse_stats()["fake/model"]
+    assert (stats.calls, stats.parse_failures, stats.repaired, stats.unrecovered) == (1, 1, 1, 0)
+
+
+async def test_complete_json_unrecovered_raises() -> None:
+    client = ScriptedClient(lambda p: "pas de json")
+    with pytest.raises(ValueError):
+        await complete_json(client, "Q", schema=FIELD_MATCH_SCHEMA, schema_name="fm")
+    stats = parse_stats()["fake/model"]
+    assert stats.unrecovered == 1
+    assert stats.failure_rate == 1.0
+
+
+async def test_judge_item_uses_repaired_output(sample_task: Task) -> None:
+    def responder(prompt: str) -> str:
+        if "Sortie a corriger" in prompt:
+            return '{"satisfied": true, "reasoning": "repare", "evidence": [], "confidence": 0.9}'
+        return '{"satisfied": true, "reasoning": "tronque'
+
+    reset_verdict_stats()
+    client = ScriptedClient(responder)
+    item = sample_task.rubric.items[0]
+    result = await judge_rubric_item(client, sample_task, "reponse", item)
+
+    assert result.satisfied is True
+    assert result.reasoning == "repare"
+    # Un verdict, mais les tokens des deux appels (illisible puis reparation)
+    stats = verdict_stats_dict()["fake/model"]
+    assert stats["calls"] == 1
+    assert stats["input_tokens"] == sum(len(p) // 4 for p in client.prompts)
+    assert stats["output_tokens"] == sum(len(responder(p)) // 4 for p in client.prompts)
+
+
+async def test_openrouter_disables_response_format_when_rejected() -> None:
+    payloads: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        payloads.append(body)
+        if "response_format" in body:
+            return httpx.Response(400, json={"error": "response_format unsupported"})
+        return httpx.Response(
+            200,
+            json={
+                "choices": [{"message": {"content": '{"match": false}'}}],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 3},
+            },
+        )
+
+    client = OpenRouterClient(model="vendor/model", api_key="test")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        data, _ = await complete_json(client, "Q", schema=FIELD_MATCH_SCHEMA, schema_name="fm")
+        assert data == {"match": False}
+        assert not client.structured_outputs
+        # Appels suivants : plus de response_format
+        await complete_json(client, "Q2", schema=FIELD_MATCH_SCHEMA, schema_name="fm")
+    finally:
+        await client.close()
+
+    assert ["response_format" in p for p in payloads] == [True, False, False]
+
+
+async def test_openrouter_keeps_response_format_on_other_client_errors() -> None:
+    payloads: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payloads.append(json.loads(request.content))
+        return httpx.Response(
+            400, json={"error": {"message": "This model's maximum context length is 8192 tokens"}}
+        )
+
+    client = OpenRouterClient(model="vendor/model", api_key="test")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.complete("Q", response_format={"type": "json_object"})
+        assert client.structured_outputs
+    finally:
+        await client.close()
+
+    assert ["response_format" in p for p in payloads] == [True]
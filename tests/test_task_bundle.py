@@ -0,0 +1,86 @@
+"""Tests du bundle compile des taches (cache de load_tasks)."""
+
+import shutil
+
+import pytest
+
+from frenchlaw_bench import config
+from frenchlaw_bench.config import DATA_DIR
+from frenchlaw_bench.core import loader
+from frenchlaw_bench.core.bundle import file_sha256
+from frenchlaw_bench.models.enums import Dimension
+
+
+@pytest.fixture
+def csv_copy(tmp_path):
+    path = tmp_path / "tasks.csv"
+    shutil.copy(DATA_DIR / "core" / "tasks.csv", path)
+    return path
+
+
+def _bundles() -> list:
+    return sorted((config.CACHE_DIR / "tasks").glob("*.pickle"))
+
+
+def _no_parse(*_args, **_kwargs):
+    raise AssertionError("le CSV n'aurait pas du etre reparse")
+
+
+def test_bundle_reused_without_parsing(csv_copy, monkeypatch) -> None:
+    first = loader.load_tasks(csv_copy)
+    assert len(_bundles()) == 1
+
+    monkeypatch.setattr(loader, "parse_tasks_csv", _no_parse)
+    again = loader.load_tasks(csv_copy)
+
+    assert [t.model_dump() for t in again] == [t.model_dump() for t in first]
+    # L'index par dimension est compile dans le bundle
+    rubric = again[0].rubric
+    assert rubric.index_by_dimension()[Dimension.NEGATIF]
+    assert rubric.negatif_items == [i for i in rubric.items if i.dimension == Dimension.NEGATIF]
+    assert len(rubric.positive_items) + len(rubric.negatif_items) == len(rubric.items)
+
+
+def test_csv_change_invalidates_bundle(csv_copy) -> None:
+    loader.load_tasks(csv_copy)
+    old = _bundles()
+
+    text = csv_copy.read_text(encoding="utf-8")
+    csv_copy.write_text(text + "\n", encoding="utf-8")
+    bundle = loader.load_task_bundle(csv_copy)
+
+    assert bundle.sha256 == file_sha256(csv_copy)
+    assert _bundles() != old and len(_bundles()) == 1  # l'ancien bundle est supprime
+
+
+def test_parser_version_invalidates_bundle(csv_copy, monkeypatch) -> None:
+    loader.load_tasks(csv_copy)
+    monkeypatch.setattr(loader, "PARSER_VERSION", loader.PARSER_VERSION + 1)
+    calls = []
+    real_parse = loader.parse_tasks_csv
+    monkeypatch.setattr(loader, "parse_tasks_csv", lambda p: calls.append(p) or real_parse(p))
+
+    loader.load_tasks(csv_copy)
+    assert calls == [csv_copy]
+
+
+def test_corrupted_bundle_is_rebuilt(csv_copy) -> None:
+    expected = len(loader.load_tasks(csv_copy))
+    _bundles()[0].write_bytes(b"pas un pickle")
+    assert len(loader.load_tasks(csv_copy)) == expected
+
+
+def test_no_cache_mode_writes_nothing(csv_copy) -> None:
+    loader.load_tasks(csv_copy, use_cache=False)
+    assert _bundles() == []
+
+
+def test_replacing_items_rebuilds_dimension_index(sample_task) -> None:
+    rubric = sample_task.rubric
+    swapped = rubric.model_copy(update={"items": [rubric.negatif_items[0], rubric.items[0]]})
+
+    assert swapped.positive_items == [rubric.items[0]]
+    assert swapped.negatif_items == [rubric.negatif_items[0]]
+    assert swapped.index_by_dimension() == {Dimension.NEGATIF: [0], Dimension.STRUCTURE: [1]}
+    # L'original est inchange
+    assert len(rubric.positive_items) == len(rubric.items) - 2
@@ -0,0 +1,204 @@
+"""Tests des sources de taches en flux (shards CSV / JSONL, filtres, fenetres)."""
+
+import asyncio
+import csv
+import json
+
+import pytest
+
+from frenchlaw_bench.config import DATA_DIR
+from frenchlaw_bench.core.bundle import file_sha256
+from frenchlaw_bench.core.loader import parse_tasks_csv
+from frenchlaw_bench.core.sources import TaskFilter, TaskSource, parse_number_ranges
+from frenchlaw_bench.models.result import TaskResult
+from frenchlaw_bench.pipeline import runner
+from frenchlaw_bench.pipeline.scheduler import MakespanSimulator, iter_windows, simulate_makespan
+
+TASKS_CSV = DATA_DIR / "core" / "tasks.csv"
+
+
+@pytest.fixture
+def shards(tmp_path):
+    """Le CSV de reference coupe en deux shards : taches 1-10 en CSV, le reste en JSONL."""
+    with open(TASKS_CSV, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        fields, rows = reader.fieldnames, list(reader)
+    csv_shard = tmp_path / "part-0.csv"
+    with open(csv_shard, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows[:10])
+    jsonl_shard = tmp_path / "part-1.jsonl"
+    jsonl_shard.write_text(
+        "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows[10:]), encoding="utf-8"
+    )
+    return csv_shard, jsonl_shard
+
+
+def test_parse_number_ranges() -> None:
+    assert parse_number_ranges("1-10, 15,20-22") == ((1, 10), (15, 15), (20, 22))
+    with pytest.raises(ValueError, match="invalide"):
+        parse_number_ranges("1-x")
+    with pytest.raises(ValueError, match="inversee"):
+        parse_number_ranges("5-2")
+
+
+def test_filter_accepts_enum_names_and_values() -> None:
+    f = TaskFilter.from_options(categories=["contentieux"], task_types=["Rédaction"])
+    assert f.categories == {"Contentieux"}
+    assert f.task_types == {"Rédaction"}
+    with pytest.raises(ValueError, match="inconnue"):
+        TaskFilter.from_options(sub_categories=["Fiscal"])
+
+
+def test_shards_match_reference_csv(tmp_path, shards) -> None:
+    source = TaskSource.from_paths([tmp_path])
+    assert source.shards == list(shards)
+    assert [t.model_dump() for t in source] == [t.model_dump() for t in parse_tasks_csv(TASKS_CSV)]
+
+
+def test_filters_applied_while_reading(shards) -> None:
+    source = TaskSource.from_paths(
+        shards, TaskFilter.from_options(categories=["Droit Privé"], numbers="1-3,7,12-30")
+    )
+    tasks = list(source)
+    assert tasks
+    assert all(t.category.value == "Droit Privé" for t in tasks)
+    assert all(t.number in (1, 2, 3, 7) or 12 <= t.number <= 30 for t in tasks)
+
+
+def test_rejected_rows_are_not_parsed(tmp_path) -> None:
+    shard = tmp_path / "tasks.jsonl"
+    shard.write_text(
+        json.dumps({"Number": 1, "Category": "inconnue", "Rubric": None}) + "\n",
+        encoding="utf-8",
+    )
+    # La ligne invalide est ecartee par le filtre avant toute validation
+    assert list(TaskSource([shard], TaskFilter(numbers=((2, 5),)))) == []
+    with pytest.raises(ValueError, match="tache 1 invalide"):
+        list(TaskSource([shard]))
+
+
+def test_iteration_is_lazy(shards) -> None:
+    csv_shard, jsonl_shard = shards
+    jsonl_shard.write_text("{pas du json\n", encoding="utf-8")
+    tasks = iter(TaskSource([csv_shard, jsonl_shard]))
+    assert next(tasks).number == 1
+    with pytest.raises(ValueError, match="JSON invalide"):
+        list(tasks)
+
+
+def _renamed_copy(csv_shard):
+    """Meme nom de fichier et memes numeros de taches, titres differents."""
+    other = csv_shard.parent / "autre" / csv_shard.name
+    other.parent.mkdir()
+    with open(csv_shard, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        fields, rows = reader.fieldnames, list(reader)
+    with open(other, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows({**row, "Title": "Copie"} for row in rows)
+    return other
+
+
+def test_dataset_sha256_covers_all_shards(shards) -> None:
+    csv_shard, jsonl_shard = shards
+    assert TaskSource([csv_shard]).dataset_sha256() == file_sha256(csv_shard)
+
+    before = TaskSource([csv_shard, jsonl_shard]).dataset_sha256()
+    assert TaskSource([jsonl_shard, csv_shard]).dataset_sha256() == before
+    with open(jsonl_shard, "a", encoding="utf-8") as f:
+        f.write("\n")
+    assert TaskSource([csv_shard, jsonl_shard]).dataset_sha256() != before
+
+    # Shards homonymes dans deux dossiers : l'ordre donne ne compte toujours pas
+    other = _renamed_copy(csv_shard)
+    assert (
+        TaskSource([csv_shard, other]).dataset_sha256()
+        == TaskSource([other, csv_shard]).dataset_sha256()
+    )
+
+
+def test_missing_shard_raises(tmp_path) -> None:
+    with pytest.raises(FileNotFoundError):
+        TaskSource.from_paths([tmp_path / "*.jsonl"])
+
+
+def test_windows_and_incremental_makespan() -> None:
+    assert [len(w) for w in iter_windows(range(7), 3)] == [3, 3, 1]
+    durations = [4.0, 1.0, 3.0, 2.0, 2.0, 5.0]
+    sim = MakespanSimulator(2)
+    for d in durations:
+        sim.add(d)
+    assert sim.makespan == simulate_makespan(durations, 2)
+
+
+class _Client:
+    def __init__(self, model: str, **_: object) -> None:
+        self.model = model
+
+    async def close(self) -> None:
+        return None
+
+
+async def test_run_benchmark_streams_source_by_window(shards, monkeypatch) -> None:
+    started: list[int] = []
+
+    async def _evaluate(task, subject, judge, semaphore, **_):
+        started.append(task.number)
+        return [
+            TaskResult(
+                task_number=task.number,
+                model_id=subject.model,
+                category=task.category.value,
+                sub_category=task.sub_category.value,
+                task_type=task.task_type.value,
+                response="ok",
+                answer_score=0.5,
+            )
+        ]
+
+    monkeypatch.setattr(runner, "OpenRouterClient", _Client)
+    monkeypatch.setattr(runner, "evaluate_task_samples", _evaluate)
+
+    source = TaskSource(list(shards))
+    run = await runner.run_benchmark(source, ["a", "b"], max_concurrent=2, window=4)
+
+    n = len(parse_tasks_csv(TASKS_CSV))
+    assert run.metadata.n_tasks == n
+    assert run.metadata.dataset_sha256 == source.dataset_sha256()
+    assert len(started) == 2 * n
+    # Une fenetre est entierement lancee avant la lecture de la suivante
+    assert set(started[:8]) == {1, 2, 3, 4}
+    # Resultats ranges par modele puis dans l'ordre de lecture
+    assert [(r.model_id, r.task_number) for r in run.task_results] == [
+        (m, t) for m in ("a", "b") for t in range(1, n + 1)
+    ]
+    assert run.aggregates[0].answer_score_by_category
+
+
+async def test_equal_task_numbers_across_shards_keep_read_order(shards, monkeypatch) -> None:
+    csv_shard, _ = shards
+    other = _renamed_copy(csv_shard)
+
+    async def _evaluate(task, subject, judge, semaphore, **_):
+        # Les taches de la copie finissent les premieres
+        await asyncio.sleep(0 if task.title == "Copie" else 0.01)
+        return [
+            TaskResult(
+                task_number=task.number,
+                task_title=task.title,
+                model_id=subject.model,
+                response="ok",
+            )
+        ]
+
+    monkeypatch.setattr(runner, "OpenRouterClient", _Client)
+    monkeypatch.setattr(runner, "evaluate_task_samples", _evaluate)
+
+    run = await runner.run_benchmark(TaskSource([csv_shard, other]), ["a"], max_concurrent=20)
+
+    titles = [r.task_title for r in run.task_results]
+    assert titles[10:] == ["Copie"] * 10
+    assert "Copie" not in titles[:10]
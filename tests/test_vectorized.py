@@ -0,0 +1,177 @@
+"""Tests du moteur de scoring vectorise (rejeu de ponderation)."""
+
+import random
+from datetime import datetime
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from frenchlaw_bench.core.loader import load_tasks
+from frenchlaw_bench.models.result import (
+    BenchmarkRun,
+    HallucinationDetail,
+    RubricItemResult,
+    TaskResult,
+)
+from frenchlaw_bench.reports.run_store import RunStore
+from frenchlaw_bench.scoring.answer_scorer import (
+    compute_answer_score_with_penalties,
+    compute_dimension_scores,
+    compute_negatif_penalty,
+)
+from frenchlaw_bench.scoring.vectorized import (
+    DIMENSIONS,
+    SEVERITIES,
+    Weighting,
+    pack_results,
+    pack_store_rows,
+    parse_overrides,
+    rescore,
+)
+
+
+def _results(tasks, model_id: str, seed: int, weighting: Weighting) -> list[TaskResult]:
+    """Resultats aleatoires, scores par le pipeline Python pour `weighting`."""
+    rng = random.Random(seed)
+    results = []
+    for task in tasks:
+        positive = [i for i in task.rubric.items if i.points > 0]
+        # Un critere sur dix reste sans verdict
+        rubric_results = [
+            RubricItemResult(
+                item_id=i.id,
+                satisfied=rng.random() < 0.6,
+                confidence=round(rng.uniform(0.3, 1.0), 2),
+                dimension=i.dimension.value,
+            )
+            for i in positive
+            if rng.random() > 0.1
+        ]
+        negatif_results = [
+            RubricItemResult(item_id=i.id, satisfied=rng.random() < 0.3)
+            for i in task.rubric.negatif_items
+        ]
+        details = [
+            HallucinationDetail(
+                claim=f"c{k}",
+                hallucinated=rng.random() < 0.4,
+                severity=rng.choice([*SEVERITIES, "inconnue"]),
+            )
+            for k in range(rng.randint(0, 12))
+        ]
+        penalty = min(
+            sum(
+                weighting.severity_penalties.get(d.severity, weighting.severity_penalties["minor"])
+                for d in details
+                if d.hallucinated
+            ),
+            task.rubric.total_positive_points,
+        )
+        results.append(
+            TaskResult(
+                task_number=task.number,
+                model_id=model_id,
+                response="r",
+                rubric_results=rubric_results,
+                negatif_results=negatif_results,
+                hallucination_details=details,
+                answer_score=compute_answer_score_with_penalties(
+                    task.rubric,
+                    rubric_results,
+                    hallucination_penalty=penalty,
+                    negatif_penalty=compute_negatif_penalty(negatif_results, task.rubric),
+                    dimension_weights=weighting.dimension_weights,
+                    use_confidence=weighting.use_confidence,
+                ),
+                answer_score_by_dimension=compute_dimension_scores(task.rubric, rubric_results),
+            )
+        )
+    return results
+
+
+@pytest.fixture(scope="module")
+def tasks():
+    return load_tasks(use_cache=False)
+
+
+def test_default_weighting_reproduces_pipeline_scores(tasks) -> None:
+    results = _results(tasks, "m", seed=1, weighting=Weighting())
+    rescored = rescore(pack_results((("r1", r) for r in results), tasks))
+
+    np.testing.assert_allclose(rescored.answer_scores, [r.answer_score for r in results])
+    for r, dims in zip(results, rescored.dimension_scores, strict=True):
+        expected = [r.answer_score_by_dimension.get(d, np.nan) for d in DIMENSIONS]
+        np.testing.assert_allclose(dims, expected)
+    (group,) = rescored.groups
+    assert group.delta == pytest.approx(0.0)
+    assert group.n_results == len(tasks)
+
+
+@pytest.mark.parametrize(
+    "weighting",
+    [
+        Weighting(dimension_weights={"Substance": 3.0, "Style": 0.1}),
+        Weighting(severity_penalties={"critical": 5.0, "major": 0.5, "minor": 0.0}),
+        Weighting(use_confidence=False),
+    ],
+)
+def test_new_weighting_matches_python_loop(tasks, weighting: Weighting) -> None:
+    # Memes verdicts, scores stockes avec la ponderation par defaut
+    stored = _results(tasks, "m", seed=2, weighting=Weighting())
+    expected = _results(tasks, "m", seed=2, weighting=weighting)
+
+    rescored = rescore(pack_results((("r1", r) for r in stored), tasks), weighting)
+    np.testing.assert_allclose(rescored.answer_scores, [r.answer_score for r in expected])
+
+
+def test_groups_and_breakdowns(tasks) -> None:
+    pairs = [("r1", r) for r in _results(tasks, "a", 3, Weighting())]
+    pairs += [("r1", r) for r in _results(tasks, "b", 4, Weighting())]
+    pairs += [("r2", r) for r in _results(tasks, "a", 5, Weighting())]
+    pairs.append(("r2", TaskResult(task_number=1, model_id="a", response="", error="timeout")))
+    rescored = rescore(pack_results(pairs, tasks))
+
+    assert [(g.run_id, g.model_id, g.n_results) for g in rescored.groups] == [
+        ("r1", "a", len(tasks)),
+        ("r1", "b", len(tasks)),
+        ("r2", "a", len(tasks)),
+    ]
+    a1 = rescored.groups[0]
+    scores = [r.answer_score for run_id, r in pairs[: len(tasks)]]
+    assert a1.answer_score_mean == pytest.approx(sum(scores) / len(scores))
+    by_cat = {}
+    for task, score in zip(tasks, scores, strict=True):
+        by_cat.setdefault(task.category.value, []).append(score)
+    assert a1.by_category == pytest.approx({k: sum(v) / len(v) for k, v in by_cat.items()})
+    assert set(a1.by_dimension) <= set(DIMENSIONS)
+
+
+def test_store_rows_match_results(tmp_path, tasks) -> None:
+    results = _results(tasks, "m", seed=6, weighting=Weighting())
+    weighting = Weighting(dimension_weights={"Méthodologie": 2.0})
+    with RunStore.open(tmp_path) as store:
+        store.add_run(
+            BenchmarkRun(
+                run_id="r1",
+                timestamp=datetime(2026, 1, 1),
+                models=["m"],
+                task_results=results,
+            )
+        )
+        rows = store.scoring_rows()
+
+    from_store = rescore(pack_store_rows(*rows, tasks), weighting)
+    from_results = rescore(pack_results((("r1", r) for r in results), tasks), weighting)
+    np.testing.assert_allclose(from_store.answer_scores, from_results.answer_scores)
+
+
+def test_parse_overrides() -> None:
+    assert parse_overrides(["methodologie=2", "SUBSTANCE=1.5"], DIMENSIONS) == {
+        "Méthodologie": 2.0,
+        "Substance": 1.5,
+    }
+    with pytest.raises(ValueError, match="inconnue"):
+        parse_overrides(["Fond=1"], DIMENSIONS)
+    with pytest.raises(ValueError, match="cle=valeur"):
+        parse_overrides(["critical"], SEVERITIES)
@@ -0,0 +1,88 @@
+"""Tests de l'extraction par morceaux du workflow Cession d'Actions."""
+
+import json
+import re
+
+from frenchlaw_bench.workflows.cession_actions.chunking import (
+    chunk_document,
+    extract_chunked,
+    merge_partials,
+    split_sections,
+)
+from tests.fakes import ScriptedClient
+
+ACTE = """\
+ACTE DE CESSION D'ACTIONS
+
+Entre les soussignes.
+
+ARTICLE 1 - OBJET
+Le Cedant cede 1 000 actions de la societe Cible SAS.
+
+ARTICLE 2 - PRIX
+Le prix de cession est de 1 500 000 euros.
+
+3. GARANTIE D'ACTIF ET DE PASSIF
+La garantie est consentie pour une duree de 3 ans.
+"""
+
+
+def test_split_sections() -> None:
+    sections = split_sections(ACTE)
+    assert len(sections) == 4
+    assert sections[0].startswith("ACTE DE CESSION")
+    assert sections[2].startswith("ARTICLE 2")
+    assert sections[3].startswith("3. GARANTIE")
+
+
+def test_chunk_document_respects_budget() -> None:
+    long_text = ACTE + "\n\n".join(f"ARTICLE {i}\n" + "clause " * 300 for i in range(4, 12))
+    chunks = chunk_document(long_text, max_tokens=800)
+    assert len(chunks) > 1
+    assert all(len(c) // 4 <= 800 for c in chunks)
+    # Aucune perte de contenu
+    assert sum(c.count("clause") for c in chunks) == 8 * 300
+
+
+def test_merge_partials_majority_lists_and_ties() -> None:
+    merged, ties = merge_partials(
+        [
+            {"date_signature": "2024-03-15", "conditions_suspensives": ["Agrement"]},
+            {
+                "date_signature": "15 mars 2024",
+                "garantie_actif_passif.duree": "3 ans",
+                "conditions_suspensives": ["agrement", "Financement"],
+            },
+            {"date_signature": "2024-04-01", "garantie_actif_passif.duree": "2 ans"},
+        ]
+    )
+    # "2024-03-15" et "15 mars 2024" votent ensemble
+    assert merged["date_signature"] == "2024-03-15"
+    assert merged["conditions_suspensives"] == ["Agrement", "Financement"]
+    assert ties == {"garantie_actif_passif.duree": ["3 ans", "2 ans"]}
+
+
+async def test_extract_chunked_merges_and_breaks_ties() -> None:
+    def responder(prompt: str) -> str:
+        if 'Réponds UNIQUEMENT : {"choice"' in prompt:
+            return '{"choice": 2, "reasoning": "avenant"}'
+        if "Sortie a corriger" in prompt:
+            return "toujours pas de json"
+        part = int(re.search(r"partie (\d+)/", prompt).group(1))
+        data = {"date_signature": "2024-03-15"}
+        data["garantie_actif_passif"] = {"duree": "3 ans" if part == 1 else "2 ans"}
+        if part == 3:
+            return "pas de json"
+        return json.dumps(data)
+
+    client = ScriptedClient(responder)
+    text = "\n\n".join(f"ARTICLE {i}\n" + "mot " * 200 for i in range(1, 4))
+    result = await extract_chunked(client, text, chunk_tokens=220)
+
+    assert result.chunks == 3
+    assert result.failed_chunks == 1
+    assert result.tie_breaks == 1
+    assert result.actions.garantie_actif_passif.duree == "2 ans"
+    # Les valeurs par defaut du schema ne votent pas
+    assert result.actions.droit_applicable == "Droit français"
+    assert result.actions.date_signature == "2024-03-15"
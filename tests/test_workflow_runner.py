@@ -0,0 +1,134 @@
+"""Tests du runner du workflow Cession d'Actions."""
+
+import asyncio
+import json
+
+from frenchlaw_bench.models.workflow import CessionActions, Entite
+from frenchlaw_bench.workflows.cession_actions import runner
+from frenchlaw_bench.workflows.cession_actions.runner import read_checkpoint, run_workflow
+from tests.fakes import ScriptedClient
+
+
+def _entries(n: int) -> list[tuple[str, CessionActions]]:
+    return [
+        (f"spa_{i}.txt", CessionActions(date_signature="2024-03-15", cedant=Entite(nom=f"C{i}")))
+        for i in range(n)
+    ]
+
+
+def _subject(prompt: str) -> str:
+    # Le document "spa_2" produit un JSON non conforme au schema
+    if "Cedant C2" in prompt:
+        return '{"cedant": "pas un objet"}'
+    name = prompt.split("Cedant ")[1].split()[0]
+    return json.dumps({"date_signature": "15 mars 2024", "cedant": {"nom": name}})
+
+
+def _write_docs(tmp_path, n: int) -> None:
+    for i in range(n):
+        (tmp_path / f"spa_{i}.txt").write_text(f"Acte de cession. Cedant C{i} le 15 mars 2024.")
+
+
+async def test_run_workflow_streams_scores_and_checkpoints(tmp_path) -> None:
+    _write_docs(tmp_path, 4)
+    subject = ScriptedClient(_subject, model="sujet/m")
+    judge = ScriptedClient(lambda p: '{"match": false}')
+    checkpoint = tmp_path / "out" / "m.jsonl"
+
+    summary = await run_workflow(
+        _entries(4),
+        subject,
+        judge,
+        checkpoint,
+        documents_dir=tmp_path,
+        extraction_concurrency=2,
+        scoring_concurrency=2,
+    )
+
+    assert summary.n_documents == 4
+    assert summary.n_scored == 3
+    assert summary.n_errors == 1
+    assert summary.accuracy == 1.0
+    # Dates normalisees : aucun appel juge
+    assert summary.judge_calls == 0
+    assert judge.prompts == []
+    assert summary.docs_per_minute > 0
+    fields = {f.field: f for f in summary.fields}
+    assert fields["date_signature"].n == 3
+    assert fields["date_signature"].ci_lower == 1.0
+
+    lines = checkpoint.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 4
+    assert len(read_checkpoint(checkpoint)) == 3
+
+
+async def test_unexpected_errors_fail_the_document_not_the_run(tmp_path, monkeypatch) -> None:
+    _write_docs(tmp_path, 4)
+
+    def subject(prompt: str) -> str:
+        if "Cedant C1" in prompt:
+            raise KeyError("choices")
+        return _subject(prompt)
+
+    async def broken_scorer(*args, **kwargs):
+        raise KeyError("accuracy")
+
+    monkeypatch.setattr(runner, "score_extraction", broken_scorer)
+    # Un worker mort bloquerait la file : le run ne se terminerait jamais
+    summary = await asyncio.wait_for(
+        run_workflow(
+            _entries(4),
+            ScriptedClient(subject, model="sujet/m"),
+            ScriptedClient(lambda p: '{"match": false}'),
+            tmp_path / "m.jsonl",
+            documents_dir=tmp_path,
+            extraction_concurrency=1,
+            scoring_concurrency=1,
+        ),
+        timeout=5,
+    )
+
+    assert (summary.n_documents, summary.n_errors) == (4, 4)
+
+
+async def test_run_workflow_resumes_from_checkpoint(tmp_path) -> None:
+    _write_docs(tmp_path, 3)
+    checkpoint = tmp_path / "m.jsonl"
+    judge = ScriptedClient(lambda p: '{"match": false}')
+
+    first = ScriptedClient(_subject, model="sujet/m")
+    await run_workflow(_entries(2), first, judge, checkpoint, documents_dir=tmp_path)
+
+    second = ScriptedClient(_subject, model="sujet/m")
+    summary = await run_workflow(_entries(3), second, judge, checkpoint, documents_dir=tmp_path)
+
+    assert summary.n_resumed == 2
+    assert summary.n_documents == 3
+    assert len(second.prompts) == 1
+
+    fresh = ScriptedClient(_subject, model="sujet/m")
+    await run_workflow(_entries(2), fresh, judge, checkpoint, documents_dir=tmp_path, resume=False)
+    assert len(fresh.prompts) == 2
+
+
+async def test_run_workflow_chunks_long_documents(tmp_path) -> None:
+    body = "\n\n".join(f"ARTICLE {i}\nCedant C0 " + "mot " * 200 for i in range(1, 4))
+    (tmp_path / "spa_0.txt").write_text(body)
+    subject = ScriptedClient(
+        lambda p: json.dumps({"date_signature": "2024-03-15", "cedant": {"nom": "C0"}}),
+        model="sujet/m",
+    )
+    judge = ScriptedClient(lambda p: '{"match": false}')
+
+    summary = await run_workflow(
+        _entries(1),
+        subject,
+        judge,
+        tmp_path / "m.jsonl",
+        documents_dir=tmp_path,
+        chunk_tokens=250,
+    )
+
+    assert summary.chunks == 3
+    assert summary.tie_breaks == 0
+    assert summary.accuracy == 1.0
@@ -0,0 +1,169 @@
+"""Tests du scoring du workflow Cession d'Actions."""
+
+import asyncio
+import json
+import re
+
+import pytest
+
+from frenchlaw_bench.llm.base import LLMResponse
+from frenchlaw_bench.models.workflow import (
+    CessionActions,
+    ClauseNonConcurrence,
+    ComplementPrix,
+    Entite,
+    GarantieActifPassif,
+    PrixCession,
+)
+from frenchlaw_bench.workflows.cession_actions.normalizers import normalized_equal
+from frenchlaw_bench.workflows.cession_actions.scorer import (
+    judge_calls_avoided,
+    score_extraction,
+)
+from tests.fakes import ScriptedClient
+
+GROUND_TRUTH = CessionActions(
+    cedant=Entite(nom="Alpha"),
+    prix_de_cession=PrixCession(modalites_paiement="Paiement comptant à la réalisation"),
+    complement_de_prix=ComplementPrix(criteres="EBITDA 2024 supérieur à 5 M€"),
+    garantie_actif_passif=GarantieActifPassif(type_franchise="absolue"),
+    clause_non_concurrence=ClauseNonConcurrence(duree="5 ans", activite="conseil en stratégie"),
+)
+
+EXTRACTED = CessionActions(
+    cedant=Entite(nom="Alpha"),
+    prix_de_cession=PrixCession(modalites_paiement="Payé intégralement au closing"),
+    complement_de_prix=ComplementPrix(criteres="si l'EBITDA 2024 dépasse 5 millions"),
+    garantie_actif_passif=GarantieActifPassif(type_franchise="relative"),
+    clause_non_concurrence=ClauseNonConcurrence(duree="5 ans", activite="conseil stratégique"),
+)
+
+# Champs jugés équivalents par le faux juge
+_EQUIVALENT = {
+    "prix_de_cession.modalites_paiement",
+    "complement_de_prix.criteres",
+    "clause_non_concurrence.activite",
+}
+
+
+def _field_responder(prompt: str) -> str:
+    field = re.search(r"Champ : (\S+)", prompt).group(1)
+    return json.dumps({"match": field in _EQUIVALENT, "reasoning": "test"})
+
+
+class _SlowClient(ScriptedClient):
+    """Client qui mesure le nombre maximal d'appels simultanés."""
+
+    def __init__(self) -> None:
+        super().__init__(_field_responder)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def complete(self, prompt: str, **kwargs) -> LLMResponse:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return await super().complete(prompt, **kwargs)
+
+
+async def test_concurrent_mode_judges_mismatches_in_parallel() -> None:
+    client = _SlowClient()
+    score = await score_extraction(EXTRACTED, GROUND_TRUTH, client, max_concurrent=2)
+
+    assert score.judge_calls == 4
+    assert client.max_in_flight == 2
+    # nom, duree de non-concurrence, droit applicable par defaut
+    assert score.exact_matches == 3
+    assert score.llm_matches == 3
+    assert score.total_fields == 7
+    assert score.latency_seconds > 0
+    by_field = {d["field"]: d["match"] for d in score.details}
+    assert by_field["garantie_actif_passif.type_franchise"] == "miss"
+    # L'ordre des details suit celui du schema
+    assert score.details[0]["field"] == "cedant.nom"
+
+
+async def test_batch_mode_single_call() -> None:
+    def responder(prompt: str) -> str:
+        fields = re.findall(r"^### (\S+)$", prompt, re.MULTILINE)
+        return json.dumps(
+            {"verdicts": [{"field": f, "match": f in _EQUIVALENT, "reasoning": ""} for f in fields]}
+        )
+
+    client = ScriptedClient(responder)
+    score = await score_extraction(EXTRACTED, GROUND_TRUTH, client, mode="batch")
+
+    assert score.judge_calls == 1
+    assert score.llm_matches == 3
+
+
+async def test_batch_mode_rejudges_missing_verdicts() -> None:
+    def responder(prompt: str) -> str:
+        if "Champ :" in prompt:
+            return _field_responder(prompt)
+        # Verdict manquant pour tous les champs sauf un
+        return (
+            '```json\n{"verdicts": [{"field": "complement_de_prix.criteres", "match": true},]}\n```'
+        )
+
+    client = ScriptedClient(responder)
+    score = await score_extraction(EXTRACTED, GROUND_TRUTH, client, mode="batch")
+
+    assert score.judge_calls == 4
+    assert score.llm_matches == 3
+
+
+@pytest.mark.parametrize(
+    ("field", "expected", "extracted", "equal"),
+    [
+        ("date_signature", "2024-03-15", "15 mars 2024", True),
+        ("date_signature", "1er mars 2024", "01/03/2024", True),
+        ("date_signature", "15 mars 2024", "16 mars 2024", False),
+        ("forme_juridique", "SAS", "société par actions simplifiée", True),
+        ("forme_juridique", "SA", "SAS", False),
+        ("rcs", "RCS Paris 123 456 789", "123456789 RCS Paris", True),
+        ("rcs", "RCS Lyon 123 456 789", "123456789 RCS Paris", False),
+        ("duree", "12 mois", "1 an", True),
+        ("duree", "trois ans", "36 mois", True),
+        ("duree", "18 mois", "1 an et demi", False),
+        ("duree", "pour une durée de 2 ans", "1 an et 12 mois", True),
+        ("duree", "2 ans à compter de la cession", "24 mois", False),
+        ("duree", "2 ans après la fin du préavis", "24 mois", False),
+        ("juridiction_competente", "Tribunal de commerce de Paris", "TC Paris", True),
+        ("juridiction_competente", "Tribunal de commerce de Paris", "TJ Paris", False),
+        ("contrepartie", "1 500 000 €", "1,5 M€", True),
+        ("contrepartie", "1.500.000 euros", "EUR 1 500 000", True),
+        ("frais_droits_enregistrement", "50 %", "50,0%", True),
+        ("pourcentage", 25.0, 0.25, True),
+        ("exclusions", ["Fiscal", "social"], ["social", "fiscal"], True),
+        ("sequestre", True, 1, False),
+    ],
+)
+def test_normalized_equal(field: str, expected: object, extracted: object, equal: bool) -> None:
+    assert normalized_equal(field, expected, extracted) is equal
+
+
+async def test_normalization_avoids_judge_calls() -> None:
+    gt = CessionActions(
+        date_signature="15 mars 2024",
+        societe_cible=Entite(forme_juridique="SAS", rcs="RCS Paris 123 456 789"),
+        garantie_actif_passif=GarantieActifPassif(duree="12 mois", type_franchise="absolue"),
+    )
+    ex = CessionActions(
+        date_signature="2024-03-15",
+        societe_cible=Entite(
+            forme_juridique="société par actions simplifiée", rcs="123456789 RCS Paris"
+        ),
+        garantie_actif_passif=GarantieActifPassif(duree="1 an", type_franchise="relative"),
+    )
+    client = ScriptedClient(_field_responder)
+    score = await score_extraction(ex, gt, client)
+
+    assert score.normalized_matches == 4
+    assert score.judge_calls == 1
+    assert score.accuracy == 5 / 6
+
+    avoided = judge_calls_avoided([score])
+    assert avoided["date_signature"] == 1.0
+    assert avoided["type_franchise"] == 0.0